@@ -50,6 +50,7 @@ CORS_ALLOWED_ORIGINS = [
 ]
 
 MIDDLEWARE = [
+    'aws_translator_app.instrumentation.MetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',  # Adicione esta linha
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -166,3 +167,220 @@ CACHES = {
 
 # Configuração do ratelimit
 RATELIMIT_CACHE = 'default'  # Ou 'cache-for-ratelimiting' se você definiu
+RATELIMIT_RATE = os.getenv('RATELIMIT_RATE', '10/m')  # Por IP, em todos os endpoints de tradução
+
+# Configuração dos endpoints de metadados (/languages/, /models/, /metadata/ etc.)
+# As respostas são pré-calculadas e enviadas com ETag; o navegador pode reutilizá-las por MAX_AGE
+# segundos e, depois disso, revalidá-las com uma requisição condicional (304 sem corpo).
+METADATA = {
+    'MAX_AGE': int(os.getenv('METADATA_MAX_AGE', 3600)),
+}
+
+# Configuração dos pools de conexão dos clientes externos (compartilhados por processo)
+AWS_MAX_POOL_CONNECTIONS = int(os.getenv('AWS_MAX_POOL_CONNECTIONS', 50))
+AWS_CONNECT_TIMEOUT = float(os.getenv('AWS_CONNECT_TIMEOUT', 5))
+AWS_READ_TIMEOUT = float(os.getenv('AWS_READ_TIMEOUT', 30))
+OPENAI_MAX_CONNECTIONS = int(os.getenv('OPENAI_MAX_CONNECTIONS', 50))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('OPENAI_MAX_KEEPALIVE_CONNECTIONS', 20))
+OPENAI_KEEPALIVE_EXPIRY = float(os.getenv('OPENAI_KEEPALIVE_EXPIRY', 60))
+OPENAI_TIMEOUT = float(os.getenv('OPENAI_TIMEOUT', 120))
+
+# Configuração da resiliência das chamadas externas (services/api/resilience.py)
+# Apenas falhas temporárias são repetidas, com backoff aleatório, e todas as tentativas cabem em
+# DEADLINE segundos. Após FAILURE_THRESHOLD falhas temporárias seguidas, as chamadas ao serviço
+# falham imediatamente por RECOVERY_TIMEOUT segundos. Com HEDGE_AFTER > 0, uma segunda chamada é
+# disparada se a primeira não responder nesse tempo (desativado na OpenAI: duplicaria o custo).
+RESILIENCE = {
+    'openai': {
+        'MAX_ATTEMPTS': int(os.getenv('OPENAI_MAX_ATTEMPTS', 4)),
+        'DEADLINE': float(os.getenv('OPENAI_DEADLINE', 150)),
+        'BASE_DELAY': 0.5,
+        'MAX_DELAY': 8.0,
+        'FAILURE_THRESHOLD': int(os.getenv('OPENAI_CIRCUIT_FAILURE_THRESHOLD', 5)),
+        'RECOVERY_TIMEOUT': float(os.getenv('OPENAI_CIRCUIT_RECOVERY_TIMEOUT', 30)),
+        'HEDGE_AFTER': float(os.getenv('OPENAI_HEDGE_AFTER', 0)),
+    },
+    'aws_translate': {
+        'MAX_ATTEMPTS': int(os.getenv('AWS_TRANSLATE_MAX_ATTEMPTS', 4)),
+        'DEADLINE': float(os.getenv('AWS_TRANSLATE_DEADLINE', 30)),
+        'BASE_DELAY': 0.2,
+        'MAX_DELAY': 4.0,
+        'FAILURE_THRESHOLD': int(os.getenv('AWS_TRANSLATE_CIRCUIT_FAILURE_THRESHOLD', 5)),
+        'RECOVERY_TIMEOUT': float(os.getenv('AWS_TRANSLATE_CIRCUIT_RECOVERY_TIMEOUT', 15)),
+        'HEDGE_AFTER': float(os.getenv('AWS_TRANSLATE_HEDGE_AFTER', 0)),
+    },
+}
+
+# Configuração do cache de traduções (AwsTranslateService.translate_text)
+# BACKEND: 'lru' (memória do processo), 'django' (usa CACHES) ou 'sqlite' (disco local)
+TRANSLATION_CACHE = {
+    'ENABLED': os.getenv('TRANSLATION_CACHE_ENABLED', 'true').lower() == 'true',
+    'BACKEND': os.getenv('TRANSLATION_CACHE_BACKEND', 'lru'),
+    'TTL': 60 * 60 * 24 * 7,  # 7 dias
+    'MAX_ENTRIES': 10000,
+    'MAX_BYTES': 64 * 1024 * 1024,
+    'DJANGO_CACHE_ALIAS': 'default',
+    'KEY_PREFIX': 'aws_translator:',
+    'SQLITE_PATH': os.getenv('TRANSLATION_CACHE_SQLITE_PATH', str(BASE_DIR / 'cache' / 'translation_cache.sqlite3')),
+}
+
+# Configuração da memória de tradução (TranslationMemoryService, modelo TranslationMemoryEntry)
+# As sentenças traduzidas ficam no banco; nas revisões de um documento, apenas as sentenças novas
+# ou alteradas são enviadas à AWS. A busca aproximada (MinHash/LSH, a partir de FUZZY_THRESHOLD de
+# similaridade, e.g. 0.9) vem desativada (0): suas correspondências só entram nas estatísticas (as
+# sentenças são traduzidas de novo), e o índice grava uma linha por faixa de cada sentença.
+TRANSLATION_MEMORY = {
+    'ENABLED': os.getenv('TRANSLATION_MEMORY_ENABLED', 'true').lower() == 'true',
+    'FUZZY_THRESHOLD': float(os.getenv('TRANSLATION_MEMORY_FUZZY_THRESHOLD', 0)),
+    'FUZZY_MIN_CHARS': 40,
+    'SHINGLE_SIZE': 5,
+    'NUM_PERM': 32,
+    'BANDS': 8,
+    'PACK_MAX_BYTES': 9000,  # AWS aceita até 10000 bytes por chamada
+}
+
+# Configuração dos glossários por especialidade (endpoint /glossaries/, GlossaryService)
+# Os termos são protegidos por marcadores antes da simplificação e da tradução e restaurados depois;
+# cada glossário é compilado uma vez por processo (autômato Aho-Corasick).
+GLOSSARIES = {
+    'MAX_TERMS': int(os.getenv('GLOSSARIES_MAX_TERMS', 200000)),
+    'MAX_TERM_CHARS': 500,
+}
+
+# Configuração do cache de respostas da OpenAI (OpenAIService.simplify_text)
+# O uso é opcional e controlado por requisição (campo `cache`: bypass, prefer ou only)
+LLM_CACHE = {
+    'ENABLED': os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true',
+    'BACKEND': os.getenv('LLM_CACHE_BACKEND', 'lru'),
+    'TTL': int(os.getenv('LLM_CACHE_TTL', 60 * 60 * 24)),  # 1 dia
+    'MAX_ENTRIES': 0,  # Limitado apenas pelo orçamento em bytes
+    'MAX_BYTES': int(os.getenv('LLM_CACHE_MAX_BYTES', 32 * 1024 * 1024)),
+    'DJANGO_CACHE_ALIAS': 'default',
+    'KEY_PREFIX': 'aws_translator:',
+    'SQLITE_PATH': os.getenv('LLM_CACHE_SQLITE_PATH', str(BASE_DIR / 'cache' / 'llm_cache.sqlite3')),
+}
+
+# Configuração do orçamento de tokens das requisições à OpenAI (OpenAIService.simplify)
+# Sem `max_tokens` na requisição, a resposta recebe OUTPUT_RATIO (ou SUMMARY_OUTPUT_RATIO, com
+# resumo) tokens por token do texto, com um mínimo de MIN_OUTPUT_TOKENS. Textos que não cabem no
+# modelo são divididos em blocos (OVERFLOW='chunk') ou recusados antes da chamada ('refuse').
+TOKEN_BUDGET = {
+    'OVERFLOW': os.getenv('TOKEN_BUDGET_OVERFLOW', 'chunk'),
+    'OUTPUT_RATIO': float(os.getenv('TOKEN_BUDGET_OUTPUT_RATIO', 1.5)),
+    'SUMMARY_OUTPUT_RATIO': float(os.getenv('TOKEN_BUDGET_SUMMARY_OUTPUT_RATIO', 0.6)),
+    'MIN_OUTPUT_TOKENS': int(os.getenv('TOKEN_BUDGET_MIN_OUTPUT_TOKENS', 256)),
+}
+
+# Configuração da detecção de idioma (LanguageDetectionService)
+# Apenas os primeiros SAMPLE_CHARS caracteres são analisados, com semente fixa (resultado
+# determinístico) e memória de CACHE_ENTRIES resultados. A origem só é informada ao AWS Translate
+# se a amostra tiver pelo menos MIN_SAMPLE_CHARS caracteres e a probabilidade for de pelo menos
+# MIN_PROBABILITY; caso contrário, usa-se 'auto'.
+LANGUAGE_DETECTION = {
+    'SAMPLE_CHARS': int(os.getenv('LANGUAGE_DETECTION_SAMPLE_CHARS', 2000)),
+    'SEED': int(os.getenv('LANGUAGE_DETECTION_SEED', 0)),
+    'MIN_PROBABILITY': float(os.getenv('LANGUAGE_DETECTION_MIN_PROBABILITY', 0.8)),
+    'MIN_SAMPLE_CHARS': int(os.getenv('LANGUAGE_DETECTION_MIN_SAMPLE_CHARS', 40)),
+    'CACHE_ENTRIES': int(os.getenv('LANGUAGE_DETECTION_CACHE_ENTRIES', 4096)),
+}
+
+# Configuração da divisão de textos longos em blocos no pipeline de tradução
+TRANSLATION_CHUNKING = {
+    'MAX_CHUNK_BYTES': int(os.getenv('TRANSLATION_MAX_CHUNK_BYTES', 6000)),  # AWS aceita até 10000 bytes
+    'MAX_CHUNK_TOKENS': int(os.getenv('TRANSLATION_MAX_CHUNK_TOKENS', 0)),  # 0 = sem limite de tokens
+    'MAX_WORKERS': int(os.getenv('TRANSLATION_MAX_WORKERS', 4)),  # Blocos processados em paralelo
+}
+
+# Configuração da tradução em streaming (endpoint /translate/stream/)
+# O texto simplificado é enviado ao AWS Translate a cada parágrafo concluído ou, antes disso, a cada
+# grupo de sentenças com pelo menos MIN_SEGMENT_CHARS caracteres.
+STREAMING_TRANSLATION = {
+    'MIN_SEGMENT_CHARS': int(os.getenv('STREAMING_TRANSLATION_MIN_SEGMENT_CHARS', 200)),
+}
+
+# Configuração da tradução para vários idiomas (`target_languages` em /translate/ e /jobs/)
+# O texto é simplificado e avaliado uma vez; as traduções para cada idioma rodam em paralelo.
+# BLEU_TARGETS: 'all' (BLEU em todos os idiomas), 'first' (apenas no primeiro; nos demais, só se a
+# back-translation já estiver no cache) ou 'none'.
+MULTI_TARGET_TRANSLATION = {
+    'MAX_TARGETS': int(os.getenv('MULTI_TARGET_TRANSLATION_MAX_TARGETS', 10)),
+    'MAX_WORKERS': int(os.getenv('MULTI_TARGET_TRANSLATION_MAX_WORKERS', 8)),
+    'BLEU_TARGETS': os.getenv('MULTI_TARGET_TRANSLATION_BLEU_TARGETS', 'first'),
+}
+
+# Configuração da fila de tarefas assíncronas (endpoints /jobs/)
+# Com AUTOSTART, os workers rodam no próprio processo web; para um processo dedicado,
+# desative-o e execute `python manage.py run_job_workers`. Os workers devolvem à fila, a cada
+# REQUEUE_INTERVAL segundos, as tarefas sem atualização há STALE_AFTER segundos.
+JOB_QUEUE = {
+    'BROKER': os.getenv('JOB_QUEUE_BROKER', 'aws_translator_app.services.jobs.brokers.DatabaseBroker'),
+    'WORKERS': int(os.getenv('JOB_QUEUE_WORKERS', 2)),
+    'AUTOSTART': os.getenv('JOB_QUEUE_AUTOSTART', 'true').lower() == 'true',
+    'UPLOAD_DIR': os.getenv('JOB_QUEUE_UPLOAD_DIR', str(BASE_DIR / 'job_uploads')),
+    'STALE_AFTER': 15 * 60,  # segundos
+    'REQUEUE_INTERVAL': 60,  # segundos
+    'HEARTBEAT_INTERVAL': 60,  # segundos; as tarefas em execução renovam updated_at (veja STALE_AFTER)
+    'MAX_ATTEMPTS': 3,
+}
+
+# Configuração da tradução em lote (endpoint /translate/batch/)
+# Textos curtos de uma linha são agrupados (um por linha) em uma única chamada ao AWS Translate.
+# Com idioma de origem 'auto', o agrupamento só é feito se PACK_AUTO_SOURCE estiver ativo.
+BATCH_TRANSLATION = {
+    'MAX_TEXTS': int(os.getenv('BATCH_TRANSLATION_MAX_TEXTS', 500)),
+    'MAX_TARGETS': int(os.getenv('BATCH_TRANSLATION_MAX_TARGETS', 10)),
+    'MAX_CONCURRENCY': int(os.getenv('BATCH_TRANSLATION_MAX_CONCURRENCY', 8)),
+    'PACK_MAX_BYTES': 4500,
+    'PACK_MAX_ITEMS': 50,
+    'PACK_ITEM_MAX_BYTES': 500,
+    'PACK_AUTO_SOURCE': os.getenv('BATCH_TRANSLATION_PACK_AUTO_SOURCE', 'false').lower() == 'true',
+}
+
+# Configuração da avaliação de qualidade (BLEU Score por back-translation)
+# MODE: 'always', 'sampled' (fração SAMPLE_RATE), 'async' (em segundo plano, consultado em
+# /quality-scores/<id>/), 'local' (apenas com a back-translation em cache) ou 'off'.
+# O modo pode ser sobrescrito por requisição (campo `bleu_mode`).
+QUALITY_SCORING = {
+    'MODE': os.getenv('QUALITY_SCORING_MODE', 'always'),
+    'SAMPLE_RATE': float(os.getenv('QUALITY_SCORING_SAMPLE_RATE', 0.1)),
+    'ASYNC_WORKERS': int(os.getenv('QUALITY_SCORING_ASYNC_WORKERS', 2)),
+}
+
+# Configuração da importação de documentos (DocumentService)
+# PDFs com pelo menos PDF_PARALLEL_MIN_PAGES páginas têm a extração distribuída entre
+# PDF_WORKERS processos, em lotes de PDF_PAGES_PER_TASK páginas.
+DOCUMENT_IMPORT = {
+    'PDF_WORKERS': int(os.getenv('DOCUMENT_IMPORT_PDF_WORKERS', min(4, os.cpu_count() or 1))),
+    'PDF_PARALLEL_MIN_PAGES': int(os.getenv('DOCUMENT_IMPORT_PDF_PARALLEL_MIN_PAGES', 100)),
+    'PDF_PAGES_PER_TASK': 16,
+}
+
+# Configuração do cache de documentos exportados (/export-document/)
+# Os arquivos gerados ficam em DIRECTORY, endereçados pelo hash do texto, das métricas e do
+# formato; acima de MAX_BYTES (cota do diretório, compartilhada pelos processos que o usam), os
+# usados há mais tempo são removidos.
+EXPORT_CACHE = {
+    'ENABLED': os.getenv('EXPORT_CACHE_ENABLED', 'true').lower() == 'true',
+    'DIRECTORY': os.getenv('EXPORT_CACHE_DIRECTORY', str(BASE_DIR / 'cache' / 'exports')),
+    'MAX_BYTES': int(os.getenv('EXPORT_CACHE_MAX_BYTES', 256 * 1024 * 1024)),
+}
+
+# Configuração dos uploads de documentos
+# Arquivos acima de FILE_UPLOAD_MAX_MEMORY_SIZE são gravados em disco (FILE_UPLOAD_TEMP_DIR)
+# em vez de mantidos na memória. UPLOAD_LIMITS recusa envios acima de MAX_REQUEST_BYTES (413)
+# e envios que ultrapassariam MAX_INFLIGHT_BYTES em processamento simultâneo no processo (503).
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv('FILE_UPLOAD_MAX_MEMORY_SIZE', 2.5 * 1024 * 1024))
+FILE_UPLOAD_TEMP_DIR = os.getenv('FILE_UPLOAD_TEMP_DIR') or None
+UPLOAD_LIMITS = {
+    'MAX_REQUEST_BYTES': int(os.getenv('UPLOAD_MAX_REQUEST_BYTES', 100 * 1024 * 1024)),
+    'MAX_INFLIGHT_BYTES': int(os.getenv('UPLOAD_MAX_INFLIGHT_BYTES', 512 * 1024 * 1024)),
+    'RETRY_AFTER': 5,  # segundos
+}
+
+# Configuração das métricas (/metrics, formato do Prometheus)
+# Com ENABLED desativado, os tempos das etapas e os contadores não são registrados, o middleware
+# de métricas é removido e /metrics responde 404. BUCKETS são as faixas, em segundos, dos histogramas.
+METRICS = {
+    'ENABLED': os.getenv('METRICS_ENABLED', 'true').lower() == 'true',
+    'BUCKETS': [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0],
+}
@@ -22,7 +22,11 @@ from django.urls import path
 from django.contrib import admin
 from django.urls import path, include
 
+from aws_translator_app.views import MetricsView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('aws_translator_app.urls')),
+    # Sem barra final: é o caminho padrão dos scrapers do Prometheus
+    path('metrics', MetricsView.as_view(), name='metrics'),
 ]
@@ -1,3 +1,31 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Glossary, Job, QualityScore, TranslationMemoryEntry
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'status', 'document_name', 'attempts', 'created_at', 'finished_at')
+    list_filter = ('status',)
+    readonly_fields = ('created_at', 'updated_at', 'started_at', 'finished_at')
+
+
+@admin.register(QualityScore)
+class QualityScoreAdmin(admin.ModelAdmin):
+    list_display = ('id', 'status', 'bleu_score', 'source_language_code', 'target_language_code', 'created_at')
+    list_filter = ('status',)
+
+
+@admin.register(TranslationMemoryEntry)
+class TranslationMemoryEntryAdmin(admin.ModelAdmin):
+    list_display = ('source_text', 'source_language_code', 'target_language_code', 'hits', 'last_used_at')
+    list_filter = ('source_language_code', 'target_language_code')
+    search_fields = ('source_text', 'translated_text')
+    readonly_fields = ('source_hash', 'created_at', 'last_used_at')
+
+
+@admin.register(Glossary)
+class GlossaryAdmin(admin.ModelAdmin):
+    list_display = ('speciality', 'source_language_code', 'name', 'term_count', 'updated_at')
+    list_filter = ('speciality', 'source_language_code')
+    readonly_fields = ('term_count', 'created_at', 'updated_at')
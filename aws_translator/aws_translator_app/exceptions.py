@@ -1,6 +1,6 @@
 # aws_translator_app/exceptions.py
 
-from ratelimit.exceptions import Ratelimited
+from django_ratelimit.exceptions import Ratelimited
 from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from rest_framework import status
@@ -0,0 +1,414 @@
+# aws_translator_app/instrumentation.py
+
+"""
+Instrumentation Module
+======================
+
+Este módulo mede o tempo de cada etapa do pipeline de tradução e expõe as métricas do processo
+no formato de exposição do Prometheus (endpoint `/metrics`), sem dependências externas.
+
+Métricas registradas durante as requisições:
+
+- `translator_stage_seconds` (histograma, por `stage`, `model` e `target_language`): tempo de cada
+  etapa. Etapas: `glossary` (proteção dos termos), `simplify` (por bloco, inclusive cache e divisão
+  por orçamento de tokens), `openai` (chamada à OpenAI, com retries), `translate` (por bloco,
+  inclusive memória de tradução e cache), `aws_translate` (chamada à AWS, com retries),
+  `readability` e `bleu` (avaliação, inclusive back-translation). O tempo total de cada requisição
+  fica em `translator_http_request_seconds`.
+- `translator_stage_errors_total` (contador, por `stage` e `error`): exceções em cada etapa.
+- `translator_upstream_characters_total` e `translator_openai_tokens_total` (contadores):
+  caracteres enviados aos serviços externos e tokens consumidos na OpenAI.
+- `translator_http_requests_total` e `translator_http_request_seconds`: requisições por endpoint
+  (`MetricsMiddleware`). Nas respostas em streaming, o tempo medido vai até o envio dos cabeçalhos.
+
+Métricas lidas no momento da coleta (sem custo durante as requisições): retries, falhas, prazos
+esgotados e estado do circuit breaker de cada serviço externo (`ResiliencePolicy.stats`) e acertos e
+falhas dos caches de tradução e da OpenAI, da memória de tradução e da detecção de idioma.
+
+Com `METRICS['ENABLED']` desativado, `stage_timer` devolve um gerenciador de contexto vazio,
+os contadores não são atualizados, o middleware é removido da cadeia e `/metrics` responde 404.
+
+Classes:
+    Counter: Contador com rótulos.
+    Histogram: Histograma com rótulos e faixas (buckets) fixas.
+    MetricFamily: Métrica lida no momento da coleta.
+    MetricsMiddleware: Conta e mede as requisições HTTP por endpoint.
+
+Funções:
+    metrics_enabled() ⇾ bool:
+        Indica se a instrumentação está ativa.
+    stage_timer(stage: str, model: str, target_language: str):
+        Gerenciador de contexto que mede uma etapa.
+    timed(stage: str):
+        Decorator que mede uma função como uma etapa.
+    count_characters(upstream: str, text: str, target_language: str) ⇾ None:
+        Conta os caracteres enviados a um serviço externo.
+    count_tokens(model: str, usage: dict) ⇾ None:
+        Conta os tokens consumidos em uma chamada à OpenAI.
+    render_metrics() ⇾ str:
+        Gera o texto do endpoint `/metrics`.
+
+Configurações (settings.METRICS):
+    - ENABLED (bool): Ativa a instrumentação.
+    - BUCKETS (List[float]): Faixas, em segundos, dos histogramas de tempo.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.instrumentation import stage_timer
+    >>> with stage_timer('simplify', model='gpt-4o-mini'):
+    ...     ...
+"""
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_enabled: Optional[bool] = None
+
+
+def metrics_enabled() -> bool:
+    """
+    Indica se a instrumentação está ativa (`METRICS['ENABLED']`, lido uma vez por processo).
+    """
+    global _enabled
+    if _enabled is None:
+        _enabled = bool(getattr(settings, 'METRICS', {}).get('ENABLED', True))
+    return _enabled
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    labels = [f'{name}="{_escape(value)}"' for name, value in labels]
+    return '{' + ','.join(labels) + '}' if labels else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    Contador monotônico com rótulos.
+
+    Métodos:
+        inc(amount: float = 1, **labels) ⇾ None: Incrementa o contador dos rótulos informados.
+    """
+
+    type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f'{self.name}_total{_format_labels(zip(self.labelnames, key))} {_format_value(value)}'
+            for key, value in values
+        ]
+
+
+class Histogram:
+    """
+    Histograma com rótulos e faixas fixas.
+
+    Métodos:
+        observe(value: float, **labels) ⇾ None: Registra uma observação para os rótulos informados.
+    """
+
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Por rótulos: [contagem por faixa (não acumulada, com +Inf ao final), soma, total]
+        self._values: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = [(key, list(counts), total, count) for key, (counts, total, count) in self._values.items()]
+        lines = []
+        for key, counts, total, count in values:
+            labels = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                lines.append(
+                    f'{self.name}_bucket{_format_labels(labels + [("le", _format_value(bound))])} {cumulative}'
+                )
+            lines.append(f'{self.name}_sum{_format_labels(labels)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_format_labels(labels)} {count}')
+        return lines
+
+
+class MetricFamily(NamedTuple):
+    """
+    Métrica lida no momento da coleta a partir das estatísticas de um serviço.
+
+    Atributos:
+        name (str): Nome da métrica (com o sufixo `_total`, nos contadores).
+        type (str): `counter` ou `gauge`.
+        documentation (str): Descrição da métrica.
+        samples (List[Tuple[dict, float]]): Rótulos e valor de cada série.
+    """
+    name: str
+    type: str
+    documentation: str
+    samples: List[Tuple[dict, float]]
+
+    def render(self) -> List[str]:
+        return [f'{self.name}{_format_labels(labels.items())} {_format_value(value)}' for labels, value in self.samples]
+
+
+def _buckets() -> Sequence[float]:
+    return tuple(getattr(settings, 'METRICS', {}).get('BUCKETS', DEFAULT_BUCKETS))
+
+
+STAGE_SECONDS = Histogram(
+    'translator_stage_seconds', 'Tempo de cada etapa do pipeline de tradução, em segundos.',
+    ('stage', 'model', 'target_language'), _buckets()
+)
+STAGE_ERRORS = Counter(
+    'translator_stage_errors', 'Exceções em cada etapa do pipeline de tradução.', ('stage', 'error')
+)
+UPSTREAM_CHARACTERS = Counter(
+    'translator_upstream_characters', 'Caracteres enviados aos serviços externos.', ('upstream', 'target_language')
+)
+OPENAI_TOKENS = Counter(
+    'translator_openai_tokens', 'Tokens consumidos nas chamadas à OpenAI (informados pela API).', ('model', 'kind')
+)
+HTTP_REQUESTS = Counter(
+    'translator_http_requests', 'Requisições HTTP por endpoint, método e status.', ('endpoint', 'method', 'status')
+)
+HTTP_SECONDS = Histogram(
+    'translator_http_request_seconds', 'Tempo das requisições HTTP por endpoint, em segundos.',
+    ('endpoint',), _buckets()
+)
+
+REGISTRY = [STAGE_SECONDS, STAGE_ERRORS, UPSTREAM_CHARACTERS, OPENAI_TOKENS, HTTP_REQUESTS, HTTP_SECONDS]
+
+
+class _StageTimer:
+    __slots__ = ('stage', 'model', 'target_language', 'started')
+
+    def __init__(self, stage: str, model: str, target_language: str):
+        self.stage = stage
+        self.model = model
+        self.target_language = target_language
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        STAGE_SECONDS.observe(
+            time.perf_counter() - self.started,
+            stage=self.stage, model=self.model, target_language=self.target_language
+        )
+        # GeneratorExit: o cliente do streaming desconectou, não é um erro da etapa
+        if exc_type is not None and exc_type is not GeneratorExit:
+            STAGE_ERRORS.inc(stage=self.stage, error=exc_type.__name__)
+        return False
+
+
+_NOOP_TIMER = nullcontext()
+
+
+def stage_timer(stage: str, model: str = '', target_language: str = ''):
+    """
+    Retorna um gerenciador de contexto que registra o tempo (e as exceções) de uma etapa.
+
+    Parâmetros:
+        stage (str): Nome da etapa.
+        model (str): Modelo da OpenAI, se houver.
+        target_language (str): Idioma de destino, se houver.
+    """
+    if not metrics_enabled():
+        return _NOOP_TIMER
+    return _StageTimer(stage, model, target_language)
+
+
+def timed(stage: str) -> Callable:
+    """
+    Decorator que registra o tempo de cada chamada da função como a etapa `stage` (sem rótulos).
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage_timer(stage):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count_characters(upstream: str, text: str, target_language: str = '') -> None:
+    if metrics_enabled():
+        UPSTREAM_CHARACTERS.inc(len(text), upstream=upstream, target_language=target_language)
+
+
+def count_tokens(model: str, usage: dict) -> None:
+    if metrics_enabled():
+        for kind in ('prompt_tokens', 'completion_tokens'):
+            if usage.get(kind):
+                OPENAI_TOKENS.inc(usage[kind], model=model, kind=kind.replace('_tokens', ''))
+
+
+class MetricsMiddleware:
+    """
+    Conta e mede as requisições HTTP pelo nome da rota (`url_name`). Compatível com views
+    síncronas e assíncronas; removido da cadeia quando a instrumentação está desativada.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not metrics_enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self._acall(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self._record(request, response, started)
+        return response
+
+    async def _acall(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self._record(request, response, started)
+        return response
+
+    @staticmethod
+    def _record(request, response, started: float) -> None:
+        match = getattr(request, 'resolver_match', None)
+        endpoint = match.url_name if match is not None and match.url_name else 'unmatched'
+        HTTP_SECONDS.observe(time.perf_counter() - started, endpoint=endpoint)
+        HTTP_REQUESTS.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+
+
+def _cache_families(caches: Dict[str, dict]) -> List[MetricFamily]:
+    return [
+        MetricFamily('translator_cache_hits_total', 'counter', 'Acertos dos caches do processo.',
+                     [({'cache': name}, stats.get('hits', 0)) for name, stats in caches.items()]),
+        MetricFamily('translator_cache_misses_total', 'counter', 'Falhas dos caches do processo.',
+                     [({'cache': name}, stats.get('misses', 0)) for name, stats in caches.items()]),
+        MetricFamily('translator_cache_hit_ratio', 'gauge', 'Taxa de acertos dos caches do processo.',
+                     [({'cache': name}, stats.get('hit_rate', 0.0)) for name, stats in caches.items()]),
+    ]
+
+
+def collect_service_metrics() -> List[MetricFamily]:
+    """
+    Lê as estatísticas já mantidas pelos serviços (resiliência, caches, memória de tradução e
+    detecção de idioma) no momento da coleta.
+    """
+    # Importados aqui: os serviços importam este módulo para registrar os tempos das etapas
+    from aws_translator_app.services.api.resilience import resilience_stats
+    from aws_translator_app.services.cache.llm_cache import get_llm_cache
+    from aws_translator_app.services.cache.translation_cache import get_translation_cache
+    from aws_translator_app.services.language import language_detection_service
+    from aws_translator_app.services.pipeline.translation_memory_service import get_translation_memory_stats
+
+    policies = resilience_stats()
+    families = [
+        MetricFamily(f'translator_upstream_{counter}_total', 'counter', documentation, [
+            ({'upstream': name}, stats.get(counter, 0)) for name, stats in policies.items()
+        ])
+        for counter, documentation in (
+            ('calls', 'Chamadas aos serviços externos (antes dos retries).'),
+            ('retries', 'Novas tentativas após falhas temporárias.'),
+            ('failures', 'Tentativas que falharam.'),
+            ('deadline_exceeded', 'Chamadas interrompidas pelo prazo total.'),
+            ('hedged', 'Chamadas duplicadas por hedging.'),
+        )
+    ]
+    families.append(MetricFamily(
+        'translator_upstream_circuit_open', 'gauge', 'Circuit breaker aberto ou em teste (1), ou fechado (0).',
+        [({'upstream': name}, 0 if stats['circuit']['state'] == 'closed' else 1) for name, stats in policies.items()]
+    ))
+    families.append(MetricFamily(
+        'translator_upstream_rejected_calls_total', 'counter', 'Chamadas recusadas com o circuit breaker aberto.',
+        [({'upstream': name}, stats['circuit'].get('rejected_calls', 0)) for name, stats in policies.items()]
+    ))
+
+    memory = get_translation_memory_stats()
+    caches = {
+        'translation': get_translation_cache().stats(),
+        'llm': get_llm_cache().stats(),
+        'translation_memory': {
+            'hits': memory['exact_hits'],
+            'misses': memory['translated_segments'],
+            'hit_rate': memory['hit_rate'],
+        },
+    }
+    # O detector carrega os perfis de idioma ao ser criado: só é lido se já estiver em uso
+    detector = language_detection_service._language_detection_service
+    if detector is not None:
+        caches['language_detection'] = detector.stats()
+    families.extend(_cache_families(caches))
+    families.append(MetricFamily(
+        'translator_translation_memory_reused_characters_total', 'counter',
+        'Caracteres reaproveitados da memória de tradução (não enviados à AWS).',
+        [({}, memory['reused_chars'])]
+    ))
+    return families
+
+
+def render_metrics() -> str:
+    """
+    Gera o texto do endpoint `/metrics` (formato de exposição do Prometheus, versão 0.0.4).
+    """
+    lines = []
+    for metric in REGISTRY:
+        name = metric.name if metric.type != 'counter' else f'{metric.name}_total'
+        lines.append(f'# HELP {name} {metric.documentation}')
+        lines.append(f'# TYPE {name} {metric.type}')
+        lines.extend(metric.render())
+    for family in collect_service_metrics():
+        lines.append(f'# HELP {family.name} {family.documentation}')
+        lines.append(f'# TYPE {family.name} {family.type}')
+        lines.extend(family.render())
+    return '\n'.join(lines) + '\n'
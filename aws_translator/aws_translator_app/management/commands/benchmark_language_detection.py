@@ -0,0 +1,63 @@
+# aws_translator_app/management/commands/benchmark_language_detection.py
+
+import time
+
+import langdetect
+from django.core.management.base import BaseCommand
+
+from aws_translator_app.services.language.language_detection_service import LanguageDetectionService
+
+SAMPLE_TEXT = (
+    "O pipeline de tradução simplifica documentos técnicos antes de traduzi-los. As métricas de "
+    "legibilidade são calculadas para o texto original e para o texto simplificado, de modo que "
+    "o usuário possa comparar o quanto o resultado ficou mais fácil de ler. Textos jurídicos e "
+    "médicos frequentemente contêm frases extraordinariamente longas e terminologia especializada.\n\n"
+)
+
+
+class Command(BaseCommand):
+    help = 'Compara o tempo de langdetect.detect no texto inteiro com o do LanguageDetectionService.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chars', type=int, default=100000, help='Tamanho do texto gerado (padrão: 100000).')
+        parser.add_argument('--repeat', type=int, default=5, help='Número de repetições (padrão: 5).')
+        parser.add_argument('--file', default=None, help='Arquivo de texto (UTF-8) a ser usado no lugar do texto gerado.')
+
+    def handle(self, *args, **options):
+        if options['file']:
+            with open(options['file'], encoding='utf-8') as handle:
+                text = handle.read()
+        else:
+            text = (SAMPLE_TEXT * (options['chars'] // len(SAMPLE_TEXT) + 1))[:options['chars']]
+        repeat = options['repeat']
+
+        self.stdout.write(f'Texto: {len(text)} caracteres, repetições: {repeat}')
+
+        # A primeira chamada do langdetect carrega os perfis; fica fora da medição, como no serviço
+        langdetect.detect('warm up')
+        legacy_times, legacy_results = [], set()
+        for _ in range(repeat):
+            started = time.perf_counter()
+            legacy_results.add(langdetect.detect(text))
+            legacy_times.append(time.perf_counter() - started)
+
+        service = LanguageDetectionService(cache_entries=0)
+        sampled_times, sampled_results = [], set()
+        for _ in range(repeat):
+            started = time.perf_counter()
+            sampled_results.add(service.detect(text))
+            sampled_times.append(time.perf_counter() - started)
+
+        service = LanguageDetectionService()
+        service.detect(text)
+        started = time.perf_counter()
+        service.detect(text)
+        memoized = time.perf_counter() - started
+
+        legacy_best, sampled_best = min(legacy_times), min(sampled_times)
+        self.stdout.write(f'langdetect.detect (texto inteiro): {legacy_best * 1000:10.2f} ms  {sorted(legacy_results)}')
+        self.stdout.write(
+            f'Serviço (amostra):                 {sampled_best * 1000:10.2f} ms  {sorted(sampled_results)} '
+            f'({legacy_best / sampled_best:.1f}x)'
+        )
+        self.stdout.write(f'Serviço (memorizado):              {memoized * 1000:10.3f} ms')
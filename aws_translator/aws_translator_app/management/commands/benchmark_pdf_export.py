@@ -0,0 +1,108 @@
+# aws_translator_app/management/commands/benchmark_pdf_export.py
+
+import os
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+from PyPDF2 import PdfReader
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+from aws_translator_app.services.document_service import DocumentService
+from aws_translator_app.services.pdf_layout_engine import PdfLayoutEngine
+
+SAMPLE_PARAGRAPH = (
+    "O pipeline de tradução simplifica documentos técnicos antes de traduzi-los. As métricas de "
+    "legibilidade são calculadas para o texto original e para o texto simplificado, de modo que "
+    "o usuário possa comparar o quanto o resultado ficou mais fácil de ler. Textos jurídicos e "
+    "médicos frequentemente contêm frases extraordinariamente longas e terminologia especializada."
+)
+
+# Linhas de corpo por página no layout padrão (Letter, margens de 50 pt, Helvetica 12)
+LINES_PER_PAGE = 48
+
+
+def legacy_export_pdf(text: str, file_path: str) -> None:
+    # Quebra de linhas da versão anterior de DocumentService._export_pdf (apenas o corpo do texto)
+    c = canvas.Canvas(file_path, pagesize=letter)
+    width, height = letter
+    text_object = c.beginText(50, height - 50)
+    text_object.setFont("Helvetica-Bold", 14)
+    text_object.textLine("Texto Simplificado e Traduzido:")
+    text_object.setFont("Helvetica", 12)
+    text_object.textLine("")
+    for line in text.split('\n'):
+        words = line.split(' ')
+        line_buffer = ""
+        for word in words:
+            if c.stringWidth(line_buffer + word, "Helvetica", 12) < (width - 100):
+                line_buffer += word + " "
+            else:
+                text_object.textLine(line_buffer.strip())
+                line_buffer = word + " "
+                if text_object.getY() <= 50:
+                    c.drawText(text_object)
+                    c.showPage()
+                    text_object = c.beginText(50, height - 50)
+                    text_object.setFont("Helvetica", 12)
+        if line_buffer:
+            text_object.textLine(line_buffer.strip())
+            if text_object.getY() <= 50:
+                c.drawText(text_object)
+                c.showPage()
+                text_object = c.beginText(50, height - 50)
+                text_object.setFont("Helvetica", 12)
+    c.drawText(text_object)
+    c.save()
+
+
+class Command(BaseCommand):
+    help = 'Compara o tempo de exportação de PDFs do PdfLayoutEngine com o da quebra de linhas anterior.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', type=int, default=500, help='Número aproximado de páginas (padrão: 500).')
+        parser.add_argument('--repeat', type=int, default=3, help='Número de repetições (padrão: 3).')
+        parser.add_argument('--paragraph-words', type=int, default=400,
+                            help='Palavras por parágrafo; parágrafos longos acentuam o custo quadrático (padrão: 400).')
+
+    def handle(self, *args, **options):
+        words = SAMPLE_PARAGRAPH.split()
+        paragraph = ' '.join(words[index % len(words)] for index in range(options['paragraph_words']))
+        lines_per_paragraph = len(PdfLayoutEngine().wrap(paragraph, 'Helvetica', 12))
+        paragraphs = max(1, options['pages'] * LINES_PER_PAGE // lines_per_paragraph)
+        text = '\n'.join(paragraph for _ in range(paragraphs))
+        repeat = options['repeat']
+
+        self.stdout.write(f'Texto: {len(text)} caracteres, {paragraphs} parágrafos, repetições: {repeat}')
+
+        with tempfile.TemporaryDirectory() as directory:
+            legacy_path = os.path.join(directory, 'legacy.pdf')
+            engine_path = os.path.join(directory, 'engine.pdf')
+
+            legacy_times, engine_times, layout_times = [], [], []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                legacy_export_pdf(text, legacy_path)
+                legacy_times.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                DocumentService._export_pdf(text, engine_path)
+                engine_times.append(time.perf_counter() - started)
+
+                # Apenas quebra de linhas e paginação, sem o desenho e a gravação do PDF
+                started = time.perf_counter()
+                engine = PdfLayoutEngine()
+                engine.paginate(engine.paragraphs(text))
+                layout_times.append(time.perf_counter() - started)
+
+            legacy_pages = len(PdfReader(legacy_path).pages)
+            engine_pages = len(PdfReader(engine_path).pages)
+
+        legacy_best, engine_best, layout_best = min(legacy_times), min(engine_times), min(layout_times)
+        self.stdout.write(f'Versão anterior:          {legacy_best * 1000:10.1f} ms  ({legacy_pages} páginas)')
+        self.stdout.write(
+            f'PdfLayoutEngine:          {engine_best * 1000:10.1f} ms  ({engine_pages} páginas, '
+            f'{legacy_best / engine_best:.1f}x)'
+        )
+        self.stdout.write(f'  (quebra e paginação:    {layout_best * 1000:10.1f} ms)')
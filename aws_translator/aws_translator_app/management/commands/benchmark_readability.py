@@ -0,0 +1,92 @@
+# aws_translator_app/management/commands/benchmark_readability.py
+
+import time
+import warnings
+
+import textstat
+from django.core.management.base import BaseCommand
+
+from aws_translator_app.services.language.readability_context import get_readability_context
+from aws_translator_app.services.language.readability_engine import ReadabilityEngine
+
+SAMPLE_TEXT = (
+    "The translation pipeline simplifies technical documents before translating them. "
+    "Readability metrics are computed for both the original and the simplified text, "
+    "so that users can compare how much easier the result is to read. "
+    "Legal and medical texts frequently contain extraordinarily long sentences, "
+    "specialized terminology and nested clauses! Does simplification really help? "
+    "In most cases it does, especially for non-specialist readers.\n\n"
+)
+
+TEXTSTAT_FUNCTIONS = {
+    'flesch_reading_ease': textstat.flesch_reading_ease,
+    'flesch_kincaid_grade': textstat.flesch_kincaid_grade,
+    'smog_index': textstat.smog_index,
+    'coleman_liau_index': textstat.coleman_liau_index,
+    'automated_readability_index': textstat.automated_readability_index,
+    'dale_chall_readability_score': textstat.dale_chall_readability_score,
+}
+
+
+class Command(BaseCommand):
+    help = 'Compara o tempo e os resultados do ReadabilityEngine com as seis funções do textstat.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chars', type=int, default=100000, help='Tamanho do texto gerado (padrão: 100000).')
+        parser.add_argument('--repeat', type=int, default=3, help='Número de repetições (padrão: 3).')
+        parser.add_argument('--language', default='en', help='Código do idioma (padrão: en).')
+        parser.add_argument('--file', default=None, help='Arquivo de texto (UTF-8) a ser usado no lugar do texto gerado.')
+        parser.add_argument('--tolerance', type=float, default=0.01, help='Diferença máxima aceita por métrica.')
+
+    def handle(self, *args, **options):
+        warnings.simplefilter('ignore')
+        if options['file']:
+            with open(options['file'], encoding='utf-8') as handle:
+                text = handle.read()
+        else:
+            text = (SAMPLE_TEXT * (options['chars'] // len(SAMPLE_TEXT) + 1))[:options['chars']]
+        language_code = options['language']
+        repeat = options['repeat']
+
+        self.stdout.write(f'Texto: {len(text)} caracteres, idioma: {language_code}, repetições: {repeat}')
+
+        textstat_times = []
+        for _ in range(repeat):
+            # set_lang limpa os caches internos do textstat, para medir o custo real de cada chamada
+            textstat.set_lang(language_code)
+            started = time.perf_counter()
+            expected = {name: function(text) for name, function in TEXTSTAT_FUNCTIONS.items()}
+            textstat_times.append(time.perf_counter() - started)
+
+        context = get_readability_context(language_code)
+        cold_times, warm_times = [], []
+        for _ in range(repeat):
+            # Um motor novo começa sem palavras memorizadas (apenas as sílabas pré-calculadas do contexto)
+            engine = ReadabilityEngine(context)
+            started = time.perf_counter()
+            engine.calculate(text)
+            cold_times.append(time.perf_counter() - started)
+            started = time.perf_counter()
+            result = engine.calculate(text)
+            warm_times.append(time.perf_counter() - started)
+
+        textstat_best, cold_best, warm_best = min(textstat_times), min(cold_times), min(warm_times)
+        self.stdout.write(f'textstat (6 funções):       {textstat_best * 1000:10.1f} ms')
+        self.stdout.write(
+            f'ReadabilityEngine (frio):   {cold_best * 1000:10.1f} ms  ({textstat_best / cold_best:.1f}x)'
+        )
+        self.stdout.write(
+            f'ReadabilityEngine (quente): {warm_best * 1000:10.1f} ms  ({textstat_best / warm_best:.1f}x)'
+        )
+
+        mismatches = 0
+        for name, value in expected.items():
+            difference = abs(value - result[name])
+            if difference > options['tolerance']:
+                mismatches += 1
+            self.stdout.write(f'  {name:30} textstat={value:10.2f}  engine={result[name]:10.2f}  diff={difference:.4f}')
+
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f'{mismatches} métrica(s) fora da tolerância.'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Todas as métricas dentro da tolerância.'))
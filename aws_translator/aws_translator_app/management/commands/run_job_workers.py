@@ -0,0 +1,30 @@
+# aws_translator_app/management/commands/run_job_workers.py
+
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from aws_translator_app.services.jobs.job_service import WorkerPool
+
+
+class Command(BaseCommand):
+    help = 'Executa o pool de workers da fila de tarefas de tradução em um processo dedicado.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=None,
+            help='Número de threads de worker (padrão: JOB_QUEUE["WORKERS"]).'
+        )
+
+    def handle(self, *args, **options):
+        pool = WorkerPool(workers=options['workers'])
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+        pool.start()
+        self.stdout.write(self.style.SUCCESS(f'{pool.workers} worker(s) aguardando tarefas.'))
+        stop.wait()
+        self.stdout.write('Finalizando os workers...')
+        pool.stop()
@@ -0,0 +1,103 @@
+# aws_translator_app/metadata.py
+
+"""
+Metadata Payloads Module
+========================
+
+Este módulo pré-calcula as respostas dos endpoints de metadados (`/languages/`, `/specialities/`,
+`/styles/`, `/complexity-levels/`, `/models/` e o combinado `/metadata/`).
+
+As listas vêm de `constants.py` e não mudam enquanto o processo está no ar, por isso o JSON de
+cada endpoint é serializado uma única vez, na importação do módulo (ao carregar as URLs), junto
+com um ETag forte (hash do conteúdo). As views apenas devolvem os bytes prontos, respondem 304
+quando o cliente já tem a versão atual (`If-None-Match`) e permitem o cache no navegador por
+`METADATA['MAX_AGE']` segundos.
+
+Classes:
+    MetadataPayload: Corpo serializado e ETag de um endpoint.
+
+Funções:
+    build_metadata() ⇾ dict:
+        Monta as listas de metadados a partir de `constants.py`.
+    etag_matches(if_none_match: str, etag: str) ⇾ bool:
+        Indica se o cabeçalho `If-None-Match` corresponde ao ETag.
+
+Instâncias:
+    METADATA_PAYLOADS (Dict[str, MetadataPayload]): As respostas de cada endpoint, por nome.
+
+Configurações (settings.METADATA):
+    - MAX_AGE (int): Tempo, em segundos, que o navegador pode reutilizar a resposta sem revalidá-la.
+"""
+
+import hashlib
+import json
+from typing import Dict, NamedTuple
+
+from .constants import LANGUAGES, SPECIALITIES, STYLES, COMPLEXITY_LEVELS, AVAILABLE_MODELS
+
+
+class MetadataPayload(NamedTuple):
+    """
+    Resposta pré-calculada de um endpoint de metadados.
+
+    Atributos:
+        body (bytes): O JSON da resposta, em UTF-8.
+        etag (str): ETag forte (entre aspas) derivado do conteúdo.
+    """
+    body: bytes
+    etag: str
+
+
+def build_metadata() -> dict:
+    """
+    Monta as listas de metadados, no mesmo formato das respostas anteriores de cada endpoint.
+
+    Retorna:
+        dict: `languages`, `specialities`, `styles`, `complexity_levels` e `models`.
+    """
+    return {
+        'languages': [{'name': name, 'code': code} for name, code in LANGUAGES.items()],
+        'specialities': [{'name': name, 'value': value} for name, value in SPECIALITIES.items()],
+        'styles': [{'name': name, 'value': value} for name, value in STYLES.items()],
+        'complexity_levels': [{'name': name, 'value': value} for name, value in COMPLEXITY_LEVELS.items()],
+        'models': [{'name': model} for model in AVAILABLE_MODELS],
+    }
+
+
+def _payload(data) -> MetadataPayload:
+    # Mesma serialização do JSONRenderer do DRF (UTF-8, sem espaços)
+    body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return MetadataPayload(body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def _build_payloads() -> Dict[str, MetadataPayload]:
+    metadata = build_metadata()
+    payloads = {name: _payload(data) for name, data in metadata.items()}
+    payloads['metadata'] = _payload(metadata)
+    return payloads
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Compara o cabeçalho `If-None-Match` com o ETag da resposta.
+
+    Segue a comparação fraca da RFC 9110 (o prefixo `W/` é ignorado), exigida para `If-None-Match`;
+    `*` corresponde a qualquer ETag.
+
+    Parâmetros:
+        if_none_match (str): O valor do cabeçalho (uma lista de ETags separados por vírgula).
+        etag (str): O ETag da resposta, entre aspas.
+
+    Retorna:
+        bool: True se o cliente já tem a versão atual.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+METADATA_PAYLOADS = _build_payloads()
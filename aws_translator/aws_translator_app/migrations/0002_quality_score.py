@@ -0,0 +1,30 @@
+# Generated by Django 5.1.3 on 2026-10-18 00:16
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aws_translator_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QualityScore',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', 'Pendente'), ('succeeded', 'Concluído'), ('failed', 'Falhou')], default='pending', max_length=16)),
+                ('source_language_code', models.CharField(blank=True, max_length=16)),
+                ('target_language_code', models.CharField(blank=True, max_length=16)),
+                ('bleu_score', models.FloatField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.3 on 2026-10-18 00:45
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aws_translator_app', '0002_quality_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationMemoryEntry',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('source_language_code', models.CharField(max_length=16)),
+                ('target_language_code', models.CharField(max_length=16)),
+                ('source_hash', models.CharField(max_length=64)),
+                ('source_text', models.TextField()),
+                ('translated_text', models.TextField()),
+                ('detected_language_code', models.CharField(blank=True, max_length=16)),
+                ('hits', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('source_language_code', 'target_language_code', 'source_hash'), name='unique_translation_memory_segment')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TranslationMemoryBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(db_index=True, max_length=32)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bands', to='aws_translator_app.translationmemoryentry')),
+            ],
+        ),
+    ]
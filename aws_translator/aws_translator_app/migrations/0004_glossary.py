@@ -0,0 +1,41 @@
+# Generated by Django 5.1.3 on 2026-10-18 00:48
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aws_translator_app', '0003_translation_memory'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Glossary',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('speciality', models.CharField(max_length=100)),
+                ('source_language_code', models.CharField(max_length=16)),
+                ('name', models.CharField(blank=True, max_length=255)),
+                ('target_language_codes', models.JSONField(default=list)),
+                ('term_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['speciality', 'source_language_code'],
+                'constraints': [models.UniqueConstraint(fields=('speciality', 'source_language_code'), name='unique_glossary_speciality')],
+            },
+        ),
+        migrations.CreateModel(
+            name='GlossaryTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_term', models.CharField(max_length=500)),
+                ('translations', models.JSONField(default=dict)),
+                ('glossary', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='aws_translator_app.glossary')),
+            ],
+        ),
+    ]
@@ -1,3 +1,169 @@
+import uuid
+
 from django.db import models
 
-# Create your models here.
+
+class Job(models.Model):
+    """
+    Tarefa assíncrona do pipeline de tradução.
+
+    Cada tarefa guarda os parâmetros da requisição (texto ou documento enviado), o progresso
+    de cada etapa, o resultado final e, em caso de falha, a mensagem de erro.
+    """
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pendente'),
+        (STATUS_RUNNING, 'Em execução'),
+        (STATUS_SUCCEEDED, 'Concluída'),
+        (STATUS_FAILED, 'Falhou'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True)
+    params = models.JSONField(default=dict)
+    document_path = models.CharField(max_length=500, blank=True)
+    document_name = models.CharField(max_length=255, blank=True)
+    progress = models.JSONField(default=dict)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    worker_id = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['created_at']
+
+    def __str__(self):
+        return f"Job {self.id} ({self.status})"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.STATUS_SUCCEEDED, self.STATUS_FAILED)
+
+
+class QualityScore(models.Model):
+    """
+    BLEU Score calculado em segundo plano (modo de avaliação `async`).
+
+    A resposta da tradução traz o identificador do registro; o score é gravado quando o cálculo
+    termina e pode ser consultado depois. Os textos não são armazenados, apenas o resultado.
+    """
+
+    STATUS_PENDING = 'pending'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pendente'),
+        (STATUS_SUCCEEDED, 'Concluído'),
+        (STATUS_FAILED, 'Falhou'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    source_language_code = models.CharField(max_length=16, blank=True)
+    target_language_code = models.CharField(max_length=16, blank=True)
+    bleu_score = models.FloatField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"QualityScore {self.id} ({self.status})"
+
+
+class TranslationMemoryEntry(models.Model):
+    """
+    Sentença traduzida guardada na memória de tradução.
+
+    A chave é o hash SHA-256 do texto normalizado da sentença, por par de idiomas; o idioma de
+    origem é o informado ao AWS Translate (inclusive `'auto'`), e o detectado pela AWS fica em
+    `detected_language_code`. As faixas (`bands`) do MinHash da sentença indexam a busca aproximada.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    source_language_code = models.CharField(max_length=16)
+    target_language_code = models.CharField(max_length=16)
+    source_hash = models.CharField(max_length=64)
+    source_text = models.TextField()
+    translated_text = models.TextField()
+    detected_language_code = models.CharField(max_length=16, blank=True)
+    hits = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['source_language_code', 'target_language_code', 'source_hash'],
+                name='unique_translation_memory_segment'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.source_language_code}→{self.target_language_code}: {self.source_text[:50]}"
+
+
+class TranslationMemoryBand(models.Model):
+    """
+    Faixa do MinHash de uma entrada da memória de tradução (índice LSH da busca aproximada).
+
+    Sentenças parecidas compartilham ao menos uma faixa com alta probabilidade; a similaridade
+    dos candidatos é confirmada depois, sobre o texto.
+    """
+
+    entry = models.ForeignKey(TranslationMemoryEntry, on_delete=models.CASCADE, related_name='bands')
+    key = models.CharField(max_length=32, db_index=True)
+
+    def __str__(self):
+        return self.key
+
+
+class Glossary(models.Model):
+    """
+    Glossário de uma especialidade (`SPECIALITIES`) para textos em um idioma de origem.
+
+    Cada termo traz suas traduções por idioma de destino; um termo sem tradução para um idioma é
+    mantido como está (termos que não devem ser traduzidos, como nomes de produtos). O glossário é
+    enviado de uma vez e substituído por inteiro a cada novo envio.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    speciality = models.CharField(max_length=100)
+    source_language_code = models.CharField(max_length=16)
+    name = models.CharField(max_length=255, blank=True)
+    target_language_codes = models.JSONField(default=list)
+    term_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['speciality', 'source_language_code']
+        constraints = [
+            models.UniqueConstraint(fields=['speciality', 'source_language_code'], name='unique_glossary_speciality'),
+        ]
+
+    def __str__(self):
+        return f"Glossary {self.speciality} ({self.source_language_code}, {self.term_count} termos)"
+
+
+class GlossaryTerm(models.Model):
+    """
+    Termo de um glossário e suas traduções (`{'en': 'habeas corpus', ...}`).
+    """
+
+    glossary = models.ForeignKey(Glossary, on_delete=models.CASCADE, related_name='terms')
+    source_term = models.CharField(max_length=500)
+    translations = models.JSONField(default=dict)
+
+    def __str__(self):
+        return self.source_term
@@ -16,3 +16,15 @@ class IsOwnerOrReadOnly(BasePermission):
 
         # Permite escrita apenas se o usuário for o dono do objeto
         return obj.owner == request.user
+
+
+class IsAdminOrReadOnly(BasePermission):
+    """
+    Permite leitura a qualquer pessoa e escrita apenas a administradores (`is_staff`).
+    Usada nos recursos compartilhados por todos os usuários, como os glossários.
+    """
+
+    def has_permission(self, request, view):
+        if request.method in SAFE_METHODS:
+            return True
+        return bool(request.user and request.user.is_staff)
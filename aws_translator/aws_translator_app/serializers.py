@@ -1,11 +1,21 @@
 # aws_translator_app/serializers.py
 
+from django.conf import settings
 from rest_framework import serializers
 
+from .constants import LANGUAGES, SPECIALITIES
+from .models import Glossary, Job, QualityScore
+from .services.cache.llm_cache import CACHE_MODES
+from .services.language.quality_scoring_service import BLEU_MODES
+
 
 class TranslateRequestSerializer(serializers.Serializer):
     text = serializers.CharField()
-    target_language = serializers.CharField()
+    # Um idioma (`target_language`) ou vários (`target_languages`, resposta agrupada por idioma)
+    target_language = serializers.CharField(required=False)
+    target_languages = serializers.ListField(
+        child=serializers.ChoiceField(choices=list(LANGUAGES.values())), required=False, allow_empty=False
+    )
     speciality = serializers.CharField()
     style = serializers.CharField()
     complexity_level = serializers.CharField()
@@ -15,19 +25,75 @@ class TranslateRequestSerializer(serializers.Serializer):
         child=serializers.CharField(), required=False, allow_empty=True
     )
     temperature = serializers.FloatField(default=0.8)
-    max_tokens = serializers.IntegerField(default=1500)
+    # Se omitido, o tamanho da resposta é derivado do tamanho do texto (TokenBudgeter)
+    max_tokens = serializers.IntegerField(required=False, allow_null=True, min_value=1)
+    cache = serializers.ChoiceField(choices=CACHE_MODES, default='bypass')
+    bleu_mode = serializers.ChoiceField(choices=BLEU_MODES, required=False)
+    # Com vários idiomas: quais recebem o BLEU Score no modo `bleu_mode` (veja TranslationPipeline.run_multi)
+    bleu_targets = serializers.ChoiceField(choices=['all', 'first', 'none'], required=False)
+
+    def validate(self, attrs):
+        if not attrs.get('target_language') and not attrs.get('target_languages'):
+            raise serializers.ValidationError(
+                'Informe um idioma de destino (`target_language`) ou uma lista (`target_languages`).'
+            )
+        if attrs.get('target_languages'):
+            attrs['target_languages'] = list(dict.fromkeys(attrs['target_languages']))
+            max_targets = getattr(settings, 'MULTI_TARGET_TRANSLATION', {}).get('MAX_TARGETS', 10)
+            if len(attrs['target_languages']) > max_targets:
+                raise serializers.ValidationError(
+                    {'target_languages': f'Máximo de {max_targets} idiomas de destino por requisição.'}
+                )
+        return attrs
 
 
 class TranslateResponseSerializer(serializers.Serializer):
     translated_text = serializers.CharField()
     metrics_original = serializers.DictField()
     metrics_simplified = serializers.DictField()
-    bleu_score = serializers.FloatField()
+    bleu_score = serializers.FloatField(allow_null=True)
+    bleu_mode = serializers.CharField(required=False)
+    quality_score_id = serializers.CharField(required=False)
     source_language_code = serializers.CharField()
+    chunks = serializers.ListField(child=serializers.DictField(), required=False)
+    token_usage = serializers.DictField(required=False)
+    # Presente quando a especialidade tem glossário no idioma do texto
+    glossary = serializers.DictField(required=False)
+
+
+class MultiTranslateResponseSerializer(serializers.Serializer):
+    # Por código de idioma: translated_text, source_language_code, bleu_score, bleu_mode e quality_score_id
+    translations = serializers.DictField(child=serializers.DictField())
+    metrics_original = serializers.DictField()
+    metrics_simplified = serializers.DictField()
+    chunks = serializers.ListField(child=serializers.DictField(), required=False)
+    token_usage = serializers.DictField(required=False)
+
+
+class BatchTranslateRequestSerializer(serializers.Serializer):
+    texts = serializers.ListField(child=serializers.CharField(trim_whitespace=False), allow_empty=False)
+    target_languages = serializers.ListField(
+        child=serializers.ChoiceField(choices=list(LANGUAGES.values())), allow_empty=False
+    )
+    source_language = serializers.CharField(default='auto')
+
+    def validate_texts(self, value):
+        max_texts = getattr(settings, 'BATCH_TRANSLATION', {}).get('MAX_TEXTS', 500)
+        if len(value) > max_texts:
+            raise serializers.ValidationError(f'Máximo de {max_texts} textos por lote.')
+        return value
+
+    def validate_target_languages(self, value):
+        max_targets = getattr(settings, 'BATCH_TRANSLATION', {}).get('MAX_TARGETS', 10)
+        if len(set(value)) > max_targets:
+            raise serializers.ValidationError(f'Máximo de {max_targets} idiomas de destino por lote.')
+        return value
 
 
 class ImportDocumentSerializer(serializers.Serializer):
     file = serializers.FileField()
+    # text: full text; pages: full text plus per-page list; stream: NDJSON, one line per page
+    output = serializers.ChoiceField(choices=['text', 'pages', 'stream'], default='text')
 
 
 class ExportDocumentSerializer(serializers.Serializer):
@@ -35,3 +101,49 @@ class ExportDocumentSerializer(serializers.Serializer):
     metrics_original = serializers.DictField()
     metrics_simplified = serializers.DictField()
     format = serializers.ChoiceField(choices=['pdf', 'docx', 'txt'])
+
+
+class JobCreateSerializer(TranslateRequestSerializer):
+    text = serializers.CharField(required=False)
+    file = serializers.FileField(required=False)
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        if not attrs.get('text') and not attrs.get('file'):
+            raise serializers.ValidationError('Informe um texto (`text`) ou um documento (`file`).')
+        return attrs
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'status', 'progress', 'error', 'document_name', 'attempts',
+            'created_at', 'updated_at', 'started_at', 'finished_at'
+        ]
+
+
+class QualityScoreSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = QualityScore
+        fields = [
+            'id', 'status', 'bleu_score', 'error', 'source_language_code', 'target_language_code',
+            'created_at', 'finished_at'
+        ]
+
+
+class GlossaryUploadSerializer(serializers.Serializer):
+    # CSV: source term, then one column per target language code (see GlossaryService.import_glossary)
+    file = serializers.FileField()
+    speciality = serializers.ChoiceField(choices=list(SPECIALITIES.values()))
+    source_language = serializers.ChoiceField(choices=list(LANGUAGES.values()))
+    name = serializers.CharField(required=False, allow_blank=True, default='')
+
+
+class GlossarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Glossary
+        fields = [
+            'id', 'speciality', 'source_language_code', 'name', 'target_language_codes', 'term_count',
+            'created_at', 'updated_at'
+        ]
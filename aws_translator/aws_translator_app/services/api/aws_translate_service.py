@@ -13,16 +13,26 @@ Classes:
 
 Dependências:
     - boto3: biblioteca da AWS para interagir com os serviços da AWS.
-    - dotenv: biblioteca para carregar variáveis de ambiente a partir de um arquivo .env.
-    - os: biblioteca padrão para interagir com o sistema operacional.
+    - services.api.client_registry: para obter o cliente AWS Translate compartilhado pelo processo.
+    - services.api.resilience: para o retry, o prazo total, o circuit breaker e o hedging das chamadas.
+    - services.cache.translation_cache: para reutilizar traduções de textos repetidos.
+    - services.pipeline.chunking_service: para dividir textos maiores que o limite da API.
+    - instrumentation: para o tempo das chamadas e os caracteres enviados.
     - typing: para anotações de tipagem.
 """
 
-import boto3
-import os
+from collections import Counter
 from botocore.exceptions import BotoCoreError, ClientError
-from dotenv import load_dotenv
-from typing import Tuple
+from typing import Optional, Tuple
+
+from aws_translator_app.instrumentation import count_characters, stage_timer
+from aws_translator_app.services.api.client_registry import client_registry
+from aws_translator_app.services.api.resilience import UpstreamUnavailableError, get_resilience_policy
+from aws_translator_app.services.cache.translation_cache import get_translation_cache
+from aws_translator_app.services.pipeline.chunking_service import TextChunker
+
+# Limite de tamanho do texto aceito pela chamada síncrona `translate_text` da AWS (bytes UTF-8)
+MAX_TEXT_BYTES = 10000
 
 
 class AwsTranslateService:
@@ -33,8 +43,14 @@ class AwsTranslateService:
     e fornece métodos para traduzir textos para diferentes idiomas de destino.
 
     Métodos:
-        translate_text(text: str, target_language_code: str) ⇾ Tuple[str, str]:
+        translate_text(text: str, target_language_code: str, source_language_code: str) ⇾ Tuple[str, str]:
             Traduz o texto fornecido para o idioma de destino especificado e retorna o texto traduzido com o código do idioma de origem detectado.
+        translate_text_uncached(text: str, target_language_code: str, source_language_code: str) ⇾ Tuple[str, str]:
+            Traduz o texto com uma chamada direta à API, sem passar pelo cache.
+        translate_long_text(text: str, target_language_code: str, source_language_code: str) ⇾ Tuple[str, str]:
+            Traduz textos de qualquer tamanho, dividindo-os em blocos que respeitam o limite da API.
+        lookup_cached_translation(text: str, target_language_code: str, source_language_code: str) ⇾ Optional[Tuple[str, str]]:
+            Retorna a tradução de `translate_long_text` apenas se ela estiver inteiramente no cache.
     """
 
     def __init__(self):
@@ -43,13 +59,18 @@ class AwsTranslateService:
 
         Este metodo realiza os seguintes passos:
             1. Carrega as credenciais da AWS a partir do arquivo .env.
-            2. Inicializa o cliente AWS Translate usando as credenciais carregadas.
+            2. Obtém o cliente AWS Translate compartilhado pelo processo.
+
+        O cliente é criado apenas uma vez por processo (veja `ClientRegistry`), portanto
+        instanciar este serviço a cada requisição não tem custo de conexão.
 
         Exceções:
             - ValueError: Se alguma das credenciais da AWS estiver faltando no arquivo .env.
             - ConnectionError: Se houver falha ao inicializar o cliente AWS Translate.
         """
         self.translate_client = None
+        self.cache = get_translation_cache()
+        self.resilience = get_resilience_policy('aws_translate')
         self.ACCESS_KEY = None
         self.SECRET_KEY = None
         self.REGION = None
@@ -65,63 +86,164 @@ class AwsTranslateService:
         Carrega as credenciais AWS do arquivo .env.
 
         Este metodo realiza os seguintes passos:
-            1. Carrega as variáveis de ambiente a partir do arquivo .env.
+            1. Carrega as variáveis de ambiente a partir do arquivo .env (apenas uma vez por processo).
             2. Obtém as credenciais AWS (ACCESS_KEY_ID, SECRET_ACCESS_KEY, REGION) das variáveis de ambiente.
             3. Verifica se todas as credenciais estão presentes; caso contrário, lança uma exceção.
 
         Exceções:
             - ValueError: se alguma das credenciais da AWS estiver faltando no arquivo .env.
         """
-        load_dotenv()
-        self.ACCESS_KEY = os.getenv('AWS_ACCESS_KEY_ID', '')
-        self.SECRET_KEY = os.getenv('AWS_SECRET_ACCESS_KEY', '')
-        self.REGION = os.getenv('AWS_REGION', '')
-
-        # Verifica se todas as credenciais estão presentes
-        if not all([self.ACCESS_KEY, self.SECRET_KEY, self.REGION]):
-            raise ValueError("Credenciais AWS faltando. Por favor, verifique o arquivo .env.")
+        self.ACCESS_KEY, self.SECRET_KEY, self.REGION = client_registry.get_aws_credentials()
 
     def init_translate_client(self):
         """
         Inicializa o cliente AWS Translate.
 
-        Este metodo utiliza as credenciais carregadas para criar um cliente AWS Translate
-        que será utilizado para realizar as traduções de textos.
+        Este metodo obtém o cliente AWS Translate compartilhado pelo processo, criado com as
+        credenciais carregadas e um pool de conexões com keep-alive.
 
         Exceções:
             - ConnectionError: se houver falha ao inicializar o cliente AWS Translate devido a credenciais inválidas
               ou problemas de rede.
         """
-        try:
-            session = boto3.Session(
-                aws_access_key_id=self.ACCESS_KEY,
-                aws_secret_access_key=self.SECRET_KEY,
-                region_name=self.REGION
-            )
-            self.translate_client = session.client('translate')
-        except (BotoCoreError, ClientError) as e:
-            raise ConnectionError(f"Falha ao inicializar o cliente AWS Translate: {str(e)}") from e
-
-    def translate_text(self, text: str, target_language_code: str) -> Tuple[str, str]:
+        self.translate_client = client_registry.get_aws_translate_client()
+
+    def translate_text(
+            self,
+            text: str,
+            target_language_code: str,
+            source_language_code: str = 'auto'
+    ) -> Tuple[str, str]:
         """
         Traduz o texto fornecido para o idioma de destino especificado e retorna o código do idioma de origem detectado.
 
+        O resultado é consultado primeiro no cache de traduções (chave: hash do texto normalizado e
+        dos idiomas); apenas em caso de falha no cache a API AWS Translate é chamada.
+
+        Parâmetros:
+            text (str): O texto a ser traduzido.
+            target_language_code (str): Código do idioma de destino.
+            source_language_code (str): Código do idioma de origem (`'auto'` para detecção automática pela AWS).
+
+        Retorna:
+            Tuple[str, str]: Uma tupla contendo o texto traduzido e o código do idioma de origem detectado.
+
+        Exceções:
+            - Exception: Se ocorrer um erro durante a tradução.
+        """
+        cached = self.cache.get(text, source_language_code, target_language_code)
+        if cached is not None:
+            return cached
+
+        result = self.translate_text_uncached(text, target_language_code, source_language_code)
+        self.cache.set(text, source_language_code, target_language_code, result)
+        return result
+
+    def translate_text_uncached(
+            self,
+            text: str,
+            target_language_code: str,
+            source_language_code: str = 'auto'
+    ) -> Tuple[str, str]:
+        """
+        Traduz o texto com uma chamada direta à API AWS Translate, sem consultar nem gravar o cache.
+
+        Falhas temporárias (throttling, timeouts, erros 5xx) são repetidas com backoff aleatório
+        dentro do prazo de `RESILIENCE['aws_translate']`; com `HEDGE_AFTER`, uma segunda chamada
+        é disparada se a primeira demorar (a tradução é idempotente).
+
         Parâmetros:
             text (str): O texto a ser traduzido.
             target_language_code (str): Código do idioma de destino.
+            source_language_code (str): Código do idioma de origem (`'auto'` para detecção automática pela AWS).
 
         Retorna:
             Tuple[str, str]: Uma tupla contendo o texto traduzido e o código do idioma de origem detectado.
 
         Exceções:
+            - CircuitOpenError: Se o AWS Translate estiver marcado como indisponível (falhas consecutivas recentes).
+            - DeadlineExceededError: Se o prazo total das tentativas terminar antes de uma resposta.
             - Exception: Se ocorrer um erro durante a tradução.
         """
+        count_characters('aws_translate', text, target_language_code)
         try:
-            response = self.translate_client.translate_text(
-                Text=text,
-                SourceLanguageCode='auto',  # Detecta automaticamente o idioma do texto de origem
-                TargetLanguageCode=target_language_code
-            )
+            # O cliente boto3 não aceita timeout por chamada; o limite de cada tentativa é o AWS_READ_TIMEOUT
+            with stage_timer('aws_translate', target_language=target_language_code):
+                response = self.resilience.call(lambda timeout: self.translate_client.translate_text(
+                    Text=text,
+                    SourceLanguageCode=source_language_code,  # 'auto' detecta automaticamente o idioma de origem
+                    TargetLanguageCode=target_language_code
+                ))
             return response['TranslatedText'], response['SourceLanguageCode']
+        except UpstreamUnavailableError:
+            raise
         except (BotoCoreError, ClientError) as e:
             raise Exception(f"Erro na tradução: {str(e)}") from e
+
+    def translate_long_text(
+            self,
+            text: str,
+            target_language_code: str,
+            source_language_code: str = 'auto'
+    ) -> Tuple[str, str]:
+        """
+        Traduz textos de qualquer tamanho, respeitando o limite de bytes da API AWS Translate.
+
+        Textos dentro do limite são traduzidos com uma única chamada. Textos maiores são divididos
+        em blocos (por parágrafo e sentença), traduzidos em sequência e remontados na ordem original.
+
+        Parâmetros:
+            text (str): O texto a ser traduzido.
+            target_language_code (str): Código do idioma de destino.
+            source_language_code (str): Código do idioma de origem (`'auto'` para detecção automática pela AWS).
+
+        Retorna:
+            Tuple[str, str]: O texto traduzido e o código do idioma de origem predominante entre os blocos.
+
+        Exceções:
+            - Exception: Se ocorrer um erro durante a tradução de algum bloco.
+        """
+        chunker = TextChunker(max_bytes=MAX_TEXT_BYTES, max_tokens=0)
+        if chunker.fits(text):
+            return self.translate_text(text, target_language_code, source_language_code)
+
+        chunks = chunker.split(text)
+        results = [self.translate_text(chunk.text, target_language_code, source_language_code) for chunk in chunks]
+        translated_text = TextChunker.join((translated for translated, _ in results), chunks)
+        source_language_code = Counter(source for _, source in results).most_common(1)[0][0]
+        return translated_text, source_language_code
+
+    def lookup_cached_translation(
+            self,
+            text: str,
+            target_language_code: str,
+            source_language_code: str = 'auto'
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Retorna a tradução que `translate_long_text` produziria, consultando apenas o cache.
+
+        Nenhuma chamada à API é feita: se o texto (ou algum de seus blocos) não estiver no cache,
+        o retorno é `None`.
+
+        Parâmetros:
+            text (str): O texto a ser traduzido.
+            target_language_code (str): Código do idioma de destino.
+            source_language_code (str): Código do idioma de origem (`'auto'` para detecção automática pela AWS).
+
+        Retorna:
+            Optional[Tuple[str, str]]: O texto traduzido e o código do idioma de origem, ou `None`.
+        """
+        chunker = TextChunker(max_bytes=MAX_TEXT_BYTES, max_tokens=0)
+        if chunker.fits(text):
+            return self.cache.get(text, source_language_code, target_language_code)
+
+        chunks = chunker.split(text)
+        results = []
+        for chunk in chunks:
+            cached = self.cache.get(chunk.text, source_language_code, target_language_code)
+            if cached is None:
+                return None
+            results.append(cached)
+        translated_text = TextChunker.join((translated for translated, _ in results), chunks)
+        source_language_code = Counter(source for _, source in results).most_common(1)[0][0]
+        return translated_text, source_language_code
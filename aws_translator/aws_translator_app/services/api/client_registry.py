@@ -0,0 +1,371 @@
+# aws_translator_app/services/api/client_registry.py
+
+"""
+Client Registry Module
+======================
+
+Este módulo mantém os clientes das APIs externas (AWS Translate e OpenAI) vivos durante
+todo o ciclo de vida do processo worker. Os clientes são criados de forma preguiçosa
+(apenas no primeiro uso), de forma thread-safe, e reutilizados por todas as requisições,
+evitando reler o arquivo .env e refazer o handshake TLS a cada chamada.
+
+Classes:
+    ClientRegistry: Registro de clientes compartilhados com pools de conexão configuráveis.
+
+Instâncias:
+    client_registry: Instância única do registro, compartilhada por todo o processo.
+
+Dependências:
+    - boto3 / botocore: para o cliente AWS Translate e a configuração do pool de conexões.
+    - httpx: cliente HTTP utilizado pela biblioteca da OpenAI (pool com keep-alive).
+    - openai: biblioteca oficial da OpenAI.
+    - dotenv: para carregar as variáveis de ambiente a partir do arquivo .env (uma única vez).
+    - django.conf.settings: para os limites configuráveis dos pools.
+
+Configurações (settings.py):
+    - AWS_MAX_POOL_CONNECTIONS (int): tamanho máximo do pool de conexões do botocore.
+    - AWS_CONNECT_TIMEOUT / AWS_READ_TIMEOUT (float): timeouts do cliente AWS.
+    - OPENAI_MAX_CONNECTIONS (int): número máximo de conexões simultâneas com a OpenAI.
+    - OPENAI_MAX_KEEPALIVE_CONNECTIONS (int): conexões ociosas mantidas abertas.
+    - OPENAI_KEEPALIVE_EXPIRY (float): tempo (s) que uma conexão ociosa permanece aberta.
+    - OPENAI_TIMEOUT (float): timeout total das chamadas à OpenAI.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.api.client_registry import client_registry
+    >>> translate_client = client_registry.get_aws_translate_client()
+    >>> openai_client = client_registry.get_openai_client()
+    >>> client_registry.stats()
+    {'aws_translate': {...}, 'openai': {...}}
+"""
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Tuple
+
+import boto3
+import httpx
+import openai
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from dotenv import load_dotenv
+
+
+class ClientRegistry:
+    """
+    Registro de clientes de API compartilhados pelo processo.
+
+    Cada cliente é criado uma única vez, na primeira vez em que é solicitado, utilizando
+    um bloqueio com verificação dupla (double-checked locking). Depois de criado, o acesso
+    ao cliente não adquire nenhum bloqueio. Os clientes do boto3 e da OpenAI são thread-safe
+    e podem ser utilizados simultaneamente por várias threads.
+
+    Métodos:
+        get_aws_credentials() ⇾ Tuple[str, str, str]:
+            Retorna as credenciais AWS carregadas do ambiente.
+        get_openai_api_key() ⇾ str:
+            Retorna a chave da API OpenAI carregada do ambiente.
+        get_aws_translate_client():
+            Retorna o cliente AWS Translate compartilhado.
+        get_openai_client() ⇾ openai.OpenAI:
+            Retorna o cliente OpenAI compartilhado.
+        get_async_openai_client() ⇾ openai.AsyncOpenAI:
+            Retorna o cliente OpenAI assíncrono do event loop atual.
+        stats() ⇾ dict:
+            Retorna estatísticas de uso dos clientes e dos pools de conexão.
+        reset() ⇾ None:
+            Fecha e descarta todos os clientes (útil em testes ou após um fork).
+    """
+
+    def __init__(self):
+        """
+        Inicializa o registro vazio. Nenhum cliente é criado neste momento.
+        """
+        self._lock = threading.RLock()
+        self._environment_loaded = False
+        self._clients: Dict[str, object] = {}
+        self._stats: Dict[str, dict] = {}
+        # Clientes assíncronos por event loop; são descartados junto com o loop.
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    def _load_environment(self) -> None:
+        """
+        Carrega o arquivo .env apenas uma vez por processo.
+        """
+        if not self._environment_loaded:
+            with self._lock:
+                if not self._environment_loaded:
+                    load_dotenv()
+                    self._environment_loaded = True
+
+    def get_aws_credentials(self) -> Tuple[str, str, str]:
+        """
+        Obtém as credenciais AWS das variáveis de ambiente.
+
+        Retorna:
+            Tuple[str, str, str]: ACCESS_KEY_ID, SECRET_ACCESS_KEY e REGION.
+
+        Exceções:
+            - ValueError: se alguma das credenciais da AWS estiver faltando.
+        """
+        self._load_environment()
+        access_key = os.getenv('AWS_ACCESS_KEY_ID', '')
+        secret_key = os.getenv('AWS_SECRET_ACCESS_KEY', '')
+        region = os.getenv('AWS_REGION', '')
+
+        if not all([access_key, secret_key, region]):
+            raise ValueError("Credenciais AWS faltando. Por favor, verifique o arquivo .env.")
+        return access_key, secret_key, region
+
+    def get_openai_api_key(self) -> str:
+        """
+        Obtém a chave da API OpenAI das variáveis de ambiente.
+
+        Retorna:
+            str: A chave da API OpenAI.
+
+        Exceções:
+            - ValueError: se a chave da API OpenAI estiver faltando.
+        """
+        self._load_environment()
+        api_key = os.getenv('OPENAI_API_KEY', '')
+        if not api_key:
+            raise ValueError("Chave da API OpenAI faltando. Por favor, verifique o arquivo .env.")
+        return api_key
+
+    def _get_or_create(self, name: str, factory: Callable[[], object]):
+        """
+        Retorna o cliente registrado com o nome informado, criando-o se necessário.
+
+        Parâmetros:
+            name (str): Nome do cliente no registro.
+            factory (Callable): Função que cria o cliente.
+
+        Retorna:
+            object: O cliente compartilhado.
+        """
+        client = self._clients.get(name)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(name)
+                if client is None:
+                    started = time.perf_counter()
+                    client = factory()
+                    self._stats[name] = {
+                        'created_at': time.time(),
+                        'init_seconds': time.perf_counter() - started,
+                        'acquisitions': 0,
+                    }
+                    self._clients[name] = client
+        # A contagem é apenas informativa; uma corrida ocasional não é relevante.
+        stats = self._stats.get(name)
+        if stats is not None:
+            stats['acquisitions'] += 1
+        return client
+
+    def get_aws_translate_client(self):
+        """
+        Retorna o cliente AWS Translate compartilhado pelo processo.
+
+        O cliente utiliza um pool de conexões do botocore com keep-alive (TCP) e tamanho
+        máximo definido por `AWS_MAX_POOL_CONNECTIONS`.
+
+        Exceções:
+            - ValueError: se alguma das credenciais da AWS estiver faltando.
+            - ConnectionError: se houver falha ao inicializar o cliente AWS Translate.
+        """
+        return self._get_or_create('aws_translate', self._create_aws_translate_client)
+
+    def get_openai_client(self) -> openai.OpenAI:
+        """
+        Retorna o cliente OpenAI compartilhado pelo processo.
+
+        O cliente utiliza um `httpx.Client` com limites de conexões e keep-alive definidos por
+        `OPENAI_MAX_CONNECTIONS`, `OPENAI_MAX_KEEPALIVE_CONNECTIONS` e `OPENAI_KEEPALIVE_EXPIRY`.
+
+        Exceções:
+            - ValueError: se a chave da API OpenAI estiver faltando.
+            - ConnectionError: se houver falha ao inicializar o cliente OpenAI.
+        """
+        return self._get_or_create('openai', self._create_openai_client)
+
+    def get_async_openai_client(self) -> openai.AsyncOpenAI:
+        """
+        Retorna o cliente OpenAI assíncrono compartilhado pelo event loop atual.
+
+        As conexões de um `httpx.AsyncClient` pertencem ao event loop em que foram abertas.
+        Em um servidor ASGI (por exemplo, uvicorn) existe um único loop por worker e, portanto,
+        um único cliente; quando views assíncronas são executadas por um servidor WSGI, cada
+        requisição roda em um loop próprio e recebe um cliente próprio.
+
+        Exceções:
+            - RuntimeError: se chamado fora de um event loop.
+            - ValueError: se a chave da API OpenAI estiver faltando.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            with self._lock:
+                client = self._async_clients.get(loop)
+                if client is None:
+                    client = self._create_async_openai_client()
+                    self._async_clients[loop] = client
+        return client
+
+    def _create_aws_translate_client(self):
+        """
+        Cria o cliente AWS Translate com o pool de conexões configurado.
+
+        As tentativas automáticas do botocore são desativadas, como as da biblioteca da OpenAI.
+        """
+        access_key, secret_key, region = self.get_aws_credentials()
+        config = Config(
+            max_pool_connections=getattr(settings, 'AWS_MAX_POOL_CONNECTIONS', 50),
+            tcp_keepalive=True,
+            connect_timeout=getattr(settings, 'AWS_CONNECT_TIMEOUT', 5),
+            read_timeout=getattr(settings, 'AWS_READ_TIMEOUT', 30),
+            # Sem tentativas automáticas do botocore: o AwsTranslateService usa a ResiliencePolicy
+            retries={'total_max_attempts': 1, 'mode': 'standard'},
+        )
+        try:
+            session = boto3.Session(
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                region_name=region
+            )
+            return session.client('translate', config=config)
+        except (BotoCoreError, ClientError) as e:
+            raise ConnectionError(f"Falha ao inicializar o cliente AWS Translate: {str(e)}") from e
+
+    @staticmethod
+    def _openai_limits() -> httpx.Limits:
+        """
+        Monta os limites do pool de conexões HTTP utilizado pelos clientes OpenAI.
+        """
+        return httpx.Limits(
+            max_connections=getattr(settings, 'OPENAI_MAX_CONNECTIONS', 50),
+            max_keepalive_connections=getattr(settings, 'OPENAI_MAX_KEEPALIVE_CONNECTIONS', 20),
+            keepalive_expiry=getattr(settings, 'OPENAI_KEEPALIVE_EXPIRY', 60.0),
+        )
+
+    def _create_openai_client(self) -> openai.OpenAI:
+        """
+        Cria o cliente OpenAI com o pool de conexões configurado.
+
+        As tentativas automáticas da biblioteca são desativadas (`max_retries=0`), pois o
+        `OpenAIService` aplica a política de `services.api.resilience`.
+        """
+        api_key = self.get_openai_api_key()
+        timeout = getattr(settings, 'OPENAI_TIMEOUT', 120.0)
+        try:
+            http_client = httpx.Client(limits=self._openai_limits(), timeout=timeout)
+            return openai.OpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+        except Exception as e:
+            raise ConnectionError(f"Falha ao inicializar o cliente OpenAI: {str(e)}") from e
+
+    def _create_async_openai_client(self) -> openai.AsyncOpenAI:
+        """
+        Cria um cliente OpenAI assíncrono com o pool de conexões configurado.
+        """
+        api_key = self.get_openai_api_key()
+        timeout = getattr(settings, 'OPENAI_TIMEOUT', 120.0)
+        try:
+            http_client = httpx.AsyncClient(limits=self._openai_limits(), timeout=timeout)
+            return openai.AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+        except Exception as e:
+            raise ConnectionError(f"Falha ao inicializar o cliente OpenAI: {str(e)}") from e
+
+    @staticmethod
+    def _aws_pool_stats(client) -> list:
+        """
+        Coleta as estatísticas dos pools urllib3 utilizados pelo cliente botocore.
+
+        O acesso usa atributos internos do botocore; caso a estrutura mude, retorna uma lista vazia.
+        """
+        try:
+            manager = client._endpoint.http_session._manager
+            pools = []
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                pools.append({
+                    'host': pool.host,
+                    'num_connections': pool.num_connections,
+                    'num_requests': pool.num_requests,
+                    'idle_connections': pool.pool.qsize() if pool.pool is not None else 0,
+                })
+            return pools
+        except Exception:
+            return []
+
+    @staticmethod
+    def _httpx_pool_stats(http_client) -> dict:
+        """
+        Coleta as estatísticas do pool httpcore utilizado por um cliente httpx.
+
+        O acesso usa atributos internos do httpx; caso a estrutura mude, retorna um dicionário vazio.
+        """
+        try:
+            connections = http_client._transport._pool.connections
+            return {
+                'open_connections': len(connections),
+                'idle_connections': sum(1 for conn in connections if conn.is_idle()),
+            }
+        except Exception:
+            return {}
+
+    def stats(self) -> dict:
+        """
+        Retorna as estatísticas dos clientes criados e de seus pools de conexão.
+
+        O estado dos pools é lido de atributos internos do botocore e do httpx: se a estrutura
+        mudar em uma atualização dessas bibliotecas, os pools aparecem vazios, sem erro.
+
+        Retorna:
+            dict: Um dicionário por cliente com o momento de criação, o tempo de inicialização,
+            o número de aquisições e o estado atual dos pools de conexão.
+        """
+        result = {}
+        for name, client in list(self._clients.items()):
+            entry = dict(self._stats.get(name, {}))
+            if name == 'aws_translate':
+                config = getattr(getattr(client, 'meta', None), 'config', None)
+                entry['max_pool_connections'] = getattr(config, 'max_pool_connections', None)
+                entry['pools'] = self._aws_pool_stats(client)
+            elif name.startswith('openai'):
+                entry['pool'] = self._httpx_pool_stats(getattr(client, '_client', None))
+            result[name] = entry
+        async_clients = list(self._async_clients.values())
+        if async_clients:
+            result['openai_async'] = {
+                'event_loops': len(async_clients),
+                'pools': [self._httpx_pool_stats(getattr(client, '_client', None)) for client in async_clients],
+            }
+        return result
+
+    def reset(self) -> None:
+        """
+        Fecha e descarta todos os clientes registrados.
+
+        Os próximos acessos criarão novos clientes. Deve ser chamado, por exemplo, após um
+        fork do processo, pois conexões abertas não podem ser compartilhadas entre processos.
+        """
+        with self._lock:
+            clients = self._clients
+            self._clients = {}
+            self._stats = {}
+            # Clientes assíncronos só podem ser fechados dentro de seus loops; apenas são descartados.
+            self._async_clients = weakref.WeakKeyDictionary()
+            self._environment_loaded = False
+        for client in clients.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+
+
+client_registry = ClientRegistry()
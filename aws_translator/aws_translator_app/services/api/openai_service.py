@@ -12,11 +12,13 @@ Classes:
     OpenAIService: Classe responsável pela interação com a API da OpenAI para simplificação de textos.
 
 Dependências:
-    - dotenv: biblioteca para carregar variáveis de ambiente a partir de um arquivo .env.
     - openai: biblioteca oficial da OpenAI para interagir com a API OpenAI.
-    - os: biblioteca padrão para interagir com o sistema operacional.
-    - time: biblioteca padrão para manipulação de tempo.
-    - random: biblioteca padrão para geração de números aleatórios.
+    - services.api.client_registry: para obter o cliente OpenAI compartilhado pelo processo.
+    - services.cache.llm_cache: para reutilizar respostas de requisições idênticas (opcional, por requisição).
+    - services.api.token_budget: para contar os tokens e derivar o `max_tokens` antes de cada chamada.
+    - services.api.resilience: para o retry, o prazo total e o circuit breaker das chamadas à OpenAI.
+    - services.language.glossary_service: para preservar os marcadores dos termos protegidos pelo glossário.
+    - instrumentation: para o tempo das chamadas, os caracteres enviados e os tokens consumidos.
     - typing: biblioteca padrão para anotações de tipos.
 
 Exemplo de Uso:
@@ -34,12 +36,53 @@ Exemplo de Uso:
     "This is a simplified version of the original technical document, making it easier to understand for non-experts."
 """
 
-import os
-import time
-import random
-from dotenv import load_dotenv
-import openai
-from typing import List, Optional
+import asyncio
+import sys
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from aws_translator_app.instrumentation import count_characters, count_tokens, stage_timer
+from aws_translator_app.services.api.client_registry import client_registry
+from aws_translator_app.services.api.token_budget import (
+    TokenBudget,
+    TokenBudgetExceededError,
+    TokenBudgeter,
+    get_token_counter,
+    merge_usage,
+    usage_from_budget,
+)
+from aws_translator_app.services.api.resilience import UpstreamUnavailableError, get_resilience_policy
+from aws_translator_app.services.cache.llm_cache import LLMCacheMissError, get_llm_cache
+from aws_translator_app.services.language.glossary_service import PLACEHOLDER_OPEN
+from aws_translator_app.services.pipeline.chunking_service import TextChunk, TextChunker
+
+
+class SimplificationResult(NamedTuple):
+    """
+    Resultado de `OpenAIService.simplify`.
+
+    Atributos:
+        text (str): O texto simplificado.
+        usage (dict): Consumo de tokens previsto e informado pela API (veja `token_budget.usage_from_budget`).
+    """
+    text: str
+    usage: dict
+
+
+class PreparedRequest(NamedTuple):
+    """
+    Requisição ao Chat Completions montada por `OpenAIService._prepare`, comum às três formas de
+    chamada (`simplify`, `asimplify` e `stream_simplify`).
+
+    Atributos:
+        budget (TokenBudget): O orçamento de tokens da requisição.
+        params (dict): Argumentos da chamada (`model`, `messages`, `max_tokens` e os parâmetros de amostragem).
+        cache_key (str, optional): A chave do cache de respostas (`None` no modo `'bypass'`).
+        cached (str, optional): A resposta armazenada em cache, se houver.
+    """
+    budget: TokenBudget
+    params: dict
+    cache_key: Optional[str]
+    cached: Optional[str]
 
 
 class OpenAIService:
@@ -52,6 +95,14 @@ class OpenAIService:
     Métodos:
         simplify_text(text: str, area_tecnica: str, estilo: str, summarize: bool, model: str) ⇾ str:
             Simplifica (e opcionalmente resume) o texto fornecido utilizando o modelo especificado da OpenAI.
+        asimplify_text(text: str, area_tecnica: str, estilo: str, summarize: bool, model: str) ⇾ str:
+            Versão assíncrona de `simplify_text`, que não bloqueia o event loop.
+        simplify(...) ⇾ SimplificationResult:
+            Como `simplify_text`, retornando também o consumo de tokens previsto e real.
+        asimplify(...) ⇾ SimplificationResult:
+            Versão assíncrona de `simplify`.
+        stream_simplify(...) ⇾ Iterator[str]:
+            Simplifica no modo de streaming, entregando o texto à medida que é gerado.
     """
 
     def __init__(self):
@@ -60,7 +111,7 @@ class OpenAIService:
 
         Este metodo realiza os seguintes passos:
             1. Carrega as credenciais da OpenAI a partir do arquivo .env.
-            2. Inicializa o cliente OpenAI com as credenciais carregadas.
+            2. Obtém o cliente OpenAI compartilhado pelo processo.
 
         Exceções:
             - ValueError: se a chave da API OpenAI estiver faltando no arquivo .env.
@@ -68,6 +119,9 @@ class OpenAIService:
         """
         self.OPENAI_API_KEY = None  # Chave da API OpenAI
         self.client = None  # Instância do cliente OpenAI
+        self.cache = get_llm_cache()  # Cache de respostas compartilhado pelo processo
+        self.budgeter = TokenBudgeter()  # Orçamento de tokens de cada requisição
+        self.resilience = get_resilience_policy('openai')  # Retry, prazo e circuit breaker compartilhados
         self.load_credentials()  # Carrega as credenciais OpenAI
         self.init_openai_client()  # Inicializa o cliente OpenAI
 
@@ -76,7 +130,7 @@ class OpenAIService:
         Carrega as credenciais OpenAI do arquivo .env.
 
         Este metodo realiza os seguintes passos:
-            1. Carrega as variáveis de ambiente a partir do arquivo .env.
+            1. Carrega as variáveis de ambiente a partir do arquivo .env (apenas uma vez por processo).
             2. Obtém a chave da API OpenAI (`OPENAI_API_KEY`) das variáveis de ambiente.
             3. Verifica se a chave da API está presente; caso contrário, lança uma exceção.
 
@@ -87,18 +141,15 @@ class OpenAIService:
             - As credenciais da OpenAI são necessárias para autenticar e autorizar solicitações à API OpenAI.
             - É uma prática recomendada armazenar credenciais sensíveis em arquivos de ambiente (.env) para evitar exposição acidental.
         """
-        load_dotenv()
-        self.OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
-
-        if not self.OPENAI_API_KEY:
-            raise ValueError("Chave da API OpenAI faltando. Por favor, verifique o arquivo .env.")
+        self.OPENAI_API_KEY = client_registry.get_openai_api_key()
 
     def init_openai_client(self):
         """
         Inicializa o cliente OpenAI.
 
-        Este metodo utiliza a chave da API carregada para configurar a biblioteca OpenAI,
-        que será utilizada para realizar chamadas à API de simplificação de textos.
+        Este metodo obtém o cliente OpenAI compartilhado pelo processo, que será utilizado para
+        realizar chamadas à API de simplificação de textos. O cliente mantém um pool de conexões
+        HTTP com keep-alive, evitando um novo handshake TLS a cada requisição.
 
         Exceções:
             - ConnectionError: se houver falha ao inicializar o cliente OpenAI devido a credenciais inválidas
@@ -108,59 +159,30 @@ class OpenAIService:
             - A biblioteca OpenAI utiliza a chave da API para autenticar solicitações e garantir que o usuário
               tenha permissão para acessar os serviços da OpenAI.
         """
-        try:
-            openai.api_key = self.OPENAI_API_KEY
-            self.client = openai
-        except Exception as e:
-            raise ConnectionError(f"Falha ao inicializar o cliente OpenAI: {str(e)}")
+        self.client = client_registry.get_openai_client()
 
-    def simplify_text(
-            self,
+    @staticmethod
+    def build_messages(
             text: str,
             area_tecnica: str,
             estilo: str,
             summarize: bool,
-            model: str,
             complexity_level: str = 'Intermediário',
-            focus_aspects: Optional[List[str]] = None,
-            temperature: float = 0.8,
-            max_tokens: int = 4096,
-            top_p: float = 1.0,
-            frequency_penalty: float = 0.0,
-            presence_penalty: float = 0.0
-    ) -> str:
+            focus_aspects: Optional[List[str]] = None
+    ) -> List[dict]:
         """
-        Simplifica (e opcionalmente resume) o texto fornecido usando a API da OpenAI.
-
-        Este metodo realiza os seguintes passos:
-            1. Define o prompt com base nos parâmetros fornecidos.
-            2. Faz uma chamada à API OpenAI ChatCompletion para obter o texto simplificado.
-            3. Implementa uma lógica de retry para lidar com possíveis falhas temporárias na API.
+        Monta as mensagens (prompt de sistema e de usuário) enviadas à API da OpenAI.
 
         Parâmetros:
             text (str): O texto a ser simplificado.
-            area_tecnica (str): A área técnica do texto (e.g., "Computer Science", "Medicine").
-            estilo (str): O estilo de escrita desejado (e.g., "informal", "formal", "casual").
+            area_tecnica (str): A área técnica do texto.
+            estilo (str): O estilo de escrita desejado.
             summarize (bool): Indica se o texto deve ser resumido além de ser simplificado.
-            model (str): O modelo da OpenAI a ser utilizado (e.g., "gpt-4", "gpt-3.5-turbo").
-            complexity_level (str): Nível de complexidade da simplificação (e.g., "Básico", "Intermediário", "Avançado").
-            focus_aspects (List[str], optional): Aspectos a serem priorizados na simplificação (e.g., ["clareza", "concisão"]).
-            temperature (float): Controla a aleatoriedade da resposta.
-            max_tokens (int): Define o tamanho máximo da resposta.
-            top_p (float): Controla a aleatoriedade via probabilidade cumulativa.
-            frequency_penalty (float): Controla a repetição de palavras.
-            presence_penalty (float): Controla a diversidade da resposta.
+            complexity_level (str): Nível de complexidade da simplificação.
+            focus_aspects (List[str], optional): Aspectos a serem priorizados na simplificação.
 
         Retorna:
-            str: O texto simplificado (e opcionalmente resumido) retornado pela API da OpenAI.
-
-        Exceções:
-            - Exception: Se ocorrer um erro durante a comunicação com a API OpenAI após várias tentativas.
-
-        Teoria:
-            - A OpenAI utiliza modelos de linguagem avançados para gerar texto de forma contextualizada e adaptada às instruções fornecidas.
-            - A simplificação de texto envolve reescrever o conteúdo de maneira mais acessível, mantendo a essência das informações.
-            - A funcionalidade de sumarização reduz o texto mantendo os pontos-chave, facilitando a compreensão rápida do conteúdo.
+            List[dict]: As mensagens no formato da API Chat Completions.
         """
         # Construir a descrição do nível de complexidade
         complexity_description = ''
@@ -183,9 +205,13 @@ class OpenAIService:
         user_content += f", utilizando um estilo {estilo}."
         if summarize:
             user_content += " Por favor, também resuma o texto, mantendo as informações essenciais."
+        if PLACEHOLDER_OPEN in text:
+            # Termos protegidos pelo glossário da especialidade (veja GlossaryService.protect)
+            user_content += (" Mantenha exatamente como estão os marcadores no formato ⟦número⟧:"
+                             " eles representam termos técnicos e serão substituídos depois.")
         user_content += f"\n\nTexto:\n\"\"\"\n{text}\n\"\"\""
 
-        messages = [
+        return [
             {
                 "role": "system",
                 "content": (
@@ -198,22 +224,475 @@ class OpenAIService:
             }
         ]
 
-        max_retries = 5
-        for attempt in range(max_retries):
-            try:
-                response = self.client.ChatCompletion.create(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    top_p=top_p,
-                    frequency_penalty=frequency_penalty,
-                    presence_penalty=presence_penalty
+    def _lookup_cache(self, messages: List[dict], cache_mode: str, **params) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Consulta o cache de respostas conforme o modo de cache.
+
+        Parâmetros:
+            messages (List[dict]): As mensagens renderizadas.
+            cache_mode (str): `'bypass'`, `'prefer'` ou `'only'`.
+            **params: Parâmetros de amostragem que compõem a chave.
+
+        Retorna:
+            Tuple[Optional[str], Optional[str]]: A chave do cache (`None` no modo `'bypass'`) e a
+            resposta armazenada (`None` se não houver).
+
+        Exceções:
+            - LLMCacheMissError: Se o modo for `'only'` e não houver resposta armazenada.
+        """
+        if cache_mode == 'bypass':
+            return None, None
+        cache_key = self.cache.make_key(messages, **params)
+        cached = self.cache.get(cache_key)
+        if cached is None and cache_mode == 'only':
+            raise LLMCacheMissError("Nenhuma resposta armazenada em cache para esta requisição.")
+        return cache_key, cached
+
+    def simplify_text(
+            self,
+            text: str,
+            area_tecnica: str,
+            estilo: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: Optional[int] = None,
+            top_p: float = 1.0,
+            frequency_penalty: float = 0.0,
+            presence_penalty: float = 0.0,
+            cache_mode: str = 'bypass'
+    ) -> str:
+        """
+        Simplifica (e opcionalmente resume) o texto fornecido usando a API da OpenAI.
+
+        Este metodo realiza os seguintes passos:
+            1. Define o prompt com base nos parâmetros fornecidos.
+            2. Calcula o orçamento de tokens (veja `simplify`).
+            3. Consulta o cache de respostas, conforme o `cache_mode`.
+            4. Faz uma chamada à API OpenAI ChatCompletion para obter o texto simplificado.
+            5. Repete a chamada apenas em falhas temporárias (timeouts, rate limit, erros 5xx), com
+               backoff aleatório dentro de um prazo total (veja `ResiliencePolicy`).
+
+        Parâmetros:
+            text (str): O texto a ser simplificado.
+            area_tecnica (str): A área técnica do texto (e.g., "Computer Science", "Medicine").
+            estilo (str): O estilo de escrita desejado (e.g., "informal", "formal", "casual").
+            summarize (bool): Indica se o texto deve ser resumido além de ser simplificado.
+            model (str): O modelo da OpenAI a ser utilizado (e.g., "gpt-4", "gpt-3.5-turbo").
+            complexity_level (str): Nível de complexidade da simplificação (e.g., "Básico", "Intermediário", "Avançado").
+            focus_aspects (List[str], optional): Aspectos a serem priorizados na simplificação (e.g., ["clareza", "concisão"]).
+            temperature (float): Controla a aleatoriedade da resposta.
+            max_tokens (int, optional): Define o tamanho máximo da resposta. Se omitido, é derivado
+                do tamanho do texto (veja `TokenBudgeter`).
+            top_p (float): Controla a aleatoriedade via probabilidade cumulativa.
+            frequency_penalty (float): Controla a repetição de palavras.
+            presence_penalty (float): Controla a diversidade da resposta.
+            cache_mode (str): Uso do cache de respostas: `'bypass'` (padrão), `'prefer'` ou `'only'`.
+
+        Retorna:
+            str: O texto simplificado (e opcionalmente resumido) retornado pela API da OpenAI.
+
+        Exceções:
+            - LLMCacheMissError: Se `cache_mode` for `'only'` e não houver resposta armazenada.
+            - TokenBudgetExceededError: Se o texto não couber no modelo e a divisão estiver desativada.
+            - CircuitOpenError: Se a OpenAI estiver marcada como indisponível (falhas consecutivas recentes).
+            - DeadlineExceededError: Se o prazo total das tentativas terminar antes de uma resposta.
+            - Exception: Se a API OpenAI retornar um erro definitivo ou se as tentativas se esgotarem.
+
+        Teoria:
+            - A OpenAI utiliza modelos de linguagem avançados para gerar texto de forma contextualizada e adaptada às instruções fornecidas.
+            - A simplificação de texto envolve reescrever o conteúdo de maneira mais acessível, mantendo a essência das informações.
+            - A funcionalidade de sumarização reduz o texto mantendo os pontos-chave, facilitando a compreensão rápida do conteúdo.
+        """
+        return self.simplify(
+            text=text,
+            area_tecnica=area_tecnica,
+            estilo=estilo,
+            summarize=summarize,
+            model=model,
+            complexity_level=complexity_level,
+            focus_aspects=focus_aspects,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            cache_mode=cache_mode
+        ).text
+
+    def _split_for_budget(self, text: str, budget: TokenBudget, summarize: bool,
+                          overflow: Optional[str]) -> List[TextChunk]:
+        """
+        Divide um texto que não cabe no modelo em blocos que cabem, ou recusa a requisição.
+
+        Exceções:
+            - TokenBudgetExceededError: Se a divisão estiver desativada (`overflow='refuse'`).
+        """
+        if (overflow or self.budgeter.overflow) != 'chunk':
+            raise TokenBudgetExceededError(
+                f"O texto tem cerca de {budget.text_tokens} tokens e excede o limite do modelo {budget.model} "
+                f"(janela de {budget.limits.context_window} tokens, resposta de até "
+                f"{budget.limits.max_output_tokens} tokens)."
+            )
+        overhead = budget.prompt_tokens - budget.text_tokens
+        limit = self.budgeter.max_text_tokens(overhead, budget.model, summarize)
+        chunker = TextChunker(max_bytes=sys.maxsize, max_tokens=limit, token_counter=get_token_counter(budget.model).count)
+        return chunker.split(text)
+
+    def _prepare(
+            self,
+            text: str,
+            area_tecnica: str,
+            estilo: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str,
+            focus_aspects: Optional[List[str]],
+            temperature: float,
+            max_tokens: Optional[int],
+            top_p: float,
+            frequency_penalty: float,
+            presence_penalty: float,
+            cache_mode: str
+    ) -> PreparedRequest:
+        """
+        Monta as mensagens, calcula o orçamento de tokens e consulta o cache de respostas.
+
+        Se o texto não couber no modelo (`budget.fits` falso), o cache não é consultado: cada
+        forma de chamada divide o texto (`_split_for_budget`) e simplifica os blocos.
+
+        Exceções:
+            - LLMCacheMissError: Se o modo for `'only'` e não houver resposta armazenada.
+        """
+        messages = self.build_messages(
+            text=text,
+            area_tecnica=area_tecnica,
+            estilo=estilo,
+            summarize=summarize,
+            complexity_level=complexity_level,
+            focus_aspects=focus_aspects
+        )
+        budget = self.budgeter.plan(messages, text, model, summarize, max_tokens)
+        params = {
+            'model': model,
+            'messages': messages,
+            'max_tokens': budget.max_tokens,
+            'temperature': temperature,
+            'top_p': top_p,
+            'frequency_penalty': frequency_penalty,
+            'presence_penalty': presence_penalty,
+        }
+        if not budget.fits:
+            return PreparedRequest(budget, params, None, None)
+        cache_key, cached = self._lookup_cache(
+            messages,
+            cache_mode,
+            **{name: value for name, value in params.items() if name != 'messages'}
+        )
+        if cached is None:
+            count_characters('openai', text)
+        return PreparedRequest(budget, params, cache_key, cached)
+
+    def _finish(self, request: PreparedRequest, content: Optional[str] = None, response=None,
+                finish_reason: Optional[str] = None) -> dict:
+        """
+        Grava a resposta no cache e retorna o consumo de tokens da requisição (veja `usage_from_budget`).
+
+        Parâmetros:
+            request (PreparedRequest): A requisição montada por `_prepare`.
+            content (str, optional): O texto gerado (não usado se a resposta veio do cache).
+            response (optional): A resposta da API (no streaming, o evento com o consumo de tokens).
+            finish_reason (str, optional): O motivo de término, quando não está em `response` (streaming).
+        """
+        if request.cached is not None:
+            return usage_from_budget(request.budget, cached=True)
+        if request.cache_key is not None and content:
+            self.cache.set(request.cache_key, content)
+        usage = usage_from_budget(request.budget, response)
+        if finish_reason is not None:
+            usage['truncated_calls'] = 1 if finish_reason == 'length' else 0
+        count_tokens(request.params['model'], usage)
+        return usage
+
+    def simplify(
+            self,
+            text: str,
+            area_tecnica: str,
+            estilo: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: Optional[int] = None,
+            top_p: float = 1.0,
+            frequency_penalty: float = 0.0,
+            presence_penalty: float = 0.0,
+            cache_mode: str = 'bypass',
+            overflow: Optional[str] = None
+    ) -> SimplificationResult:
+        """
+        Simplifica o texto, como `simplify_text`, e retorna também o consumo de tokens.
+
+        Antes de qualquer chamada de rede, os tokens da entrada são contados localmente e o
+        `max_tokens` é derivado do tamanho do texto (a menos que informado). Se o texto não
+        couber no modelo (janela de contexto ou limite de saída), ele é dividido em blocos
+        simplificados em sequência (`overflow='chunk'`) ou a requisição é recusada
+        (`overflow='refuse'`).
+
+        Parâmetros:
+            Os mesmos de `simplify_text`, e:
+            overflow (str, optional): `'chunk'` ou `'refuse'`. Padrão: `TOKEN_BUDGET['OVERFLOW']`.
+
+        Retorna:
+            SimplificationResult: O texto simplificado e o consumo de tokens (previsto e
+            informado pela API; veja `usage_from_budget`).
+
+        Exceções:
+            As mesmas de `simplify_text`.
+        """
+        request = self._prepare(
+            text, area_tecnica, estilo, summarize, model, complexity_level, focus_aspects,
+            temperature, max_tokens, top_p, frequency_penalty, presence_penalty, cache_mode
+        )
+
+        if not request.budget.fits:
+            chunks = self._split_for_budget(text, request.budget, summarize, overflow)
+            # Cada bloco cabe no modelo por construção; 'refuse' evita uma nova divisão
+            results = [
+                self.simplify(
+                    chunk.text, area_tecnica, estilo, summarize, model, complexity_level, focus_aspects,
+                    temperature, max_tokens, top_p, frequency_penalty, presence_penalty, cache_mode,
+                    overflow='refuse'
+                )
+                for chunk in chunks
+            ]
+            return SimplificationResult(
+                TextChunker.join((result.text for result in results), chunks),
+                merge_usage(result.usage for result in results)
+            )
+
+        if request.cached is not None:
+            return SimplificationResult(request.cached, self._finish(request))
+
+        try:
+            with stage_timer('openai', model=model):
+                response = self.resilience.call(
+                    lambda timeout: self.client.chat.completions.create(**request.params, timeout=timeout)
+                )
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            raise Exception(f"Erro ao simplificar o texto: {str(e)}") from e
+        content = response.choices[0].message.content.strip()
+        return SimplificationResult(content, self._finish(request, content, response))
+
+    def stream_simplify(
+            self,
+            text: str,
+            area_tecnica: str,
+            estilo: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: Optional[int] = None,
+            top_p: float = 1.0,
+            frequency_penalty: float = 0.0,
+            presence_penalty: float = 0.0,
+            cache_mode: str = 'bypass',
+            overflow: Optional[str] = None,
+            usage_callback: Optional[Callable[[dict], None]] = None
+    ) -> Iterator[str]:
+        """
+        Simplifica o texto no modo de streaming do Chat Completions, entregando o texto à medida
+        que é gerado.
+
+        O orçamento de tokens e a divisão de textos que não cabem no modelo são os mesmos de
+        `simplify` (os blocos são transmitidos em sequência, separados por uma linha em branco).
+        Uma resposta em cache é entregue de uma só vez. As falhas ao abrir o stream são tentadas
+        novamente, como em `simplify`; depois do primeiro trecho, a exceção é propagada, pois o
+        cliente já recebeu parte da resposta.
+
+        Parâmetros:
+            Os mesmos de `simplify`, e:
+            usage_callback (Callable, optional): Chamada com o consumo de tokens de cada requisição
+                ao fim da sua transmissão.
+
+        Retorna:
+            Iterator[str]: Os trechos do texto simplificado, na ordem.
+
+        Exceções:
+            As mesmas de `simplify_text`.
+        """
+        request = self._prepare(
+            text, area_tecnica, estilo, summarize, model, complexity_level, focus_aspects,
+            temperature, max_tokens, top_p, frequency_penalty, presence_penalty, cache_mode
+        )
+
+        if not request.budget.fits:
+            chunks = self._split_for_budget(text, request.budget, summarize, overflow)
+            for chunk in chunks:
+                yield from self.stream_simplify(
+                    chunk.text, area_tecnica, estilo, summarize, model, complexity_level, focus_aspects,
+                    temperature, max_tokens, top_p, frequency_penalty, presence_penalty, cache_mode,
+                    overflow='refuse', usage_callback=usage_callback
+                )
+                if chunk.separator:
+                    yield chunk.separator
+            return
+
+        if request.cached is not None:
+            usage = self._finish(request)
+            if usage_callback is not None:
+                usage_callback(usage)
+            yield request.cached
+            return
+
+        try:
+            # Apenas a abertura do stream é repetida; o hedging duplicaria a geração inteira
+            stream = self.resilience.call(lambda timeout: self.client.chat.completions.create(
+                **request.params,
+                stream=True,
+                stream_options={'include_usage': True},
+                timeout=timeout
+            ), hedge=False)
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            raise Exception(f"Erro ao simplificar o texto: {str(e)}") from e
+
+        parts = []
+        usage_response = None
+        finish_reason = None
+        # Os espaços iniciais da resposta são descartados, como no `strip()` de `simplify`
+        started = False
+        try:
+            for event in stream:
+                if getattr(event, 'usage', None) is not None:
+                    usage_response = event
+                for choice in getattr(event, 'choices', None) or []:
+                    finish_reason = getattr(choice, 'finish_reason', None) or finish_reason
+                    delta = getattr(choice.delta, 'content', None)
+                    if not delta:
+                        continue
+                    if not started:
+                        delta = delta.lstrip()
+                        if not delta:
+                            continue
+                        started = True
+                    parts.append(delta)
+                    yield delta
+        finally:
+            # Se o consumidor parar antes do fim (e.g., o cliente do SSE desconectou, `GeneratorExit`),
+            # fechar o stream encerra a conexão HTTP e interrompe a geração (e a cobrança) na OpenAI
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                close()
+
+        # O evento com o consumo de tokens não tem `choices`: o motivo de término vem dos anteriores
+        usage = self._finish(request, ''.join(parts).strip(), usage_response, finish_reason or 'stop')
+        if usage_callback is not None:
+            usage_callback(usage)
+
+    async def asimplify_text(
+            self,
+            text: str,
+            area_tecnica: str,
+            estilo: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: Optional[int] = None,
+            top_p: float = 1.0,
+            frequency_penalty: float = 0.0,
+            presence_penalty: float = 0.0,
+            cache_mode: str = 'bypass'
+    ) -> str:
+        """
+        Versão assíncrona de `simplify_text`.
+
+        Utiliza o cliente `AsyncOpenAI` do event loop atual e aguarda o backoff entre as
+        tentativas com `asyncio.sleep` (veja `ResiliencePolicy.acall`), de modo que nenhuma
+        thread fica bloqueada enquanto a resposta da OpenAI não chega. Os parâmetros, o retorno
+        e as exceções são os mesmos de `simplify_text`.
+        """
+        result = await self.asimplify(
+            text=text,
+            area_tecnica=area_tecnica,
+            estilo=estilo,
+            summarize=summarize,
+            model=model,
+            complexity_level=complexity_level,
+            focus_aspects=focus_aspects,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            cache_mode=cache_mode
+        )
+        return result.text
+
+    async def asimplify(
+            self,
+            text: str,
+            area_tecnica: str,
+            estilo: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: Optional[int] = None,
+            top_p: float = 1.0,
+            frequency_penalty: float = 0.0,
+            presence_penalty: float = 0.0,
+            cache_mode: str = 'bypass',
+            overflow: Optional[str] = None
+    ) -> SimplificationResult:
+        """
+        Versão assíncrona de `simplify`. Os parâmetros, o retorno e as exceções são os mesmos.
+        """
+        # O backend do cache pode fazer I/O síncrono (banco de dados, SQLite): fora do event loop
+        request = await asyncio.to_thread(
+            self._prepare,
+            text, area_tecnica, estilo, summarize, model, complexity_level, focus_aspects,
+            temperature, max_tokens, top_p, frequency_penalty, presence_penalty, cache_mode
+        )
+
+        if not request.budget.fits:
+            chunks = self._split_for_budget(text, request.budget, summarize, overflow)
+            results = []
+            for chunk in chunks:
+                results.append(await self.asimplify(
+                    chunk.text, area_tecnica, estilo, summarize, model, complexity_level, focus_aspects,
+                    temperature, max_tokens, top_p, frequency_penalty, presence_penalty, cache_mode,
+                    overflow='refuse'
+                ))
+            return SimplificationResult(
+                TextChunker.join((result.text for result in results), chunks),
+                merge_usage(result.usage for result in results)
+            )
+
+        if request.cached is not None:
+            return SimplificationResult(request.cached, self._finish(request))
+
+        async_client = client_registry.get_async_openai_client()
+        try:
+            with stage_timer('openai', model=model):
+                response = await self.resilience.acall(
+                    lambda timeout: async_client.chat.completions.create(**request.params, timeout=timeout)
                 )
-                return response.choices[0].message.content.strip()
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise Exception(f"Erro ao simplificar o texto após várias tentativas: {str(e)}")
-                else:
-                    wait_time = 2 ** attempt + random.uniform(0, 1)
-                    time.sleep(wait_time)
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            raise Exception(f"Erro ao simplificar o texto: {str(e)}") from e
+        content = response.choices[0].message.content.strip()
+        usage = await asyncio.to_thread(self._finish, request, content, response)
+        return SimplificationResult(content, usage)
@@ -0,0 +1,499 @@
+# aws_translator_app/services/api/resilience.py
+
+"""
+Resilience Module
+=================
+
+Este módulo concentra a política de chamadas às APIs externas (OpenAI e AWS Translate):
+
+1. Classificação dos erros: falhas transitórias (timeouts, conexão, throttling, erros 5xx) são
+   repetidas; erros definitivos (credenciais, modelo inválido, requisição inválida, cota esgotada)
+   são propagados na primeira ocorrência.
+2. Prazo total (deadline) por chamada: todas as tentativas e esperas de uma chamada cabem no
+   prazo configurado, e cada tentativa recebe como timeout apenas o tempo restante.
+3. Backoff exponencial com *full jitter* (espera aleatória entre zero e o teto da tentativa),
+   interrompido quando a próxima espera ultrapassaria o prazo.
+4. Circuit breaker por serviço externo: após falhas transitórias consecutivas, as chamadas falham
+   imediatamente por um intervalo, em vez de ocuparem workers esperando um serviço degradado.
+   Depois do intervalo, uma única chamada de teste decide se o circuito volta a fechar.
+5. Requisições *hedged* (opcional): se a tentativa não terminar em `HEDGE_AFTER` segundos, uma
+   segunda é disparada em paralelo e vale a primeira resposta. Reduz a latência de cauda ao custo
+   de chamadas extras; use apenas em chamadas idempotentes.
+
+Classes:
+    UpstreamUnavailableError: Base dos erros de indisponibilidade (circuito aberto ou prazo esgotado).
+    CircuitOpenError: O circuito do serviço está aberto.
+    DeadlineExceededError: O prazo da chamada terminou antes de uma resposta.
+    Deadline: Prazo total de uma chamada.
+    CircuitBreaker: Circuit breaker de um serviço externo.
+    ResiliencePolicy: Executa chamadas com retry, prazo, circuit breaker e hedging.
+
+Funções:
+    is_retryable(error: BaseException) ⇾ bool:
+        Indica se o erro é transitório (e a chamada pode ser repetida).
+    get_resilience_policy(name: str) ⇾ ResiliencePolicy:
+        Retorna a política compartilhada pelo processo para o serviço informado.
+    resilience_stats() ⇾ dict:
+        Retorna o estado dos circuit breakers e os contadores de cada política.
+
+Configurações (settings.py):
+    - RESILIENCE (dict): Uma entrada por serviço (`'openai'`, `'aws_translate'`) com
+      `MAX_ATTEMPTS`, `DEADLINE`, `BASE_DELAY`, `MAX_DELAY`, `FAILURE_THRESHOLD`,
+      `RECOVERY_TIMEOUT` e `HEDGE_AFTER` (segundos; 0 desativa o hedging).
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.api.resilience import get_resilience_policy
+    >>> policy = get_resilience_policy('aws_translate')
+    >>> response = policy.call(lambda timeout: client.translate_text(Text='Olá', ...))
+"""
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import openai
+from botocore.exceptions import ClientError, ConnectionError as BotoConnectionError, HTTPClientError
+from django.conf import settings
+
+T = TypeVar('T')
+
+# Códigos de erro da AWS que indicam sobrecarga ou falha temporária do serviço
+RETRYABLE_AWS_CODES = frozenset({
+    'ThrottlingException', 'Throttling', 'TooManyRequestsException', 'LimitExceededException',
+    'ServiceUnavailableException', 'ServiceUnavailable', 'InternalServerException',
+    'InternalFailure', 'RequestTimeout', 'RequestTimeoutException',
+})
+
+# Status HTTP transitórios (timeout, conflito, rate limit e erros do servidor)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+DEFAULT_CONFIG = {
+    'MAX_ATTEMPTS': 4,
+    'DEADLINE': 60.0,
+    'BASE_DELAY': 0.5,
+    'MAX_DELAY': 8.0,
+    'FAILURE_THRESHOLD': 5,
+    'RECOVERY_TIMEOUT': 30.0,
+    'HEDGE_AFTER': 0.0,
+}
+
+
+class UpstreamUnavailableError(Exception):
+    """
+    O serviço externo não respondeu a tempo ou está marcado como indisponível.
+    """
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """
+    O circuit breaker do serviço está aberto: a chamada falhou sem ser enviada.
+    """
+
+
+class DeadlineExceededError(UpstreamUnavailableError):
+    """
+    O prazo total da chamada (todas as tentativas) terminou antes de uma resposta.
+    """
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code
+    if isinstance(error, ClientError):
+        return error.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+    return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Classifica o erro de uma chamada externa como transitório ou definitivo.
+
+    São transitórios: falhas de conexão e timeouts, throttling (HTTP 429 e os códigos de
+    throttling da AWS), conflitos (409) e erros do servidor (5xx). Todo o resto (credenciais,
+    permissões, modelo ou requisição inválidos) é definitivo, assim como o rate limit da OpenAI
+    por cota esgotada (`insufficient_quota`), que não se resolve com uma nova tentativa.
+
+    Parâmetros:
+        error (BaseException): O erro levantado pela chamada.
+
+    Retorna:
+        bool: True se a chamada pode ser repetida.
+    """
+    if isinstance(error, UpstreamUnavailableError):
+        return False
+    if isinstance(error, openai.RateLimitError):
+        return getattr(error, 'code', None) != 'insufficient_quota'
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code', '')
+        if code in RETRYABLE_AWS_CODES:
+            return True
+    if isinstance(error, (openai.APIConnectionError, BotoConnectionError, HTTPClientError,
+                          ConnectionError, TimeoutError)):
+        return True
+    status = _status_code(error)
+    return status is not None and (status in RETRYABLE_STATUS_CODES or status >= 500)
+
+
+class Deadline:
+    """
+    Prazo total de uma chamada, medido com um relógio monotônico.
+    """
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """
+        Retorna o tempo restante, em segundos (zero se o prazo já terminou).
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker de um serviço externo, compartilhado por todas as threads do processo.
+
+    Estados:
+        - `closed`: as chamadas passam; falhas transitórias consecutivas são contadas.
+        - `open`: atingido o limite de falhas, as chamadas falham imediatamente com
+          `CircuitOpenError` durante `recovery_timeout` segundos.
+        - `half_open`: passado o intervalo, uma única chamada de teste é liberada; se tiver
+          sucesso, o circuito fecha, e se falhar, volta a abrir.
+
+    Apenas falhas transitórias contam: um erro definitivo (por exemplo, requisição inválida)
+    mostra que o serviço está respondendo.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Inicializa o circuit breaker fechado.
+
+        Parâmetros:
+            name (str): Nome do serviço (usado nas mensagens de erro).
+            failure_threshold (int): Falhas transitórias consecutivas que abrem o circuito (0 desativa).
+            recovery_timeout (float): Segundos com o circuito aberto antes da chamada de teste.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._rejected = 0
+        self._opened = 0
+
+    def before_call(self) -> None:
+        """
+        Verifica se a chamada pode ser enviada.
+
+        Exceções:
+            - CircuitOpenError: Se o circuito estiver aberto (ou se a chamada de teste já estiver em andamento).
+        """
+        if not self.failure_threshold:
+            return
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self._rejected += 1
+            retry_in = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(
+            f"O serviço {self.name} está temporariamente indisponível. "
+            f"Tente novamente em {retry_in:.0f} segundos."
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        if not self.failure_threshold:
+            return
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._opened += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """
+        Libera a chamada de teste sem alterar o estado (a chamada terminou sem indicar a saúde do serviço).
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def stats(self) -> dict:
+        state = self.state
+        with self._lock:
+            return {
+                'state': state,
+                'consecutive_failures': self._failures,
+                'times_opened': self._opened,
+                'rejected_calls': self._rejected,
+            }
+
+
+class ResiliencePolicy:
+    """
+    Executa chamadas a um serviço externo com classificação de erros, prazo total, retry com
+    jitter, circuit breaker e, opcionalmente, hedging.
+
+    A função chamada recebe o tempo restante do prazo (`timeout`, em segundos), para limitar
+    cada tentativa; clientes que não aceitam timeout por chamada podem ignorá-lo.
+
+    Métodos:
+        call(fn: Callable[[float], T], hedge: Optional[bool] = None) ⇾ T:
+            Executa a chamada síncrona.
+        acall(fn: Callable[[float], Awaitable[T]], hedge: Optional[bool] = None) ⇾ T:
+            Executa a chamada assíncrona.
+        stats() ⇾ dict:
+            Retorna os contadores da política e o estado do circuit breaker.
+    """
+
+    def __init__(self, name: str, config: Optional[dict] = None):
+        """
+        Inicializa a política.
+
+        Parâmetros:
+            name (str): Nome do serviço externo.
+            config (dict, optional): Configuração (veja `DEFAULT_CONFIG`); chaves ausentes usam o padrão.
+        """
+        config = {**DEFAULT_CONFIG, **(config or {})}
+        self.name = name
+        self.max_attempts = max(1, int(config['MAX_ATTEMPTS']))
+        self.deadline = float(config['DEADLINE'])
+        self.base_delay = float(config['BASE_DELAY'])
+        self.max_delay = float(config['MAX_DELAY'])
+        self.hedge_after = float(config['HEDGE_AFTER'])
+        self.breaker = CircuitBreaker(name, int(config['FAILURE_THRESHOLD']), float(config['RECOVERY_TIMEOUT']))
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._counters = {'calls': 0, 'retries': 0, 'hedged': 0, 'failures': 0, 'deadline_exceeded': 0}
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Retorna a espera antes da tentativa seguinte à `attempt` (a partir de 1): um valor
+        aleatório entre zero e `min(MAX_DELAY, BASE_DELAY * 2 ** (attempt - 1))`.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def _after_failure(self, error: Exception, attempt: int, deadline: Deadline) -> float:
+        """
+        Registra a falha e retorna a espera antes da próxima tentativa, ou propaga o erro.
+        """
+        retryable = is_retryable(error)
+        if retryable:
+            self.breaker.record_failure()
+        else:
+            # O serviço respondeu; o erro é da requisição
+            self.breaker.record_success()
+        if not retryable or attempt >= self.max_attempts:
+            self._count('failures')
+            raise error
+        delay = self.backoff(attempt)
+        if delay >= deadline.remaining():
+            self._count('deadline_exceeded')
+            raise DeadlineExceededError(
+                f"Prazo de {self.deadline:.0f} segundos esgotado para o serviço {self.name} "
+                f"após {attempt} tentativa(s): {error}"
+            ) from error
+        self._count('retries')
+        return delay
+
+    def _check_deadline(self, deadline: Deadline) -> float:
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            self._count('deadline_exceeded')
+            raise DeadlineExceededError(f"Prazo de {self.deadline:.0f} segundos esgotado para o serviço {self.name}.")
+        return remaining
+
+    def call(self, fn: Callable[[float], T], hedge: Optional[bool] = None) -> T:
+        """
+        Executa `fn` com retry, prazo total e circuit breaker.
+
+        Parâmetros:
+            fn (Callable[[float], T]): A chamada; recebe o tempo restante do prazo.
+            hedge (bool, optional): Força ou desativa o hedging. Padrão: ativo se `HEDGE_AFTER` > 0.
+
+        Retorna:
+            T: O resultado de `fn`.
+
+        Exceções:
+            - CircuitOpenError: Se o circuito do serviço estiver aberto.
+            - DeadlineExceededError: Se o prazo terminar antes de uma resposta.
+            - Exception: O erro de `fn`, se for definitivo ou se as tentativas se esgotarem.
+        """
+        hedge = self.hedge_after > 0 if hedge is None else hedge
+        deadline = Deadline(self.deadline)
+        self._count('calls')
+        attempt = 0
+        while True:
+            attempt += 1
+            self.breaker.before_call()
+            try:
+                remaining = self._check_deadline(deadline)
+                result = self._call_hedged(fn, deadline) if hedge else fn(remaining)
+            except UpstreamUnavailableError:
+                # O prazo terminou sem resposta do serviço: não conta como sucesso nem como falha
+                self.breaker.release_probe()
+                raise
+            except Exception as e:
+                time.sleep(self._after_failure(e, attempt, deadline))
+                continue
+            self.breaker.record_success()
+            return result
+
+    def _call_hedged(self, fn: Callable[[float], T], deadline: Deadline) -> T:
+        """
+        Executa `fn` em uma thread e, se não houver resposta em `HEDGE_AFTER` segundos, dispara
+        uma segunda tentativa; retorna a primeira resposta bem-sucedida.
+        """
+        if self._hedge_executor is None:
+            with self._lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(thread_name_prefix=f'hedge-{self.name}')
+        executor = self._hedge_executor
+
+        pending = {executor.submit(fn, deadline.remaining())}
+        done, pending = wait(pending, timeout=min(self.hedge_after, deadline.remaining()))
+        if not done and not deadline.expired():
+            self._count('hedged')
+            pending.add(executor.submit(fn, deadline.remaining()))
+
+        error = None
+        while True:
+            for future in done:
+                if future.exception() is None:
+                    # A tentativa mais lenta continua em segundo plano; seu resultado é descartado
+                    return future.result()
+                error = future.exception()
+            if not pending:
+                raise error
+            done, pending = wait(pending, timeout=deadline.remaining(), return_when=FIRST_COMPLETED)
+            if not done:
+                raise TimeoutError(f"Sem resposta do serviço {self.name} dentro do prazo.")
+
+    async def acall(self, fn: Callable[[float], Awaitable[T]], hedge: Optional[bool] = None) -> T:
+        """
+        Versão assíncrona de `call`: as esperas usam `asyncio.sleep` e cada tentativa é limitada
+        ao tempo restante com `asyncio.wait_for`. Os parâmetros, o retorno e as exceções são os mesmos.
+        """
+        hedge = self.hedge_after > 0 if hedge is None else hedge
+        deadline = Deadline(self.deadline)
+        self._count('calls')
+        attempt = 0
+        while True:
+            attempt += 1
+            self.breaker.before_call()
+            try:
+                remaining = self._check_deadline(deadline)
+                if hedge:
+                    result = await self._acall_hedged(fn, deadline)
+                else:
+                    result = await asyncio.wait_for(fn(remaining), timeout=remaining)
+            except UpstreamUnavailableError:
+                self.breaker.release_probe()
+                raise
+            except Exception as e:
+                await asyncio.sleep(self._after_failure(e, attempt, deadline))
+                continue
+            self.breaker.record_success()
+            return result
+
+    async def _acall_hedged(self, fn: Callable[[float], Awaitable[T]], deadline: Deadline) -> T:
+        pending = {asyncio.ensure_future(fn(deadline.remaining()))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=min(self.hedge_after, deadline.remaining()))
+            if not done and not deadline.expired():
+                self._count('hedged')
+                pending.add(asyncio.ensure_future(fn(deadline.remaining())))
+
+            error = None
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                if not pending:
+                    raise error
+                done, pending = await asyncio.wait(
+                    pending, timeout=deadline.remaining(), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise TimeoutError(f"Sem resposta do serviço {self.name} dentro do prazo.")
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self._counters)
+        return {**counters, 'circuit': self.breaker.stats()}
+
+
+_policies: Dict[str, ResiliencePolicy] = {}
+_policies_lock = threading.Lock()
+
+
+def get_resilience_policy(name: str) -> ResiliencePolicy:
+    """
+    Retorna a política de resiliência compartilhada pelo processo para o serviço informado.
+
+    A política (e, portanto, o circuit breaker) é criada no primeiro acesso a partir de
+    `settings.RESILIENCE[name]`.
+
+    Parâmetros:
+        name (str): Nome do serviço (`'openai'` ou `'aws_translate'`).
+
+    Retorna:
+        ResiliencePolicy: A política do serviço.
+    """
+    policy = _policies.get(name)
+    if policy is None:
+        with _policies_lock:
+            policy = _policies.get(name)
+            if policy is None:
+                config = getattr(settings, 'RESILIENCE', {}).get(name, {})
+                policy = ResiliencePolicy(name, config)
+                _policies[name] = policy
+    return policy
+
+
+def resilience_stats() -> dict:
+    """
+    Retorna os contadores e o estado do circuit breaker de cada política criada.
+    """
+    return {name: policy.stats() for name, policy in list(_policies.items())}
@@ -0,0 +1,332 @@
+# aws_translator_app/services/api/token_budget.py
+
+"""
+Token Budget Module
+===================
+
+Este módulo calcula o orçamento de tokens das requisições à OpenAI antes de qualquer chamada
+de rede: conta os tokens da entrada localmente, deriva o `max_tokens` da resposta a partir do
+tamanho da entrada (e do pedido de resumo) e verifica se a requisição cabe na janela de contexto
+e no limite de saída do modelo.
+
+A contagem usa o `tiktoken` com a codificação de cada modelo; se ele não estiver instalado ou
+os arquivos da codificação não puderem ser obtidos (e.g., sem rede), os tokens são estimados de
+forma conservadora a partir dos caracteres do texto (veja `estimate_tokens`), e os orçamentos
+indicam `exact=False`.
+
+Classes:
+    ModelLimits: Janela de contexto, limite de saída e codificação de um modelo.
+    TokenBudget: Orçamento calculado para uma requisição.
+    TokenCounter: Conta os tokens de textos e mensagens para um modelo.
+    TokenBudgeter: Calcula os orçamentos conforme `settings.TOKEN_BUDGET`.
+    TokenBudgetExceededError: A entrada não cabe no modelo e a divisão está desativada.
+
+Funções:
+    get_token_counter(model: str) ⇾ TokenCounter:
+        Retorna o contador de tokens do modelo, criado uma vez por processo.
+    estimate_tokens(text: str) ⇾ int:
+        Estimativa conservadora do número de tokens, usada sem o `tiktoken`.
+    usage_from_budget(budget: TokenBudget, response=None, cached: bool = False) ⇾ dict:
+        Monta o consumo previsto e real de tokens de uma chamada.
+    merge_usage(usages: Iterable[dict]) ⇾ dict:
+        Soma os consumos de tokens de várias chamadas.
+
+Dependências:
+    - tiktoken: para a contagem exata de tokens (sem ele, a contagem é estimada).
+
+Configurações (settings.TOKEN_BUDGET):
+    - OVERFLOW (str): `'chunk'` (divide a entrada que não cabe no modelo) ou `'refuse'`.
+    - OUTPUT_RATIO (float): tokens de saída por token de entrada na simplificação.
+    - SUMMARY_OUTPUT_RATIO (float): tokens de saída por token de entrada quando há resumo.
+    - MIN_OUTPUT_TOKENS (int): `max_tokens` mínimo de uma requisição.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.api.token_budget import TokenBudgeter
+    >>> budget = TokenBudgeter().plan(messages, text, model='gpt-4o-mini', summarize=False)
+    >>> budget.prompt_tokens, budget.max_tokens, budget.fits
+    (412, 600, True)
+"""
+
+import math
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from django.conf import settings
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - instalação sem o tiktoken
+    tiktoken = None
+
+
+class ModelLimits(NamedTuple):
+    """
+    Limites de um modelo da OpenAI.
+
+    Atributos:
+        context_window (int): Tokens de entrada e saída somados.
+        max_output_tokens (int): Tokens máximos da resposta.
+        encoding (str): Codificação do `tiktoken`.
+    """
+    context_window: int
+    max_output_tokens: int
+    encoding: str
+
+
+# Limites dos modelos de `constants.AVAILABLE_MODELS`
+MODEL_LIMITS: Dict[str, ModelLimits] = {
+    'gpt-3.5-turbo-0125': ModelLimits(16385, 4096, 'cl100k_base'),
+    'gpt-4-turbo': ModelLimits(128000, 4096, 'cl100k_base'),
+    'gpt-4o-mini': ModelLimits(128000, 16384, 'o200k_base'),
+    'gpt-4o': ModelLimits(128000, 16384, 'o200k_base'),
+}
+
+# Modelos desconhecidos usam os limites mais restritivos da lista
+DEFAULT_MODEL_LIMITS = ModelLimits(16385, 4096, 'cl100k_base')
+
+# Formatação do Chat Completions: tokens fixos por mensagem e do início da resposta
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_REPLY = 3
+
+
+class TokenBudgetExceededError(ValueError):
+    """
+    Exceção lançada quando a entrada não cabe no modelo e a divisão automática está desativada.
+    """
+    pass
+
+
+class TokenBudget(NamedTuple):
+    """
+    Orçamento de tokens de uma requisição.
+
+    Atributos:
+        model (str): O modelo.
+        prompt_tokens (int): Tokens previstos da entrada (mensagens completas).
+        text_tokens (int): Tokens previstos do texto a ser simplificado.
+        max_tokens (int): `max_tokens` a ser enviado à API.
+        desired_output_tokens (int): Saída prevista para o texto, antes dos limites do modelo.
+        limits (ModelLimits): Os limites do modelo.
+        exact (bool): Se a contagem veio do `tiktoken` (e não de uma estimativa).
+        fits (bool): Se a entrada e a saída prevista cabem no modelo.
+    """
+    model: str
+    prompt_tokens: int
+    text_tokens: int
+    max_tokens: int
+    desired_output_tokens: int
+    limits: ModelLimits
+    exact: bool
+    fits: bool
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estima o número de tokens de um texto sem o `tiktoken`.
+
+    Caracteres ASCII contam como 1/3 de token e os demais como um token inteiro. A média em
+    inglês é de cerca de 4 caracteres por token, mas textos em português, números e pontuação
+    rendem menos caracteres por token; com 1/3, a estimativa fica acima da contagem real dos
+    modelos da OpenAI para esses textos, e o orçamento erra para o lado seguro (a janela de
+    contexto não é excedida e a resposta não é truncada).
+    """
+    ascii_characters = len(text.encode('ascii', 'ignore'))
+    return math.ceil(ascii_characters / 3 + (len(text) - ascii_characters))
+
+
+class TokenCounter:
+    """
+    Conta os tokens de textos e mensagens para um modelo.
+
+    Métodos:
+        count(text: str) ⇾ int:
+            Conta os tokens de um texto.
+        count_messages(messages: List[dict]) ⇾ int:
+            Conta os tokens de uma lista de mensagens do Chat Completions.
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        self.limits = MODEL_LIMITS.get(model, DEFAULT_MODEL_LIMITS)
+        self._encoding = None
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.get_encoding(self.limits.encoding)
+            except Exception:
+                # Sem acesso aos arquivos da codificação (e.g., sem rede): usa a estimativa
+                self._encoding = None
+        self.exact = self._encoding is not None
+
+    def count(self, text: str) -> int:
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return estimate_tokens(text)
+
+    def count_messages(self, messages: List[dict]) -> int:
+        total = TOKENS_PER_REPLY
+        for message in messages:
+            total += TOKENS_PER_MESSAGE
+            for value in message.values():
+                total += self.count(value)
+        return total
+
+
+_counters: Dict[str, TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(model: str) -> TokenCounter:
+    """
+    Retorna o contador de tokens do modelo, criado uma vez por processo.
+    """
+    counter = _counters.get(model)
+    if counter is None:
+        with _counters_lock:
+            counter = _counters.get(model)
+            if counter is None:
+                counter = TokenCounter(model)
+                _counters[model] = counter
+    return counter
+
+
+class TokenBudgeter:
+    """
+    Calcula o orçamento de tokens das requisições de simplificação.
+
+    Métodos:
+        plan(messages: List[dict], text: str, model: str, summarize: bool, max_tokens: Optional[int]) ⇾ TokenBudget:
+            Calcula o orçamento de uma requisição.
+        max_text_tokens(messages_overhead: int, model: str, summarize: bool) ⇾ int:
+            Tokens máximos de texto por requisição, para a divisão de entradas que não cabem no modelo.
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        """
+        Inicializa o calculador de orçamentos.
+
+        Parâmetros:
+            config (dict, optional): Configurações. Padrão: `settings.TOKEN_BUDGET`.
+        """
+        config = config if config is not None else getattr(settings, 'TOKEN_BUDGET', {})
+        self.overflow = config.get('OVERFLOW', 'chunk')
+        self.output_ratio = config.get('OUTPUT_RATIO', 1.5)
+        self.summary_output_ratio = config.get('SUMMARY_OUTPUT_RATIO', 0.6)
+        self.min_output_tokens = config.get('MIN_OUTPUT_TOKENS', 256)
+
+    def _ratio(self, summarize: bool) -> float:
+        return self.summary_output_ratio if summarize else self.output_ratio
+
+    def plan(self, messages: List[dict], text: str, model: str, summarize: bool,
+             max_tokens: Optional[int] = None) -> TokenBudget:
+        """
+        Calcula o orçamento de tokens de uma requisição.
+
+        A saída prevista é proporcional ao texto (`OUTPUT_RATIO`, ou `SUMMARY_OUTPUT_RATIO` com
+        resumo), com um mínimo de `MIN_OUTPUT_TOKENS`. Um `max_tokens` informado pelo cliente
+        substitui a previsão. Em ambos os casos, o valor é limitado pelo limite de saída do
+        modelo e pelo espaço restante na janela de contexto.
+
+        Parâmetros:
+            messages (List[dict]): As mensagens completas da requisição.
+            text (str): O texto a ser simplificado (parte das mensagens).
+            model (str): O modelo.
+            summarize (bool): Indica se o texto deve ser resumido.
+            max_tokens (int, optional): `max_tokens` pedido pelo cliente.
+
+        Retorna:
+            TokenBudget: O orçamento. `fits` é falso quando a entrada não cabe na janela de
+            contexto ou quando a saída prevista excede o limite de saída do modelo (a resposta
+            seria truncada).
+        """
+        counter = get_token_counter(model)
+        limits = counter.limits
+        prompt_tokens = counter.count_messages(messages)
+        text_tokens = counter.count(text)
+
+        desired = max_tokens or max(self.min_output_tokens, math.ceil(text_tokens * self._ratio(summarize)))
+        available = min(limits.max_output_tokens, limits.context_window - prompt_tokens)
+        if max_tokens:
+            # Valor pedido pelo cliente: basta haver espaço para a resposta (o valor é limitado ao disponível)
+            fits = available >= min(max_tokens, self.min_output_tokens)
+        else:
+            fits = desired <= available
+        return TokenBudget(
+            model=model,
+            prompt_tokens=prompt_tokens,
+            text_tokens=text_tokens,
+            max_tokens=max(1, min(desired, available)),
+            desired_output_tokens=desired,
+            limits=limits,
+            exact=counter.exact,
+            fits=fits
+        )
+
+    def max_text_tokens(self, messages_overhead: int, model: str, summarize: bool) -> int:
+        """
+        Retorna quantos tokens de texto cabem em uma requisição, considerando a saída prevista.
+
+        Parâmetros:
+            messages_overhead (int): Tokens das mensagens sem o texto (instruções e formatação).
+            model (str): O modelo.
+            summarize (bool): Indica se o texto deve ser resumido.
+
+        Retorna:
+            int: O maior número de tokens de texto cuja entrada e saída previstas cabem no modelo.
+        """
+        limits = get_token_counter(model).limits
+        ratio = self._ratio(summarize)
+        by_context = (limits.context_window - messages_overhead - self.min_output_tokens) / (1 + ratio)
+        by_output = limits.max_output_tokens / ratio
+        return max(1, int(min(by_context, by_output)))
+
+
+def usage_from_budget(budget: TokenBudget, response=None, cached: bool = False) -> dict:
+    """
+    Monta o consumo de tokens de uma chamada: o previsto pelo orçamento e o informado pela API.
+
+    Parâmetros:
+        budget (TokenBudget): O orçamento da chamada.
+        response (optional): A resposta do Chat Completions (`None` para respostas em cache).
+        cached (bool): Se a resposta veio do cache de respostas.
+
+    Retorna:
+        dict: `model`, `exact`, `predicted_prompt_tokens`, `max_tokens`, `prompt_tokens`,
+        `completion_tokens`, `calls`, `cached_calls` e `truncated_calls`.
+    """
+    usage = getattr(response, 'usage', None)
+    choices = getattr(response, 'choices', None) or []
+    truncated = bool(choices) and getattr(choices[0], 'finish_reason', None) == 'length'
+    return {
+        'model': budget.model,
+        'exact': budget.exact,
+        'predicted_prompt_tokens': budget.prompt_tokens,
+        'max_tokens': budget.max_tokens,
+        'prompt_tokens': getattr(usage, 'prompt_tokens', None) or 0,
+        'completion_tokens': getattr(usage, 'completion_tokens', None) or 0,
+        'calls': 0 if cached else 1,
+        'cached_calls': 1 if cached else 0,
+        'truncated_calls': 1 if truncated else 0,
+    }
+
+
+def merge_usage(usages: Iterable[dict]) -> dict:
+    """
+    Soma os consumos de tokens de várias chamadas (e.g., os blocos de um texto).
+
+    Parâmetros:
+        usages (Iterable[dict]): Consumos retornados por `usage_from_budget` (ou já somados).
+
+    Retorna:
+        dict: O consumo total; `exact` é verdadeiro apenas se todas as contagens forem exatas.
+    """
+    merged = None
+    for usage in usages:
+        if merged is None:
+            merged = dict(usage)
+            continue
+        for key, value in usage.items():
+            if key == 'exact':
+                merged[key] = merged[key] and value
+            elif key != 'model':
+                merged[key] = merged.get(key, 0) + value
+    return merged or {}
@@ -0,0 +1,420 @@
+# aws_translator_app/services/cache/backends.py
+
+"""
+Cache Backends Module
+=====================
+
+Este módulo fornece backends de cache intercambiáveis utilizados pelos caches de resultados
+do pipeline de tradução. Todos os backends armazenam valores serializáveis em JSON e
+expõem a mesma interface (`get`, `set`, `delete`, `clear`, `stats`).
+
+Backends disponíveis:
+    - LRUCacheBackend: cache em memória do processo, com TTL e remoção LRU por número de
+      entradas e por tamanho em bytes.
+    - DjangoCacheBackend: delega para um dos caches configurados em `settings.CACHES`.
+    - SQLiteCacheBackend: cache local em disco (SQLite), compartilhado entre os processos
+      de uma mesma máquina e persistente entre reinicializações, com remoção LRU por número
+      de entradas e por tamanho em bytes.
+
+Funções:
+    build_cache_backend(config: dict) ⇾ BaseCacheBackend:
+        Cria o backend descrito pelo dicionário de configuração.
+
+Dependências:
+    - sqlite3: biblioteca padrão para o cache em disco.
+    - threading: para sincronizar o acesso ao cache em memória.
+    - django.core.cache: para o backend baseado em `settings.CACHES`.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from django.core.cache import caches
+
+
+class BaseCacheBackend:
+    """
+    Interface comum dos backends de cache.
+
+    Métodos:
+        get(key: str) ⇾ Optional[Any]: Retorna o valor armazenado ou `None`.
+        set(key: str, value: Any, ttl: Optional[float]) ⇾ None: Armazena um valor.
+        delete(key: str) ⇾ None: Remove um valor.
+        clear() ⇾ None: Remove todos os valores.
+        stats() ⇾ dict: Retorna estatísticas específicas do backend.
+    """
+
+    name = 'base'
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {'backend': self.name}
+
+
+class LRUCacheBackend(BaseCacheBackend):
+    """
+    Cache em memória com TTL e remoção LRU.
+
+    As entradas são mantidas em um `OrderedDict` na ordem de uso; a entrada menos
+    recentemente utilizada é removida sempre que o número de entradas ou o total de
+    bytes ultrapassa os limites configurados.
+
+    Parâmetros:
+        max_entries (int): Número máximo de entradas (0 para ilimitado).
+        max_bytes (int): Tamanho máximo aproximado, em bytes, dos valores armazenados (0 para ilimitado).
+        default_ttl (float, optional): TTL padrão em segundos (`None` para não expirar).
+    """
+
+    name = 'lru'
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 0, default_ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._data: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def _sizeof(key: str, value: Any) -> int:
+        """
+        Estima o tamanho de uma entrada pelo tamanho de sua representação JSON.
+        """
+        return len(key) + len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at, size = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self._bytes -= size
+                self._expirations += 1
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        size = self._sizeof(key, value)
+        if self.max_bytes and size > self.max_bytes:
+            # Um valor maior que todo o orçamento nunca seria mantido; não vale a pena armazená-lo.
+            return
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._data[key] = (value, expires_at, size)
+            self._bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove as entradas menos recentemente utilizadas até respeitar os limites.
+        Deve ser chamado com o bloqueio adquirido.
+        """
+        while self._data and (
+                (self.max_entries and len(self._data) > self.max_entries)
+                or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            _, (_, _, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'backend': self.name,
+                'entries': len(self._data),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+            }
+
+
+class DjangoCacheBackend(BaseCacheBackend):
+    """
+    Backend que delega para um cache configurado em `settings.CACHES`.
+
+    Parâmetros:
+        alias (str): Nome do cache em `settings.CACHES`.
+        default_ttl (float, optional): TTL padrão em segundos (`None` para não expirar).
+        key_prefix (str): Prefixo aplicado a todas as chaves.
+    """
+
+    name = 'django'
+
+    def __init__(self, alias: str = 'default', default_ttl: Optional[float] = None, key_prefix: str = ''):
+        self.alias = alias
+        self.default_ttl = default_ttl
+        self.key_prefix = key_prefix
+
+    @property
+    def _cache(self):
+        # `caches` já mantém uma instância por thread; não guardamos a referência.
+        return caches[self.alias]
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(self.key_prefix + key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        self._cache.set(self.key_prefix + key, value, timeout=ttl)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(self.key_prefix + key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {'backend': self.name, 'alias': self.alias}
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """
+    Cache local em disco baseado em SQLite.
+
+    Cada thread utiliza sua própria conexão. O banco é aberto em modo WAL, o que permite
+    leituras concorrentes de vários processos enquanto outro processo escreve. Quando o
+    número de entradas ultrapassa `max_entries`, ou o total de bytes ultrapassa `max_bytes`,
+    as entradas acessadas há mais tempo são removidas.
+
+    O total de bytes (chave e valor JSON em UTF-8, como no `LRUCacheBackend`) é mantido por
+    triggers em uma tabela de uma linha, de modo que fica correto entre os processos que
+    compartilham o arquivo e não exige percorrer a tabela a cada gravação.
+
+    Parâmetros:
+        path (str): Caminho do arquivo SQLite.
+        max_entries (int): Número máximo de entradas (0 para ilimitado).
+        max_bytes (int): Tamanho máximo, em bytes, das entradas armazenadas (0 para ilimitado).
+        default_ttl (float, optional): TTL padrão em segundos (`None` para não expirar).
+    """
+
+    name = 'sqlite'
+
+    # Entradas lidas por consulta ao liberar espaço para o orçamento em bytes
+    EVICTION_BATCH = 32
+
+    def __init__(
+            self,
+            path: str,
+            max_entries: int = 100000,
+            max_bytes: int = 0,
+            default_ttl: Optional[float] = None
+    ):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._local = threading.local()
+        self._evictions = 0
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS cache_entries ('
+            ' key TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL,'
+            ' expires_at REAL,'
+            ' accessed_at REAL NOT NULL)'
+        )
+        self._connection().execute(
+            'CREATE INDEX IF NOT EXISTS cache_entries_accessed_at ON cache_entries (accessed_at)'
+        )
+        self._connection().executescript(
+            'BEGIN IMMEDIATE;'
+            'CREATE TABLE IF NOT EXISTS cache_usage ('
+            ' id INTEGER PRIMARY KEY CHECK (id = 1),'
+            ' bytes INTEGER NOT NULL);'
+            # Arquivos criados antes do orçamento em bytes: o total parte das entradas existentes
+            'INSERT OR IGNORE INTO cache_usage (id, bytes) SELECT 1, coalesce(sum('
+            ' length(CAST(key AS BLOB)) + length(CAST(value AS BLOB))), 0) FROM cache_entries;'
+            'CREATE TRIGGER IF NOT EXISTS cache_entries_insert AFTER INSERT ON cache_entries BEGIN'
+            ' UPDATE cache_usage SET bytes = bytes'
+            '  + length(CAST(NEW.key AS BLOB)) + length(CAST(NEW.value AS BLOB)); END;'
+            'CREATE TRIGGER IF NOT EXISTS cache_entries_delete AFTER DELETE ON cache_entries BEGIN'
+            ' UPDATE cache_usage SET bytes = bytes'
+            '  - length(CAST(OLD.key AS BLOB)) - length(CAST(OLD.value AS BLOB)); END;'
+            'CREATE TRIGGER IF NOT EXISTS cache_entries_update AFTER UPDATE OF value ON cache_entries BEGIN'
+            ' UPDATE cache_usage SET bytes = bytes'
+            '  + length(CAST(NEW.value AS BLOB)) - length(CAST(OLD.value AS BLOB)); END;'
+            'COMMIT;'
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão SQLite da thread atual, abrindo-a se necessário.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[Any]:
+        connection = self._connection()
+        row = connection.execute(
+            'SELECT value, expires_at FROM cache_entries WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        now = time.time()
+        if expires_at is not None and expires_at <= now:
+            connection.execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+            return None
+        connection.execute('UPDATE cache_entries SET accessed_at = ? WHERE key = ?', (now, key))
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        serialized = json.dumps(value, ensure_ascii=False)
+        if self.max_bytes and len(key.encode('utf-8')) + len(serialized.encode('utf-8')) > self.max_bytes:
+            # Como no LRUCacheBackend: um valor maior que todo o orçamento nunca seria mantido
+            return
+        connection = self._connection()
+        # Um upsert (e não INSERT OR REPLACE, cuja remoção implícita não dispara triggers)
+        # mantém o total de bytes correto
+        connection.execute(
+            'INSERT INTO cache_entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)'
+            ' ON CONFLICT (key) DO UPDATE SET'
+            ' value = excluded.value, expires_at = excluded.expires_at, accessed_at = excluded.accessed_at',
+            (key, serialized, expires_at, now)
+        )
+        if self.max_entries:
+            deleted = connection.execute(
+                'DELETE FROM cache_entries WHERE key IN ('
+                ' SELECT key FROM cache_entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            ).rowcount
+            self._evictions += max(deleted, 0)
+        if self.max_bytes:
+            self._evict_bytes(connection, key)
+
+    def _bytes(self, connection: sqlite3.Connection) -> int:
+        row = connection.execute('SELECT bytes FROM cache_usage WHERE id = 1').fetchone()
+        return row[0] if row else 0
+
+    def _evict_bytes(self, connection: sqlite3.Connection, keep: str) -> None:
+        """
+        Remove as entradas acessadas há mais tempo (exceto a recém-gravada) até o total de bytes
+        caber em `max_bytes`.
+        """
+        excess = self._bytes(connection) - self.max_bytes
+        while excess > 0:
+            oldest = connection.execute(
+                'SELECT key, length(CAST(key AS BLOB)) + length(CAST(value AS BLOB)) FROM cache_entries'
+                ' WHERE key != ? ORDER BY accessed_at LIMIT ?',
+                (keep, self.EVICTION_BATCH)
+            ).fetchall()
+            if not oldest:
+                break
+            victims = []
+            for victim, size in oldest:
+                victims.append(victim)
+                excess -= size
+                if excess <= 0:
+                    break
+            deleted = connection.execute(
+                f'DELETE FROM cache_entries WHERE key IN ({", ".join("?" * len(victims))})', victims
+            ).rowcount
+            self._evictions += max(deleted, 0)
+            # Outro processo pode ter gravado ou removido entradas nesse meio-tempo
+            excess = self._bytes(connection) - self.max_bytes
+
+    def delete(self, key: str) -> None:
+        self._connection().execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        self._connection().execute('DELETE FROM cache_entries')
+
+    def stats(self) -> dict:
+        connection = self._connection()
+        (entries,) = connection.execute('SELECT COUNT(*) FROM cache_entries').fetchone()
+        return {
+            'backend': self.name,
+            'path': self.path,
+            'entries': entries,
+            'bytes': self._bytes(connection),
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'evictions': self._evictions,
+        }
+
+
+def build_cache_backend(config: dict) -> BaseCacheBackend:
+    """
+    Cria um backend de cache a partir de um dicionário de configuração.
+
+    Parâmetros:
+        config (dict): Configuração com as chaves `BACKEND` (`'lru'`, `'django'` ou `'sqlite'`),
+            `TTL`, `MAX_ENTRIES`, `MAX_BYTES`, `DJANGO_CACHE_ALIAS`, `KEY_PREFIX` e `SQLITE_PATH`.
+
+    Retorna:
+        BaseCacheBackend: O backend configurado.
+
+    Exceções:
+        - ValueError: se o backend informado não for suportado.
+    """
+    backend = config.get('BACKEND', 'lru')
+    ttl = config.get('TTL')
+    if backend == 'lru':
+        return LRUCacheBackend(
+            max_entries=config.get('MAX_ENTRIES', 10000),
+            max_bytes=config.get('MAX_BYTES', 0),
+            default_ttl=ttl
+        )
+    elif backend == 'django':
+        return DjangoCacheBackend(
+            alias=config.get('DJANGO_CACHE_ALIAS', 'default'),
+            default_ttl=ttl,
+            key_prefix=config.get('KEY_PREFIX', '')
+        )
+    elif backend == 'sqlite':
+        return SQLiteCacheBackend(
+            path=config['SQLITE_PATH'],
+            max_entries=config.get('MAX_ENTRIES', 100000),
+            max_bytes=config.get('MAX_BYTES', 0),
+            default_ttl=ttl
+        )
+    else:
+        raise ValueError(f"Backend de cache não suportado: {backend}")
@@ -0,0 +1,251 @@
+# aws_translator_app/services/cache/export_cache.py
+
+"""
+Export Cache Module
+===================
+
+Este módulo fornece um cache em disco, endereçado por conteúdo, para os documentos exportados
+(PDF, DOCX, TXT). A chave de cada arquivo é o hash SHA-256 do formato, das métricas e do texto,
+de modo que baixar novamente o mesmo relatório serve o arquivo já gerado, sem uma nova
+renderização com o reportlab ou o python-docx.
+
+O diretório tem uma cota em bytes (`MAX_BYTES`); ao ultrapassá-la, os arquivos usados há mais
+tempo são removidos (LRU). A cota vale para o diretório, e não para cada processo: a cada novo
+arquivo, o uso é recalculado a partir do próprio diretório, que pode ser compartilhado por vários
+processos (e.g., os workers do gunicorn). Os arquivos são gravados em um nome temporário no
+próprio diretório e movidos com `os.replace`, de modo que nenhuma requisição lê um arquivo
+incompleto, mesmo com várias exportações simultâneas (em threads ou processos) do mesmo conteúdo.
+
+Classes:
+    ExportCache: Cache de documentos exportados com cota de disco e remoção LRU.
+
+Funções:
+    get_export_cache() ⇾ ExportCache:
+        Retorna o cache de exportações do processo, configurado por `settings.EXPORT_CACHE`.
+
+Dependências:
+    - hashlib: para gerar as chaves do cache.
+    - json: para serializar as métricas de forma canônica.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.cache.export_cache import get_export_cache
+    >>> cache = get_export_cache()
+    >>> key = cache.make_key(text, metrics_original, metrics_simplified, 'pdf')
+    >>> cache.get(key)  # caminho do arquivo em cache ou None
+    >>> path = cache.put(key, temporary_path)  # move o arquivo gerado para o cache
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from django.conf import settings
+
+
+class ExportCache:
+    """
+    Cache de documentos exportados, armazenados como arquivos em um diretório.
+
+    O índice LRU (chave ⇾ tamanho) fica em memória e é reconstruído a partir do diretório (pela
+    data de modificação dos arquivos, atualizada a cada acerto) na criação do cache e a cada
+    arquivo gravado, antes de aplicar a cota; arquivos gravados por outro processo são acertos, e
+    arquivos removidos por outro processo são falhas.
+
+    Métodos:
+        make_key(text: str, metrics_original: dict, metrics_simplified: dict, format: str) ⇾ str:
+            Gera a chave do cache para o conteúdo exportado.
+        get(key: str) ⇾ Optional[str]:
+            Retorna o caminho do arquivo em cache ou `None`.
+        temporary_path(format: str) ⇾ str:
+            Cria um caminho temporário único no diretório do cache para gerar um arquivo.
+        put(key: str, temporary_path: str) ⇾ str:
+            Move o arquivo gerado para o cache e aplica a cota de disco.
+        stats() ⇾ dict:
+            Retorna os contadores de acertos/falhas, o número de arquivos e os bytes ocupados.
+    """
+
+    TEMPORARY_PREFIX = '.tmp-'
+    # Arquivos temporários mais antigos que isso (em segundos) são restos de exportações
+    # interrompidas; os mais recentes podem ser renderizações em andamento em outro processo
+    TEMPORARY_MAX_AGE = 60 * 60
+
+    def __init__(self, directory: str, max_bytes: int, enabled: bool = True):
+        """
+        Inicializa o cache de exportações.
+
+        Parâmetros:
+            directory (str): Diretório onde os arquivos são armazenados (criado se não existir).
+            max_bytes (int): Cota de disco do diretório, em bytes.
+            enabled (bool): Indica se o cache está ativo.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, int]' = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        if enabled:
+            os.makedirs(directory, exist_ok=True)
+            self._load_index()
+
+    def _load_index(self) -> None:
+        """
+        Remove os restos de exportações interrompidas e carrega o índice a partir do diretório.
+        """
+        expired = time.time() - self.TEMPORARY_MAX_AGE
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.startswith(self.TEMPORARY_PREFIX):
+                try:
+                    if entry.stat().st_mtime < expired:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+        with self._lock:
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """
+        Recarrega o índice LRU a partir dos arquivos do diretório, do usado há mais tempo ao mais
+        recente. Deve ser chamado com o bloqueio adquirido.
+        """
+        files = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or entry.name.startswith(self.TEMPORARY_PREFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                # Removido por outro processo durante a leitura
+                continue
+            files.append((stat.st_mtime, entry.name, stat.st_size))
+        self._entries.clear()
+        self._bytes = 0
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._bytes += size
+
+    @staticmethod
+    def make_key(text: str, metrics_original: Optional[dict], metrics_simplified: Optional[dict], format: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(format.lower().encode('utf-8'))
+        digest.update(b'\x00')
+        digest.update(json.dumps([metrics_original, metrics_simplified], sort_keys=True, default=str).encode('utf-8'))
+        digest.update(b'\x00')
+        digest.update(text.encode('utf-8'))
+        return f'{digest.hexdigest()}.{format.lower()}'
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = None
+        with self._lock:
+            if size is None:
+                if key in self._entries:
+                    self._bytes -= self._entries.pop(key)
+                self._misses += 1
+                return None
+            if key not in self._entries:
+                # Gravado por outro processo
+                self._entries[key] = size
+                self._bytes += size
+            self._entries.move_to_end(key)
+            self._hits += 1
+        try:
+            # Mantém a ordem LRU entre reinícios do processo
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def temporary_path(self, format: str) -> str:
+        descriptor, path = tempfile.mkstemp(prefix=self.TEMPORARY_PREFIX, suffix=f'.{format.lower()}', dir=self.directory)
+        os.close(descriptor)
+        return path
+
+    def put(self, key: str, temporary_path: str) -> str:
+        path = self._path(key)
+        size = os.path.getsize(temporary_path)
+        os.replace(temporary_path, path)
+        with self._lock:
+            # O uso do diretório inclui os arquivos gravados pelos outros processos
+            self._rebuild_index()
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)
+            self._entries[key] = size
+            self._bytes += size
+            evicted = self._evict(keep=key)
+        for evicted_key in evicted:
+            try:
+                # Em POSIX, downloads em andamento continuam lendo o arquivo aberto
+                os.remove(self._path(evicted_key))
+            except OSError:
+                pass
+        return path
+
+    def _evict(self, keep: str) -> list:
+        evicted = []
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = next(iter(self._entries.items()))
+            if key == keep:
+                break
+            del self._entries[key]
+            self._bytes -= size
+            self._evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses = self._hits, self._misses
+            lookups = hits + misses
+            return {
+                'enabled': self.enabled,
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'evictions': self._evictions,
+            }
+
+
+_export_cache: Optional[ExportCache] = None
+_export_cache_lock = threading.Lock()
+
+
+def get_export_cache() -> ExportCache:
+    """
+    Retorna o cache de exportações compartilhado pelo processo.
+
+    O cache é criado no primeiro acesso a partir de `settings.EXPORT_CACHE`.
+
+    Retorna:
+        ExportCache: O cache de exportações.
+    """
+    global _export_cache
+    if _export_cache is None:
+        with _export_cache_lock:
+            if _export_cache is None:
+                config = getattr(settings, 'EXPORT_CACHE', {})
+                _export_cache = ExportCache(
+                    directory=config.get('DIRECTORY', os.path.join(tempfile.gettempdir(), 'aws_translator_exports')),
+                    max_bytes=config.get('MAX_BYTES', 256 * 1024 * 1024),
+                    enabled=config.get('ENABLED', True)
+                )
+    return _export_cache
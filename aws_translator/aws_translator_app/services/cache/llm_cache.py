@@ -0,0 +1,151 @@
+# aws_translator_app/services/cache/llm_cache.py
+
+"""
+LLM Response Cache Module
+=========================
+
+Este módulo fornece um cache opcional para as respostas da OpenAI utilizadas na simplificação
+de textos. A chave de cada entrada é o hash SHA-256 das mensagens já renderizadas (prompt de
+sistema e de usuário) e de todos os parâmetros de amostragem (modelo, temperatura, `max_tokens`,
+`top_p`, penalidades). Requisições idênticas são atendidas em milissegundos, sem nova chamada à API.
+
+O uso do cache é controlado por requisição através do modo de cache:
+    - `bypass`: ignora o cache (não lê nem grava).
+    - `prefer`: utiliza a resposta armazenada, se existir; caso contrário, chama a API e armazena a resposta.
+    - `only`: utiliza apenas a resposta armazenada; se não existir, lança `LLMCacheMissError`.
+
+Classes:
+    LLMCacheMissError: Exceção lançada no modo `only` quando não há resposta armazenada.
+    LLMResponseCache: Cache de respostas com contadores de acertos e falhas.
+
+Funções:
+    get_llm_cache() ⇾ LLMResponseCache:
+        Retorna o cache de respostas do processo, configurado por `settings.LLM_CACHE`.
+
+Dependências:
+    - hashlib / json: para gerar as chaves do cache.
+    - services.cache.backends: backends de armazenamento (LRU em memória com orçamento em bytes, por padrão).
+"""
+
+import hashlib
+import json
+import threading
+from typing import List, Optional
+
+from django.conf import settings
+
+from aws_translator_app.services.cache.backends import BaseCacheBackend, build_cache_backend
+
+CACHE_MODES = ('bypass', 'prefer', 'only')
+
+
+class LLMCacheMissError(Exception):
+    """
+    Exceção lançada quando o modo de cache `only` é solicitado e não há resposta armazenada.
+    """
+    pass
+
+
+class LLMResponseCache:
+    """
+    Cache de respostas da OpenAI endereçado pelo prompt renderizado e pelos parâmetros de amostragem.
+
+    Métodos:
+        make_key(messages: List[dict], **params) ⇾ str:
+            Gera a chave do cache para as mensagens e parâmetros informados.
+        get(key: str) ⇾ Optional[str]:
+            Retorna a resposta armazenada ou `None`.
+        set(key: str, content: str) ⇾ None:
+            Armazena uma resposta.
+        stats() ⇾ dict:
+            Retorna os contadores de acertos/falhas e as estatísticas do backend.
+    """
+
+    KEY_PREFIX = 'llm:'
+
+    def __init__(self, backend: Optional[BaseCacheBackend], enabled: bool = True):
+        """
+        Inicializa o cache de respostas.
+
+        Parâmetros:
+            backend (BaseCacheBackend, optional): Backend de armazenamento.
+            enabled (bool): Indica se o cache está ativo; quando inativo, o modo `only` sempre falha
+                e os demais modos se comportam como `bypass`.
+        """
+        self.backend = backend
+        self.enabled = enabled and backend is not None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def make_key(self, messages: List[dict], **params) -> str:
+        payload = json.dumps(
+            {'messages': messages, 'params': params},
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+        return self.KEY_PREFIX + hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        try:
+            value = self.backend.get(key)
+        except Exception:
+            value = None
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, content: str) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.backend.set(key, content)
+        except Exception:
+            pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        lookups = hits + misses
+        result = {
+            'enabled': self.enabled,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+        }
+        if self.backend is not None:
+            try:
+                result['backend'] = self.backend.stats()
+            except Exception:
+                pass
+        return result
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """
+    Retorna o cache de respostas da OpenAI compartilhado pelo processo.
+
+    O cache é criado no primeiro acesso a partir de `settings.LLM_CACHE`.
+
+    Retorna:
+        LLMResponseCache: O cache de respostas.
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                config = getattr(settings, 'LLM_CACHE', {})
+                enabled = config.get('ENABLED', True)
+                backend = build_cache_backend(config) if enabled else None
+                _llm_cache = LLMResponseCache(backend, enabled=enabled)
+    return _llm_cache
@@ -0,0 +1,158 @@
+# aws_translator_app/services/cache/translation_cache.py
+
+"""
+Translation Cache Module
+========================
+
+Este módulo fornece um cache endereçado por conteúdo para os resultados do AWS Translate.
+A chave de cada entrada é o hash SHA-256 do texto normalizado, do idioma de origem e do
+idioma de destino, de modo que parágrafos repetidos (avisos legais, rodapés, etc.) são
+traduzidos uma única vez.
+
+Classes:
+    TranslationCache: Cache de traduções com contadores de acertos e falhas.
+
+Funções:
+    get_translation_cache() ⇾ TranslationCache:
+        Retorna o cache de traduções do processo, configurado por `settings.TRANSLATION_CACHE`.
+
+Dependências:
+    - hashlib: para gerar as chaves do cache.
+    - unicodedata: para normalizar o texto antes de gerar a chave.
+    - services.cache.backends: backends de armazenamento (LRU em memória, `CACHES` do Django, SQLite).
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.cache.translation_cache import get_translation_cache
+    >>> cache = get_translation_cache()
+    >>> cache.set("Olá, mundo.", 'pt', 'en', ("Hello, world.", 'pt'))
+    >>> cache.get("Olá,   mundo. ", 'pt', 'en')
+    ('Hello, world.', 'pt')
+    >>> cache.stats()
+    {'enabled': True, 'hits': 1, 'misses': 0, ...}
+"""
+
+import hashlib
+import threading
+import unicodedata
+from typing import Optional, Tuple
+
+from django.conf import settings
+
+from aws_translator_app.services.cache.backends import BaseCacheBackend, build_cache_backend
+
+
+class TranslationCache:
+    """
+    Cache de resultados de tradução endereçado por conteúdo.
+
+    Métodos:
+        make_key(text: str, source_language_code: str, target_language_code: str) ⇾ str:
+            Gera a chave do cache para a combinação de texto e idiomas.
+        get(text: str, source_language_code: str, target_language_code: str) ⇾ Optional[Tuple[str, str]]:
+            Retorna a tradução armazenada (texto traduzido e idioma de origem detectado) ou `None`.
+        set(text: str, source_language_code: str, target_language_code: str, result: Tuple[str, str]) ⇾ None:
+            Armazena o resultado de uma tradução.
+        stats() ⇾ dict:
+            Retorna os contadores de acertos/falhas e as estatísticas do backend.
+    """
+
+    KEY_PREFIX = 'translation:'
+
+    def __init__(self, backend: Optional[BaseCacheBackend], enabled: bool = True):
+        """
+        Inicializa o cache de traduções.
+
+        Parâmetros:
+            backend (BaseCacheBackend, optional): Backend de armazenamento.
+            enabled (bool): Indica se o cache está ativo; quando inativo, todas as consultas são falhas.
+        """
+        self.backend = backend
+        self.enabled = enabled and backend is not None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """
+        Normaliza o texto para a geração da chave.
+
+        Aplica a normalização Unicode NFC, remove espaços nas extremidades e colapsa
+        sequências de espaços em cada linha, preservando as quebras de linha.
+        """
+        text = unicodedata.normalize('NFC', text)
+        return '\n'.join(' '.join(line.split()) for line in text.strip().splitlines())
+
+    def make_key(self, text: str, source_language_code: str, target_language_code: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(source_language_code.encode('utf-8'))
+        digest.update(b'\x00')
+        digest.update(target_language_code.encode('utf-8'))
+        digest.update(b'\x00')
+        digest.update(self.normalize_text(text).encode('utf-8'))
+        return self.KEY_PREFIX + digest.hexdigest()
+
+    def get(self, text: str, source_language_code: str, target_language_code: str) -> Optional[Tuple[str, str]]:
+        if not self.enabled:
+            return None
+        try:
+            value = self.backend.get(self.make_key(text, source_language_code, target_language_code))
+        except Exception:
+            # Uma falha no cache nunca deve impedir a tradução.
+            value = None
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return tuple(value) if value is not None else None
+
+    def set(self, text: str, source_language_code: str, target_language_code: str,
+            result: Tuple[str, str]) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.backend.set(self.make_key(text, source_language_code, target_language_code), list(result))
+        except Exception:
+            pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        lookups = hits + misses
+        result = {
+            'enabled': self.enabled,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+        }
+        if self.backend is not None:
+            try:
+                result['backend'] = self.backend.stats()
+            except Exception:
+                pass
+        return result
+
+
+_translation_cache: Optional[TranslationCache] = None
+_translation_cache_lock = threading.Lock()
+
+
+def get_translation_cache() -> TranslationCache:
+    """
+    Retorna o cache de traduções compartilhado pelo processo.
+
+    O cache é criado no primeiro acesso a partir de `settings.TRANSLATION_CACHE`.
+
+    Retorna:
+        TranslationCache: O cache de traduções.
+    """
+    global _translation_cache
+    if _translation_cache is None:
+        with _translation_cache_lock:
+            if _translation_cache is None:
+                config = getattr(settings, 'TRANSLATION_CACHE', {})
+                enabled = config.get('ENABLED', True)
+                backend = build_cache_backend(config) if enabled else None
+                _translation_cache = TranslationCache(backend, enabled=enabled)
+    return _translation_cache
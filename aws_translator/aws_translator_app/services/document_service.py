@@ -17,6 +17,11 @@ diferentes formatos de documentos. Suporta os seguintes formatos:
     - DOCX (`.docx`)
     - TXT (`.txt`)
 
+A importação de PDFs é feita página a página (`iter_pdf_pages`), de forma preguiçosa: cada
+página é extraída apenas quando consumida, o que permite transmitir o texto ao cliente (ou
+iniciar a tradução) antes do fim da extração. PDFs com muitas páginas têm a extração distribuída
+entre processos (veja `settings.DOCUMENT_IMPORT`), preservando a ordem das páginas.
+
 Classes:
     DocumentService: Classe responsável pela importação e exportação de documentos.
 
@@ -24,7 +29,9 @@ Dependências:
     - PyPDF2: biblioteca para manipulação de arquivos PDF.
     - python-docx: biblioteca para manipulação de arquivos DOCX.
     - EbookLib: biblioteca para manipulação de arquivos EPUB.
+    - services.epub_reader: extração do texto visível dos capítulos de EPUBs.
     - reportlab: biblioteca para geração de PDFs.
+    - services.pdf_layout_engine: quebra de linhas e paginação dos PDFs exportados.
     - typing: biblioteca padrão para anotações de tipos.
 
 Exemplo de Uso:
@@ -36,10 +43,20 @@ Exemplo de Uso:
 
     # Exportar um documento
     >>> file_path = doc_service.export_document(text, metrics_original, metrics_simplified, format)
+
+    # Exportar reutilizando o cache de exportações (settings.EXPORT_CACHE)
+    >>> exported = doc_service.export_document_cached(text, metrics_original, metrics_simplified, format)
 """
 
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, List, NamedTuple, Optional
+import codecs
+import multiprocessing
 import os
+import shutil
+import tempfile
+import threading
 
 import PyPDF2  # Para PDFs
 from docx import Document  # Para DOCX
@@ -48,6 +65,84 @@ from ebooklib import epub  # Para EPUB
 from reportlab.lib.pagesizes import letter  # Para exportar PDFs
 from reportlab.pdfgen import canvas
 
+from aws_translator_app.services.cache.export_cache import get_export_cache
+from aws_translator_app.services import epub_reader
+from aws_translator_app.services.epub_reader import PARAGRAPH_SEPARATOR, EpubChapter
+from aws_translator_app.services.pdf_layout_engine import LayoutLine, PdfLayoutEngine
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+# Content-Type de cada formato de exportação
+EXPORT_CONTENT_TYPES = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'txt': 'text/plain; charset=utf-8',
+}
+
+
+class ExportedDocument(NamedTuple):
+    """
+    Documento exportado por `DocumentService.export_document_cached`.
+
+    Atributos:
+        path (str): Caminho do arquivo.
+        temporary (bool): Se o arquivo deve ser removido após o envio (fora do cache).
+        cached (bool): Se o arquivo já estava no cache (sem nova renderização).
+    """
+    path: str
+    temporary: bool
+    cached: bool
+
+
+def _import_config() -> dict:
+    # Importado aqui para que os processos de extração não dependam das configurações do Django
+    from django.conf import settings
+    return getattr(settings, 'DOCUMENT_IMPORT', {})
+
+
+def _get_pdf_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Retorna o pool de processos de extração de PDFs, criado no primeiro uso.
+
+    Os processos são iniciados com `spawn`, para não herdar o estado (threads, conexões) do processo web.
+    """
+    global _pdf_pool
+    if _pdf_pool is None:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                _pdf_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    return _pdf_pool
+
+
+def _reset_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    # Um processo que termina de forma abrupta inutiliza o pool; o próximo uso cria outro.
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+_worker_reader = (None, None)
+
+
+def _extract_pdf_pages(path: str, start: int, stop: int) -> List[str]:
+    """
+    Extrai o texto das páginas `start` a `stop - 1` de um PDF (executado nos processos do pool).
+
+    Cada processo mantém aberto o último PDF lido, para que os lotes seguintes do mesmo arquivo
+    não precisem interpretá-lo de novo.
+    """
+    global _worker_reader
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if _worker_reader[0] != key:
+        _worker_reader = (key, PyPDF2.PdfReader(path))
+    reader = _worker_reader[1]
+    return [reader.pages[index].extract_text() or '' for index in range(start, stop)]
+
 
 class DocumentService:
     """
@@ -61,8 +156,20 @@ class DocumentService:
         import_document(file) ⇾ Optional[str]:
             Importa texto de um arquivo de documento.
 
+        iter_document(file) ⇾ Iterator[str]:
+            Importa texto de um arquivo de documento em partes (uma por página, para PDFs).
+
+        iter_pdf_pages(file) ⇾ Iterator[str]:
+            Extrai o texto de um PDF página a página, de forma preguiçosa.
+
+        iter_epub_chapters(file) ⇾ Iterator[EpubChapter]:
+            Extrai o texto visível de um EPUB capítulo a capítulo, na ordem de leitura.
+
         export_document(text: str, metrics_original: dict, metrics_simplified: dict, format: str) ⇾ str:
             Exporta texto e métricas para um arquivo de documento e retorna o caminho do arquivo gerado.
+
+        export_document_cached(text: str, metrics_original: dict, metrics_simplified: dict, format: str) ⇾ ExportedDocument:
+            Exporta texto e métricas, reutilizando o arquivo do cache de exportações quando possível.
     """
 
     def import_document(self, file) -> Optional[str]:
@@ -95,6 +202,109 @@ class DocumentService:
         else:
             raise ValueError(f"Formato de arquivo não suportado: {ext}")
 
+    def iter_document(self, file) -> Iterator[str]:
+        """
+        Importa texto de um arquivo de documento em partes, à medida que são extraídas.
+
+        Para PDFs, cada parte é o texto de uma página (páginas sem texto são omitidas); para EPUBs,
+        o texto de um capítulo, na ordem de leitura; para os demais formatos, o documento inteiro
+        é uma única parte.
+
+        Parâmetros:
+            file: Arquivo enviado (UploadedFile).
+
+        Retorna:
+            Iterator[str]: As partes do texto, na ordem do documento.
+
+        Exceções:
+            - ValueError: se o formato do arquivo não for suportado.
+            - Exception: Se ocorrer um erro durante a importação do documento.
+        """
+        _, ext = os.path.splitext(file.name)
+        if ext.lower() == '.pdf':
+            for page_text in self.iter_pdf_pages(file):
+                if page_text:
+                    yield page_text
+        elif ext.lower() == '.epub':
+            for chapter in self.iter_epub_chapters(file):
+                yield chapter.text
+        else:
+            text = self.import_document(file)
+            if text:
+                yield text
+
+    @staticmethod
+    def iter_pdf_pages(file, workers: Optional[int] = None) -> Iterator[str]:
+        """
+        Extrai o texto de um PDF página a página.
+
+        As páginas são extraídas sob demanda, conforme o gerador é consumido. Se o PDF tiver pelo
+        menos `DOCUMENT_IMPORT['PDF_PARALLEL_MIN_PAGES']` páginas, a extração é distribuída em
+        lotes entre processos; as páginas continuam sendo entregues na ordem do documento, assim
+        que cada lote termina.
+
+        Parâmetros:
+            file: Arquivo PDF enviado (UploadedFile) ou objeto de arquivo binário.
+            workers (int, optional): Número de processos de extração. Padrão: `DOCUMENT_IMPORT['PDF_WORKERS']`.
+
+        Retorna:
+            Iterator[str]: O texto de cada página (vazio para páginas sem texto).
+
+        Exceções:
+            - Exception: Se ocorrer um erro durante a leitura do PDF.
+        """
+        config = _import_config()
+        workers = workers or config.get('PDF_WORKERS', os.cpu_count() or 1)
+        try:
+            reader = PyPDF2.PdfReader(file)
+            page_count = len(reader.pages)
+            if workers < 2 or page_count < config.get('PDF_PARALLEL_MIN_PAGES', 100):
+                for page in reader.pages:
+                    yield page.extract_text() or ''
+                return
+        except Exception as e:
+            raise Exception(f"Erro ao importar PDF: {str(e)}")
+
+        yield from DocumentService._iter_pdf_pages_parallel(
+            file, page_count, workers, config.get('PDF_PAGES_PER_TASK', 16)
+        )
+
+    @staticmethod
+    def _iter_pdf_pages_parallel(file, page_count: int, workers: int, pages_per_task: int) -> Iterator[str]:
+        """
+        Distribui a extração das páginas de um PDF entre processos, em lotes de `pages_per_task` páginas.
+
+        Os processos leem o PDF do disco: se o upload já estiver em um arquivo temporário, ele é
+        reutilizado; caso contrário, o conteúdo é copiado para um arquivo temporário.
+        """
+        temporary_path = None
+        if hasattr(file, 'temporary_file_path'):
+            path = file.temporary_file_path()
+        else:
+            file.seek(0)
+            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temporary:
+                shutil.copyfileobj(file, temporary)
+            path = temporary_path = temporary.name
+
+        pool = _get_pdf_pool(workers)
+        futures = [
+            pool.submit(_extract_pdf_pages, path, start, min(start + pages_per_task, page_count))
+            for start in range(0, page_count, pages_per_task)
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        except BrokenProcessPool as e:
+            _reset_pdf_pool(pool)
+            raise Exception(f"Erro ao importar PDF: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Erro ao importar PDF: {str(e)}")
+        finally:
+            for future in futures:
+                future.cancel()
+            if temporary_path:
+                os.remove(temporary_path)
+
     def export_document(self, text: str, metrics_original: dict, metrics_simplified: dict, format: str) -> str:
         """
         Exporta texto e métricas para um arquivo de documento.
@@ -108,6 +318,9 @@ class DocumentService:
             metrics_simplified (dict): Métricas do texto simplificado.
             format (str): Formato de exportação desejado (`'pdf'`, `'docx'`, `'txt'`).
 
+        O arquivo é criado com um nome único (`tempfile.mkstemp`), de modo que exportações
+        simultâneas não sobrescrevem os arquivos umas das outras. Cabe ao chamador removê-lo.
+
         Retorna:
             str: O caminho do arquivo exportado.
 
@@ -116,8 +329,61 @@ class DocumentService:
             - Exception: Se ocorrer um erro durante a exportação do documento.
         """
         format = format.lower()
-        # Gerar um caminho temporário para o arquivo
-        file_path = f'/tmp/output.{format}'
+        if format not in EXPORT_CONTENT_TYPES:
+            raise ValueError(f"Formato de exportação não suportado: {format}")
+        # Gerar um caminho temporário único para o arquivo
+        descriptor, file_path = tempfile.mkstemp(prefix='export-', suffix=f'.{format}')
+        os.close(descriptor)
+        self._render(text, file_path, metrics_original, metrics_simplified, format)
+        return file_path
+
+    def export_document_cached(self, text: str, metrics_original: dict, metrics_simplified: dict,
+                               format: str) -> ExportedDocument:
+        """
+        Exporta texto e métricas, reutilizando o documento já gerado para o mesmo conteúdo.
+
+        A chave do cache de exportações é o hash do texto, das métricas e do formato: se o
+        arquivo já existir, ele é retornado sem nova renderização; caso contrário, o documento é
+        gerado em um arquivo temporário do diretório do cache e movido para o cache. Com o cache
+        desativado, o comportamento é o de `export_document`.
+
+        Parâmetros:
+            text (str): O texto a ser exportado.
+            metrics_original (dict): Métricas do texto original.
+            metrics_simplified (dict): Métricas do texto simplificado.
+            format (str): Formato de exportação desejado (`'pdf'`, `'docx'`, `'txt'`).
+
+        Retorna:
+            ExportedDocument: O caminho do arquivo e se ele é temporário (deve ser removido após o
+            envio) ou pertence ao cache.
+
+        Exceções:
+            - ValueError: se o formato de exportação não for suportado.
+            - Exception: Se ocorrer um erro durante a exportação do documento.
+        """
+        format = format.lower()
+        if format not in EXPORT_CONTENT_TYPES:
+            raise ValueError(f"Formato de exportação não suportado: {format}")
+        cache = get_export_cache()
+        if not cache.enabled:
+            return ExportedDocument(self.export_document(text, metrics_original, metrics_simplified, format), True, False)
+
+        key = cache.make_key(text, metrics_original, metrics_simplified, format)
+        cached_path = cache.get(key)
+        if cached_path is not None:
+            return ExportedDocument(cached_path, False, True)
+
+        temporary_path = cache.temporary_path(format)
+        try:
+            self._render(text, temporary_path, metrics_original, metrics_simplified, format)
+            return ExportedDocument(cache.put(key, temporary_path), False, False)
+        except Exception:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def _render(self, text: str, file_path: str, metrics_original: dict, metrics_simplified: dict,
+                format: str) -> None:
         if format == 'pdf':
             self._export_pdf(text, file_path, metrics_original, metrics_simplified)
         elif format == 'docx':
@@ -126,14 +392,14 @@ class DocumentService:
             self._export_txt(text, file_path, metrics_original, metrics_simplified)
         else:
             raise ValueError(f"Formato de exportação não suportado: {format}")
-        return file_path
 
     @staticmethod
     def _import_pdf(file) -> str:
         """
         Importa texto de um arquivo PDF.
 
-        Utiliza a biblioteca PyPDF2 para extrair o texto de cada página do PDF.
+        Utiliza a biblioteca PyPDF2 para extrair o texto de cada página do PDF (veja `iter_pdf_pages`);
+        as páginas são unidas uma única vez ao final.
 
         Parâmetros:
             file: Arquivo PDF enviado (UploadedFile).
@@ -144,16 +410,8 @@ class DocumentService:
         Exceções:
             - Exception: Se ocorrer um erro durante a leitura do PDF.
         """
-        try:
-            reader = PyPDF2.PdfReader(file)
-            text = ''
-            for page in reader.pages:
-                extracted_text = page.extract_text()
-                if extracted_text:
-                    text += extracted_text + '\n'
-            return text.strip()
-        except Exception as e:
-            raise Exception(f"Erro ao importar PDF: {str(e)}")
+        pages = [page_text for page_text in DocumentService.iter_pdf_pages(file) if page_text]
+        return '\n'.join(pages).strip()
 
     @staticmethod
     def _import_docx(file) -> str:
@@ -183,7 +441,9 @@ class DocumentService:
         """
         Importa texto de um arquivo EPUB.
 
-        Utiliza a biblioteca EbookLib para extrair o conteúdo textual dos documentos do EPUB.
+        Utiliza a biblioteca EbookLib para ler o livro e extrai apenas o texto visível de cada
+        capítulo, na ordem de leitura (veja `iter_epub_chapters`). Os capítulos são separados por
+        uma linha em branco.
 
         Parâmetros:
             file: Arquivo EPUB enviado (UploadedFile).
@@ -194,14 +454,46 @@ class DocumentService:
         Exceções:
             - Exception: Se ocorrer um erro durante a leitura do EPUB.
         """
+        chapters = [chapter.text for chapter in DocumentService.iter_epub_chapters(file)]
+        return PARAGRAPH_SEPARATOR.join(chapters).strip()
+
+    @staticmethod
+    def iter_epub_chapters(file) -> Iterator[EpubChapter]:
+        """
+        Extrai o texto de um EPUB capítulo a capítulo.
+
+        Os capítulos seguem o spine do livro; a marcação XHTML, os estilos e os scripts são
+        descartados, e cada elemento de bloco vira um parágrafo (separados por uma linha em
+        branco, o separador de parágrafos do `ChunkingService`).
+
+        Parâmetros:
+            file: Arquivo EPUB enviado (UploadedFile).
+
+        Retorna:
+            Iterator[EpubChapter]: Os capítulos com texto, na ordem de leitura.
+
+        Exceções:
+            - Exception: Se ocorrer um erro durante a leitura do EPUB.
+        """
+        temporary_path = None
         try:
-            book = epub.read_epub(file)
-            text = ''
-            for item in book.get_items():
-                if item.get_type() == epub.ITEM_DOCUMENT:
-                    content = item.get_content()
-                    text += content.decode('utf-8') + '\n'
-            return text.strip()
+            # O EbookLib lê o EPUB a partir de um caminho: uploads grandes já estão em disco e são lidos
+            # diretamente do arquivo temporário; os mantidos em memória são copiados para um
+            if hasattr(file, 'temporary_file_path'):
+                source = file.temporary_file_path()
+            else:
+                file.seek(0)
+                with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as temporary:
+                    shutil.copyfileobj(file, temporary)
+                source = temporary_path = temporary.name
+            book = epub.read_epub(source, options={'ignore_ncx': True})
+        except Exception as e:
+            raise Exception(f"Erro ao importar EPUB: {str(e)}")
+        finally:
+            if temporary_path:
+                os.remove(temporary_path)
+        try:
+            yield from epub_reader.iter_epub_chapters(book)
         except Exception as e:
             raise Exception(f"Erro ao importar EPUB: {str(e)}")
 
@@ -210,7 +502,8 @@ class DocumentService:
         """
         Importa texto de um arquivo TXT.
 
-        Abre o arquivo de texto e lê todos o seu conteúdo.
+        Lê o arquivo em blocos e os decodifica de forma incremental (um caractere UTF-8 dividido
+        entre dois blocos é tratado corretamente), sem carregar todo o conteúdo binário na memória.
 
         Parâmetros:
             file: Arquivo TXT enviado (UploadedFile).
@@ -222,7 +515,11 @@ class DocumentService:
             - Exception: Se ocorrer um erro durante a leitura do TXT.
         """
         try:
-            return file.read().decode('utf-8').strip()
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            chunks = file.chunks() if hasattr(file, 'chunks') else iter(lambda: file.read(64 * 1024), b'')
+            parts = [decoder.decode(chunk) for chunk in chunks]
+            parts.append(decoder.decode(b'', final=True))
+            return ''.join(parts).strip()
         except Exception as e:
             raise Exception(f"Erro ao importar TXT: {str(e)}")
 
@@ -231,8 +528,9 @@ class DocumentService:
         """
         Exporta texto e métricas para um arquivo PDF.
 
-        Utiliza a biblioteca ReportLab para gerar um PDF a partir do texto fornecido,
-        cuidando da formatação e quebra de linhas conforme necessário, e inclui as métricas.
+        Utiliza a biblioteca ReportLab para gerar um PDF a partir do texto fornecido e inclui as
+        métricas. A quebra de linhas e a paginação são feitas pelo `PdfLayoutEngine`, que mede
+        cada palavra uma única vez.
 
         Parâmetros:
             text (str): O texto a ser exportado para o PDF.
@@ -247,44 +545,10 @@ class DocumentService:
             - Exception: Se ocorrer um erro durante a criação do PDF.
         """
         try:
-            c = canvas.Canvas(file_path, pagesize=letter)
-            width, height = letter
-
-            # Configurações do texto
-            text_object = c.beginText(50, height - 50)
-            text_object.setFont("Helvetica-Bold", 14)
-            text_object.textLine("Texto Simplificado e Traduzido:")
-            text_object.setFont("Helvetica", 12)
-            text_object.textLine("")
-
-            # Adicionar o texto
-            for line in text.split('\n'):
-                words = line.split(' ')
-                line_buffer = ""
-
-                for word in words:
-                    if c.stringWidth(line_buffer + word, "Helvetica", 12) < (width - 100):
-                        line_buffer += word + " "
-                    else:
-                        text_object.textLine(line_buffer.strip())
-                        line_buffer = word + " "
-
-                        if text_object.getY() <= 50:
-                            c.drawText(text_object)
-                            c.showPage()
-                            text_object = c.beginText(50, height - 50)
-                            text_object.setFont("Helvetica", 12)
-
-                if line_buffer:
-                    text_object.textLine(line_buffer.strip())
-
-                    if text_object.getY() <= 50:
-                        c.drawText(text_object)
-                        c.showPage()
-                        text_object = c.beginText(50, height - 50)
-                        text_object.setFont("Helvetica", 12)
-
-            text_object.textLine("")
+            engine = PdfLayoutEngine(page_size=letter)
+            lines = list(engine.heading("Texto Simplificado e Traduzido:"))
+            lines.extend(engine.paragraphs(text))
+            lines.append(LayoutLine("", engine.font_name, engine.font_size))
 
             if metrics_original and metrics_simplified:
                 metric_names = {
@@ -297,40 +561,21 @@ class DocumentService:
                 }
 
                 # Métricas do texto original
-                text_object.setFont("Helvetica-Bold", 14)
-                text_object.textLine("Métricas do Texto Original:")
-                text_object.setFont("Helvetica", 12)
-                text_object.textLine("")
-
+                lines.extend(engine.heading("Métricas do Texto Original:"))
                 for key, value in metrics_original.items():
                     metric_name = metric_names.get(key, key)
-                    text_object.textLine(f"{metric_name}: {value:.2f}")
-
-                    if text_object.getY() <= 50:
-                        c.drawText(text_object)
-                        c.showPage()
-                        text_object = c.beginText(50, height - 50)
-                        text_object.setFont("Helvetica", 12)
-
-                text_object.textLine("")
+                    lines.append(LayoutLine(f"{metric_name}: {value:.2f}", engine.font_name, engine.font_size))
+                lines.append(LayoutLine("", engine.font_name, engine.font_size))
 
                 # Métricas do texto simplificado
-                text_object.setFont("Helvetica-Bold", 14)
-                text_object.textLine("Métricas do Texto Simplificado:")
-                text_object.setFont("Helvetica", 12)
-                text_object.textLine("")
-
+                lines.extend(engine.heading("Métricas do Texto Simplificado:"))
                 for key, value in metrics_simplified.items():
                     metric_name = metric_names.get(key, key)
-                    text_object.textLine(f"{metric_name}: {value:.2f}")
-
-                    if text_object.getY() <= 50:
-                        c.drawText(text_object)
-                        c.showPage()
-                        text_object = c.beginText(50, height - 50)
-                        text_object.setFont("Helvetica", 12)
+                    lines.append(LayoutLine(f"{metric_name}: {value:.2f}", engine.font_name, engine.font_size))
 
-            c.drawText(text_object)
+            # Quebra de linhas e paginação já feitas; o canvas apenas desenha as páginas
+            c = canvas.Canvas(file_path, pagesize=letter)
+            engine.render(c, engine.paginate(lines))
             c.save()
         except Exception as e:
             raise Exception(f"Erro ao exportar PDF: {str(e)}")
@@ -0,0 +1,213 @@
+# aws_translator_app/services/epub_reader.py
+
+"""
+EPUB Reader Module
+==================
+
+Este módulo extrai o texto visível dos capítulos de um EPUB, para a importação de documentos.
+
+A versão anterior concatenava o XHTML bruto de todos os documentos do livro, com marcação,
+estilos e scripts, o que multiplicava o número de tokens enviados ao modelo. Aqui cada capítulo
+é percorrido por um parser em fluxo (o `HTMLParser` do lxml com um *target*, que recebe os
+eventos de abertura, fechamento e texto sem construir a árvore), e apenas o texto visível é
+mantido, com um parágrafo por elemento de bloco. Os capítulos seguem a ordem do *spine* (a ordem
+de leitura do livro) e são entregues um a um, para alimentar o pipeline em partes.
+
+Classes:
+    EpubChapter: Um capítulo extraído (título e texto).
+
+Funções:
+    iter_epub_chapters(book: epub.EpubBook) ⇾ Iterator[EpubChapter]:
+        Extrai os capítulos de um livro, na ordem de leitura.
+    xhtml_to_text(content: bytes) ⇾ Tuple[Optional[str], str]:
+        Extrai o título (primeiro cabeçalho) e o texto visível de um documento XHTML.
+
+Dependências:
+    - EbookLib: para a leitura do EPUB (manifesto e spine).
+    - lxml: para a leitura do XHTML de cada capítulo.
+
+Exemplo de Uso:
+    >>> from ebooklib import epub
+    >>> from aws_translator_app.services.epub_reader import iter_epub_chapters
+    >>> for chapter in iter_epub_chapters(epub.read_epub('livro.epub')):
+    ...     print(chapter.title, len(chapter.text))
+"""
+
+import re
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import ebooklib
+from ebooklib import epub
+from lxml import etree
+
+# Elementos cujo conteúdo não é exibido ao leitor
+SKIPPED_TAGS = frozenset({'head', 'script', 'style', 'noscript', 'template', 'svg', 'math'})
+
+# Elementos de bloco: cada um começa e termina um parágrafo
+BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'body', 'caption', 'dd', 'div', 'dl', 'dt',
+    'figcaption', 'figure', 'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li',
+    'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'td', 'th', 'tr', 'ul',
+})
+
+HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+
+PARAGRAPH_SEPARATOR = '\n\n'
+
+_XML_ENCODING_RE = re.compile(rb'^<\?xml[^>]*encoding=["\']([A-Za-z0-9._-]+)["\']')
+
+
+class EpubChapter(NamedTuple):
+    """
+    Um capítulo do EPUB.
+
+    Atributos:
+        index (int): Posição do capítulo na ordem de leitura (a partir de 1).
+        title (Optional[str]): Texto do primeiro cabeçalho do capítulo, se houver.
+        text (str): Texto visível, com os parágrafos separados por uma linha em branco.
+    """
+    index: int
+    title: Optional[str]
+    text: str
+
+
+def _local_name(tag) -> str:
+    # Remove o namespace ('{...}p') ou o prefixo ('epub:switch'); comentários e instruções não têm nome
+    if not isinstance(tag, str):
+        return ''
+    return tag.rsplit('}', 1)[-1].rsplit(':', 1)[-1].lower()
+
+
+class _VisibleTextCollector:
+    """
+    Target do parser do lxml: recebe os eventos do documento em ordem e monta os parágrafos.
+    """
+
+    def __init__(self):
+        self.paragraphs: List[str] = []
+        self.title: Optional[str] = None
+        self._lines: List[str] = []
+        self._parts: List[str] = []
+        self._skip_depth = 0
+        self._heading_start: Optional[int] = None
+
+    def _break_line(self) -> None:
+        line = ' '.join(''.join(self._parts).split())
+        self._parts = []
+        if line:
+            self._lines.append(line)
+
+    def _break_paragraph(self) -> None:
+        self._break_line()
+        if self._lines:
+            self.paragraphs.append('\n'.join(self._lines))
+            self._lines = []
+
+    def start(self, tag, attrib) -> None:
+        name = _local_name(tag)
+        if self._skip_depth or name in SKIPPED_TAGS:
+            self._skip_depth += 1
+            return
+        if name == 'br':
+            self._break_line()
+        elif name in BLOCK_TAGS:
+            self._break_paragraph()
+            if name in HEADING_TAGS and self.title is None:
+                self._heading_start = len(self.paragraphs)
+
+    def end(self, tag) -> None:
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+        name = _local_name(tag)
+        if name in BLOCK_TAGS:
+            self._break_paragraph()
+            if name in HEADING_TAGS and self._heading_start is not None:
+                if len(self.paragraphs) > self._heading_start:
+                    self.title = ' '.join(self.paragraphs[self._heading_start].split())
+                self._heading_start = None
+
+    def data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._parts.append(data)
+
+    def comment(self, text: str) -> None:
+        pass
+
+    def close(self) -> List[str]:
+        self._break_paragraph()
+        return self.paragraphs
+
+
+def _detect_encoding(content: bytes) -> str:
+    # O EPUB exige UTF-8 ou UTF-16; a declaração XML (se houver) tem precedência sobre o padrão.
+    if content.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf-16'
+    if content.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    match = _XML_ENCODING_RE.match(content[:200])
+    return match.group(1).decode('ascii') if match else 'utf-8'
+
+
+def xhtml_to_text(content: bytes) -> Tuple[Optional[str], str]:
+    """
+    Extrai o texto visível de um documento XHTML.
+
+    O parser de HTML do lxml é usado (e não o de XML) por tolerar marcação inválida e entidades
+    HTML como `&nbsp;`, frequentes em EPUBs. Cabeçalho, scripts e estilos são descartados, os
+    espaços são normalizados e cada elemento de bloco vira um parágrafo; `<br>` vira uma quebra
+    de linha dentro do parágrafo.
+
+    Parâmetros:
+        content (bytes): O documento XHTML.
+
+    Retorna:
+        Tuple[Optional[str], str]: O título (texto do primeiro cabeçalho `h1`-`h6`, se houver) e o
+        texto, com os parágrafos separados por uma linha em branco.
+    """
+    if not content or not content.strip():
+        return None, ''
+    collector = _VisibleTextCollector()
+    parser = etree.HTMLParser(target=collector, encoding=_detect_encoding(content), no_network=True)
+    parser.feed(content)
+    paragraphs = parser.close()
+    return collector.title, PARAGRAPH_SEPARATOR.join(paragraphs)
+
+
+def _is_navigation(item) -> bool:
+    # O sumário (EPUB 3) às vezes é incluído no spine; seu texto repete os títulos dos capítulos
+    return isinstance(item, epub.EpubNav) or 'nav' in (getattr(item, 'properties', None) or [])
+
+
+def _reading_order(book: epub.EpubBook) -> List:
+    items = []
+    for entry in book.spine:
+        item_id = entry[0] if isinstance(entry, (tuple, list)) else entry
+        item = book.get_item_with_id(item_id)
+        if item is not None and item.get_type() == ebooklib.ITEM_DOCUMENT and not _is_navigation(item):
+            items.append(item)
+    if not items:
+        # Livros sem spine: usa a ordem do manifesto
+        items = [item for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT) if not _is_navigation(item)]
+    return items
+
+
+def iter_epub_chapters(book: epub.EpubBook) -> Iterator[EpubChapter]:
+    """
+    Extrai os capítulos de um EPUB na ordem de leitura (spine), um a um.
+
+    Documentos que não fazem parte do spine e o sumário de navegação não são incluídos, e
+    capítulos sem texto visível (capas, páginas só com imagens) são omitidos.
+
+    Parâmetros:
+        book (epub.EpubBook): O livro lido com `epub.read_epub`.
+
+    Retorna:
+        Iterator[EpubChapter]: Os capítulos com texto, na ordem de leitura.
+    """
+    index = 0
+    for item in _reading_order(book):
+        title, text = xhtml_to_text(item.get_content())
+        if text:
+            index += 1
+            yield EpubChapter(index=index, title=title, text=text)
@@ -0,0 +1,139 @@
+# aws_translator_app/services/jobs/brokers.py
+
+"""
+Job Brokers Module
+==================
+
+Este módulo define a interface dos brokers da fila de tarefas e o broker padrão, baseado no
+banco de dados do Django. O broker é responsável apenas por distribuir as tarefas entre os
+workers; o estado de cada tarefa fica sempre no modelo `Job`.
+
+O broker utilizado é definido em `settings.JOB_QUEUE['BROKER']` (caminho pontuado da classe),
+o que permite trocar o banco de dados por um serviço externo (Redis, SQS, etc.) sem alterar
+os workers ou as views.
+
+Classes:
+    BaseBroker: Interface dos brokers.
+    DatabaseBroker: Broker que utiliza a própria tabela de `Job` como fila (sem serviços externos).
+
+Funções:
+    get_broker() ⇾ BaseBroker:
+        Retorna o broker configurado para o processo.
+
+Dependências:
+    - django.db: para a reserva atômica das tarefas pendentes.
+    - django.utils.module_loading: para carregar o broker configurado.
+"""
+
+import threading
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from aws_translator_app.models import Job
+
+
+class BaseBroker:
+    """
+    Interface dos brokers da fila de tarefas.
+
+    Métodos:
+        enqueue(job: Job) ⇾ None:
+            Publica uma tarefa recém-criada.
+        claim(worker_id: str, timeout: float) ⇾ Optional[Job]:
+            Reserva a próxima tarefa pendente para o worker, aguardando até `timeout` segundos.
+        requeue_stale(older_than: float, max_attempts: int) ⇾ int:
+            Devolve à fila as tarefas em execução sem atualização há mais de `older_than` segundos
+            (o worker renova `updated_at` periodicamente enquanto executa a tarefa); as que já
+            atingiram `max_attempts` execuções são marcadas como `failed`.
+    """
+
+    def enqueue(self, job: Job) -> None:
+        raise NotImplementedError
+
+    def claim(self, worker_id: str, timeout: float = 1.0) -> Optional[Job]:
+        raise NotImplementedError
+
+    def requeue_stale(self, older_than: float, max_attempts: int = 3) -> int:
+        return 0
+
+
+class DatabaseBroker(BaseBroker):
+    """
+    Broker baseado no banco de dados.
+
+    As tarefas pendentes são lidas da tabela de `Job` em ordem de criação. A reserva é feita
+    com um `UPDATE ... WHERE status = 'pending'`, que só afeta uma linha se nenhum outro worker
+    a tiver reservado antes, de modo que vários workers (em várias threads ou processos)
+    podem consumir a mesma fila sem bloqueios explícitos.
+
+    Dentro de um mesmo processo, `enqueue` acorda imediatamente os workers que estão
+    aguardando; workers em outros processos percebem a tarefa na próxima consulta.
+    """
+
+    def __init__(self):
+        self._wakeup = threading.Condition()
+
+    def enqueue(self, job: Job) -> None:
+        with self._wakeup:
+            self._wakeup.notify()
+
+    def claim(self, worker_id: str, timeout: float = 1.0) -> Optional[Job]:
+        job = self._try_claim(worker_id)
+        if job is None:
+            with self._wakeup:
+                self._wakeup.wait(timeout)
+            job = self._try_claim(worker_id)
+        return job
+
+    @staticmethod
+    def _try_claim(worker_id: str) -> Optional[Job]:
+        candidates = Job.objects.filter(status=Job.STATUS_PENDING).order_by('created_at').values_list('pk', flat=True)[:5]
+        for pk in candidates:
+            claimed = Job.objects.filter(pk=pk, status=Job.STATUS_PENDING).update(
+                status=Job.STATUS_RUNNING,
+                worker_id=worker_id,
+                attempts=F('attempts') + 1,
+                started_at=timezone.now(),
+                updated_at=timezone.now()
+            )
+            if claimed:
+                return Job.objects.get(pk=pk)
+        return None
+
+    def requeue_stale(self, older_than: float, max_attempts: int = 3) -> int:
+        limit = timezone.now() - timedelta(seconds=older_than)
+        stale = Job.objects.filter(status=Job.STATUS_RUNNING, updated_at__lt=limit)
+        stale.filter(attempts__gte=max_attempts).update(
+            status=Job.STATUS_FAILED,
+            error='Tarefa interrompida repetidamente; número máximo de tentativas atingido.',
+            finished_at=timezone.now(),
+            updated_at=timezone.now()
+        )
+        return stale.filter(attempts__lt=max_attempts).update(
+            status=Job.STATUS_PENDING,
+            worker_id='',
+            updated_at=timezone.now()
+        )
+
+
+_broker: Optional[BaseBroker] = None
+_broker_lock = threading.Lock()
+
+
+def get_broker() -> BaseBroker:
+    """
+    Retorna o broker configurado em `settings.JOB_QUEUE['BROKER']`, criado uma vez por processo.
+    """
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                config = getattr(settings, 'JOB_QUEUE', {})
+                broker_path = config.get('BROKER', 'aws_translator_app.services.jobs.brokers.DatabaseBroker')
+                _broker = import_string(broker_path)()
+    return _broker
@@ -0,0 +1,328 @@
+# aws_translator_app/services/jobs/job_service.py
+
+"""
+Job Service Module
+==================
+
+Este módulo implementa a execução assíncrona do pipeline de tradução. Uma requisição cria uma
+tarefa (`Job`) e recebe seu identificador imediatamente; um pool de workers executa o pipeline
+(importação do documento, simplificação, tradução, métricas e BLEU) e registra o progresso de
+cada etapa, que pode ser consultado pelos endpoints de status e resultado.
+
+Classes:
+    JobService: Criação e execução de tarefas.
+    WorkerPool: Pool de threads que consome a fila de tarefas.
+
+Funções:
+    get_worker_pool() ⇾ WorkerPool:
+        Retorna o pool de workers do processo.
+
+Dependências:
+    - services.jobs.brokers: para publicar e reservar tarefas.
+    - services.pipeline.translation_pipeline: pipeline executado por cada tarefa.
+    - services.document_service: para importar os documentos enviados.
+
+Configurações (settings.JOB_QUEUE):
+    - BROKER (str): caminho pontuado da classe do broker.
+    - WORKERS (int): número de threads do pool.
+    - AUTOSTART (bool): inicia o pool no processo web na primeira tarefa criada.
+    - UPLOAD_DIR (str): diretório onde os documentos enviados aguardam o processamento.
+    - STALE_AFTER (float): segundos sem atualização após os quais uma tarefa em execução volta à fila.
+    - HEARTBEAT_INTERVAL (float): intervalo, em segundos, entre os sinais de vida (`updated_at`)
+      gravados enquanto uma tarefa executa; deve ser bem menor que `STALE_AFTER`.
+    - REQUEUE_INTERVAL (float): intervalo, em segundos, entre as verificações de tarefas paradas
+      feitas pelos workers em execução.
+    - MAX_ATTEMPTS (int): número máximo de execuções de uma tarefa interrompida (por exemplo, por
+      reinicialização do worker) antes de ser marcada como `failed`.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.jobs.job_service import JobService
+    >>> job = JobService().submit(params={'text': 'Texto...', 'target_language': 'en', ...})
+    >>> job.status
+    'pending'
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.files import File
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from aws_translator_app.models import Job
+from aws_translator_app.services.document_service import DocumentService
+from aws_translator_app.services.jobs.brokers import get_broker
+from aws_translator_app.services.pipeline.translation_pipeline import TranslationPipeline
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_STAGES = ['import', 'chunks', 'readability', 'bleu']
+
+
+def _config() -> dict:
+    return getattr(settings, 'JOB_QUEUE', {})
+
+
+class JobService:
+    """
+    Serviço para criar e executar tarefas do pipeline de tradução.
+
+    Métodos:
+        submit(params: dict, document=None) ⇾ Job:
+            Cria uma tarefa para um texto ou documento e a publica no broker.
+        run(job: Job) ⇾ None:
+            Executa o pipeline da tarefa e registra o progresso e o resultado.
+    """
+
+    def submit(self, params: dict, document=None) -> Job:
+        """
+        Cria uma tarefa e a publica no broker.
+
+        Parâmetros:
+            params (dict): Parâmetros do pipeline (os mesmos de `TranslateRequestSerializer`).
+                Se `document` não for informado, `params['text']` é obrigatório.
+            document (UploadedFile, optional): Documento a ser importado pelo worker.
+
+        Retorna:
+            Job: A tarefa criada, com status `pending`.
+        """
+        job = Job(params=params, progress={stage: {'status': 'pending'} for stage in PIPELINE_STAGES})
+        if document is not None:
+            job.document_name = os.path.basename(document.name)
+            job.document_path = self._store_document(job.id, document)
+        else:
+            job.progress['import'] = {'status': 'skipped'}
+        job.save()
+
+        get_broker().enqueue(job)
+        if _config().get('AUTOSTART', True):
+            get_worker_pool().start()
+        return job
+
+    @staticmethod
+    def _store_document(job_id: uuid.UUID, document) -> str:
+        """
+        Grava o documento enviado no diretório de uploads, em blocos, e retorna o caminho do arquivo.
+        """
+        upload_dir = str(_config().get('UPLOAD_DIR', os.path.join(settings.BASE_DIR, 'job_uploads')))
+        os.makedirs(upload_dir, exist_ok=True)
+        _, ext = os.path.splitext(document.name)
+        path = os.path.join(upload_dir, f'{job_id}{ext.lower()}')
+        with open(path, 'wb') as destination:
+            for chunk in document.chunks():
+                destination.write(chunk)
+        return path
+
+    def run(self, job: Job) -> None:
+        """
+        Executa o pipeline de uma tarefa já reservada por um worker.
+
+        O progresso de cada etapa é gravado no banco conforme avança e, enquanto o pipeline executa,
+        uma thread renova `updated_at` a cada `HEARTBEAT_INTERVAL` segundos, de modo que etapas longas
+        não sejam confundidas com tarefas paradas (veja `BaseBroker.requeue_stale`). Ao final, a tarefa
+        é marcada como `succeeded` (com o resultado) ou `failed` (com a mensagem de erro) e o documento
+        enviado, se houver, é removido.
+
+        Todas as gravações são condicionadas ao `worker_id` da reserva: se a tarefa tiver sido devolvida
+        à fila e reservada por outro worker, esta execução não sobrescreve o estado da nova.
+
+        Parâmetros:
+            job (Job): A tarefa a ser executada (com status `running`).
+        """
+        progress = dict(job.progress)
+        progress_lock = threading.Lock()
+        worker_thread = threading.current_thread()
+        owned = Job.objects.filter(pk=job.pk, worker_id=job.worker_id, status=Job.STATUS_RUNNING)
+
+        def update_stage(stage: str, completed: int, total: int) -> None:
+            with progress_lock:
+                progress[stage] = {
+                    'status': 'completed' if completed >= total else 'running',
+                    'completed': completed,
+                    'total': total,
+                }
+                owned.update(progress=dict(progress), updated_at=timezone.now())
+            if threading.current_thread() is not worker_thread:
+                # Chamado a partir de uma thread do pipeline: não deixa conexões abertas para trás.
+                connection.close()
+
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job, finished), name=f'job-heartbeat-{job.pk}', daemon=True
+        )
+        heartbeat.start()
+        try:
+            params = dict(job.params)
+            if job.document_path:
+                update_stage('import', 0, 1)
+                with open(job.document_path, 'rb') as handle:
+                    params['text'] = DocumentService().import_document(File(handle, name=job.document_name))
+                update_stage('import', 1, 1)
+
+            options = dict(
+                text=params['text'],
+                speciality=params['speciality'],
+                style=params['style'],
+                summarize=params.get('summarize', False),
+                model=params['model'],
+                complexity_level=params.get('complexity_level', 'Intermediário'),
+                focus_aspects=params.get('focus_aspects', []),
+                temperature=params.get('temperature', 0.8),
+                max_tokens=params.get('max_tokens'),
+                cache_mode=params.get('cache', 'bypass'),
+                bleu_mode=params.get('bleu_mode'),
+                progress_callback=update_stage
+            )
+            if params.get('target_languages'):
+                result = TranslationPipeline().run_multi(
+                    target_languages=params['target_languages'],
+                    bleu_targets=params.get('bleu_targets'),
+                    **options
+                )
+            else:
+                result = TranslationPipeline().run(target_language=params['target_language'], **options)
+            updated = owned.update(
+                status=Job.STATUS_SUCCEEDED,
+                result=result,
+                error='',
+                finished_at=timezone.now(),
+                updated_at=timezone.now()
+            )
+        except Exception as e:
+            logger.exception("Falha ao executar a tarefa %s", job.pk)
+            updated = owned.update(
+                status=Job.STATUS_FAILED,
+                error=str(e),
+                finished_at=timezone.now(),
+                updated_at=timezone.now()
+            )
+        finally:
+            finished.set()
+            heartbeat.join()
+        if not updated:
+            # A tarefa voltou à fila (e talvez já execute em outro worker), que ainda precisa do documento
+            logger.warning("Tarefa %s não pertence mais ao worker %s; resultado descartado", job.pk, job.worker_id)
+            return
+        if job.document_path:
+            try:
+                os.remove(job.document_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _heartbeat(job: Job, finished: threading.Event) -> None:
+        """
+        Renova `updated_at` da tarefa a cada `HEARTBEAT_INTERVAL` segundos, até `finished` ser sinalizado.
+        """
+        interval = _config().get('HEARTBEAT_INTERVAL', 60)
+        try:
+            while not finished.wait(interval):
+                beats = Job.objects.filter(pk=job.pk, worker_id=job.worker_id, status=Job.STATUS_RUNNING).update(
+                    updated_at=timezone.now()
+                )
+                if not beats:
+                    return
+        except Exception:
+            logger.exception("Falha ao renovar a tarefa %s", job.pk)
+        finally:
+            connection.close()
+
+
+class WorkerPool:
+    """
+    Pool de threads que consome a fila de tarefas.
+
+    Cada worker reserva uma tarefa no broker, executa o pipeline e volta a aguardar. O pool pode
+    rodar dentro do processo web (iniciado na primeira tarefa, se `AUTOSTART` estiver ativo) ou em
+    um processo dedicado, com o comando `python manage.py run_job_workers`.
+
+    As tarefas interrompidas (e.g., um processo web reciclado no meio da execução) voltam à fila na
+    partida do pool e, depois, a cada `REQUEUE_INTERVAL` segundos, enquanto os workers estiverem
+    em execução, e não apenas quando um novo pool for iniciado.
+
+    Métodos:
+        start() ⇾ None: Inicia os workers (chamadas repetidas não têm efeito).
+        stop(timeout: float) ⇾ None: Sinaliza a parada e aguarda o término dos workers.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or _config().get('WORKERS', 2)
+        self._threads: List[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._requeue_lock = threading.Lock()
+        self._last_requeue = float('-inf')
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._stopping.clear()
+            self._requeue_stale(force=True)
+            prefix = f'{socket.gethostname()}:{os.getpid()}'
+            self._threads = [
+                threading.Thread(
+                    target=self._work, args=(f'{prefix}:{index}',), name=f'job-worker-{index}', daemon=True
+                )
+                for index in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def _requeue_stale(self, force: bool = False) -> None:
+        """
+        Devolve à fila as tarefas paradas, no máximo uma vez a cada `REQUEUE_INTERVAL` segundos
+        por pool (ou imediatamente, com `force`).
+        """
+        with self._requeue_lock:
+            now = time.monotonic()
+            if not force and now - self._last_requeue < _config().get('REQUEUE_INTERVAL', 60):
+                return
+            self._last_requeue = now
+        get_broker().requeue_stale(_config().get('STALE_AFTER', 15 * 60), _config().get('MAX_ATTEMPTS', 3))
+
+    def _work(self, worker_id: str) -> None:
+        broker = get_broker()
+        service = JobService()
+        while not self._stopping.is_set():
+            try:
+                self._requeue_stale()
+                job = broker.claim(worker_id, timeout=1.0)
+                if job is not None:
+                    service.run(job)
+            except Exception:
+                logger.exception("Erro no worker %s", worker_id)
+                self._stopping.wait(1.0)
+            finally:
+                close_old_connections()
+
+
+_worker_pool: Optional[WorkerPool] = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool:
+    """
+    Retorna o pool de workers do processo, criado no primeiro acesso.
+    """
+    global _worker_pool
+    if _worker_pool is None:
+        with _worker_pool_lock:
+            if _worker_pool is None:
+                _worker_pool = WorkerPool()
+    return _worker_pool
@@ -6,7 +6,8 @@ BLEU Score Service Module
 
 Este módulo fornece serviços para calcular o BLEU Score usando Back-Translation.
 Ele utiliza o serviço AWS Translate para tradução e back-translation, e a biblioteca
-sacrebleu para calcular o BLEU Score.
+sacrebleu para calcular o BLEU Score. As back-translations passam pelo mesmo cache de
+traduções do `AwsTranslateService`.
 
 Classes:
     BleuScoreService: Classe responsável por calcular o BLEU Score.
@@ -27,6 +28,8 @@ Exemplo de Uso:
 """
 
 import sacrebleu
+from typing import Optional
+
 from aws_translator_app.services.api.aws_translate_service import AwsTranslateService
 
 
@@ -37,13 +40,21 @@ class BleuScoreService:
     Métodos:
         compute_bleu_score(original_text: str, translated_text: str, source_language_code: str) -> float:
             Traduz o texto traduzido de volta para o idioma original e calcula o BLEU Score entre o texto original e o texto back-translated.
+        compute_cached_bleu_score(original_text: str, translated_text: str, source_language_code: str) -> Optional[float]:
+            Calcula o BLEU Score apenas se a back-translation já estiver no cache de traduções (sem chamadas à AWS).
+        score(original_text: str, back_translated_text: str) -> float:
+            Calcula o BLEU Score entre o texto original e um texto back-translated já disponível.
     """
 
-    def __init__(self):
+    def __init__(self, aws_translate_service: Optional[AwsTranslateService] = None):
         """
         Inicializa a instância do BleuScoreService.
+
+        Parâmetros:
+            aws_translate_service (AwsTranslateService, optional): Serviço de tradução a ser reutilizado.
+                Se não for informado, um novo serviço é criado (com o cliente e o cache compartilhados).
         """
-        self.aws_translate_service = AwsTranslateService()
+        self.aws_translate_service = aws_translate_service or AwsTranslateService()
 
     def compute_bleu_score(self, original_text: str, translated_text: str, source_language_code: str) -> float:
         """
@@ -62,20 +73,59 @@ class BleuScoreService:
         """
         try:
             # Back-translation para o idioma de origem
-            back_translated_text, _ = self.aws_translate_service.translate_text(translated_text, source_language_code)
-
-            # Cálculo do BLEU Score para sentença única com suavização e normalização
-            bleu = sacrebleu.sentence_bleu(
-                back_translated_text,
-                [original_text],
-                smooth_method='exp',
-                smooth_value=0.1,
-                lowercase=True
+            back_translated_text, _ = self.aws_translate_service.translate_long_text(
+                translated_text, source_language_code
             )
-
-            # Normaliza o BLEU Score para a escala de 0 a 1
-            normalized_bleu = bleu.score / 100
-            return normalized_bleu
+            return self.score(original_text, back_translated_text)
 
         except Exception as e:
             raise Exception(f"Erro ao calcular o BLEU Score: {str(e)}") from e
+
+    def compute_cached_bleu_score(
+            self,
+            original_text: str,
+            translated_text: str,
+            source_language_code: str
+    ) -> Optional[float]:
+        """
+        Calcula o BLEU Score localmente, reutilizando uma back-translation que já esteja no cache.
+
+        Útil quando o mesmo texto já foi avaliado antes: o score é obtido sem nenhuma chamada à AWS.
+
+        Parâmetros:
+            original_text (str): O texto original (no idioma de origem).
+            translated_text (str): O texto traduzido (no idioma de destino).
+            source_language_code (str): O código do idioma de origem.
+
+        Retorna:
+            Optional[float]: O BLEU Score na escala de 0 a 1, ou `None` se a back-translation não estiver no cache.
+        """
+        cached = self.aws_translate_service.lookup_cached_translation(translated_text, source_language_code)
+        if cached is None:
+            return None
+        back_translated_text, _ = cached
+        return self.score(original_text, back_translated_text)
+
+    @staticmethod
+    def score(original_text: str, back_translated_text: str) -> float:
+        """
+        Calcula o BLEU Score entre o texto original e o texto back-translated.
+
+        Parâmetros:
+            original_text (str): O texto original.
+            back_translated_text (str): O texto traduzido de volta para o idioma original.
+
+        Retorna:
+            float: O BLEU Score na escala de 0 a 1.
+        """
+        # Cálculo do BLEU Score para sentença única com suavização e normalização
+        bleu = sacrebleu.sentence_bleu(
+            back_translated_text,
+            [original_text],
+            smooth_method='exp',
+            smooth_value=0.1,
+            lowercase=True
+        )
+
+        # Normaliza o BLEU Score para a escala de 0 a 1
+        return bleu.score / 100
@@ -0,0 +1,430 @@
+# aws_translator_app/services/language/glossary_service.py
+
+"""
+Glossary Service Module
+=======================
+
+Este módulo aplica glossários de terminologia por especialidade (modelo `Glossary`) ao pipeline
+de tradução, sem chamadas extras à OpenAI ou à AWS:
+
+1. Proteção: antes da simplificação, os termos do glossário encontrados no texto são substituídos
+   por marcadores (`⟦0⟧`, `⟦1⟧`, ...), que passam intactos pela OpenAI e pelo AWS Translate.
+2. Restauração: no texto traduzido, cada marcador volta como a tradução do termo para o idioma de
+   destino (ou o próprio termo, se o glossário não tiver tradução para esse idioma); no texto
+   simplificado, volta como o trecho original.
+
+A busca dos termos usa um autômato Aho-Corasick compilado uma vez por glossário e mantido em
+memória no processo (recompilado quando o glossário muda). A busca percorre o texto uma única vez,
+em tempo proporcional ao tamanho do texto e não ao número de termos (glossários de 100 mil termos
+custam o mesmo por caractere que glossários de 10). A comparação ignora maiúsculas e minúsculas,
+respeita limites de palavra e, entre termos sobrepostos, escolhe o que começa antes e, depois, o
+mais longo. A restauração é uma única substituição por expressão regular.
+
+Classes:
+    AhoCorasick: Autômato de busca simultânea de vários padrões.
+    CompiledGlossary: Glossário compilado (autômato e traduções dos termos).
+    ProtectedText: Texto com os termos substituídos por marcadores.
+    GlossaryService: Proteção, restauração e importação de glossários.
+
+Funções:
+    fold_case(text: str) ⇾ str:
+        Converte o texto para minúsculas preservando as posições dos caracteres.
+
+Dependências:
+    - models.Glossary, models.GlossaryTerm: armazenamento dos glossários.
+    - csv: para a leitura dos arquivos de glossário.
+
+Configurações (settings.GLOSSARIES):
+    - MAX_TERMS (int): Número máximo de termos por glossário.
+    - MAX_TERM_CHARS (int): Tamanho máximo de um termo.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.language.glossary_service import GlossaryService
+    >>> service = GlossaryService()
+    >>> protected = service.protect("O habeas corpus foi negado.", 'Direito', 'pt')
+    >>> protected.text
+    'O ⟦0⟧ foi negado.'
+    >>> service.restore("The ⟦0⟧ was denied.", protected, 'en')
+    ('The writ of habeas corpus was denied.', 1)
+"""
+
+import csv
+import io
+import re
+import threading
+import time
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+from aws_translator_app.constants import LANGUAGES
+from aws_translator_app.models import Glossary, GlossaryTerm
+
+PLACEHOLDER_RE = re.compile(r'⟦\s*(\d+)\s*⟧')
+PLACEHOLDER_OPEN = '⟦'
+
+# Os estados do autômato ficam em um único dicionário de inteiros (estado << 21 | código do caractere),
+# bem mais compacto que um dicionário por estado em glossários grandes
+_CHAR_BITS = 21
+
+
+def fold_case(text: str) -> str:
+    """
+    Converte o texto para minúsculas preservando as posições dos caracteres (os raros caracteres
+    cuja minúscula tem mais de um caractere, como `'İ'`, são mantidos).
+    """
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+
+class AhoCorasick:
+    """
+    Autômato Aho-Corasick para a busca simultânea de vários padrões em uma única passada.
+
+    Métodos:
+        find(text: str) ⇾ List[Tuple[int, int, int]]:
+            Retorna as ocorrências não sobrepostas dos padrões, delimitadas por limites de palavra.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Compila o autômato.
+
+        Parâmetros:
+            patterns (Iterable[str]): Os padrões, já normalizados com `fold_case`. O índice de cada
+                padrão na sequência identifica as ocorrências; padrões repetidos ficam com o primeiro índice.
+        """
+        goto: Dict[int, int] = {}
+        keys = array('q', [0])  # Chave (estado pai << 21 | caractere) que leva a cada estado
+        depths = array('l', [0])
+        output = array('l', [-1])
+        lengths = []
+        for index, pattern in enumerate(patterns):
+            lengths.append(len(pattern))
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                key = node << _CHAR_BITS | ord(char)
+                child = goto.get(key)
+                if child is None:
+                    child = len(keys)
+                    goto[key] = child
+                    keys.append(key)
+                    depths.append(depths[node] + 1)
+                    output.append(-1)
+                node = child
+            if output[node] < 0:
+                output[node] = index
+
+        # Ligações de falha e de saída (próximo estado, na cadeia de falhas, que termina um padrão),
+        # calculadas em ordem de profundidade: a falha de um estado depende apenas de estados mais rasos
+        fail = array('l', [0]) * len(keys)
+        dict_link = array('l', [0]) * len(keys)
+        mask = (1 << _CHAR_BITS) - 1
+        for node in sorted(range(1, len(keys)), key=depths.__getitem__):
+            key = keys[node]
+            parent, char = key >> _CHAR_BITS, key & mask
+            if not parent:
+                continue
+            state = fail[parent]
+            while state and (state << _CHAR_BITS | char) not in goto:
+                state = fail[state]
+            fail[node] = goto.get(state << _CHAR_BITS | char, 0)
+            dict_link[node] = fail[node] if output[fail[node]] >= 0 else dict_link[fail[node]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+        self._dict_link = dict_link
+        self._lengths = lengths
+        self.states = len(keys)
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Procura os padrões no texto.
+
+        Parâmetros:
+            text (str): O texto, já normalizado com `fold_case`.
+
+        Retorna:
+            List[Tuple[int, int, int]]: As ocorrências `(início, fim, índice do padrão)`, em ordem e sem
+            sobreposição: entre ocorrências sobrepostas vence a que começa antes e, depois, a mais longa.
+            Ocorrências no meio de uma palavra (e.g., `'lei'` em `'leitura'`) são ignoradas.
+        """
+        goto, fail, output, dict_link, lengths = self._goto, self._fail, self._output, self._dict_link, self._lengths
+        candidates = []
+        node = 0
+        size = len(text)
+        for position, char in enumerate(text):
+            code = ord(char)
+            while node and (node << _CHAR_BITS | code) not in goto:
+                node = fail[node]
+            node = goto.get(node << _CHAR_BITS | code, 0)
+            match = node if output[node] >= 0 else dict_link[node]
+            while match:
+                index = output[match]
+                end = position + 1
+                start = end - lengths[index]
+                if ((start == 0 or not text[start - 1].isalnum() or not text[start].isalnum())
+                        and (end == size or not text[end].isalnum() or not char.isalnum())):
+                    candidates.append((start, -end, index))
+                match = dict_link[match]
+
+        candidates.sort()
+        matches = []
+        last_end = 0
+        for start, negative_end, index in candidates:
+            if start >= last_end:
+                matches.append((start, -negative_end, index))
+                last_end = -negative_end
+        return matches
+
+
+class CompiledGlossary(NamedTuple):
+    """
+    Glossário compilado, mantido em memória no processo.
+
+    Atributos:
+        id (str): Identificador do glossário.
+        updated_at (datetime): Versão do glossário compilada.
+        automaton (AhoCorasick): Autômato dos termos de origem.
+        translations (List[dict]): Traduções de cada termo, pelo índice do termo no autômato.
+    """
+    id: str
+    updated_at: object
+    automaton: AhoCorasick
+    translations: List[dict]
+
+
+class ProtectedText(NamedTuple):
+    """
+    Texto com os termos do glossário substituídos por marcadores.
+
+    Atributos:
+        text (str): O texto com os marcadores.
+        surfaces (List[str]): O trecho original de cada marcador (o marcador `⟦n⟧` é `surfaces[n]`).
+        terms (List[int]): O índice do termo no glossário de cada marcador.
+        glossary (CompiledGlossary, optional): O glossário aplicado (`None` se não houver glossário).
+    """
+    text: str
+    surfaces: List[str]
+    terms: List[int]
+    glossary: Optional[CompiledGlossary]
+
+
+_compiled: Dict[str, CompiledGlossary] = {}
+_compiled_lock = threading.Lock()
+
+
+class GlossaryService:
+    """
+    Aplica e importa glossários de terminologia.
+
+    Métodos:
+        protect(text: str, speciality: str, source_language_code: Optional[str]) ⇾ ProtectedText:
+            Substitui os termos do glossário da especialidade por marcadores.
+        restore(text: str, protected: ProtectedText, target_language_code: Optional[str]) ⇾ Tuple[str, int]:
+            Substitui os marcadores pelos termos traduzidos (ou originais).
+        compile(glossary: Glossary) ⇾ CompiledGlossary:
+            Retorna o glossário compilado, compilando-o se necessário.
+        import_glossary(file, speciality: str, source_language_code: str, name: str) ⇾ Tuple[Glossary, float]:
+            Substitui o glossário da especialidade pelo conteúdo de um arquivo CSV.
+        delete(glossary: Glossary) ⇾ None:
+            Remove o glossário.
+    """
+
+    def __init__(self):
+        config = getattr(settings, 'GLOSSARIES', {})
+        self.max_terms = config.get('MAX_TERMS', 200000)
+        self.max_term_chars = config.get('MAX_TERM_CHARS', 500)
+
+    def protect(self, text: str, speciality: str, source_language_code: Optional[str]) -> ProtectedText:
+        """
+        Substitui os termos do glossário da especialidade e do idioma de origem por marcadores.
+
+        Cada trecho distinto recebe um marcador (as repetições usam o mesmo), de modo que o texto
+        protegido de um mesmo documento é sempre igual (e aproveita os caches de simplificação e tradução).
+
+        Parâmetros:
+            text (str): O texto original.
+            speciality (str): A especialidade do texto.
+            source_language_code (str, optional): O idioma do texto (`None` se não detectado).
+
+        Retorna:
+            ProtectedText: O texto protegido (igual ao original se não houver glossário ou termos).
+        """
+        glossary = None
+        if source_language_code:
+            row = Glossary.objects.filter(
+                speciality=speciality, source_language_code=source_language_code
+            ).only('id', 'updated_at').first()
+            if row is not None:
+                glossary = self.compile(row)
+        if glossary is None:
+            return ProtectedText(text, [], [], None)
+
+        parts, surfaces, terms, markers = [], [], [], {}
+        last = 0
+        for start, end, index in glossary.automaton.find(fold_case(text)):
+            surface = text[start:end]
+            marker = markers.get(surface)
+            if marker is None:
+                marker = markers[surface] = len(surfaces)
+                surfaces.append(surface)
+                terms.append(index)
+            parts.append(text[last:start])
+            parts.append(f'{PLACEHOLDER_OPEN}{marker}⟧')
+            last = end
+        parts.append(text[last:])
+        return ProtectedText(''.join(parts), surfaces, terms, glossary)
+
+    @staticmethod
+    def restore(text: str, protected: ProtectedText, target_language_code: Optional[str] = None) -> Tuple[str, int]:
+        """
+        Substitui os marcadores pelos termos, em uma única passada.
+
+        Parâmetros:
+            text (str): O texto com marcadores (simplificado ou traduzido).
+            protected (ProtectedText): O resultado de `protect` para o texto original.
+            target_language_code (str, optional): O idioma do texto. Se omitido, os marcadores voltam
+                como o trecho original (texto simplificado, no idioma de origem).
+
+        Retorna:
+            Tuple[str, int]: O texto restaurado e o número de marcadores substituídos. Marcadores
+            desconhecidos são mantidos.
+        """
+        if not protected.surfaces:
+            return text, 0
+        restored = 0
+
+        def replace(match):
+            nonlocal restored
+            marker = int(match.group(1))
+            if marker >= len(protected.surfaces):
+                return match.group()
+            restored += 1
+            surface = protected.surfaces[marker]
+            if target_language_code is None:
+                return surface
+            term = protected.glossary.translations[protected.terms[marker]].get(target_language_code) or surface
+            if surface[:1].isupper() and term[:1].islower():
+                # Termo no início de uma frase (ou título) no texto original
+                term = term[0].upper() + term[1:]
+            return term
+
+        return PLACEHOLDER_RE.sub(replace, text), restored
+
+    def compile(self, glossary: Glossary) -> CompiledGlossary:
+        """
+        Retorna o glossário compilado, a partir da memória do processo se a versão (`updated_at`) for a atual.
+        """
+        key = str(glossary.pk)
+        compiled = _compiled.get(key)
+        if compiled is not None and compiled.updated_at == glossary.updated_at:
+            return compiled
+        with _compiled_lock:
+            compiled = _compiled.get(key)
+            if compiled is not None and compiled.updated_at == glossary.updated_at:
+                return compiled
+            rows = list(GlossaryTerm.objects.filter(glossary_id=glossary.pk).order_by('pk').values_list(
+                'source_term', 'translations'
+            ))
+            compiled = CompiledGlossary(
+                key,
+                glossary.updated_at,
+                AhoCorasick(fold_case(source_term) for source_term, _ in rows),
+                [translations for _, translations in rows]
+            )
+            _compiled[key] = compiled
+            return compiled
+
+    def import_glossary(self, file, speciality: str, source_language_code: str, name: str = '') -> Tuple[Glossary, float]:
+        """
+        Substitui o glossário da especialidade e do idioma de origem pelo conteúdo de um arquivo CSV.
+
+        O arquivo (UTF-8, separado por vírgula, ponto e vírgula ou tabulação) tem um cabeçalho: a
+        primeira coluna é o termo de origem e cada coluna seguinte é um idioma de destino, pelo
+        código (e.g., `termo,en,es`). Células vazias indicam que o termo não deve ser traduzido
+        para aquele idioma.
+
+        Parâmetros:
+            file: O arquivo enviado.
+            speciality (str): A especialidade do glossário.
+            source_language_code (str): O idioma dos termos de origem.
+            name (str): Nome descritivo do glossário.
+
+        Retorna:
+            Tuple[Glossary, float]: O glossário gravado e o tempo de compilação, em segundos (o
+            glossário já fica compilado na memória do processo).
+
+        Exceções:
+            - ValueError: Se o arquivo for inválido ou exceder os limites configurados.
+        """
+        try:
+            content = file.read().decode('utf-8-sig')
+        except UnicodeDecodeError:
+            raise ValueError("O glossário deve estar em UTF-8.")
+        try:
+            dialect = csv.Sniffer().sniff(content[:4096], delimiters=',;\t')
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.reader(io.StringIO(content), dialect)
+
+        header = [column.strip() for column in next(reader, [])]
+        targets = header[1:]
+        unknown = [code for code in targets if code not in LANGUAGES.values()]
+        if not targets or unknown:
+            raise ValueError(
+                "O cabeçalho deve ter o termo de origem seguido dos códigos dos idiomas de destino"
+                + (f" (códigos desconhecidos: {', '.join(unknown)})." if unknown else ".")
+            )
+
+        terms = {}
+        for row in reader:
+            source_term = row[0].strip() if row else ''
+            if not source_term:
+                continue
+            if len(source_term) > self.max_term_chars:
+                raise ValueError(f"Termo com mais de {self.max_term_chars} caracteres: {source_term[:50]}...")
+            translations = {
+                code: value.strip() for code, value in zip(targets, row[1:]) if value.strip()
+            }
+            # Termos repetidos: vale a última linha
+            terms[source_term] = translations
+            if len(terms) > self.max_terms:
+                raise ValueError(f"Máximo de {self.max_terms} termos por glossário.")
+        if not terms:
+            raise ValueError("O glossário não tem termos.")
+
+        with transaction.atomic():
+            glossary, _ = Glossary.objects.select_for_update().get_or_create(
+                speciality=speciality, source_language_code=source_language_code
+            )
+            GlossaryTerm.objects.filter(glossary=glossary).delete()
+            GlossaryTerm.objects.bulk_create(
+                (GlossaryTerm(glossary=glossary, source_term=source_term, translations=translations)
+                 for source_term, translations in terms.items()),
+                batch_size=2000
+            )
+            glossary.name = name
+            glossary.target_language_codes = targets
+            glossary.term_count = len(terms)
+            glossary.save()
+
+        started = time.perf_counter()
+        self.compile(glossary)
+        return glossary, time.perf_counter() - started
+
+    @staticmethod
+    def delete(glossary: Glossary) -> None:
+        """
+        Remove o glossário e sua versão compilada.
+        """
+        with _compiled_lock:
+            _compiled.pop(str(glossary.pk), None)
+        glossary.delete()
@@ -0,0 +1,245 @@
+# aws_translator_app/services/language/language_detection_service.py
+
+"""
+Language Detection Service Module
+=================================
+
+Este módulo detecta o idioma dos textos do pipeline uma única vez por requisição, para uso tanto
+nas métricas de legibilidade quanto na tradução (como idioma de origem explícito do AWS Translate,
+em vez de `'auto'`, que repetiria a detecção no serviço).
+
+A função `langdetect.detect` analisa o texto inteiro, carrega os perfis de idioma na primeira
+chamada e é não determinística (amostragem aleatória sem semente fixa). Aqui:
+
+- Os perfis são carregados uma vez por processo, em uma `DetectorFactory` própria com semente
+  fixa, de modo que o mesmo texto sempre resulta no mesmo idioma.
+- Apenas um prefixo do texto (`SAMPLE_CHARS` caracteres, cortado em um espaço) é analisado;
+  o idioma de um documento não muda depois dos primeiros parágrafos.
+- O resultado é memorizado pelo hash da amostra (LRU com `CACHE_ENTRIES` entradas): o texto
+  original e o simplificado, e as repetições de um mesmo texto, não são analisados de novo.
+- Para a tradução, detecções em amostras com menos de `MIN_SAMPLE_CHARS` caracteres ou com
+  probabilidade abaixo de `MIN_PROBABILITY` (textos mistos) são descartadas; nesse caso a chamada
+  continua usando a detecção do AWS Translate. Em textos muito curtos, o langdetect erra com
+  probabilidade próxima de 1 (e.g., `'Olá'` ⇾ `'hu'`), por isso o tamanho mínimo.
+
+Classes:
+    LanguageDetectionService: Detecta e memoriza o idioma de textos.
+
+Funções:
+    get_language_detection_service() ⇾ LanguageDetectionService:
+        Retorna o serviço compartilhado pelo processo.
+
+Dependências:
+    - langdetect: perfis de idioma e detector.
+
+Configurações (settings.LANGUAGE_DETECTION):
+    - SAMPLE_CHARS (int): Tamanho máximo do prefixo analisado.
+    - SEED (int): Semente do detector.
+    - MIN_PROBABILITY (float): Probabilidade mínima para aceitar a detecção na tradução.
+    - MIN_SAMPLE_CHARS (int): Tamanho mínimo da amostra para aceitar a detecção na tradução.
+    - CACHE_ENTRIES (int): Número de resultados memorizados.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.language.language_detection_service import (
+    ...     get_language_detection_service
+    ... )
+    >>> detector = get_language_detection_service()
+    >>> detector.detect("Este é um texto em português.")
+    'pt'
+    >>> detector.aws_source_language("Este é um texto em português.", target_language_code='en')
+    'pt'
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from django.conf import settings
+from langdetect.detector_factory import PROFILES_DIRECTORY, DetectorFactory
+from langdetect.lang_detect_exception import LangDetectException
+
+# Códigos do langdetect que diferem dos usados pelo AWS Translate
+AWS_LANGUAGE_CODES = {
+    'zh-cn': 'zh',
+    'zh-tw': 'zh-TW',
+}
+
+# Idiomas do langdetect aceitos pelo AWS Translate como idioma de origem
+AWS_SOURCE_LANGUAGES = frozenset({
+    'af', 'ar', 'bg', 'bn', 'ca', 'cs', 'cy', 'da', 'de', 'el', 'en', 'es', 'et', 'fa', 'fi',
+    'fr', 'gu', 'he', 'hi', 'hr', 'hu', 'id', 'it', 'ja', 'kn', 'ko', 'lt', 'lv', 'mk', 'ml',
+    'mr', 'nl', 'no', 'pa', 'pl', 'pt', 'ro', 'ru', 'sk', 'sl', 'so', 'sq', 'sv', 'sw', 'ta',
+    'te', 'th', 'tl', 'tr', 'uk', 'ur', 'vi', 'zh', 'zh-TW',
+})
+
+
+class LanguageDetectionService:
+    """
+    Detecta o idioma de textos a partir de um prefixo, com detector determinístico e memorização.
+
+    Os perfis de idioma ficam na fábrica do serviço (carregados na criação); cada detecção cria um
+    `Detector` próprio, de modo que o serviço pode ser usado por várias threads ao mesmo tempo.
+
+    Métodos:
+        sample(text: str) ⇾ str:
+            Retorna o prefixo do texto analisado na detecção.
+        detect(text: str) ⇾ Optional[str]:
+            Retorna o código do idioma mais provável (no padrão do AWS Translate), ou `None`.
+        detect_with_probability(text: str) ⇾ Tuple[Optional[str], float]:
+            Retorna o idioma mais provável e sua probabilidade.
+        aws_source_language(text: str, target_language_code: Optional[str]) ⇾ str:
+            Retorna o idioma de origem a informar ao AWS Translate (`'auto'` se indeterminado).
+        stats() ⇾ dict:
+            Retorna as estatísticas da memória de resultados.
+    """
+
+    def __init__(
+            self,
+            sample_chars: int = 2000,
+            seed: int = 0,
+            min_probability: float = 0.8,
+            min_sample_chars: int = 40,
+            cache_entries: int = 4096
+    ):
+        """
+        Inicializa o serviço e carrega os perfis de idioma.
+
+        Parâmetros:
+            sample_chars (int): Tamanho máximo do prefixo analisado.
+            seed (int): Semente do detector.
+            min_probability (float): Probabilidade mínima para aceitar a detecção na tradução.
+            min_sample_chars (int): Tamanho mínimo da amostra para aceitar a detecção na tradução.
+            cache_entries (int): Número de resultados memorizados (0 desativa a memória).
+        """
+        self.sample_chars = sample_chars
+        self.min_probability = min_probability
+        self.min_sample_chars = min_sample_chars
+        self.cache_entries = cache_entries
+        self._factory = DetectorFactory()
+        self._factory.load_profile(PROFILES_DIRECTORY)
+        self._factory.set_seed(seed)
+        self._cache: 'OrderedDict[str, Tuple[Optional[str], float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def sample(self, text: str) -> str:
+        """
+        Retorna o prefixo do texto analisado: até `sample_chars` caracteres, terminando em um espaço.
+        """
+        text = text.strip()
+        if len(text) <= self.sample_chars:
+            return text
+        cut = text.rfind(' ', 0, self.sample_chars)
+        return text[:cut if cut > 0 else self.sample_chars]
+
+    def _detect_uncached(self, sample: str) -> Tuple[Optional[str], float]:
+        try:
+            detector = self._factory.create()
+            detector.append(sample)
+            candidates = detector.get_probabilities()
+        except LangDetectException:
+            # Textos sem letras (números, símbolos) ou vazios
+            return None, 0.0
+        if not candidates:
+            return None, 0.0
+        return AWS_LANGUAGE_CODES.get(candidates[0].lang, candidates[0].lang), candidates[0].prob
+
+    def detect_with_probability(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Detecta o idioma do texto a partir de seu prefixo.
+
+        Parâmetros:
+            text (str): O texto.
+
+        Retorna:
+            Tuple[Optional[str], float]: O código do idioma mais provável no padrão do AWS Translate
+            (e.g., `'pt'`, `'zh-TW'`) e sua probabilidade; `(None, 0.0)` se o texto não tiver letras.
+        """
+        sample = self.sample(text)
+        if not sample:
+            return None, 0.0
+        key = hashlib.sha256(sample.encode('utf-8')).hexdigest()
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return self._cache[key]
+            self._misses += 1
+
+        result = self._detect_uncached(sample)
+        if self.cache_entries:
+            with self._lock:
+                self._cache[key] = result
+                while len(self._cache) > self.cache_entries:
+                    self._cache.popitem(last=False)
+        return result
+
+    def detect(self, text: str) -> Optional[str]:
+        """
+        Retorna o idioma mais provável do texto (como `langdetect.detect`), ou `None` se o texto
+        não tiver letras. Veja `detect_with_probability`.
+        """
+        return self.detect_with_probability(text)[0]
+
+    def aws_source_language(self, text: str, target_language_code: Optional[str] = None) -> str:
+        """
+        Retorna o idioma de origem a informar ao AWS Translate para o texto.
+
+        Parâmetros:
+            text (str): O texto a ser traduzido.
+            target_language_code (str, optional): O idioma de destino.
+
+        Retorna:
+            str: O idioma detectado, ou `'auto'` se a detecção não for confiável (amostra curta ou
+            probabilidade baixa), se o AWS Translate
+            não aceitar o idioma ou se ele for igual ao de destino (caso em que a chamada segue
+            como antes, com a detecção automática da AWS).
+        """
+        if len(self.sample(text)) < self.min_sample_chars:
+            return 'auto'
+        language_code, probability = self.detect_with_probability(text)
+        if (probability < self.min_probability or language_code not in AWS_SOURCE_LANGUAGES
+                or language_code == target_language_code):
+            return 'auto'
+        return language_code
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses, entries = self._hits, self._misses, len(self._cache)
+        lookups = hits + misses
+        return {
+            'entries': entries,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+        }
+
+
+_language_detection_service: Optional[LanguageDetectionService] = None
+_language_detection_service_lock = threading.Lock()
+
+
+def get_language_detection_service() -> LanguageDetectionService:
+    """
+    Retorna o serviço de detecção de idioma compartilhado pelo processo.
+
+    O serviço (e os perfis de idioma) é criado no primeiro acesso a partir de `settings.LANGUAGE_DETECTION`.
+
+    Retorna:
+        LanguageDetectionService: O serviço compartilhado.
+    """
+    global _language_detection_service
+    if _language_detection_service is None:
+        with _language_detection_service_lock:
+            if _language_detection_service is None:
+                config = getattr(settings, 'LANGUAGE_DETECTION', {})
+                _language_detection_service = LanguageDetectionService(
+                    sample_chars=config.get('SAMPLE_CHARS', 2000),
+                    seed=config.get('SEED', 0),
+                    min_probability=config.get('MIN_PROBABILITY', 0.8),
+                    min_sample_chars=config.get('MIN_SAMPLE_CHARS', 40),
+                    cache_entries=config.get('CACHE_ENTRIES', 4096)
+                )
+    return _language_detection_service
@@ -0,0 +1,193 @@
+# aws_translator_app/services/language/quality_scoring_service.py
+
+"""
+Quality Scoring Service Module
+==============================
+
+Este módulo decide se, como e quando o BLEU Score de uma tradução é calculado. O BLEU Score
+por back-translation exige uma segunda chamada completa ao AWS Translate, o que dobra o custo
+de tradução e acrescenta uma etapa sequencial ao tempo de resposta. Os modos disponíveis são:
+
+- `always`: calcula o score em toda requisição (comportamento original).
+- `sampled`: calcula o score em uma fração das requisições (`SAMPLE_RATE`).
+- `async`: calcula o score depois da resposta, em segundo plano; o resultado fica em `QualityScore`.
+- `local`: calcula o score apenas se a back-translation já estiver no cache (sem chamadas à AWS).
+- `off`: não calcula o score.
+
+Nos modos `sampled` e `async`, se a back-translation já estiver no cache o score é calculado
+localmente e devolvido na própria resposta, sem chamadas à AWS. O campo `bleu_mode` da resposta
+indica o modo que efetivamente produziu o score (`skipped` quando nenhum score foi calculado).
+
+Classes:
+    QualityScoringService: Aplica o modo de avaliação configurado.
+
+Constantes:
+    BLEU_MODES: Modos de avaliação aceitos.
+
+Dependências:
+    - services.language.bleu_score_service: para o cálculo do BLEU Score.
+    - models.QualityScore: para os scores calculados em segundo plano.
+    - instrumentation: para o tempo da avaliação (etapa `bleu`).
+
+Configurações (settings.QUALITY_SCORING):
+    - MODE (str): modo padrão (pode ser sobrescrito por requisição).
+    - SAMPLE_RATE (float): fração das requisições avaliadas no modo `sampled` (0 a 1).
+    - ASYNC_WORKERS (int): número de threads para os cálculos em segundo plano.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.language.quality_scoring_service import QualityScoringService
+    >>> service = QualityScoringService()
+    >>> service.score('Texto original.', 'Translated text.', 'pt', 'en', mode='async')
+    {'bleu_score': None, 'bleu_mode': 'async', 'quality_score_id': 'a3f0...'}
+"""
+
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from aws_translator_app.instrumentation import stage_timer
+from aws_translator_app.models import QualityScore
+from aws_translator_app.services.language.bleu_score_service import BleuScoreService
+
+logger = logging.getLogger(__name__)
+
+BLEU_MODES = ('always', 'sampled', 'async', 'local', 'off')
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _config() -> dict:
+    return getattr(settings, 'QUALITY_SCORING', {})
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_config().get('ASYNC_WORKERS', 2), thread_name_prefix='quality-score'
+                )
+    return _executor
+
+
+class QualityScoringService:
+    """
+    Serviço que aplica o modo de avaliação de qualidade (BLEU Score) de uma tradução.
+
+    Métodos:
+        score(original_text: str, translated_text: str, source_language_code: str,
+              target_language_code: str, mode: Optional[str]) ⇾ dict:
+            Calcula (ou agenda, ou dispensa) o BLEU Score conforme o modo.
+    """
+
+    def __init__(self, bleu_service: Optional[BleuScoreService] = None, sample_rate: Optional[float] = None):
+        """
+        Inicializa o serviço.
+
+        Parâmetros:
+            bleu_service (BleuScoreService, optional): Serviço de BLEU Score a ser utilizado.
+            sample_rate (float, optional): Fração avaliada no modo `sampled`. Padrão: `QUALITY_SCORING['SAMPLE_RATE']`.
+        """
+        self.bleu_service = bleu_service or BleuScoreService()
+        self.default_mode = _config().get('MODE', 'always')
+        self.sample_rate = _config().get('SAMPLE_RATE', 0.1) if sample_rate is None else sample_rate
+
+    def score(
+            self,
+            original_text: str,
+            translated_text: str,
+            source_language_code: str,
+            target_language_code: str = '',
+            mode: Optional[str] = None
+    ) -> dict:
+        """
+        Calcula o BLEU Score conforme o modo de avaliação.
+
+        Parâmetros:
+            original_text (str): O texto no idioma de origem (o texto simplificado, no pipeline).
+            translated_text (str): O texto traduzido.
+            source_language_code (str): Código do idioma de origem.
+            target_language_code (str): Código do idioma de destino (registrado no modo `async`).
+            mode (str, optional): Modo de avaliação. Padrão: `QUALITY_SCORING['MODE']`.
+
+        Retorna:
+            dict: `bleu_score` (ou `None`), `bleu_mode` (o modo que produziu o score, ou `skipped`)
+            e, no modo `async`, `quality_score_id`.
+
+        Exceções:
+            - ValueError: Se o modo for desconhecido.
+            - Exception: Se ocorrer um erro no cálculo do BLEU Score (modos `always` e `sampled`).
+        """
+        mode = mode or self.default_mode
+        if mode not in BLEU_MODES:
+            raise ValueError(f"Modo de avaliação desconhecido: {mode}. Use um de {', '.join(BLEU_MODES)}.")
+
+        if mode == 'off':
+            return {'bleu_score': None, 'bleu_mode': 'off'}
+
+        with stage_timer('bleu', target_language=target_language_code):
+            return self._score(original_text, translated_text, source_language_code, target_language_code, mode)
+
+    def _score(
+            self,
+            original_text: str,
+            translated_text: str,
+            source_language_code: str,
+            target_language_code: str,
+            mode: str
+    ) -> dict:
+        if mode == 'always':
+            return {
+                'bleu_score': self.bleu_service.compute_bleu_score(original_text, translated_text, source_language_code),
+                'bleu_mode': 'always',
+            }
+
+        # Os demais modos usam a back-translation do cache sempre que possível
+        local_score = self.bleu_service.compute_cached_bleu_score(original_text, translated_text, source_language_code)
+        if local_score is not None:
+            return {'bleu_score': local_score, 'bleu_mode': 'local'}
+
+        if mode == 'sampled' and random.random() < self.sample_rate:
+            return {
+                'bleu_score': self.bleu_service.compute_bleu_score(original_text, translated_text, source_language_code),
+                'bleu_mode': 'sampled',
+            }
+
+        if mode == 'async':
+            record = QualityScore.objects.create(
+                source_language_code=source_language_code,
+                target_language_code=target_language_code
+            )
+            _get_executor().submit(self._score_in_background, record.pk, original_text, translated_text, source_language_code)
+            return {'bleu_score': None, 'bleu_mode': 'async', 'quality_score_id': str(record.pk)}
+
+        return {'bleu_score': None, 'bleu_mode': 'skipped'}
+
+    def _score_in_background(self, record_id, original_text: str, translated_text: str, source_language_code: str) -> None:
+        """
+        Calcula o BLEU Score e grava o resultado no registro `QualityScore` correspondente.
+        """
+        try:
+            bleu_score = self.bleu_service.compute_bleu_score(original_text, translated_text, source_language_code)
+            QualityScore.objects.filter(pk=record_id).update(
+                status=QualityScore.STATUS_SUCCEEDED,
+                bleu_score=bleu_score,
+                finished_at=timezone.now()
+            )
+        except Exception as e:
+            logger.exception("Falha ao calcular o BLEU Score %s", record_id)
+            QualityScore.objects.filter(pk=record_id).update(
+                status=QualityScore.STATUS_FAILED,
+                error=str(e),
+                finished_at=timezone.now()
+            )
+        finally:
+            connection.close()
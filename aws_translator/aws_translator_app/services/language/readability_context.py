@@ -0,0 +1,168 @@
+# aws_translator_app/services/language/readability_context.py
+
+"""
+Readability Context Module
+==========================
+
+Este módulo define os contextos de legibilidade por idioma: todos os dados de que o cálculo
+das métricas precisa (parâmetros do Flesch, hifenizador, lista de palavras fáceis e dicionário
+de sílabas pré-calculado), carregados uma única vez por processo.
+
+Os contextos são imutáveis (`frozenset` e `MappingProxyType`) e podem ser compartilhados entre
+threads sem travas: nenhuma requisição altera estado global (como `textstat.set_lang`) nem relê
+arquivos do disco.
+
+Classes:
+    ReadabilityContext: Dados imutáveis de legibilidade de um idioma.
+
+Funções:
+    load_readability_context(language_code: str) ⇾ ReadabilityContext:
+        Carrega o contexto de um idioma (leitura dos arquivos e pré-cálculo das sílabas).
+    get_readability_context(language_code: str) ⇾ ReadabilityContext:
+        Retorna o contexto do idioma, carregado uma vez por processo.
+
+Constantes:
+    SUPPORTED_LANGUAGES: Idiomas com contexto próprio; os demais usam o contexto 'en'.
+
+Dependências:
+    - pyphen: para a hifenização (contagem de sílabas).
+    - textstat: apenas para as listas de palavras fáceis distribuídas com a biblioteca.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.language.readability_context import get_readability_context
+    >>> context = get_readability_context('pt')
+    >>> 'casa' in context.easy_words
+    True
+"""
+
+import logging
+import os
+import threading
+from importlib import resources
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, NamedTuple
+
+from pyphen import Pyphen
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_LANGUAGES = ('en', 'es', 'de', 'fr', 'it', 'nl', 'pt', 'ru')
+
+# Parâmetros do Flesch Reading Ease por idioma (os mesmos do textstat; idiomas ausentes usam 'en')
+FLESCH_CONFIG = {
+    'en': {'base': 206.835, 'sentence_length': 1.015, 'syllables_per_word': 84.6},
+    'de': {'base': 180, 'sentence_length': 1, 'syllables_per_word': 58.5},
+    'es': {'base': 206.84, 'sentence_length': 1.02, 'syllables_per_word': 0.6},
+    'fr': {'base': 207, 'sentence_length': 1.015, 'syllables_per_word': 73.6},
+    'it': {'base': 217, 'sentence_length': 1.3, 'syllables_per_word': 0.6},
+    'nl': {'base': 206.835, 'sentence_length': 0.93, 'syllables_per_word': 77},
+    'ru': {'base': 206.835, 'sentence_length': 1.3, 'syllables_per_word': 60.1},
+}
+
+# Idiomas em que o Flesch usa sílabas por 100 palavras
+SYLLABLES_PER_100_WORDS = ('es', 'it')
+
+# Listas de palavras fáceis do próprio projeto, por idioma (complementam as do textstat)
+LOCAL_EASY_WORDS_FILES = {
+    'pt': os.path.join(os.path.dirname(__file__), 'pt_easy_words.txt'),
+}
+
+
+class ReadabilityContext(NamedTuple):
+    """
+    Dados imutáveis de legibilidade de um idioma.
+
+    Atributos:
+        language_code (str): Código do idioma.
+        flesch (Mapping[str, float]): Parâmetros do Flesch Reading Ease.
+        syllables_per_100_words (bool): Se o Flesch usa sílabas por 100 palavras (es, it).
+        pyphen (Pyphen): Hifenizador do idioma (somente leitura após a criação).
+        easy_words (FrozenSet[str]): Lista de palavras fáceis do Dale-Chall.
+        syllables (Mapping[str, int]): Sílabas pré-calculadas das palavras fáceis.
+    """
+    language_code: str
+    flesch: Mapping[str, float]
+    syllables_per_100_words: bool
+    pyphen: Pyphen
+    easy_words: FrozenSet[str]
+    syllables: Mapping[str, int]
+
+
+def _read_textstat_easy_words(language_code: str):
+    try:
+        content = resources.files('textstat').joinpath('resources', language_code, 'easy_words.txt').read_text(encoding='utf-8')
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return frozenset(line.strip() for line in content.splitlines())
+
+
+def _read_local_easy_words(language_code: str):
+    path = LOCAL_EASY_WORDS_FILES.get(language_code)
+    if path is None:
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return frozenset(word.strip().lower() for word in file if word.strip())
+    except FileNotFoundError:
+        logger.warning("Arquivo %s não encontrado. Usando a lista padrão de palavras fáceis.", path)
+        return None
+
+
+def load_readability_context(language_code: str) -> ReadabilityContext:
+    """
+    Carrega o contexto de legibilidade de um idioma.
+
+    A lista de palavras fáceis vem do arquivo local do projeto (e.g., `pt_easy_words.txt`), da
+    lista distribuída com o textstat ou, na falta de ambas, da lista em inglês. As sílabas de
+    todas as palavras fáceis são pré-calculadas com o hifenizador do idioma.
+
+    Parâmetros:
+        language_code (str): Código do idioma.
+
+    Retorna:
+        ReadabilityContext: O contexto carregado.
+    """
+    easy_words = (
+        _read_local_easy_words(language_code)
+        or _read_textstat_easy_words(language_code)
+        or _read_textstat_easy_words('en')
+        or frozenset()
+    )
+    pyphen = Pyphen(lang=language_code)
+    syllables = {word: len(pyphen.positions(word)) + 1 for word in easy_words if word}
+    return ReadabilityContext(
+        language_code=language_code,
+        flesch=MappingProxyType(dict(FLESCH_CONFIG.get(language_code, FLESCH_CONFIG['en']))),
+        syllables_per_100_words=language_code in SYLLABLES_PER_100_WORDS,
+        pyphen=pyphen,
+        easy_words=easy_words,
+        syllables=MappingProxyType(syllables)
+    )
+
+
+_contexts: Dict[str, ReadabilityContext] = {}
+_contexts_lock = threading.Lock()
+
+
+def get_readability_context(language_code: str) -> ReadabilityContext:
+    """
+    Retorna o contexto de legibilidade do idioma, carregado uma vez por processo.
+
+    Idiomas fora de `SUPPORTED_LANGUAGES` usam o contexto 'en'.
+
+    Parâmetros:
+        language_code (str): Código do idioma.
+
+    Retorna:
+        ReadabilityContext: O contexto compartilhado do idioma.
+    """
+    if language_code not in SUPPORTED_LANGUAGES:
+        language_code = 'en'
+    context = _contexts.get(language_code)
+    if context is None:
+        with _contexts_lock:
+            context = _contexts.get(language_code)
+            if context is None:
+                context = load_readability_context(language_code)
+                _contexts[language_code] = context
+    return context
@@ -0,0 +1,293 @@
+# aws_translator_app/services/language/readability_engine.py
+
+"""
+Readability Engine Module
+=========================
+
+Este módulo calcula as seis métricas de legibilidade do `ReadabilityService` a partir de uma
+única passagem pelo texto. As funções do `textstat` recalculam, cada uma, a tokenização, a
+contagem de sentenças e a contagem de sílabas (hifenização com `pyphen`); aqui o texto é
+percorrido uma vez e todas as métricas são derivadas das mesmas contagens.
+
+A contagem de sílabas, a parte mais cara, é memorizada por palavra: em textos longos, a maior
+parte das palavras se repete, e cada forma distinta é hifenizada uma única vez por processo.
+Os dados de cada idioma vêm de um `ReadabilityContext` imutável; o único estado mutável do motor
+é essa memória, um dicionário em que escritas concorrentes gravam sempre o mesmo valor para a
+mesma chave, de modo que threads podem calcular métricas em paralelo sem travas.
+
+As fórmulas, os arredondamentos intermediários e as regras de tokenização reproduzem as do
+`textstat` 0.7.4 (incluindo a lista de palavras fáceis usada no Dale-Chall), de modo que os
+resultados coincidem com os da biblioteca. O comando `python manage.py benchmark_readability`
+compara as duas implementações.
+
+Classes:
+    TextCounts: Contagens compartilhadas entre as métricas.
+    ReadabilityEngine: Calcula as métricas de legibilidade para um idioma.
+
+Funções:
+    get_readability_engine(language_code: str) ⇾ ReadabilityEngine:
+        Retorna o motor do idioma, criado uma vez por processo.
+
+Dependências:
+    - services.language.readability_context: dados de legibilidade de cada idioma.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.language.readability_engine import get_readability_engine
+    >>> get_readability_engine('en').calculate("This is a simple example. It has short sentences.")
+    {'flesch_reading_ease': 83.32, 'flesch_kincaid_grade': 2.9, ...}
+"""
+
+import math
+import re
+import threading
+from typing import Dict, NamedTuple, Tuple
+
+from aws_translator_app.services.language.readability_context import ReadabilityContext, get_readability_context
+
+# Limite de palavras distintas memorizadas por idioma (evita crescimento ilimitado)
+MAX_MEMO_ENTRIES = 200000
+
+PUNCTUATION_RE = re.compile(r"[^\w\s]")
+WORD_CHAR_RE = re.compile(r"\w")
+SENTENCE_RE = re.compile(r"\b[^.!?]+[.!?]*", re.UNICODE)
+DALE_CHALL_TOKEN_RE = re.compile(r"[\w\='‘’]+")
+
+
+class TextCounts(NamedTuple):
+    """
+    Contagens do texto das quais todas as métricas são derivadas.
+    """
+    words: int
+    sentences: int
+    syllables: int
+    characters: int
+    letters: int
+    polysyllables: int
+    difficult_words: int
+
+
+class _TokenInfo(NamedTuple):
+    syllables: int
+    is_word: bool
+    letters: int
+    dale_chall_tokens: Tuple[str, ...]
+
+
+def _legacy_round(number: float, points: int = 0) -> float:
+    # Mesmo arredondamento do textstat ("meio para longe do zero")
+    p = 10 ** points
+    return float(math.floor((number * p) + math.copysign(0.5, number))) / p
+
+
+class ReadabilityEngine:
+    """
+    Motor de métricas de legibilidade para um idioma.
+
+    Métodos:
+        count(text: str) ⇾ TextCounts:
+            Percorre o texto uma vez e retorna as contagens compartilhadas.
+        calculate(text: str) ⇾ dict:
+            Calcula as seis métricas de legibilidade do texto.
+        syllable_count(word: str) ⇾ int:
+            Conta as sílabas de uma palavra (memorizado).
+    """
+
+    def __init__(self, context: ReadabilityContext):
+        """
+        Inicializa o motor para o contexto de um idioma.
+
+        Parâmetros:
+            context (ReadabilityContext): Dados do idioma (hifenização, parâmetros do Flesch
+                e lista de palavras fáceis).
+        """
+        self.context = context
+        self._tokens: Dict[str, _TokenInfo] = {}
+        self._syllables: Dict[str, int] = {}
+
+    def syllable_count(self, word: str) -> int:
+        """
+        Conta as sílabas de uma palavra já em minúsculas e sem pontuação.
+
+        Parâmetros:
+            word (str): A palavra.
+
+        Retorna:
+            int: O número de sílabas (posições de hifenização + 1).
+        """
+        count = self.context.syllables.get(word)
+        if count is None:
+            count = self._syllables.get(word)
+        if count is None:
+            count = len(self.context.pyphen.positions(word)) + 1
+            if len(self._syllables) < MAX_MEMO_ENTRIES:
+                self._syllables[word] = count
+        return count
+
+    def _token_info(self, token: str) -> _TokenInfo:
+        # `token` é um trecho do texto sem espaços (str.split); o resultado é memorizado por trecho.
+        info = self._tokens.get(token)
+        if info is None:
+            lowered = token.lower()
+            stripped = PUNCTUATION_RE.sub('', lowered)
+            info = _TokenInfo(
+                syllables=sum(self.syllable_count(word) for word in stripped.split()),
+                is_word=bool(WORD_CHAR_RE.search(token)),
+                letters=len(WORD_CHAR_RE.findall(token)),
+                dale_chall_tokens=tuple(DALE_CHALL_TOKEN_RE.findall(lowered))
+            )
+            if len(self._tokens) < MAX_MEMO_ENTRIES:
+                self._tokens[token] = info
+        return info
+
+    def count(self, text: str) -> TextCounts:
+        """
+        Percorre o texto uma vez e retorna as contagens usadas por todas as métricas.
+
+        Parâmetros:
+            text (str): O texto a ser analisado.
+
+        Retorna:
+            TextCounts: Palavras, sentenças, sílabas, caracteres, letras, palavras polissílabas e
+            palavras difíceis (distintas, fora da lista de palavras fáceis).
+        """
+        words = syllables = characters = letters = polysyllables = 0
+        dale_chall_tokens = set()
+        for token in text.split():
+            info = self._token_info(token)
+            characters += len(token)
+            syllables += info.syllables
+            letters += info.letters
+            if info.is_word:
+                words += 1
+            if info.syllables >= 3:
+                polysyllables += 1
+            dale_chall_tokens.update(info.dale_chall_tokens)
+
+        # Sentenças com até duas palavras não são contadas (mesma regra do textstat)
+        sentences = 0
+        for sentence in SENTENCE_RE.findall(text):
+            sentence_words = 0
+            for token in sentence.split():
+                if WORD_CHAR_RE.search(token):
+                    sentence_words += 1
+                    if sentence_words > 2:
+                        sentences += 1
+                        break
+
+        return TextCounts(
+            words=words,
+            sentences=max(1, sentences),
+            syllables=syllables,
+            characters=characters,
+            letters=letters,
+            polysyllables=polysyllables,
+            difficult_words=len(dale_chall_tokens - self.context.easy_words)
+        )
+
+    def calculate(self, text: str) -> dict:
+        """
+        Calcula as seis métricas de legibilidade a partir de uma única contagem do texto.
+
+        Parâmetros:
+            text (str): O texto a ser analisado.
+
+        Retorna:
+            dict: As mesmas chaves de `ReadabilityService.calculate_readability`.
+        """
+        counts = self.count(text)
+        return self.metrics_from_counts(counts)
+
+    def metrics_from_counts(self, counts: TextCounts) -> dict:
+        """
+        Calcula as métricas a partir de contagens já obtidas.
+
+        Parâmetros:
+            counts (TextCounts): As contagens do texto.
+
+        Retorna:
+            dict: As seis métricas de legibilidade.
+        """
+        words, sentences = counts.words, counts.sentences
+
+        avg_sentence_length = _legacy_round(words / sentences, 1)
+
+        def avg_syllables_per_word(interval: int = 1) -> float:
+            if not words:
+                return 0.0
+            return _legacy_round(counts.syllables * interval / words, 1)
+
+        flesch = self.context.flesch
+        interval = 100 if self.context.syllables_per_100_words else 1
+        flesch_reading_ease = _legacy_round(
+            flesch['base']
+            - float(flesch['sentence_length'] * avg_sentence_length)
+            - float(flesch['syllables_per_word'] * avg_syllables_per_word(interval)),
+            2
+        )
+
+        flesch_kincaid_grade = _legacy_round(
+            float(0.39 * avg_sentence_length) + float(11.8 * avg_syllables_per_word()) - 15.59, 1
+        )
+
+        smog_index = 0.0
+        if sentences >= 3:
+            smog_index = _legacy_round((1.043 * (30 * (counts.polysyllables / sentences)) ** .5) + 3.1291, 1)
+
+        letters_per_word = _legacy_round(counts.letters / words, 2) if words else 0.0
+        sentences_per_word = _legacy_round(sentences / words, 2) if words else 0.0
+        coleman_liau_index = _legacy_round(
+            float((0.058 * _legacy_round(letters_per_word * 100, 2))
+                  - (0.296 * _legacy_round(sentences_per_word * 100, 2)) - 15.8),
+            2
+        )
+
+        automated_readability_index = 0.0
+        if words:
+            automated_readability_index = _legacy_round(
+                (4.71 * _legacy_round(counts.characters / words, 2))
+                + (0.5 * _legacy_round(words / sentences, 2))
+                - 21.43,
+                1
+            )
+
+        dale_chall_readability_score = 0.0
+        if words:
+            per_difficult_words = 100 - float(words - counts.difficult_words) / float(words) * 100
+            score = (0.1579 * per_difficult_words) + (0.0496 * avg_sentence_length)
+            if per_difficult_words > 5:
+                score += 3.6365
+            dale_chall_readability_score = _legacy_round(score, 2)
+
+        return {
+            'flesch_reading_ease': flesch_reading_ease,
+            'flesch_kincaid_grade': flesch_kincaid_grade,
+            'smog_index': smog_index,
+            'coleman_liau_index': coleman_liau_index,
+            'automated_readability_index': automated_readability_index,
+            'dale_chall_readability_score': dale_chall_readability_score
+        }
+
+
+_engines: Dict[str, ReadabilityEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_readability_engine(language_code: str) -> ReadabilityEngine:
+    """
+    Retorna o motor de legibilidade do idioma, criado uma vez por processo.
+
+    Parâmetros:
+        language_code (str): Código do idioma (idiomas sem suporte usam o motor 'en').
+
+    Retorna:
+        ReadabilityEngine: O motor compartilhado do idioma.
+    """
+    context = get_readability_context(language_code)
+    engine = _engines.get(context.language_code)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(context.language_code)
+            if engine is None:
+                engine = ReadabilityEngine(context)
+                _engines[context.language_code] = engine
+    return engine
@@ -17,9 +17,13 @@ Suporta o cálculo das seguintes métricas:
 Classes:
     ReadabilityService: Classe responsável pelo cálculo das métricas de legibilidade.
 
+As métricas são calculadas pelo `ReadabilityEngine`, que percorre o texto uma única vez e
+reproduz as fórmulas do `textstat`.
+
 Dependências:
-    - textstat: biblioteca para calcular métricas de legibilidade.
-    - langdetect: biblioteca para detecção de idioma de textos.
+    - services.language.language_detection_service: para a detecção de idioma (amostrada e memorizada).
+    - services.language.readability_context: dados imutáveis de legibilidade por idioma.
+    - services.language.readability_engine: para o cálculo das métricas.
 
 Exemplo de Uso:
     >>> from translation_app.services.language.readability_service import ReadabilityService
@@ -36,21 +40,28 @@ Exemplo de Uso:
     }
 """
 
-import textstat
-from langdetect import detect
-import os
+from typing import FrozenSet, Optional
+
+from aws_translator_app.services.language.language_detection_service import get_language_detection_service
+from aws_translator_app.services.language.readability_context import SUPPORTED_LANGUAGES, get_readability_context
+from aws_translator_app.services.language.readability_engine import get_readability_engine
 
 
 class ReadabilityService:
     """
     Serviço para calcular métricas de legibilidade de textos.
 
-    Este serviço utiliza a biblioteca `textstat` para calcular diversas métricas
-    de legibilidade. A detecção de idioma é realizada com a biblioteca `langdetect`
-    para ajustar as métricas conforme o idioma do texto fornecido.
+    Este serviço utiliza o `ReadabilityEngine` (equivalente ao `textstat`) para calcular
+    diversas métricas de legibilidade. O idioma do texto, que ajusta as métricas, pode ser informado
+    por quem chama (por exemplo, o pipeline, que já o detectou); caso contrário, é detectado com o
+    `LanguageDetectionService`.
+
+    Os dados de cada idioma (palavras fáceis, sílabas, hifenização) ficam em contextos imutáveis,
+    carregados uma vez por processo; nenhum estado global é alterado a cada chamada, de modo que
+    o serviço pode ser usado por várias threads ao mesmo tempo.
 
     Métodos:
-        calculate_readability(text: str) ⇒ dict:
+        calculate_readability(text: str, language_code: Optional[str] = None) ⇒ dict:
             Calcula e retorna as métricas de legibilidade para o texto fornecido.
     """
 
@@ -63,45 +74,36 @@ class ReadabilityService:
         pass
 
     @staticmethod
-    def load_easy_words(language_code: str) -> None:
+    def load_easy_words(language_code: str) -> FrozenSet[str]:
         """
-        Carrega a lista de palavras fáceis para o idioma especificado.
+        Retorna a lista de palavras fáceis para o idioma especificado.
 
-        Se o idioma for Português ('pt'), carrega as palavras do arquivo 'pt_easy_words.txt'.
-        Caso contrário, utiliza a lista padrão para o idioma configurado em `textstat`.
+        Se o idioma for Português ('pt'), as palavras vêm do arquivo 'pt_easy_words.txt'; para os
+        demais, da lista do `textstat` (inglês, se não houver lista para o idioma). O arquivo é lido
+        apenas uma vez por processo, no carregamento do contexto do idioma.
 
         Args:
             language_code (str): Código do idioma (e.g., 'en', 'pt').
+
+        Returns:
+            FrozenSet[str]: As palavras fáceis do idioma.
         """
-        if language_code == 'pt':
-            # Caminho para o arquivo de palavras fáceis em português
-            easy_words_file = os.path.join(os.path.dirname(__file__), 'pt_easy_words.txt')
-            try:
-                with open(easy_words_file, 'r', encoding='utf-8') as file:
-                    easy_words = set(word.strip().lower() for word in file if word.strip())
-                textstat.easy_word_set = easy_words
-            except FileNotFoundError:
-                print(f"Arquivo {easy_words_file} não encontrado. Usando lista padrão de palavras fáceis em Inglês.")
-                # Define inglês como padrão se o arquivo não for encontrado
-                textstat.set_lang('en')
-        else:
-            # Para outros idiomas suportados, usa a configuração padrão do textstat
-            pass
+        return get_readability_context(language_code).easy_words
 
     @staticmethod
-    def calculate_readability(text: str) -> dict:
+    def calculate_readability(text: str, language_code: Optional[str] = None) -> dict:
         """
         Calcula métricas de legibilidade para o texto fornecido.
 
         Este metodo realiza os seguintes passos:
-            1. Detecta o idioma do texto usando `langdetect`.
-            2. Configura o idioma para a biblioteca `textstat` se suportado.
-            3. Carrega a lista de palavras fáceis para o idioma.
-            4. Calcula as métricas de legibilidade.
-            5. Retorna as métricas em um dicionário.
+            1. Detecta o idioma do texto com o `LanguageDetectionService`, se não for informado.
+            2. Seleciona o motor do idioma, se suportado (caso contrário, o de inglês).
+            3. Calcula as métricas de legibilidade com o motor do idioma (uma única passagem pelo texto).
+            4. Retorna as métricas em um dicionário.
 
         Parâmetros:
             text (str): O texto a ser analisado.
+            language_code (str, optional): O idioma do texto, se já for conhecido.
 
         Retorna:
             dict: um dicionário contendo as métricas de legibilidade calculadas.
@@ -110,29 +112,11 @@ class ReadabilityService:
             - Nenhuma exceção explícita é lançada. Caso ocorra um erro na detecção do idioma,
               o idioma padrão será configurado como inglês ('en').
         """
-        # Detecta o idioma do texto
-        try:
-            language_code = detect(text)
-            # Lista de idiomas suportados pelo textstat
-            supported_languages = ['en', 'es', 'de', 'fr', 'it', 'nl', 'pt', 'ru']
-            if language_code in supported_languages:
-                textstat.set_lang(language_code)
-                ReadabilityService.load_easy_words(language_code)
-            else:
-                # Define inglês como padrão se o idioma não for suportado
-                textstat.set_lang('en')
-        except Exception:
-            # Em caso de erro na detecção do idioma, define inglês como padrão
-            textstat.set_lang('en')
-
-        # Calcula as métricas de legibilidade
-        metrics = {
-            'flesch_reading_ease': textstat.flesch_reading_ease(text),
-            'flesch_kincaid_grade': textstat.flesch_kincaid_grade(text),
-            'smog_index': textstat.smog_index(text),
-            'coleman_liau_index': textstat.coleman_liau_index(text),
-            'automated_readability_index': textstat.automated_readability_index(text),
-            'dale_chall_readability_score': textstat.dale_chall_readability_score(text)
-        }
-
-        return metrics
+        if language_code is None:
+            language_code = get_language_detection_service().detect(text)
+        if language_code not in SUPPORTED_LANGUAGES:
+            # Define inglês como padrão se o idioma não for suportado (ou não for detectado)
+            language_code = 'en'
+
+        # Calcula as métricas de legibilidade (tokenização e contagem de sílabas uma única vez)
+        return get_readability_engine(language_code).calculate(text)
@@ -0,0 +1,214 @@
+# aws_translator_app/services/pdf_layout_engine.py
+
+"""
+PDF Layout Engine Module
+========================
+
+Este módulo faz a diagramação dos PDFs exportados pelo `DocumentService`: quebra de linhas e
+paginação do texto antes do desenho com o ReportLab.
+
+A versão anterior media a linha inteira (`stringWidth(linha + palavra)`) a cada palavra
+adicionada, um custo quadrático no comprimento da linha, e repetia a lógica de quebra de página
+em vários pontos. Aqui a largura de cada palavra é medida uma única vez (e memorizada por fonte
+e tamanho), a quebra de linhas é gulosa sobre as larguras já calculadas e a paginação é feita em
+uma única passagem sobre as linhas.
+
+Como as fontes padrão do PDF não têm kerning no ReportLab, a largura de uma linha é exatamente
+a soma das larguras das palavras e dos espaços, e as quebras coincidem com as da versão anterior
+(exceto por palavras mais largas que a página, que antes eram precedidas de uma linha vazia).
+O comando `python manage.py benchmark_pdf_export` compara as duas implementações.
+
+Classes:
+    LayoutLine: Uma linha diagramada (texto, fonte e tamanho).
+    PdfLayoutEngine: Quebra de linhas, paginação e desenho em um canvas do ReportLab.
+
+Dependências:
+    - reportlab: para a medição das palavras e o desenho das páginas.
+
+Exemplo de Uso:
+    >>> from reportlab.pdfgen import canvas
+    >>> from aws_translator_app.services.pdf_layout_engine import PdfLayoutEngine
+    >>> engine = PdfLayoutEngine()
+    >>> lines = list(engine.heading("Título")) + list(engine.paragraphs("Texto longo..."))
+    >>> c = canvas.Canvas('/tmp/exemplo.pdf', pagesize=engine.page_size)
+    >>> engine.render(c, engine.paginate(lines))
+    >>> c.save()
+"""
+
+import threading
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+# Limite de palavras distintas memorizadas por fonte e tamanho (evita crescimento ilimitado)
+MAX_WIDTH_CACHE_ENTRIES = 100000
+
+# Entrelinha do ReportLab quando não é informada (1,2 × o tamanho da fonte)
+LEADING_FACTOR = 1.2
+
+_width_caches: Dict[Tuple[str, float], Dict[str, float]] = {}
+_width_caches_lock = threading.Lock()
+
+
+def _width_cache(font_name: str, font_size: float) -> Dict[str, float]:
+    key = (font_name, font_size)
+    cache = _width_caches.get(key)
+    if cache is None:
+        with _width_caches_lock:
+            cache = _width_caches.setdefault(key, {})
+    return cache
+
+
+class LayoutLine(NamedTuple):
+    """
+    Uma linha pronta para o desenho.
+    """
+    text: str
+    font_name: str
+    font_size: float
+
+
+class PdfLayoutEngine:
+    """
+    Motor de diagramação de texto em páginas de PDF.
+
+    Métodos:
+        word_width(word: str, font_name: str, font_size: float) ⇾ float:
+            Retorna a largura de uma palavra (memorizada).
+        wrap(paragraph: str, font_name: str, font_size: float) ⇾ List[str]:
+            Quebra um parágrafo em linhas que cabem na largura útil da página.
+        paragraphs(text: str) ⇾ Iterator[LayoutLine]:
+            Quebra um texto (parágrafos separados por '\\n') na fonte do corpo.
+        heading(text: str) ⇾ Iterator[LayoutLine]:
+            Retorna um título seguido de uma linha em branco.
+        paginate(lines: Iterable[LayoutLine]) ⇾ List[List[LayoutLine]]:
+            Distribui as linhas em páginas, em uma única passagem.
+        render(c, pages: List[List[LayoutLine]]) ⇾ None:
+            Desenha as páginas em um canvas do ReportLab.
+    """
+
+    def __init__(self, page_size: Tuple[float, float] = letter, margin: float = 50,
+                 font_name: str = 'Helvetica', font_size: float = 12,
+                 heading_font_name: str = 'Helvetica-Bold', heading_font_size: float = 14):
+        """
+        Inicializa o motor de diagramação.
+
+        Parâmetros:
+            page_size (Tuple[float, float]): Largura e altura da página, em pontos.
+            margin (float): Margem da página, em pontos.
+            font_name (str): Fonte do corpo do texto.
+            font_size (float): Tamanho da fonte do corpo do texto.
+            heading_font_name (str): Fonte dos títulos.
+            heading_font_size (float): Tamanho da fonte dos títulos.
+        """
+        self.page_size = page_size
+        self.margin = margin
+        self.font_name = font_name
+        self.font_size = font_size
+        self.heading_font_name = heading_font_name
+        self.heading_font_size = heading_font_size
+        self.max_width = page_size[0] - 2 * margin
+
+    @staticmethod
+    def word_width(word: str, font_name: str, font_size: float) -> float:
+        cache = _width_cache(font_name, font_size)
+        width = cache.get(word)
+        if width is None:
+            width = stringWidth(word, font_name, font_size)
+            if len(cache) < MAX_WIDTH_CACHE_ENTRIES:
+                cache[word] = width
+        return width
+
+    def wrap(self, paragraph: str, font_name: str, font_size: float) -> List[str]:
+        """
+        Quebra um parágrafo em linhas de forma gulosa: cada linha recebe palavras enquanto a
+        largura acumulada (palavras e espaços) for menor que a largura útil da página.
+
+        Parâmetros:
+            paragraph (str): O parágrafo, sem quebras de linha.
+            font_name (str): A fonte usada na medição.
+            font_size (float): O tamanho da fonte usada na medição.
+
+        Retorna:
+            List[str]: As linhas do parágrafo (uma linha vazia para parágrafos vazios). Palavras
+            mais largas que a página ocupam uma linha sozinhas.
+        """
+        space = self.word_width(' ', font_name, font_size)
+        max_width = self.max_width
+        lines = []
+        current: List[str] = []
+        current_width = 0.0
+        # split(' ') (e não split()) preserva espaços repetidos, como na versão anterior
+        for word in paragraph.split(' '):
+            width = self.word_width(word, font_name, font_size)
+            if not current:
+                current.append(word)
+                current_width = width
+            elif current_width + space + width < max_width:
+                current.append(word)
+                current_width += space + width
+            else:
+                lines.append(' '.join(current).strip())
+                current = [word]
+                current_width = width
+        lines.append(' '.join(current).strip())
+        return lines
+
+    def paragraphs(self, text: str) -> Iterator[LayoutLine]:
+        font_name, font_size = self.font_name, self.font_size
+        for paragraph in text.split('\n'):
+            for line in self.wrap(paragraph, font_name, font_size):
+                yield LayoutLine(line, font_name, font_size)
+
+    def heading(self, text: str) -> Iterator[LayoutLine]:
+        yield LayoutLine(text, self.heading_font_name, self.heading_font_size)
+        yield LayoutLine('', self.font_name, self.font_size)
+
+    def paginate(self, lines: Iterable[LayoutLine]) -> List[List[LayoutLine]]:
+        """
+        Distribui as linhas em páginas: cada linha desce o cursor pela entrelinha da sua fonte,
+        e uma nova página começa quando o cursor alcança a margem inferior.
+
+        Parâmetros:
+            lines (Iterable[LayoutLine]): As linhas, na ordem de desenho.
+
+        Retorna:
+            List[List[LayoutLine]]: As linhas de cada página.
+        """
+        top = self.page_size[1] - self.margin
+        bottom = self.margin
+        pages: List[List[LayoutLine]] = []
+        page: List[LayoutLine] = []
+        y = top
+        for line in lines:
+            page.append(line)
+            y -= line.font_size * LEADING_FACTOR
+            if y <= bottom:
+                pages.append(page)
+                page = []
+                y = top
+        if page or not pages:
+            pages.append(page)
+        return pages
+
+    def render(self, c, pages: List[List[LayoutLine]]) -> None:
+        """
+        Desenha as páginas em um canvas do ReportLab (uma chamada `showPage` entre páginas).
+
+        Parâmetros:
+            c (reportlab.pdfgen.canvas.Canvas): O canvas de destino.
+            pages (List[List[LayoutLine]]): As páginas retornadas por `paginate`.
+        """
+        top = self.page_size[1] - self.margin
+        for number, page in enumerate(pages):
+            if number:
+                c.showPage()
+            text_object = c.beginText(self.margin, top)
+            font = None
+            for line in page:
+                if font != (line.font_name, line.font_size):
+                    font = (line.font_name, line.font_size)
+                    text_object.setFont(line.font_name, line.font_size)
+                text_object.textLine(line.text)
+            c.drawText(text_object)
@@ -0,0 +1,197 @@
+# aws_translator_app/services/pipeline/batch_translation_service.py
+
+"""
+Batch Translation Service Module
+================================
+
+Este módulo traduz listas de textos curtos (rótulos de interface, títulos de produtos, etc.)
+para vários idiomas de destino em uma única requisição. Para reduzir o número de chamadas
+ao AWS Translate, o serviço:
+
+1. Remove entradas duplicadas (cada texto distinto é traduzido uma única vez por idioma).
+2. Consulta o cache de traduções antes de qualquer chamada.
+3. Agrupa textos pequenos, de uma única linha, em uma só chamada (um texto por linha) quando é
+   seguro fazê-lo. O resultado agrupado só é aceito se a tradução devolver exatamente uma linha
+   por texto; caso contrário, os textos do grupo são traduzidos individualmente.
+4. Executa as chamadas em paralelo, com um limite de concorrência.
+
+Os resultados são devolvidos na ordem de entrada, e erros são reportados por item, sem
+interromper o restante do lote.
+
+Classes:
+    BatchTranslationService: Tradução em lote de N textos para M idiomas.
+
+Dependências:
+    - concurrent.futures: para executar as chamadas em paralelo.
+    - services.api.aws_translate_service: para as chamadas ao AWS Translate.
+
+Configurações (settings.BATCH_TRANSLATION):
+    - MAX_CONCURRENCY (int): número máximo de chamadas simultâneas ao AWS Translate.
+    - PACK_MAX_BYTES (int): tamanho máximo, em bytes, de um grupo de textos.
+    - PACK_MAX_ITEMS (int): número máximo de textos em um grupo.
+    - PACK_ITEM_MAX_BYTES (int): tamanho máximo de um texto para que ele possa ser agrupado.
+    - PACK_AUTO_SOURCE (bool): permite agrupar textos quando o idioma de origem é `'auto'`
+      (a AWS detecta um único idioma para todo o grupo; só é seguro se o lote for monolíngue).
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.pipeline.batch_translation_service import BatchTranslationService
+    >>> service = BatchTranslationService()
+    >>> service.translate(['Salvar', 'Cancelar', 'Salvar'], ['en', 'es'], source_language_code='pt')
+    {'results': [{'index': 0, 'text': 'Salvar', 'translations': {'en': {...}, 'es': {...}}}, ...], 'stats': {...}}
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from aws_translator_app.services.api.aws_translate_service import AwsTranslateService
+
+PACK_SEPARATOR = '\n'
+
+
+class BatchTranslationService:
+    """
+    Serviço de tradução em lote.
+
+    Métodos:
+        translate(texts: List[str], target_language_codes: List[str], source_language_code: str) ⇾ dict:
+            Traduz todos os textos para todos os idiomas de destino.
+    """
+
+    def __init__(self, aws_service: Optional[AwsTranslateService] = None):
+        """
+        Inicializa o serviço de tradução em lote.
+
+        Parâmetros:
+            aws_service (AwsTranslateService, optional): Serviço de tradução a ser utilizado.
+        """
+        config = getattr(settings, 'BATCH_TRANSLATION', {})
+        self.aws_service = aws_service or AwsTranslateService()
+        self.max_concurrency = config.get('MAX_CONCURRENCY', 8)
+        self.pack_max_bytes = config.get('PACK_MAX_BYTES', 4500)
+        self.pack_max_items = config.get('PACK_MAX_ITEMS', 50)
+        self.pack_item_max_bytes = config.get('PACK_ITEM_MAX_BYTES', 500)
+        self.pack_auto_source = config.get('PACK_AUTO_SOURCE', False)
+
+    def translate(self, texts: List[str], target_language_codes: List[str], source_language_code: str = 'auto') -> dict:
+        """
+        Traduz todos os textos para todos os idiomas de destino.
+
+        Parâmetros:
+            texts (List[str]): Textos a serem traduzidos.
+            target_language_codes (List[str]): Códigos dos idiomas de destino.
+            source_language_code (str): Código do idioma de origem (`'auto'` para detecção automática).
+
+        Retorna:
+            dict: `results`, com um item por texto de entrada (na mesma ordem) contendo as traduções
+            ou o erro de cada idioma, e `stats`, com o número de textos distintos, acertos de cache
+            e chamadas feitas à AWS.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        target_language_codes = list(dict.fromkeys(target_language_codes))
+        outcomes: Dict[Tuple[str, str], dict] = {}
+        stats = {'items': len(texts), 'unique_texts': len(unique_texts), 'cache_hits': 0, 'aws_calls': 0, 'packed_calls': 0}
+
+        # Consulta o cache; o que faltar é agrupado em unidades de trabalho
+        units = []
+        for target in target_language_codes:
+            misses = []
+            for text in unique_texts:
+                cached = self.aws_service.cache.get(text, source_language_code, target)
+                if cached is not None:
+                    stats['cache_hits'] += 1
+                    outcomes[(text, target)] = self._success(cached)
+                else:
+                    misses.append(text)
+            units.extend((target, group) for group in self._plan(misses, source_language_code))
+
+        if units:
+            workers = min(self.max_concurrency, len(units))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='batch-translate') as executor:
+                for unit_outcomes, calls, packed in executor.map(
+                        lambda unit: self._run_unit(unit[0], unit[1], source_language_code), units
+                ):
+                    outcomes.update(unit_outcomes)
+                    stats['aws_calls'] += calls
+                    stats['packed_calls'] += packed
+
+        results = [
+            {
+                'index': index,
+                'text': text,
+                'translations': {target: outcomes[(text, target)] for target in target_language_codes},
+            }
+            for index, text in enumerate(texts)
+        ]
+        return {'results': results, 'stats': stats}
+
+    def _packable(self, text: str) -> bool:
+        return (
+            PACK_SEPARATOR not in text
+            and text.strip() == text
+            and bool(text)
+            and len(text.encode('utf-8')) <= self.pack_item_max_bytes
+        )
+
+    def _plan(self, texts: List[str], source_language_code: str) -> List[List[str]]:
+        """
+        Divide os textos em grupos: textos agrupáveis são reunidos até os limites configurados;
+        os demais formam grupos de um único texto.
+        """
+        can_pack = source_language_code != 'auto' or self.pack_auto_source
+        groups, current, current_bytes = [], [], 0
+        for text in texts:
+            if not can_pack or not self._packable(text):
+                groups.append([text])
+                continue
+            size = len(text.encode('utf-8')) + len(PACK_SEPARATOR)
+            if current and (current_bytes + size > self.pack_max_bytes or len(current) >= self.pack_max_items):
+                groups.append(current)
+                current, current_bytes = [], 0
+            current.append(text)
+            current_bytes += size
+        if current:
+            groups.append(current)
+        return groups
+
+    def _run_unit(self, target: str, group: List[str], source_language_code: str) -> Tuple[Dict[Tuple[str, str], dict], int, int]:
+        """
+        Traduz um grupo de textos para um idioma de destino.
+
+        Retorna:
+            Tuple: os resultados por (texto, idioma), o número de chamadas à AWS e o número de chamadas agrupadas.
+        """
+        outcomes = {}
+        calls = packed = 0
+        if len(group) > 1:
+            calls += 1
+            try:
+                translated, detected = self.aws_service.translate_text_uncached(
+                    PACK_SEPARATOR.join(group), target, source_language_code
+                )
+                lines = translated.split(PACK_SEPARATOR)
+                if len(lines) == len(group):
+                    packed += 1
+                    for text, line in zip(group, lines):
+                        result = (line.strip(), detected)
+                        self.aws_service.cache.set(text, source_language_code, target, result)
+                        outcomes[(text, target)] = self._success(result)
+                    return outcomes, calls, packed
+            except Exception:
+                # O grupo é traduzido item a item, para isolar o erro no(s) texto(s) responsável(is).
+                pass
+
+        for text in group:
+            calls += 1
+            try:
+                result = self.aws_service.translate_long_text(text, target, source_language_code)
+                outcomes[(text, target)] = self._success(result)
+            except Exception as e:
+                outcomes[(text, target)] = {'error': str(e)}
+        return outcomes, calls, packed
+
+    @staticmethod
+    def _success(result: Tuple[str, str]) -> dict:
+        translated_text, source_language_code = result
+        return {'translated_text': translated_text, 'source_language_code': source_language_code}
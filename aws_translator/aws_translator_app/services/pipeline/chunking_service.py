@@ -0,0 +1,255 @@
+# aws_translator_app/services/pipeline/chunking_service.py
+
+"""
+Chunking Service Module
+=======================
+
+Este módulo divide textos longos em blocos (chunks) que respeitam um orçamento de bytes
+(UTF-8) e, opcionalmente, de tokens. A divisão respeita, nesta ordem de preferência:
+
+1. Limites de parágrafo (linhas em branco).
+2. Limites de sentença (pontuação final seguida de espaço).
+3. Limites de palavra (apenas quando uma única sentença excede o orçamento).
+
+Cada bloco guarda o separador que o segue no texto original, permitindo remontar o
+resultado processado na mesma ordem e com a mesma estrutura de parágrafos.
+
+Classes:
+    TextChunk: Bloco de texto com seu índice e separador.
+    TextChunker: Responsável por dividir e remontar textos.
+
+Funções:
+    split_sentences(text: str) ⇾ List[TextChunk]:
+        Divide o texto em sentenças, sem orçamento de tamanho (usada pela memória de tradução).
+
+Dependências:
+    - re: para identificar parágrafos e sentenças.
+    - django.conf.settings: para os limites padrão (`TRANSLATION_CHUNKING`).
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.pipeline.chunking_service import TextChunker
+    >>> chunker = TextChunker(max_bytes=20)
+    >>> chunks = chunker.split("Primeira frase. Segunda frase.\\n\\nOutro parágrafo.")
+    >>> [chunk.text for chunk in chunks]
+    ['Primeira frase.', 'Segunda frase.', 'Outro parágrafo.']
+    >>> TextChunker.join([chunk.text.upper() for chunk in chunks], chunks)
+    'PRIMEIRA FRASE. SEGUNDA FRASE.\\n\\nOUTRO PARÁGRAFO.'
+"""
+
+import math
+import re
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+from django.conf import settings
+
+PARAGRAPH_BREAK = '\n\n'
+SENTENCE_BREAK = ' '
+
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+_SENTENCE_RE = re.compile(r'(?<=[.!?…;:])\s+')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estima o número de tokens de um texto (aproximadamente 4 caracteres por token).
+    """
+    return math.ceil(len(text) / 4)
+
+
+class TextChunk(NamedTuple):
+    """
+    Bloco de texto produzido pelo `TextChunker`.
+
+    Atributos:
+        index (int): Posição do bloco no texto original.
+        text (str): Conteúdo do bloco.
+        separator (str): Separador que segue o bloco no texto original (vazio no último bloco).
+    """
+    index: int
+    text: str
+    separator: str
+
+
+
+def split_sentences(text: str) -> List[TextChunk]:
+    """
+    Divide o texto em sentenças, com os mesmos critérios de parágrafo e sentença do `TextChunker`,
+    mas sem agrupá-las nem limitar seu tamanho.
+
+    Parâmetros:
+        text (str): O texto a ser dividido.
+
+    Retorna:
+        List[TextChunk]: As sentenças na ordem original, cada uma com o separador que a segue
+        (remontáveis com `TextChunker.join`). Um texto vazio resulta em uma lista vazia.
+    """
+    pieces = []  # Lista de (sentença, separador)
+    for paragraph in _PARAGRAPH_RE.split(text.strip()):
+        sentences = [sentence for sentence in _SENTENCE_RE.split(paragraph.strip()) if sentence]
+        if not sentences:
+            continue
+        pieces.extend((sentence, SENTENCE_BREAK) for sentence in sentences[:-1])
+        pieces.append((sentences[-1], PARAGRAPH_BREAK))
+    return [
+        TextChunk(index, sentence, separator if index < len(pieces) - 1 else '')
+        for index, (sentence, separator) in enumerate(pieces)
+    ]
+
+class TextChunker:
+    """
+    Divide textos em blocos limitados por bytes e tokens, preservando parágrafos e sentenças.
+
+    Métodos:
+        split(text: str) ⇾ List[TextChunk]:
+            Divide o texto em blocos dentro do orçamento.
+        join(pieces: Iterable[str], chunks: List[TextChunk]) ⇾ str:
+            Remonta os blocos processados, na ordem original, com seus separadores.
+    """
+
+    def __init__(
+            self,
+            max_bytes: Optional[int] = None,
+            max_tokens: Optional[int] = None,
+            token_counter: Optional[Callable[[str], int]] = None
+    ):
+        """
+        Inicializa o divisor de textos.
+
+        Parâmetros:
+            max_bytes (int, optional): Tamanho máximo de cada bloco em bytes UTF-8.
+                Padrão: `TRANSLATION_CHUNKING['MAX_CHUNK_BYTES']`.
+            max_tokens (int, optional): Número máximo de tokens de cada bloco (0 para não limitar).
+                Padrão: `TRANSLATION_CHUNKING['MAX_CHUNK_TOKENS']`.
+            token_counter (Callable, optional): Função que conta os tokens de um texto.
+                Padrão: estimativa de 4 caracteres por token.
+        """
+        config = getattr(settings, 'TRANSLATION_CHUNKING', {})
+        self.max_bytes = max_bytes or config.get('MAX_CHUNK_BYTES', 6000)
+        self.max_tokens = max_tokens if max_tokens is not None else config.get('MAX_CHUNK_TOKENS', 0)
+        self.token_counter = token_counter or estimate_tokens
+
+    def fits(self, text: str) -> bool:
+        """
+        Indica se o texto cabe no orçamento de um único bloco.
+        """
+        if len(text.encode('utf-8')) > self.max_bytes:
+            return False
+        if self.max_tokens and self.token_counter(text) > self.max_tokens:
+            return False
+        return True
+
+    def split(self, text: str) -> List[TextChunk]:
+        """
+        Divide o texto em blocos dentro do orçamento.
+
+        Parágrafos consecutivos são agrupados no mesmo bloco enquanto couberem; um parágrafo
+        maior que o orçamento é dividido em sentenças, e uma sentença maior que o orçamento
+        é dividida em palavras.
+
+        Parâmetros:
+            text (str): O texto a ser dividido.
+
+        Retorna:
+            List[TextChunk]: Os blocos na ordem original. Um texto vazio resulta em uma lista vazia.
+        """
+        pieces = []  # Lista de (texto, separador)
+        for paragraph in _PARAGRAPH_RE.split(text.strip()):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if self.fits(paragraph):
+                pieces.append((paragraph, PARAGRAPH_BREAK))
+                continue
+            sentence_pieces = self._pack(self._split_sentences(paragraph), SENTENCE_BREAK)
+            pieces.extend((piece, SENTENCE_BREAK) for piece in sentence_pieces[:-1])
+            pieces.append((sentence_pieces[-1], PARAGRAPH_BREAK))
+
+        # Agrupa parágrafos pequenos consecutivos no mesmo bloco
+        chunks = []
+        buffer, buffer_separator = None, PARAGRAPH_BREAK
+        for piece, separator in pieces:
+            if buffer is not None and buffer_separator == PARAGRAPH_BREAK:
+                candidate = buffer + PARAGRAPH_BREAK + piece
+                if self.fits(candidate):
+                    buffer, buffer_separator = candidate, separator
+                    continue
+            if buffer is not None:
+                chunks.append((buffer, buffer_separator))
+            buffer, buffer_separator = piece, separator
+        if buffer is not None:
+            chunks.append((buffer, ''))
+
+        return [TextChunk(index, chunk, separator) for index, (chunk, separator) in enumerate(chunks)]
+
+    def _split_sentences(self, paragraph: str) -> List[str]:
+        """
+        Divide um parágrafo em sentenças, dividindo em palavras as sentenças que excedem o orçamento.
+        """
+        sentences = []
+        for sentence in _SENTENCE_RE.split(paragraph):
+            if not sentence:
+                continue
+            if self.fits(sentence):
+                sentences.append(sentence)
+            else:
+                sentences.extend(self._pack(self._split_words(sentence), SENTENCE_BREAK))
+        return sentences
+
+    def _split_words(self, sentence: str) -> List[str]:
+        """
+        Divide uma sentença em palavras; palavras maiores que o orçamento são cortadas em caracteres.
+        """
+        words = []
+        for word in sentence.split():
+            while not self.fits(word):
+                cut = self._largest_prefix(word)
+                words.append(word[:cut])
+                word = word[cut:]
+            if word:
+                words.append(word)
+        return words
+
+    def _largest_prefix(self, word: str) -> int:
+        """
+        Retorna o tamanho do maior prefixo da palavra que cabe no orçamento (busca binária).
+        """
+        low, high = 1, len(word)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.fits(word[:middle]):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def _pack(self, parts: List[str], separator: str) -> List[str]:
+        """
+        Agrupa partes consecutivas, unidas pelo separador, enquanto couberem no orçamento.
+        """
+        packed = []
+        buffer = None
+        for part in parts:
+            if buffer is not None:
+                candidate = buffer + separator + part
+                if self.fits(candidate):
+                    buffer = candidate
+                    continue
+                packed.append(buffer)
+            buffer = part
+        if buffer is not None:
+            packed.append(buffer)
+        return packed
+
+    @staticmethod
+    def join(pieces: Iterable[str], chunks: List[TextChunk]) -> str:
+        """
+        Remonta os blocos processados na ordem original.
+
+        Parâmetros:
+            pieces (Iterable[str]): Resultado do processamento de cada bloco, na mesma ordem de `chunks`.
+            chunks (List[TextChunk]): Os blocos originais (fornecem os separadores).
+
+        Retorna:
+            str: O texto remontado.
+        """
+        return ''.join(piece.strip() + chunk.separator for piece, chunk in zip(pieces, chunks))
@@ -0,0 +1,429 @@
+# aws_translator_app/services/pipeline/translation_memory_service.py
+
+"""
+Translation Memory Service Module
+=================================
+
+Este módulo mantém uma memória de tradução persistente (modelo `TranslationMemoryEntry`), no nível
+de sentença, para que revisões de documentos já traduzidos enviem ao AWS Translate apenas as
+sentenças que mudaram.
+
+Cada texto é dividido em sentenças (`split_sentences`) e cada sentença é procurada na memória do
+par de idiomas:
+
+1. Correspondência exata: hash SHA-256 do texto normalizado (a mesma normalização do cache de
+   traduções), em uma única consulta para o texto inteiro. Apenas essas traduções são reaproveitadas.
+2. Correspondência aproximada (desativada por padrão): as sentenças restantes são comparadas por
+   MinHash (shingles de caracteres) com um índice LSH (`TranslationMemoryBand`), e os candidatos
+   que compartilham uma faixa são confirmados pela similaridade de Jaccard real (a partir de
+   `FUZZY_THRESHOLD`, com os mesmos números). Essas sentenças são contadas nas estatísticas
+   (`fuzzy_hits`: sentenças revisadas de um texto já traduzido), mas são traduzidas de novo: uma
+   pequena edição (e.g., um "não" inserido) mantém a similaridade acima de 0,9 e inverte o sentido
+   da tradução antiga. Como o resultado não é reaproveitado, a busca e o índice (uma linha por
+   faixa de cada sentença gravada) só são mantidos quando `FUZZY_THRESHOLD` é maior que zero.
+
+As sentenças sem correspondência exata são traduzidas em grupos de sentenças consecutivas, uma por
+linha, em uma única chamada ao AWS Translate por grupo (como no agrupamento da tradução em lote).
+Se a tradução não devolver uma linha por sentença, o grupo é traduzido como um trecho corrido e
+não é gravado na memória. As traduções novas são gravadas e o resultado é remontado na ordem
+original, com os separadores de parágrafo e sentença do texto.
+
+Assim, o volume de caracteres enviado à AWS (e o tempo de tradução) cai na proporção das
+sentenças inalteradas.
+
+Classes:
+    MinHasher: Assinaturas MinHash e chaves das faixas LSH de um texto.
+    TranslationMemoryService: Tradução com consulta e gravação na memória.
+
+Funções:
+    get_translation_memory_stats() ⇾ dict:
+        Retorna os contadores da memória de tradução no processo.
+
+Dependências:
+    - models.TranslationMemoryEntry, models.TranslationMemoryBand: armazenamento da memória.
+    - services.api.aws_translate_service: para as chamadas ao AWS Translate.
+    - services.cache.translation_cache: para a normalização do texto.
+    - services.pipeline.chunking_service: para a divisão em sentenças e a remontagem.
+
+Configurações (settings.TRANSLATION_MEMORY):
+    - ENABLED (bool): Ativa a memória de tradução no pipeline.
+    - FUZZY_THRESHOLD (float): Similaridade mínima para contar uma correspondência aproximada
+      (e.g., 0.9). Padrão: 0, que desativa a busca aproximada e o índice LSH.
+    - FUZZY_MIN_CHARS (int): Tamanho mínimo da sentença para a busca aproximada.
+    - SHINGLE_SIZE (int): Tamanho dos shingles de caracteres.
+    - NUM_PERM (int): Número de funções de hash do MinHash.
+    - BANDS (int): Número de faixas do índice LSH (divisor de NUM_PERM).
+    - PACK_MAX_BYTES (int): Tamanho máximo de um grupo de sentenças em uma chamada.
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.pipeline.translation_memory_service import TranslationMemoryService
+    >>> memory = TranslationMemoryService()
+    >>> memory.translate("Primeira frase. Segunda frase.", 'en', 'pt')
+    ('First sentence. Second sentence.', 'pt')
+    >>> memory.translate("Primeira frase. Terceira frase.", 'en', 'pt')  # Apenas a segunda sentença é enviada
+    ('First sentence. Third sentence.', 'pt')
+"""
+
+import hashlib
+import random
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import F
+from django.utils import timezone
+
+from aws_translator_app.models import TranslationMemoryBand, TranslationMemoryEntry
+from aws_translator_app.services.api.aws_translate_service import MAX_TEXT_BYTES, AwsTranslateService
+from aws_translator_app.services.cache.translation_cache import TranslationCache
+from aws_translator_app.services.pipeline.chunking_service import TextChunk, TextChunker, split_sentences
+
+PACK_SEPARATOR = '\n'
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_NUMBER_RE = re.compile(r'\d+(?:[.,]\d+)*')
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _shingles(text: str, size: int) -> Set[str]:
+    text = ' '.join(text.casefold().split())
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _jaccard(first: Set[str], second: Set[str]) -> float:
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class MinHasher:
+    """
+    Calcula assinaturas MinHash de conjuntos de shingles e as chaves das faixas do índice LSH.
+
+    As permutações são derivadas de uma semente fixa, de modo que as chaves gravadas no banco
+    continuam válidas entre processos e reinícios (enquanto `NUM_PERM` e `BANDS` não mudarem).
+
+    Métodos:
+        signature(shingles: Set[str]) ⇾ List[int]:
+            Retorna a assinatura MinHash do conjunto.
+        band_keys(shingles: Set[str]) ⇾ List[str]:
+            Retorna as chaves das faixas LSH do conjunto.
+    """
+
+    def __init__(self, num_perm: int = 32, bands: int = 8, seed: int = 1):
+        """
+        Parâmetros:
+            num_perm (int): Número de funções de hash.
+            bands (int): Número de faixas (divisor de `num_perm`).
+            seed (int): Semente das permutações.
+        """
+        if num_perm % bands:
+            raise ValueError("O número de faixas (BANDS) deve dividir o número de permutações (NUM_PERM).")
+        rng = random.Random(seed)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+    def signature(self, shingles: Set[str]) -> List[int]:
+        hashes = [int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+                  for shingle in shingles]
+        return [min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in self.permutations]
+
+    def band_keys(self, shingles: Set[str]) -> List[str]:
+        signature = self.signature(shingles)
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(repr(rows).encode('ascii'), digest_size=12).hexdigest()
+            keys.append(f'{band}:{digest}')
+        return keys
+
+
+class TranslationMemoryService:
+    """
+    Tradução com reaproveitamento de sentenças já traduzidas.
+
+    Métodos:
+        translate(text: str, target_language_code: str, source_language_code: str) ⇾ Tuple[str, str]:
+            Traduz o texto, enviando à AWS apenas as sentenças que não estão na memória.
+    """
+
+    def __init__(self, aws_service: Optional[AwsTranslateService] = None):
+        """
+        Inicializa o serviço a partir de `settings.TRANSLATION_MEMORY`.
+
+        Parâmetros:
+            aws_service (AwsTranslateService, optional): Serviço de tradução a ser utilizado.
+        """
+        config = getattr(settings, 'TRANSLATION_MEMORY', {})
+        self.aws_service = aws_service or AwsTranslateService()
+        self.fuzzy_threshold = config.get('FUZZY_THRESHOLD', 0)
+        self.fuzzy_min_chars = config.get('FUZZY_MIN_CHARS', 40)
+        self.shingle_size = config.get('SHINGLE_SIZE', 5)
+        self.pack_max_bytes = min(config.get('PACK_MAX_BYTES', 9000), MAX_TEXT_BYTES)
+        self.min_hasher = MinHasher(config.get('NUM_PERM', 32), config.get('BANDS', 8))
+
+    def translate(
+            self,
+            text: str,
+            target_language_code: str,
+            source_language_code: str = 'auto'
+    ) -> Tuple[str, str]:
+        """
+        Traduz o texto reaproveitando as sentenças encontradas (exatamente) na memória de tradução.
+
+        Parâmetros:
+            text (str): O texto a ser traduzido.
+            target_language_code (str): Código do idioma de destino.
+            source_language_code (str): Código do idioma de origem (`'auto'` para detecção automática pela AWS).
+
+        Retorna:
+            Tuple[str, str]: O texto traduzido (com a estrutura de parágrafos do original) e o código
+            do idioma de origem predominante entre as sentenças.
+
+        Exceções:
+            - Exception: Se ocorrer um erro na tradução das sentenças novas.
+        """
+        segments = split_sentences(text)
+        if not segments:
+            return self.aws_service.translate_long_text(text, target_language_code, source_language_code)
+
+        pair = {'source_language_code': source_language_code, 'target_language_code': target_language_code}
+        hashes = [self._hash(segment.text) for segment in segments]
+        matches = self._exact_matches(pair, hashes)
+        exact_hits = len([digest for digest in hashes if digest in matches])
+        similar = self._fuzzy_matches(pair, segments, hashes, matches)
+        fuzzy_hits = len([digest for digest in hashes if digest in similar])
+
+        # Índice do segmento ⇾ (tradução, idioma detectado); grupos sem alinhamento por sentença
+        # ficam no primeiro segmento, com os demais marcados como vazios (None)
+        translations: Dict[int, Optional[Tuple[str, str]]] = {}
+        for index, digest in enumerate(hashes):
+            entry = matches.get(digest)
+            if entry is not None:
+                translations[index] = (entry.translated_text, entry.detected_language_code or source_language_code)
+
+        misses = [index for index in range(len(segments)) if index not in translations]
+        learned: Dict[str, Tuple[str, str, str]] = {}
+        translated_chars = 0
+        for group in self._plan(segments, misses):
+            translated_chars += sum(len(segments[index].text) for index in group)
+            translations.update(self._translate_group(
+                segments, group, target_language_code, source_language_code, hashes, learned
+            ))
+
+        self._remember(pair, learned)
+        reused = [entry.pk for entry in matches.values()]
+        if reused:
+            TranslationMemoryEntry.objects.filter(pk__in=reused).update(
+                hits=F('hits') + 1, last_used_at=timezone.now()
+            )
+
+        with _stats_lock:
+            _stats['segments'] += len(segments)
+            _stats['exact_hits'] += exact_hits
+            _stats['fuzzy_hits'] += fuzzy_hits
+            _stats['translated_segments'] += len(misses)
+            _stats['translated_chars'] += translated_chars
+            _stats['reused_chars'] += sum(len(segment.text) for segment in segments) - translated_chars
+
+        return self._stitch(segments, translations)
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(TranslationCache.normalize_text(text).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _exact_matches(pair: dict, hashes: List[str]) -> Dict[str, TranslationMemoryEntry]:
+        entries = TranslationMemoryEntry.objects.filter(**pair, source_hash__in=set(hashes))
+        return {entry.source_hash: entry for entry in entries}
+
+    def _fuzzy_matches(
+            self,
+            pair: dict,
+            segments: List[TextChunk],
+            hashes: List[str],
+            matches: Dict[str, TranslationMemoryEntry]
+    ) -> Dict[str, TranslationMemoryEntry]:
+        """
+        Procura correspondências aproximadas para as sentenças sem correspondência exata.
+
+        Retorna:
+            Dict[str, TranslationMemoryEntry]: A entrada mais parecida, pelo hash da sentença. Usada
+            apenas nas estatísticas: a sentença é traduzida de novo (veja a descrição do módulo).
+        """
+        similar = {}
+        if not self.fuzzy_threshold:
+            return similar
+        pending = {}
+        for segment, digest in zip(segments, hashes):
+            if digest not in matches and digest not in pending and len(segment.text) >= self.fuzzy_min_chars:
+                shingles = _shingles(segment.text, self.shingle_size)
+                pending[digest] = (segment.text, shingles, self.min_hasher.band_keys(shingles))
+        if not pending:
+            return similar
+
+        keys = {key for _, _, band_keys in pending.values() for key in band_keys}
+        candidates_by_key: Dict[str, List[TranslationMemoryEntry]] = {}
+        bands = TranslationMemoryBand.objects.filter(
+            key__in=keys,
+            entry__source_language_code=pair['source_language_code'],
+            entry__target_language_code=pair['target_language_code']
+        ).select_related('entry')
+        for band in bands:
+            candidates_by_key.setdefault(band.key, []).append(band.entry)
+
+        for digest, (text, shingles, band_keys) in pending.items():
+            numbers = _NUMBER_RE.findall(text)
+            best, best_similarity = None, self.fuzzy_threshold
+            for key in band_keys:
+                for entry in candidates_by_key.get(key, ()):
+                    if _NUMBER_RE.findall(entry.source_text) != numbers:
+                        continue
+                    similarity = _jaccard(shingles, _shingles(entry.source_text, self.shingle_size))
+                    if similarity >= best_similarity:
+                        best, best_similarity = entry, similarity
+            if best is not None:
+                similar[digest] = best
+        return similar
+
+    def _plan(self, segments: List[TextChunk], misses: List[int]) -> List[List[int]]:
+        """
+        Agrupa as sentenças sem correspondência: sentenças consecutivas no texto formam um grupo,
+        até `PACK_MAX_BYTES`; sentenças com quebras de linha ou maiores que o limite ficam sozinhas.
+        """
+        groups, current, current_bytes = [], [], 0
+        for index in misses:
+            text = segments[index].text
+            size = len(text.encode('utf-8')) + len(PACK_SEPARATOR)
+            packable = PACK_SEPARATOR not in text and size <= self.pack_max_bytes
+            if current and (not packable or index != current[-1] + 1 or current_bytes + size > self.pack_max_bytes):
+                groups.append(current)
+                current, current_bytes = [], 0
+            if not packable:
+                groups.append([index])
+                continue
+            current.append(index)
+            current_bytes += size
+        if current:
+            groups.append(current)
+        return groups
+
+    def _translate_group(
+            self,
+            segments: List[TextChunk],
+            group: List[int],
+            target_language_code: str,
+            source_language_code: str,
+            hashes: List[str],
+            learned: Dict[str, Tuple[str, str, str]]
+    ) -> Dict[int, Optional[Tuple[str, str]]]:
+        """
+        Traduz um grupo de sentenças consecutivas com uma chamada ao AWS Translate, uma sentença
+        por linha. As traduções alinhadas são acrescentadas a `learned` (pelo hash da sentença).
+        """
+        texts = [segments[index].text for index in group]
+        if len(group) > 1:
+            translated, detected = self.aws_service.translate_text(
+                PACK_SEPARATOR.join(texts), target_language_code, source_language_code
+            )
+            lines = translated.split(PACK_SEPARATOR)
+            if len(lines) != len(group):
+                # Sem alinhamento por sentença: o grupo é traduzido como um trecho corrido
+                run = TextChunker.join(texts, [segments[index] for index in group[:-1]] + [
+                    segments[group[-1]]._replace(separator='')
+                ])
+                result = self.aws_service.translate_long_text(run, target_language_code, source_language_code)
+                return {group[0]: result, **{index: None for index in group[1:]}}
+        else:
+            translated, detected = self.aws_service.translate_long_text(
+                texts[0], target_language_code, source_language_code
+            )
+            lines = [translated]
+
+        results = {}
+        for index, text, line in zip(group, texts, lines):
+            results[index] = (line.strip(), detected)
+            learned[hashes[index]] = (text, line.strip(), detected)
+        return results
+
+    def _remember(self, pair: dict, learned: Dict[str, Tuple[str, str, str]]) -> None:
+        """
+        Grava as sentenças traduzidas e, com a busca aproximada ativa, as faixas do MinHash das que
+        podem ser buscadas por aproximação.
+        """
+        if not learned:
+            return
+        entries = [
+            TranslationMemoryEntry(
+                **pair, source_hash=digest, source_text=text, translated_text=translated,
+                detected_language_code=detected
+            )
+            for digest, (text, translated, detected) in learned.items()
+        ]
+        # Outra requisição pode ter gravado a mesma sentença: as duplicatas são ignoradas
+        TranslationMemoryEntry.objects.bulk_create(entries, ignore_conflicts=True)
+        if not self.fuzzy_threshold:
+            return
+        saved = set(TranslationMemoryEntry.objects.filter(
+            pk__in=[entry.pk for entry in entries]
+        ).values_list('pk', flat=True))
+        bands = [
+            TranslationMemoryBand(entry=entry, key=key)
+            for entry in entries
+            if entry.pk in saved and len(entry.source_text) >= self.fuzzy_min_chars
+            for key in self.min_hasher.band_keys(_shingles(entry.source_text, self.shingle_size))
+        ]
+        try:
+            TranslationMemoryBand.objects.bulk_create(bands)
+        except IntegrityError:
+            # A entrada foi removida entre as duas gravações; o índice aproximado é opcional
+            pass
+
+    @staticmethod
+    def _stitch(segments: List[TextChunk], translations: Dict[int, Optional[Tuple[str, str]]]) -> Tuple[str, str]:
+        parts = []
+        for index, segment in enumerate(segments):
+            translation = translations[index]
+            if translation is None:
+                # Parte de um grupo traduzido como trecho corrido (no primeiro segmento do grupo)
+                continue
+            # O separador é o do último segmento coberto pela tradução
+            last = index
+            while last + 1 < len(segments) and translations[last + 1] is None:
+                last += 1
+            parts.append(translation[0].strip() + segments[last].separator)
+        sources = Counter(translation[1] for translation in translations.values() if translation is not None)
+        return ''.join(parts), sources.most_common(1)[0][0]
+
+
+def get_translation_memory_stats() -> dict:
+    """
+    Retorna os contadores da memória de tradução acumulados no processo: sentenças consultadas,
+    correspondências exatas (reaproveitadas) e aproximadas (traduzidas de novo), sentenças e
+    caracteres enviados à AWS e caracteres reaproveitados.
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    segments = stats.get('segments', 0)
+    hits = stats.get('exact_hits', 0)
+    return {
+        'enabled': getattr(settings, 'TRANSLATION_MEMORY', {}).get('ENABLED', True),
+        'segments': segments,
+        'exact_hits': stats.get('exact_hits', 0),
+        'fuzzy_hits': stats.get('fuzzy_hits', 0),
+        'translated_segments': stats.get('translated_segments', 0),
+        'translated_chars': stats.get('translated_chars', 0),
+        'reused_chars': stats.get('reused_chars', 0),
+        'hit_rate': hits / segments if segments else 0.0,
+    }
@@ -0,0 +1,764 @@
+# aws_translator_app/services/pipeline/translation_pipeline.py
+
+"""
+Translation Pipeline Module
+===========================
+
+Este módulo orquestra o pipeline completo do endpoint `/translate/`:
+
+1. Divisão do texto original em blocos (parágrafos/sentenças) dentro de um orçamento de bytes/tokens.
+2. Simplificação (OpenAI) e tradução (AWS Translate) de cada bloco, em paralelo e com
+   paralelismo limitado.
+3. Remontagem dos blocos simplificados e traduzidos na ordem original.
+4. Cálculo das métricas de legibilidade do texto original e do texto simplificado.
+5. Cálculo do BLEU Score por back-translation, conforme o modo de avaliação (veja `QualityScoringService`).
+
+O metodo `arun` executa o mesmo pipeline de forma assíncrona (para views ASGI), rodando em
+paralelo as etapas independentes: a legibilidade do texto original junto com a simplificação,
+e a legibilidade do texto simplificado junto com a tradução.
+
+O metodo `stream` executa o pipeline como uma sequência de eventos (para o endpoint
+`/translate/stream/`, via Server-Sent Events): o texto simplificado é entregue à medida que a
+OpenAI o gera, e cada parágrafo ou grupo de sentenças concluído é traduzido imediatamente, sem
+esperar o fim da simplificação. As métricas e o BLEU Score são os últimos eventos.
+
+O idioma é detectado uma única vez por texto pelo `LanguageDetectionService` (amostra do início,
+memorizada) e informado tanto às métricas de legibilidade quanto ao AWS Translate, como idioma de
+origem explícito, em vez de `'auto'`. Como o prompt da simplificação não fixa o idioma da resposta,
+a origem da tradução é detectada no texto simplificado, que é o texto efetivamente traduzido.
+
+Com a memória de tradução ativa (`TranslationMemoryService`), cada bloco é traduzido sentença a
+sentença: as sentenças já traduzidas em requisições anteriores são reaproveitadas, e apenas as
+novas ou alteradas são enviadas ao AWS Translate.
+
+Se a especialidade tiver um glossário no idioma do texto (`GlossaryService`), os termos do glossário
+são substituídos por marcadores antes da simplificação e restaurados depois: como o trecho original
+no texto simplificado e como a tradução do glossário no texto traduzido.
+
+Textos curtos resultam em um único bloco e, portanto, no mesmo número de chamadas de antes.
+Textos longos (por exemplo, um PDF de 50 páginas importado via `DocumentService.import_document`)
+são processados em uma única requisição, com os tempos de cada bloco no resultado.
+
+Classes:
+    TranslationPipeline: Executa o pipeline de simplificação, tradução e métricas.
+
+Dependências:
+    - concurrent.futures: para processar os blocos em paralelo.
+    - asyncio: para a versão assíncrona do pipeline.
+    - services.pipeline.chunking_service: para dividir e remontar o texto.
+    - services.pipeline.translation_memory_service: para reaproveitar sentenças já traduzidas.
+    - services.api / services.language: serviços utilizados em cada etapa.
+    - instrumentation: para o tempo de cada etapa (`translator_stage_seconds`).
+
+Exemplo de Uso:
+    >>> from aws_translator_app.services.pipeline.translation_pipeline import TranslationPipeline
+    >>> pipeline = TranslationPipeline()
+    >>> result = pipeline.run(
+    ...     text=texto_longo, target_language='en', speciality='Direito', style='Formal',
+    ...     summarize=False, model='gpt-4o-mini', complexity_level='Básico'
+    ... )
+    >>> result['chunks'][0]
+    {'index': 0, 'bytes': 5980, 'simplify_seconds': 3.2, 'translate_seconds': 0.4, ...}
+"""
+
+import asyncio
+import re
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+
+from aws_translator_app.instrumentation import stage_timer
+from aws_translator_app.services.api.aws_translate_service import AwsTranslateService
+from aws_translator_app.services.api.openai_service import OpenAIService
+from aws_translator_app.services.api.token_budget import merge_usage
+from aws_translator_app.services.language.bleu_score_service import BleuScoreService
+from aws_translator_app.services.language.glossary_service import PLACEHOLDER_OPEN, GlossaryService, ProtectedText
+from aws_translator_app.services.language.language_detection_service import (
+    LanguageDetectionService,
+    get_language_detection_service
+)
+from aws_translator_app.services.language.quality_scoring_service import QualityScoringService
+from aws_translator_app.services.language.readability_service import ReadabilityService
+from aws_translator_app.services.pipeline.chunking_service import TextChunk, TextChunker
+from aws_translator_app.services.pipeline.translation_memory_service import TranslationMemoryService
+
+# Fronteiras em que o texto simplificado em streaming pode ser enviado para tradução
+_PARAGRAPH_BOUNDARY_RE = re.compile(r'\n\s*\n')
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?…;:])\s+')
+
+
+class TranslationPipeline:
+    """
+    Pipeline de simplificação, tradução e avaliação de textos.
+
+    Métodos:
+        run(...) ⇾ dict:
+            Executa o pipeline completo e retorna o texto traduzido, as métricas e os tempos por bloco.
+        run_multi(...) ⇾ dict:
+            Executa o pipeline para vários idiomas de destino, simplificando e avaliando o texto uma única vez.
+        arun(...) ⇾ dict:
+            Versão assíncrona de `run`, com as etapas independentes executadas em paralelo.
+        stream(...) ⇾ Iterator[Tuple[str, dict]]:
+            Executa o pipeline entregando os resultados parciais como eventos.
+    """
+
+    def __init__(
+            self,
+            aws_service: Optional[AwsTranslateService] = None,
+            openai_service: Optional[OpenAIService] = None,
+            readability_service: Optional[ReadabilityService] = None,
+            bleu_service: Optional[BleuScoreService] = None,
+            chunker: Optional[TextChunker] = None,
+            max_workers: Optional[int] = None,
+            quality_service: Optional[QualityScoringService] = None,
+            language_detector: Optional[LanguageDetectionService] = None,
+            translation_memory: Optional[TranslationMemoryService] = None,
+            glossary_service: Optional[GlossaryService] = None
+    ):
+        """
+        Inicializa o pipeline.
+
+        Parâmetros:
+            aws_service (AwsTranslateService, optional): Serviço de tradução.
+            openai_service (OpenAIService, optional): Serviço de simplificação.
+            readability_service (ReadabilityService, optional): Serviço de métricas de legibilidade.
+            bleu_service (BleuScoreService, optional): Serviço de BLEU Score.
+            chunker (TextChunker, optional): Divisor de textos.
+            max_workers (int, optional): Número máximo de blocos processados simultaneamente.
+                Padrão: `TRANSLATION_CHUNKING['MAX_WORKERS']`.
+            quality_service (QualityScoringService, optional): Serviço que aplica o modo de avaliação do BLEU Score.
+            language_detector (LanguageDetectionService, optional): Detector de idioma. Padrão: o do processo.
+            translation_memory (TranslationMemoryService, optional): Memória de tradução. Padrão: uma nova,
+                se `TRANSLATION_MEMORY['ENABLED']`; sem ela, os textos são traduzidos inteiros.
+            glossary_service (GlossaryService, optional): Serviço que aplica os glossários das especialidades.
+        """
+        config = getattr(settings, 'TRANSLATION_CHUNKING', {})
+        self.aws_service = aws_service or AwsTranslateService()
+        self.openai_service = openai_service or OpenAIService()
+        self.readability_service = readability_service or ReadabilityService()
+        self.bleu_service = bleu_service or BleuScoreService(self.aws_service)
+        self.chunker = chunker or TextChunker()
+        self.max_workers = max_workers or config.get('MAX_WORKERS', 4)
+        self.quality_service = quality_service or QualityScoringService(self.bleu_service)
+        self.language_detector = language_detector or get_language_detection_service()
+        streaming = getattr(settings, 'STREAMING_TRANSLATION', {})
+        self.min_segment_chars = streaming.get('MIN_SEGMENT_CHARS', 200)
+        if translation_memory is None and getattr(settings, 'TRANSLATION_MEMORY', {}).get('ENABLED', True):
+            translation_memory = TranslationMemoryService(self.aws_service)
+        self.translation_memory = translation_memory
+        self.glossary_service = glossary_service or GlossaryService()
+        # A memória de tradução e os glossários consultam o banco; as conexões abertas por outras
+        # threads (blocos em paralelo, `asyncio.to_thread`) são fechadas ao final de cada consulta
+        self._owner_thread = threading.current_thread()
+
+    def run(
+            self,
+            text: str,
+            target_language: str,
+            speciality: str,
+            style: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: Optional[int] = None,
+            cache_mode: str = 'bypass',
+            bleu_mode: Optional[str] = None,
+            progress_callback: Optional[Callable[[str, int, int], None]] = None
+    ) -> dict:
+        """
+        Executa o pipeline completo para o texto fornecido.
+
+        Parâmetros:
+            text (str): O texto original.
+            target_language (str): Código do idioma de destino.
+            speciality (str): Área técnica do texto.
+            style (str): Estilo de escrita desejado.
+            summarize (bool): Indica se o texto deve ser resumido.
+            model (str): Modelo da OpenAI.
+            complexity_level (str): Nível de complexidade da simplificação.
+            focus_aspects (List[str], optional): Aspectos a serem priorizados na simplificação.
+            temperature (float): Temperatura de amostragem.
+            max_tokens (int, optional): Tamanho máximo da resposta da OpenAI para cada bloco. Se omitido,
+                é derivado do tamanho de cada bloco (veja `TokenBudgeter`).
+            cache_mode (str): Uso do cache de respostas da OpenAI (`bypass`, `prefer` ou `only`).
+            bleu_mode (str, optional): Modo de avaliação do BLEU Score (`always`, `sampled`, `async`, `local` ou `off`).
+                Padrão: `QUALITY_SCORING['MODE']`.
+            progress_callback (Callable, optional): Função chamada como `progress_callback(etapa, concluídos, total)`
+                ao longo das etapas `'chunks'`, `'readability'` e `'bleu'`.
+
+        Retorna:
+            dict: Dicionário com `translated_text`, `metrics_original`, `metrics_simplified`,
+            `bleu_score`, `bleu_mode`, `source_language_code`, `chunks` (tempos e tokens de cada bloco)
+            e `token_usage` (tokens previstos e consumidos na simplificação, somados); no modo
+            `async`, também `quality_score_id`.
+
+        Exceções:
+            - Exception: Se ocorrer um erro em qualquer etapa do pipeline.
+        """
+        result = self.run_multi(
+            text=text,
+            target_languages=[target_language],
+            speciality=speciality,
+            style=style,
+            summarize=summarize,
+            model=model,
+            complexity_level=complexity_level,
+            focus_aspects=focus_aspects,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            cache_mode=cache_mode,
+            bleu_mode=bleu_mode,
+            bleu_targets='all',
+            progress_callback=progress_callback
+        )
+        translation = result.pop('translations')[target_language]
+        return {
+            'translated_text': translation.pop('translated_text'),
+            'metrics_original': result['metrics_original'],
+            'metrics_simplified': result['metrics_simplified'],
+            **translation,
+            'chunks': result['chunks'],
+            'token_usage': result['token_usage'],
+        }
+
+    def run_multi(
+            self,
+            text: str,
+            target_languages: List[str],
+            speciality: str,
+            style: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: Optional[int] = None,
+            cache_mode: str = 'bypass',
+            bleu_mode: Optional[str] = None,
+            bleu_targets: Optional[str] = None,
+            progress_callback: Optional[Callable[[str, int, int], None]] = None
+    ) -> dict:
+        """
+        Executa o pipeline para vários idiomas de destino: o texto é simplificado e avaliado uma
+        única vez, e cada bloco simplificado é traduzido para todos os idiomas em paralelo.
+
+        As traduções usam o cliente AWS compartilhado pelo processo, com no máximo
+        `MULTI_TARGET_TRANSLATION['MAX_WORKERS']` chamadas simultâneas. O BLEU Score de cada
+        idioma segue a política `bleu_targets`:
+
+            - `all`: todos os idiomas são avaliados no modo `bleu_mode`.
+            - `first`: apenas o primeiro idioma é avaliado no modo `bleu_mode`; os demais, no modo
+              `local` (apenas se a back-translation já estiver no cache, sem chamadas à AWS).
+            - `none`: nenhum idioma é avaliado.
+
+        Parâmetros:
+            target_languages (List[str]): Códigos dos idiomas de destino (repetições são ignoradas).
+            bleu_targets (str, optional): Política do BLEU Score por idioma. Padrão:
+                `MULTI_TARGET_TRANSLATION['BLEU_TARGETS']`.
+            Os demais, os mesmos de `run`.
+
+        Retorna:
+            dict: Dicionário com `translations` (por código de idioma: `translated_text`,
+            `source_language_code`, `bleu_score`, `bleu_mode` e, no modo `async`,
+            `quality_score_id`), `metrics_original`, `metrics_simplified`, `chunks` e `token_usage`.
+
+        Exceções:
+            - Exception: Se ocorrer um erro em qualquer etapa do pipeline.
+        """
+        targets = list(dict.fromkeys(target_languages))
+        if not targets:
+            raise ValueError("Informe ao menos um idioma de destino.")
+        protected = self._protect(text, speciality)
+        chunks = self.chunker.split(protected.text)
+        if not chunks:
+            raise ValueError("O texto a ser traduzido está vazio.")
+
+        config = getattr(settings, 'MULTI_TARGET_TRANSLATION', {})
+        bleu_targets = bleu_targets or config.get('BLEU_TARGETS', 'first')
+
+        def report(stage: str, completed: int, total: int) -> None:
+            if progress_callback is not None:
+                progress_callback(stage, completed, total)
+
+        completed_chunks = [0]
+        progress_lock = threading.Lock()
+        report('chunks', 0, len(chunks))
+
+        # Com um único idioma, as traduções rodam na própria thread do bloco
+        translate_executor = None
+        if len(targets) > 1:
+            translate_executor = ThreadPoolExecutor(
+                max_workers=min(config.get('MAX_WORKERS', 8), len(targets) * len(chunks)),
+                thread_name_prefix='translate-target'
+            )
+
+        def translate_all(simplified: str) -> dict:
+            if translate_executor is None:
+                return {target: self._translate(simplified, target) for target in targets}
+            futures = {target: translate_executor.submit(self._translate, simplified, target) for target in targets}
+            return {target: future.result() for target, future in futures.items()}
+
+        def process_chunk(chunk: TextChunk) -> dict:
+            started = time.perf_counter()
+            with stage_timer('simplify', model=model):
+                simplification = self.openai_service.simplify(
+                    text=chunk.text,
+                    area_tecnica=speciality,
+                    estilo=style,
+                    summarize=summarize,
+                    model=model,
+                    complexity_level=complexity_level,
+                    focus_aspects=focus_aspects,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    cache_mode=cache_mode
+                )
+            simplified = simplification.text
+            simplified_at = time.perf_counter()
+            translations = translate_all(simplified)
+            finished = time.perf_counter()
+            with progress_lock:
+                completed_chunks[0] += 1
+                report('chunks', completed_chunks[0], len(chunks))
+            return {
+                'simplified_text': simplified,
+                'translations': translations,
+                'usage': simplification.usage,
+                'timing': {
+                    'index': chunk.index,
+                    'bytes': len(chunk.text.encode('utf-8')),
+                    'predicted_prompt_tokens': simplification.usage.get('predicted_prompt_tokens'),
+                    'prompt_tokens': simplification.usage.get('prompt_tokens'),
+                    'completion_tokens': simplification.usage.get('completion_tokens'),
+                    'simplify_seconds': round(simplified_at - started, 4),
+                    'translate_seconds': round(finished - simplified_at, 4),
+                    'total_seconds': round(finished - started, 4),
+                },
+            }
+
+        try:
+            if len(chunks) == 1:
+                results = [process_chunk(chunks[0])]
+            else:
+                workers = min(self.max_workers, len(chunks))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='translate-chunk') as executor:
+                    # `map` preserva a ordem de entrada, independentemente da ordem de conclusão.
+                    results = list(executor.map(process_chunk, chunks))
+
+            simplified_text, _ = self.glossary_service.restore(
+                TextChunker.join((result['simplified_text'] for result in results), chunks), protected
+            )
+            translations = {}
+            for target in targets:
+                translated_text, restored = self.glossary_service.restore(
+                    TextChunker.join((result['translations'][target][0] for result in results), chunks),
+                    protected, target
+                )
+                translations[target] = {
+                    'translated_text': translated_text,
+                    'source_language_code': Counter(
+                        result['translations'][target][1] for result in results
+                    ).most_common(1)[0][0],
+                }
+                if protected.glossary is not None:
+                    translations[target]['glossary'] = self._glossary_report(protected, restored)
+
+            report('readability', 0, 2)
+            metrics_original = self._readability(text)
+            report('readability', 1, 2)
+            metrics_simplified = self._readability(simplified_text)
+            report('readability', 2, 2)
+
+            report('bleu', 0, len(targets))
+
+            def score(index: int, target: str) -> dict:
+                if bleu_targets == 'none':
+                    mode = 'off'
+                elif bleu_targets == 'first' and index > 0:
+                    mode = 'local'
+                else:
+                    mode = bleu_mode
+                translation = translations[target]
+                # Com vários idiomas, roda nas threads do executor (veja `_score`)
+                return self._score(
+                    simplified_text, translation['translated_text'], translation['source_language_code'],
+                    target, mode
+                )
+
+            if translate_executor is None:
+                qualities = [score(index, target) for index, target in enumerate(targets)]
+            else:
+                qualities = list(translate_executor.map(score, range(len(targets)), targets))
+            for target, quality in zip(targets, qualities):
+                translations[target].update(quality)
+            report('bleu', len(targets), len(targets))
+        finally:
+            if translate_executor is not None:
+                translate_executor.shutdown(wait=False, cancel_futures=True)
+
+        return {
+            'translations': translations,
+            'metrics_original': metrics_original,
+            'metrics_simplified': metrics_simplified,
+            'chunks': [result['timing'] for result in results],
+            'token_usage': merge_usage(result['usage'] for result in results),
+        }
+
+    async def arun(
+            self,
+            text: str,
+            target_language: str,
+            speciality: str,
+            style: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: Optional[int] = None,
+            cache_mode: str = 'bypass',
+            bleu_mode: Optional[str] = None
+    ) -> dict:
+        """
+        Executa o pipeline completo de forma assíncrona.
+
+        Este metodo realiza os seguintes passos:
+            1. Simplifica os blocos (OpenAI assíncrona) enquanto calcula a legibilidade do texto original.
+            2. Traduz os blocos simplificados enquanto calcula a legibilidade do texto simplificado.
+            3. Calcula o BLEU Score, conforme o modo de avaliação.
+
+        As chamadas ao AWS Translate (boto3 é síncrono) e o cálculo das métricas (CPU) são executados
+        em threads com `asyncio.to_thread`, sem bloquear o event loop. O número de blocos processados
+        simultaneamente é limitado por `max_workers`.
+
+        Os parâmetros, o retorno e as exceções são os mesmos de `run`.
+        """
+        protected = await asyncio.to_thread(self._protect, text, speciality)
+        chunks = self.chunker.split(protected.text)
+        if not chunks:
+            raise ValueError("O texto a ser traduzido está vazio.")
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+        timings = [{'index': chunk.index, 'bytes': len(chunk.text.encode('utf-8'))} for chunk in chunks]
+        usages = [None] * len(chunks)
+
+        async def simplify_chunk(chunk: TextChunk) -> str:
+            async with semaphore:
+                started = time.perf_counter()
+                with stage_timer('simplify', model=model):
+                    simplification = await self.openai_service.asimplify(
+                        text=chunk.text,
+                        area_tecnica=speciality,
+                        estilo=style,
+                        summarize=summarize,
+                        model=model,
+                        complexity_level=complexity_level,
+                        focus_aspects=focus_aspects,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        cache_mode=cache_mode
+                    )
+                timings[chunk.index]['simplify_seconds'] = round(time.perf_counter() - started, 4)
+                for key in ('predicted_prompt_tokens', 'prompt_tokens', 'completion_tokens'):
+                    timings[chunk.index][key] = simplification.usage.get(key)
+                usages[chunk.index] = simplification.usage
+                return simplification.text
+
+        async def translate_chunk(chunk: TextChunk, simplified: str):
+            async with semaphore:
+                started = time.perf_counter()
+                result = await asyncio.to_thread(self._translate, simplified, target_language)
+                timings[chunk.index]['translate_seconds'] = round(time.perf_counter() - started, 4)
+                return result
+
+        # Etapa 1: legibilidade do original em paralelo com a simplificação
+        metrics_original, simplified_chunks = await asyncio.gather(
+            asyncio.to_thread(self._readability, text),
+            asyncio.gather(*(simplify_chunk(chunk) for chunk in chunks))
+        )
+        simplified_text, _ = self.glossary_service.restore(TextChunker.join(simplified_chunks, chunks), protected)
+
+        # Etapa 2: legibilidade do texto simplificado em paralelo com a tradução
+        metrics_simplified, translations = await asyncio.gather(
+            asyncio.to_thread(self._readability, simplified_text),
+            asyncio.gather(*(
+                translate_chunk(chunk, simplified) for chunk, simplified in zip(chunks, simplified_chunks)
+            ))
+        )
+        translated_text, restored = self.glossary_service.restore(
+            TextChunker.join((translated for translated, _ in translations), chunks), protected, target_language
+        )
+        source_language_code = Counter(source for _, source in translations).most_common(1)[0][0]
+
+        # Etapa 3: BLEU Score (back-translation), conforme o modo de avaliação
+        quality = await asyncio.to_thread(
+            self._score, simplified_text, translated_text, source_language_code, target_language, bleu_mode
+        )
+
+        for timing in timings:
+            timing['total_seconds'] = round(timing['simplify_seconds'] + timing['translate_seconds'], 4)
+
+        result = {
+            'translated_text': translated_text,
+            'metrics_original': metrics_original,
+            'metrics_simplified': metrics_simplified,
+            **quality,
+            'source_language_code': source_language_code,
+            'chunks': timings,
+            'token_usage': merge_usage(usages),
+        }
+        if protected.glossary is not None:
+            result['glossary'] = self._glossary_report(protected, restored)
+        return result
+
+    def _translate(self, text: str, target_language: str, source_language: Optional[str] = None):
+        """
+        Traduz o texto informando ao AWS Translate o idioma de origem detectado (ou `'auto'`, se
+        a detecção não for confiável; veja `LanguageDetectionService.aws_source_language`), pela
+        memória de tradução, se ativa.
+        """
+        if source_language is None:
+            source_language = self.language_detector.aws_source_language(text, target_language)
+        with stage_timer('translate', target_language=target_language):
+            if self.translation_memory is None:
+                return self.aws_service.translate_long_text(text, target_language, source_language)
+            try:
+                return self.translation_memory.translate(text, target_language, source_language)
+            finally:
+                if threading.current_thread() is not self._owner_thread:
+                    connection.close()
+
+    def _protect(self, text: str, speciality: str) -> ProtectedText:
+        """
+        Protege os termos do glossário da especialidade no idioma do texto (veja `GlossaryService.protect`).
+        """
+        try:
+            with stage_timer('glossary'):
+                return self.glossary_service.protect(text, speciality, self.language_detector.detect(text))
+        finally:
+            if threading.current_thread() is not self._owner_thread:
+                connection.close()
+
+    def _score(self, original: str, translated: str, source_language: str, target_language: str,
+               mode: Optional[str]) -> dict:
+        """
+        Avalia a tradução (veja `QualityScoringService.score`); a avaliação pode gravar um `QualityScore`.
+        """
+        try:
+            return self.quality_service.score(original, translated, source_language, target_language, mode=mode)
+        finally:
+            if threading.current_thread() is not self._owner_thread:
+                connection.close()
+
+    @staticmethod
+    def _glossary_report(protected: ProtectedText, restored: int) -> dict:
+        # Marcadores perdidos na simplificação (e.g., em um resumo) não aparecem em `restored`
+        return {
+            'id': protected.glossary.id,
+            'terms': len(set(protected.terms)),
+            'occurrences': protected.text.count(PLACEHOLDER_OPEN),
+            'restored': restored,
+        }
+
+    def _readability(self, text: str) -> dict:
+        # O idioma vem do detector compartilhado (memorizado), e não de uma nova análise do texto inteiro
+        with stage_timer('readability'):
+            return self.readability_service.calculate_readability(text, self.language_detector.detect(text))
+
+    @staticmethod
+    def _cut_segment(buffer: str, min_chars: int) -> Optional[Tuple[str, str, str]]:
+        """
+        Separa do início do buffer o maior trecho concluído: até a última quebra de parágrafo ou,
+        a partir de `min_chars` caracteres, até a última fronteira de sentença.
+
+        Retorna:
+            Optional[Tuple[str, str, str]]: O trecho, o separador (espaço ou quebra original) e o
+            restante do buffer, ou `None` se ainda não houver um trecho concluído.
+        """
+        # Uma fronteira no fim do buffer ainda pode crescer (um espaço pode ser o início de uma
+        # quebra de parágrafo); só é usada quando o texto seguinte começa a chegar
+        boundary = None
+        for match in _PARAGRAPH_BOUNDARY_RE.finditer(buffer):
+            if match.end() < len(buffer):
+                boundary = match
+        if boundary is None and len(buffer) >= min_chars:
+            for match in _SENTENCE_BOUNDARY_RE.finditer(buffer):
+                if match.end() < len(buffer):
+                    boundary = match
+        if boundary is None or not buffer[:boundary.start()].strip():
+            return None
+        return buffer[:boundary.start()], boundary.group(), buffer[boundary.end():]
+
+    def stream(
+            self,
+            text: str,
+            target_language: str,
+            speciality: str,
+            style: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: Optional[int] = None,
+            cache_mode: str = 'bypass',
+            bleu_mode: Optional[str] = None
+    ) -> Iterator[Tuple[str, dict]]:
+        """
+        Executa o pipeline entregando os resultados parciais como eventos `(nome, dados)`.
+
+        Os blocos são simplificados em sequência, no modo de streaming da OpenAI. O texto gerado
+        é acumulado e, a cada parágrafo concluído (ou grupo de sentenças com pelo menos
+        `STREAMING_TRANSLATION['MIN_SEGMENT_CHARS']` caracteres), o trecho é traduzido em uma
+        thread enquanto a geração continua. As traduções são entregues na ordem do texto.
+
+        Eventos, na ordem:
+            - `start`: `{'chunks': total de blocos}`.
+            - `simplified`: `{'chunk': índice do bloco, 'text': trecho gerado}` (vários).
+            - `translated`: `{'index': índice do trecho, 'text': tradução, 'separator': separador
+              que o segue, 'source_language_code': idioma detectado}` (vários, intercalados com
+              `simplified`).
+            - `metrics`: `{'metrics_original': ..., 'metrics_simplified': ...}`.
+            - `quality`: o resultado de `QualityScoringService.score` (`bleu_score`, `bleu_mode`, ...).
+            - `done`: `{'translated_text', 'source_language_code', 'token_usage'}`.
+
+        Os parâmetros e as exceções são os mesmos de `run`; as exceções interrompem a sequência
+        de eventos.
+        """
+        protected = self._protect(text, speciality)
+        chunks = self.chunker.split(protected.text)
+        if not chunks:
+            raise ValueError("O texto a ser traduzido está vazio.")
+
+        yield 'start', {'chunks': len(chunks)}
+
+        usages = []
+        simplified_chunks = []
+        segments = deque()  # (future da tradução, separador), na ordem do texto
+        translated_parts = []
+        source_languages = Counter()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='translate-segment')
+
+        # Trechos curtos nem sempre permitem uma detecção confiável; o primeiro idioma detectado
+        # com confiança vale para os trechos seguintes
+        stream_source = ['auto']
+        restored_terms = [0]
+        # Um marcador do glossário pode chegar dividido entre dois deltas; o trecho a partir de um
+        # marcador incompleto é retido até o delta seguinte
+        held = ['']
+
+        def release(delta: str, final: bool = False) -> str:
+            if not protected.surfaces:
+                return delta
+            pending = held[0] + delta
+            cut = pending.rfind(PLACEHOLDER_OPEN)
+            if not final and cut >= 0 and '⟧' not in pending[cut:]:
+                held[0], pending = pending[cut:], pending[:cut]
+            else:
+                held[0] = ''
+            return self.glossary_service.restore(pending, protected)[0]
+
+        def submit(segment: str, separator: str) -> None:
+            segment = segment.strip()
+            if stream_source[0] == 'auto':
+                stream_source[0] = self.language_detector.aws_source_language(segment, target_language)
+            segments.append((
+                executor.submit(self._translate, segment, target_language, stream_source[0]),
+                separator
+            ))
+
+        def drain(wait: bool) -> Iterator[Tuple[str, dict]]:
+            # Entrega as traduções concluídas no início da fila (todas, se `wait`)
+            while segments and (wait or segments[0][0].done()):
+                future, separator = segments.popleft()
+                translated, source_language_code = future.result()
+                translated, restored = self.glossary_service.restore(translated, protected, target_language)
+                restored_terms[0] += restored
+                source_languages[source_language_code] += 1
+                translated_parts.append(translated + separator)
+                yield 'translated', {
+                    'index': len(translated_parts) - 1,
+                    'text': translated,
+                    'separator': separator,
+                    'source_language_code': source_language_code,
+                }
+
+        try:
+            for chunk in chunks:
+                parts = []
+                buffer = ''
+                # `closing`: se o cliente desconectar, o stream da OpenAI é fechado imediatamente
+                with closing(self.openai_service.stream_simplify(
+                        text=chunk.text,
+                        area_tecnica=speciality,
+                        estilo=style,
+                        summarize=summarize,
+                        model=model,
+                        complexity_level=complexity_level,
+                        focus_aspects=focus_aspects,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        cache_mode=cache_mode,
+                        usage_callback=usages.append
+                )) as deltas:
+                    for delta in deltas:
+                        parts.append(delta)
+                        released = release(delta)
+                        if released:
+                            yield 'simplified', {'chunk': chunk.index, 'text': released}
+                        buffer += delta
+                        cut = self._cut_segment(buffer, self.min_segment_chars)
+                        if cut is not None:
+                            segment, separator, buffer = cut
+                            submit(segment, separator)
+                        yield from drain(wait=False)
+
+                simplified_chunks.append(''.join(parts).strip())
+                released = release('', final=True)
+                if released:
+                    yield 'simplified', {'chunk': chunk.index, 'text': released}
+                if buffer.strip():
+                    submit(buffer, chunk.separator)
+                elif segments:
+                    # O separador do bloco substitui o do último trecho
+                    segments[-1] = (segments[-1][0], chunk.separator)
+                elif translated_parts:
+                    translated_parts[-1] = translated_parts[-1].rstrip() + chunk.separator
+                if chunk.separator:
+                    yield 'simplified', {'chunk': chunk.index, 'text': chunk.separator}
+
+            yield from drain(wait=True)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        simplified_text, _ = self.glossary_service.restore(TextChunker.join(simplified_chunks, chunks), protected)
+        translated_text = ''.join(translated_parts).strip()
+        source_language_code = source_languages.most_common(1)[0][0] if source_languages else None
+
+        yield 'metrics', {
+            'metrics_original': self._readability(text),
+            'metrics_simplified': self._readability(simplified_text),
+        }
+        if translated_text:
+            yield 'quality', self._score(
+                simplified_text, translated_text, source_language_code, target_language, bleu_mode
+            )
+        else:
+            # Simplificação vazia: nenhum trecho foi traduzido, e não há idioma de origem nem texto a avaliar
+            yield 'quality', {'bleu_score': None, 'bleu_mode': 'skipped'}
+        done = {
+            'translated_text': translated_text,
+            'source_language_code': source_language_code,
+            'token_usage': merge_usage(usages),
+        }
+        if protected.glossary is not None:
+            done['glossary'] = self._glossary_report(protected, restored_terms[0])
+        yield 'done', done
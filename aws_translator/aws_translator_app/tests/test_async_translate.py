@@ -0,0 +1,104 @@
+import threading
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from aws_translator_app.services.language.glossary_service import ProtectedText
+from aws_translator_app.services.pipeline.translation_pipeline import TranslationPipeline
+
+PAYLOAD = {
+    'text': 'A força normal é perpendicular à superfície.',
+    'target_language': 'en',
+    'speciality': 'Física',
+    'style': 'Formal',
+    'complexity_level': 'Básico',
+    'model': 'gpt-4o-mini',
+}
+RESULT = {
+    'translated_text': 'The normal force is perpendicular to the surface.',
+    'metrics_original': {},
+    'metrics_simplified': {},
+    'bleu_score': None,
+    'bleu_mode': 'off',
+    'source_language_code': 'pt',
+}
+
+
+class AsyncTranslateViewTests(TestCase):
+    def setUp(self):
+        cache.clear()  # contadores do ratelimit
+        patcher = mock.patch('aws_translator_app.views.TranslationPipeline')
+        self.pipeline = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.pipeline.arun = mock.AsyncMock(return_value=RESULT)
+
+    def post(self, payload):
+        return self.client.post(reverse('translate_async'), payload, content_type='application/json')
+
+    def test_translates_with_arun(self):
+        response = self.post(PAYLOAD)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['translated_text'], RESULT['translated_text'])
+        self.assertEqual(self.pipeline.arun.await_args.kwargs['target_language'], 'en')
+
+    def test_invalid_payload(self):
+        response = self.post({**PAYLOAD, 'speciality': ''})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('speciality', response.json())
+        self.pipeline.arun.assert_not_awaited()
+
+    @mock.patch('aws_translator_app.views.RATE_LIMIT', '2/m')
+    def test_rate_limit(self):
+        self.assertEqual(self.post(PAYLOAD).status_code, 200)
+        self.assertEqual(self.post(PAYLOAD).status_code, 200)
+        self.assertEqual(self.post(PAYLOAD).status_code, 429)
+        self.assertEqual(self.pipeline.arun.await_count, 2)
+
+
+class PipelineScoreConnectionTests(SimpleTestCase):
+    def setUp(self):
+        self.quality = mock.Mock()
+        self.quality.score.return_value = {'bleu_score': None, 'bleu_mode': 'off'}
+        with override_settings(TRANSLATION_MEMORY={'ENABLED': False}):
+            self.pipeline = TranslationPipeline(
+                aws_service=mock.Mock(), openai_service=mock.Mock(), readability_service=mock.Mock(),
+                quality_service=self.quality, language_detector=mock.Mock(), translation_memory=None,
+                glossary_service=mock.Mock(),
+            )
+
+    @mock.patch('aws_translator_app.services.pipeline.translation_pipeline.connection')
+    def test_worker_thread_closes_its_connection(self, connection):
+        thread = threading.Thread(target=self.pipeline._score, args=('Olá.', 'Hello.', 'pt', 'en', 'off'))
+        thread.start()
+        thread.join()
+        connection.close.assert_called_once()
+        self.quality.score.assert_called_once_with('Olá.', 'Hello.', 'pt', 'en', mode='off')
+
+    @mock.patch('aws_translator_app.services.pipeline.translation_pipeline.connection')
+    def test_owner_thread_keeps_its_connection(self, connection):
+        self.pipeline._score('Olá.', 'Hello.', 'pt', 'en', 'off')
+        connection.close.assert_not_called()
+
+    @mock.patch('aws_translator_app.services.pipeline.translation_pipeline.connection')
+    def test_multi_target_scores_close_their_connections(self, connection):
+        self.pipeline.openai_service.simplify.return_value = mock.Mock(text='Texto simplificado.', usage={})
+        self.pipeline.aws_service.translate_long_text.side_effect = lambda text, target, source: (
+            f'{target}: {text}', 'pt'
+        )
+        self.pipeline.glossary_service.protect.side_effect = lambda text, *args: ProtectedText(text, [], [], None)
+        self.pipeline.glossary_service.restore.side_effect = lambda text, *args: (text, 0)
+        scoring_threads = []
+        self.quality.score.side_effect = lambda *args, **kwargs: (
+            scoring_threads.append(threading.current_thread()) or {'bleu_score': None, 'bleu_mode': 'off'}
+        )
+
+        result = self.pipeline.run_multi('Texto original.', ['en', 'es'], 'Física', 'Formal', False, 'gpt-4o-mini',
+                                         bleu_targets='all')
+
+        self.assertEqual(result['translations']['es']['translated_text'], 'es: Texto simplificado.')
+        # As avaliações rodam nas threads do executor, e cada uma fecha a conexão que abriu
+        self.assertEqual(len(scoring_threads), 2)
+        self.assertNotIn(threading.current_thread(), scoring_threads)
+        self.assertEqual(connection.close.call_count, 2)
@@ -0,0 +1,78 @@
+from django.test import SimpleTestCase
+
+from aws_translator_app.services.pipeline.chunking_service import TextChunk, TextChunker, split_sentences
+
+
+def pieces(chunks):
+    return [(chunk.text, chunk.separator) for chunk in chunks]
+
+
+class TextChunkerTests(SimpleTestCase):
+    def test_paragraphs_are_packed_up_to_the_budget(self):
+        chunks = TextChunker(max_bytes=40).split('Um parágrafo.\n\nOutro parágrafo.\n\nTerceiro.')
+        self.assertEqual(pieces(chunks), [
+            ('Um parágrafo.\n\nOutro parágrafo.', '\n\n'),
+            ('Terceiro.', ''),
+        ])
+        self.assertEqual([chunk.index for chunk in chunks], [0, 1])
+
+    def test_long_paragraph_is_split_at_sentences(self):
+        chunks = TextChunker(max_bytes=40).split('Primeira frase longa aqui. Segunda frase longa aqui. Terceira.\n\nFim.')
+        self.assertEqual(pieces(chunks), [
+            ('Primeira frase longa aqui.', ' '),
+            ('Segunda frase longa aqui. Terceira.', '\n\n'),
+            ('Fim.', ''),
+        ])
+
+    def test_long_sentence_is_split_at_words(self):
+        chunks = TextChunker(max_bytes=40).split('palavra ' * 12)
+        self.assertEqual(pieces(chunks), [
+            ('palavra palavra palavra palavra palavra', ' '),
+            ('palavra palavra palavra palavra palavra', ' '),
+            ('palavra palavra', ''),
+        ])
+
+    def test_token_budget_is_respected(self):
+        chunks = TextChunker(max_bytes=1000, max_tokens=5).split(
+            'Um dois tres quatro. Cinco seis sete oito nove dez onze.'
+        )
+        self.assertEqual([chunk.text for chunk in chunks], [
+            'Um dois tres quatro.', 'Cinco seis sete oito', 'nove dez onze.',
+        ])
+
+    def test_long_word_is_cut_without_breaking_characters(self):
+        chunks = TextChunker(max_bytes=10).split('ação' * 10)
+        self.assertTrue(all(len(chunk.text.encode('utf-8')) <= 10 for chunk in chunks))
+        self.assertEqual(''.join(chunk.text for chunk in chunks), 'ação' * 10)
+
+    def test_blank_lines_are_normalized(self):
+        self.assertEqual(pieces(TextChunker(max_bytes=1000).split('Olá mundo.\n \n\nDois.')),
+                         [('Olá mundo.\n\nDois.', '')])
+        self.assertEqual(TextChunker(max_bytes=40).split('  \n\n '), [])
+
+    def test_join_restores_the_text(self):
+        text = ('Sentença com acentuação e cedilha. ' * 30).strip()
+        chunker = TextChunker(max_bytes=40)
+        chunks = chunker.split(text)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunker.fits(chunk.text) for chunk in chunks))
+        self.assertEqual(TextChunker.join((chunk.text for chunk in chunks), chunks), text)
+
+    def test_join_uses_processed_pieces(self):
+        chunks = [TextChunk(0, 'a', ' '), TextChunk(1, 'b', '\n\n'), TextChunk(2, 'c', '')]
+        self.assertEqual(TextChunker.join(['A', 'B', 'C'], chunks), 'A B\n\nC')
+
+
+class SplitSentencesTests(SimpleTestCase):
+    def test_sentences_keep_their_separators(self):
+        self.assertEqual(pieces(split_sentences('Primeira frase. Segunda frase!\n\nTerceiro parágrafo.')), [
+            ('Primeira frase.', ' '), ('Segunda frase!', '\n\n'), ('Terceiro parágrafo.', ''),
+        ])
+
+    def test_clause_punctuation_ends_a_segment(self):
+        self.assertEqual([chunk.text for chunk in split_sentences('Pergunta? Resposta: sim; talvez… Fim.')],
+                         ['Pergunta?', 'Resposta:', 'sim;', 'talvez…', 'Fim.'])
+
+    def test_text_without_final_punctuation(self):
+        self.assertEqual(pieces(split_sentences('Sem pontuação final')), [('Sem pontuação final', '')])
+        self.assertEqual(split_sentences(''), [])
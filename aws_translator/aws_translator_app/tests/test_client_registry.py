@@ -0,0 +1,57 @@
+import os
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from aws_translator_app.services.api.client_registry import ClientRegistry
+
+AWS_ENVIRONMENT = {'AWS_ACCESS_KEY_ID': 'test', 'AWS_SECRET_ACCESS_KEY': 'test', 'AWS_REGION': 'us-east-1'}
+
+
+class ClientRegistryTests(SimpleTestCase):
+    def setUp(self):
+        self.registry = ClientRegistry()
+        self.registry._environment_loaded = True  # sem leitura do .env do desenvolvedor
+
+    @mock.patch.dict(os.environ, AWS_ENVIRONMENT)
+    def test_aws_client_is_created_once(self):
+        client = self.registry.get_aws_translate_client()
+        self.assertIs(self.registry.get_aws_translate_client(), client)
+        stats = self.registry.stats()['aws_translate']
+        self.assertEqual(stats['acquisitions'], 2)
+        self.assertEqual(stats['max_pool_connections'], 50)
+        self.assertEqual(stats['pools'], [])
+
+    @mock.patch.dict(os.environ, {'AWS_ACCESS_KEY_ID': '', 'OPENAI_API_KEY': ''})
+    def test_missing_credentials(self):
+        with self.assertRaises(ValueError):
+            self.registry.get_aws_translate_client()
+        with self.assertRaises(ValueError):
+            self.registry.get_openai_client()
+        self.assertEqual(self.registry.stats(), {})
+
+    def test_stats_tolerate_unknown_client_internals(self):
+        self.registry._get_or_create('aws_translate', object)
+        self.registry._get_or_create('openai', object)
+        stats = self.registry.stats()
+        self.assertEqual(stats['aws_translate']['pools'], [])
+        self.assertIsNone(stats['aws_translate']['max_pool_connections'])
+        self.assertEqual(stats['openai']['pool'], {})
+
+
+class ClientPoolStatsViewTests(TestCase):
+    def test_requires_staff(self):
+        client = APIClient()
+        url = reverse('client_pool_stats')
+        self.assertEqual(client.get(url).status_code, 401)
+
+        client.force_authenticate(User.objects.create_user('user'))
+        self.assertEqual(client.get(url).status_code, 403)
+
+        client.force_authenticate(User.objects.create_user('admin', is_staff=True))
+        response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('resilience', response.json())
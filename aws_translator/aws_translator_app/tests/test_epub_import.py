@@ -0,0 +1,90 @@
+import io
+import os
+import tempfile
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+from ebooklib import epub
+
+from aws_translator_app.services.document_service import DocumentService
+from aws_translator_app.services.epub_reader import PARAGRAPH_SEPARATOR, EpubChapter, xhtml_to_text
+
+CHAPTER_ONE = (
+    '<html><head><title>Ignorado</title><style>p { color: red; }</style></head><body>'
+    '<h1>Capítulo   1</h1><p>Primeiro   parágrafo.</p>'
+    '<script>alert("não é texto");</script><p>Segunda linha<br/>com quebra.</p></body></html>'
+)
+CHAPTER_TWO = '<html><body><h2>Capítulo 2</h2><div>Texto do segundo capítulo.</div></body></html>'
+COVER = '<html><body><img src="capa.jpg"/></body></html>'
+
+
+def epub_file(spine=('capitulo2', 'capa', 'capitulo1')):
+    """
+    Builds an EPUB with two chapters and an image-only cover, read in the given spine order.
+    """
+    book = epub.EpubBook()
+    book.set_identifier('livro-teste')
+    book.set_title('Livro de teste')
+    book.set_language('pt')
+    for uid, content in (('capitulo1', CHAPTER_ONE), ('capitulo2', CHAPTER_TWO), ('capa', COVER)):
+        item = epub.EpubHtml(uid=uid, file_name=f'{uid}.xhtml')
+        item.content = content
+        book.add_item(item)
+    book.add_item(epub.EpubNav())
+    book.spine = ['nav', *spine]
+
+    buffer = io.BytesIO()
+    epub.write_epub(buffer, book)
+    return SimpleUploadedFile('livro.epub', buffer.getvalue(), content_type='application/epub+zip')
+
+
+class XhtmlToTextTests(SimpleTestCase):
+    def test_only_visible_text_is_kept(self):
+        title, text = xhtml_to_text(CHAPTER_ONE.encode('utf-8'))
+        self.assertEqual(title, 'Capítulo 1')
+        self.assertEqual(text.split(PARAGRAPH_SEPARATOR),
+                         ['Capítulo 1', 'Primeiro parágrafo.', 'Segunda linha\ncom quebra.'])
+
+    def test_declared_encoding_and_html_entities(self):
+        content = '<?xml version="1.0" encoding="ISO-8859-1"?><html><body><p>Ação&nbsp;rápida</p></body></html>'
+        self.assertEqual(xhtml_to_text(content.encode('iso-8859-1')), (None, 'Ação rápida'))
+
+    def test_empty_document(self):
+        self.assertEqual(xhtml_to_text(b'  '), (None, ''))
+
+
+class EpubImportTests(SimpleTestCase):
+    def test_chapters_follow_the_spine(self):
+        chapters = list(DocumentService.iter_epub_chapters(epub_file()))
+        # O sumário e a capa sem texto são omitidos
+        self.assertEqual(chapters, [
+            EpubChapter(index=1, title='Capítulo 2', text='Capítulo 2\n\nTexto do segundo capítulo.'),
+            EpubChapter(index=2, title='Capítulo 1',
+                        text='Capítulo 1\n\nPrimeiro parágrafo.\n\nSegunda linha\ncom quebra.'),
+        ])
+
+    def test_import_document_joins_the_chapters(self):
+        text = DocumentService().import_document(epub_file(spine=('capitulo1', 'capitulo2')))
+        self.assertEqual(text.split(PARAGRAPH_SEPARATOR), [
+            'Capítulo 1', 'Primeiro parágrafo.', 'Segunda linha\ncom quebra.',
+            'Capítulo 2', 'Texto do segundo capítulo.',
+        ])
+        self.assertNotIn('alert', text)
+        self.assertNotIn('color', text)
+
+    def test_iter_document_yields_one_part_per_chapter(self):
+        parts = list(DocumentService().iter_document(epub_file()))
+        self.assertEqual([part.split(PARAGRAPH_SEPARATOR)[0] for part in parts], ['Capítulo 2', 'Capítulo 1'])
+
+    def test_in_memory_upload_copy_is_removed(self):
+        with mock.patch('aws_translator_app.services.document_service.epub.read_epub',
+                        wraps=epub.read_epub) as read_epub:
+            list(DocumentService.iter_epub_chapters(epub_file()))
+        path = read_epub.call_args.args[0]
+        self.assertTrue(path.startswith(tempfile.gettempdir()))
+        self.assertFalse(os.path.exists(path))
+
+    def test_invalid_epub(self):
+        with self.assertRaisesMessage(Exception, 'Erro ao importar EPUB'):
+            DocumentService().import_document(SimpleUploadedFile('livro.epub', b'not an epub'))
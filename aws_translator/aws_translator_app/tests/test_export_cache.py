@@ -0,0 +1,109 @@
+import os
+import tempfile
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from aws_translator_app.services.cache.export_cache import ExportCache
+from aws_translator_app.services.document_service import DocumentService
+
+METRICS = {'flesch_reading_ease': 50.0}
+
+
+class ExportCacheTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def store(self, cache, key, size=100):
+        path = cache.temporary_path('txt')
+        with open(path, 'wb') as file:
+            file.write(b'x' * size)
+        return cache.put(key, path)
+
+    def age(self, key, seconds):
+        path = os.path.join(self.directory, key)
+        os.utime(path, (time.time() - seconds, time.time() - seconds))
+
+    def test_hit_returns_the_stored_file(self):
+        cache = ExportCache(self.directory, max_bytes=1000)
+        key = cache.make_key('Texto.', METRICS, METRICS, 'pdf')
+        self.assertIsNone(cache.get(key))
+        path = self.store(cache, key)
+        self.assertEqual(cache.get(key), path)
+        self.assertEqual((cache.stats()['hits'], cache.stats()['misses']), (1, 1))
+
+    def test_key_depends_on_the_content(self):
+        key = ExportCache.make_key('Texto.', METRICS, METRICS, 'pdf')
+        self.assertEqual(ExportCache.make_key('Texto.', dict(METRICS), dict(METRICS), 'PDF'), key)
+        self.assertNotEqual(ExportCache.make_key('Texto.', METRICS, METRICS, 'txt'), key)
+        self.assertNotEqual(ExportCache.make_key('Texto.', METRICS, {}, 'pdf'), key)
+        self.assertNotEqual(ExportCache.make_key('Outro texto.', METRICS, METRICS, 'pdf'), key)
+
+    def test_least_recently_used_files_are_removed_above_the_quota(self):
+        cache = ExportCache(self.directory, max_bytes=250)
+        self.store(cache, 'a.txt')
+        self.age('a.txt', 30)
+        self.store(cache, 'b.txt')
+        self.age('b.txt', 20)
+        cache.get('a.txt')
+        self.store(cache, 'c.txt')
+
+        self.assertEqual(sorted(os.listdir(self.directory)), ['a.txt', 'c.txt'])
+        self.assertEqual(cache.stats()['bytes'], 200)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_quota_covers_files_written_by_other_processes(self):
+        first = ExportCache(self.directory, max_bytes=250)
+        second = ExportCache(self.directory, max_bytes=250)
+        self.store(first, 'a.txt')
+        self.age('a.txt', 30)
+        self.store(second, 'b.txt')
+        self.age('b.txt', 20)
+        self.store(first, 'c.txt')
+
+        self.assertEqual(sorted(os.listdir(self.directory)), ['b.txt', 'c.txt'])
+        self.assertIsNotNone(first.get('b.txt'))
+        self.assertIsNone(second.get('a.txt'))
+
+    def test_only_abandoned_temporary_files_are_cleaned_up(self):
+        cache = ExportCache(self.directory, max_bytes=1000)
+        in_flight = cache.temporary_path('pdf')
+        abandoned = cache.temporary_path('pdf')
+        os.utime(abandoned, (0, 0))
+
+        ExportCache(self.directory, max_bytes=1000)
+        self.assertTrue(os.path.exists(in_flight))
+        self.assertFalse(os.path.exists(abandoned))
+        self.assertEqual(ExportCache(self.directory, max_bytes=1000).stats()['entries'], 0)
+
+
+class ExportDocumentPathTests(SimpleTestCase):
+    def test_each_export_gets_its_own_file(self):
+        service = DocumentService()
+        first = service.export_document('Primeiro texto.', METRICS, METRICS, 'txt')
+        second = service.export_document('Segundo texto.', METRICS, METRICS, 'txt')
+        self.addCleanup(os.remove, first)
+        self.addCleanup(os.remove, second)
+
+        self.assertNotEqual(first, second)
+        with open(first, encoding='utf-8') as file:
+            self.assertIn('Primeiro texto.', file.read())
+
+    def test_cached_export_renders_once(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        cache = ExportCache(directory.name, max_bytes=1024 * 1024)
+        service = DocumentService()
+        with mock.patch('aws_translator_app.services.document_service.get_export_cache', return_value=cache), \
+                mock.patch.object(DocumentService, '_render', autospec=True,
+                                  side_effect=lambda self, text, path, *args: open(path, 'w').close()) as render:
+            first = service.export_document_cached('Texto.', METRICS, METRICS, 'txt')
+            second = service.export_document_cached('Texto.', METRICS, METRICS, 'txt')
+
+        render.assert_called_once()
+        self.assertEqual(first.path, second.path)
+        self.assertEqual((first.temporary, first.cached), (False, False))
+        self.assertEqual((second.temporary, second.cached), (False, True))
@@ -0,0 +1,66 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from aws_translator_app.services.cache.export_cache import ExportCache
+from aws_translator_app.views import _TemporaryExportFile
+
+PAYLOAD = {
+    'text': 'Texto exportado.',
+    'metrics_original': {'flesch_reading_ease': 50.0},
+    'metrics_simplified': {'flesch_reading_ease': 70.0},
+    'format': 'txt',
+}
+
+
+class ExportDocumentViewTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()  # contadores do ratelimit
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def export(self, export_cache):
+        with mock.patch('aws_translator_app.services.document_service.get_export_cache', return_value=export_cache):
+            response = APIClient().post(reverse('export_document'), PAYLOAD, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="output.txt"')
+        return response
+
+    def test_temporary_export_is_removed_when_the_response_closes(self):
+        with mock.patch('aws_translator_app.views._TemporaryExportFile', wraps=_TemporaryExportFile) as opened:
+            response = self.export(ExportCache(self.directory, max_bytes=0, enabled=False))
+        path = opened.call_args.args[0]
+        self.assertTrue(os.path.exists(path))
+
+        self.assertIn('Texto exportado.', b''.join(response.streaming_content).decode('utf-8'))
+        response.close()
+        self.assertFalse(os.path.exists(path))
+
+    def test_cached_export_stays_on_disk(self):
+        export_cache = ExportCache(self.directory, max_bytes=1024 * 1024)
+        response = self.export(export_cache)
+        b''.join(response.streaming_content)
+        response.close()
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+        self.export(export_cache).close()
+        self.assertEqual(export_cache.stats()['hits'], 1)
+
+
+class TemporaryExportFileTests(SimpleTestCase):
+    def test_close_removes_the_file(self):
+        descriptor, path = tempfile.mkstemp()
+        os.write(descriptor, b'conteudo')
+        os.close(descriptor)
+
+        file = _TemporaryExportFile(path)
+        self.assertEqual(file.read(), b'conteudo')
+        file.close()
+        self.assertFalse(os.path.exists(path))
+        file.close()
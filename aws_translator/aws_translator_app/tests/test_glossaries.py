@@ -0,0 +1,185 @@
+from types import SimpleNamespace
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from aws_translator_app.models import Glossary
+from aws_translator_app.services.language.glossary_service import AhoCorasick, GlossaryService, fold_case
+from aws_translator_app.services.pipeline.translation_pipeline import TranslationPipeline
+
+SPECIALITY = 'Física'
+CSV = 'termo,en,es\nforça normal,normal force,fuerza normal\nmassa,mass,masa\n'
+
+
+def upload_data():
+    return {
+        'file': SimpleUploadedFile('glossario.csv', CSV.encode('utf-8'), content_type='text/csv'),
+        'speciality': SPECIALITY,
+        'source_language': 'pt',
+    }
+
+
+class GlossaryViewPermissionTests(TestCase):
+    def setUp(self):
+        cache.clear()  # contadores do ratelimit
+        self.client = APIClient()
+        self.admin = User.objects.create_user('admin', is_staff=True)
+
+    def test_anonymous_upload_is_rejected(self):
+        response = self.client.post(reverse('glossary_list'), upload_data(), format='multipart')
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(Glossary.objects.exists())
+
+    def test_non_staff_upload_is_rejected(self):
+        self.client.force_authenticate(User.objects.create_user('user'))
+        response = self.client.post(reverse('glossary_list'), upload_data(), format='multipart')
+        self.assertEqual(response.status_code, 403)
+
+    def test_admin_upload_and_public_read(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.post(reverse('glossary_list'), upload_data(), format='multipart')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['term_count'], 2)
+
+        self.client.force_authenticate(None)
+        glossary_url = reverse('glossary_detail', args=[response.json()['id']])
+        self.assertEqual(self.client.get(reverse('glossary_list')).status_code, 200)
+        self.assertEqual(self.client.get(glossary_url).status_code, 200)
+
+    def test_delete_requires_admin(self):
+        self.client.force_authenticate(self.admin)
+        glossary_id = self.client.post(reverse('glossary_list'), upload_data(), format='multipart').json()['id']
+        glossary_url = reverse('glossary_detail', args=[glossary_id])
+
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.delete(glossary_url).status_code, 401)
+        self.assertTrue(Glossary.objects.filter(pk=glossary_id).exists())
+
+        self.client.force_authenticate(self.admin)
+        self.assertEqual(self.client.delete(glossary_url).status_code, 204)
+        self.assertFalse(Glossary.objects.filter(pk=glossary_id).exists())
+
+
+def glossary_file(content=CSV):
+    return SimpleUploadedFile('glossario.csv', content.encode('utf-8'), content_type='text/csv')
+
+
+class FoldCaseTests(SimpleTestCase):
+    def test_lower_cases_the_text(self):
+        self.assertEqual(fold_case('Força Normal'), 'força normal')
+        self.assertEqual(fold_case('ΣΟΦΟΣ'), 'σοφος')
+        self.assertEqual(fold_case(''), '')
+
+    def test_characters_that_change_length_are_kept_in_place(self):
+        # 'İ'.lower() tem dois caracteres e 'ẞ'.casefold() vira 'ss'; as posições encontradas valem no texto original
+        self.assertEqual(fold_case('İstanbul'), 'İstanbul')
+        self.assertEqual(fold_case('Straße ẞ'), 'straße ß')
+        self.assertEqual(len(fold_case('İstanbul Straße ẞ')), len('İstanbul Straße ẞ'))
+
+
+class AhoCorasickTests(SimpleTestCase):
+    def test_matches_whole_words_only(self):
+        self.assertEqual(AhoCorasick(['lei']).find('leitura da lei'), [(11, 14, 0)])
+        self.assertEqual(AhoCorasick(['c++']).find('usa c++.'), [(4, 7, 0)])
+        self.assertEqual(AhoCorasick(['massa']).find('sem termos'), [])
+
+    def test_longest_leftmost_match_wins(self):
+        self.assertEqual(AhoCorasick(['força', 'força normal', 'normal']).find('a força normal'), [(2, 14, 1)])
+        self.assertEqual(AhoCorasick(['ab cd', 'cd ef']).find('ab cd ef'), [(0, 5, 0)])
+        self.assertEqual(AhoCorasick(['he', 'she', 'hers']).find('she hers ushers'), [(0, 3, 1), (4, 8, 2)])
+
+    def test_duplicate_and_empty_patterns(self):
+        self.assertEqual(AhoCorasick(['massa', 'massa']).find('massa'), [(0, 5, 0)])
+        self.assertEqual(AhoCorasick(['', 'a']).find('a'), [(0, 1, 1)])
+
+
+class GlossaryServiceTests(TestCase):
+    def setUp(self):
+        self.service = GlossaryService()
+        self.service.import_glossary(glossary_file(CSV + 'Newton,,\n'), SPECIALITY, 'pt')
+        self.protected = self.service.protect(
+            'A força normal e a massa. Força normal, massa e Newton.', SPECIALITY, 'pt'
+        )
+
+    def test_protect_replaces_terms_with_placeholders(self):
+        self.assertEqual(self.protected.text, 'A ⟦0⟧ e a ⟦1⟧. ⟦2⟧, ⟦1⟧ e ⟦3⟧.')
+        self.assertEqual(self.protected.surfaces, ['força normal', 'massa', 'Força normal', 'Newton'])
+
+    def test_restore_uses_the_target_language_terms(self):
+        self.assertEqual(
+            self.service.restore('The ⟦0⟧ and the ⟦1⟧. ⟦2⟧, ⟦1⟧ and ⟦3⟧.', self.protected, 'en'),
+            ('The normal force and the mass. Normal force, mass and Newton.', 5)
+        )
+
+    def test_restore_tolerates_spaced_and_unknown_placeholders(self):
+        self.assertEqual(self.service.restore('La ⟦ 0 ⟧ y la ⟦1⟧ ⟦9⟧.', self.protected, 'es'),
+                         ('La fuerza normal y la masa ⟦9⟧.', 2))
+
+    def test_restore_without_target_uses_the_original_terms(self):
+        self.assertEqual(self.service.restore('Uma ⟦0⟧ simplificada.', self.protected),
+                         ('Uma força normal simplificada.', 1))
+
+    def test_no_glossary_for_language(self):
+        protected = self.service.protect('The normal force.', SPECIALITY, 'en')
+        self.assertEqual(protected.text, 'The normal force.')
+        self.assertIsNone(protected.glossary)
+        self.assertEqual(self.service.restore('⟦0⟧', protected, 'en'), ('⟦0⟧', 0))
+
+    def test_reimport_recompiles(self):
+        self.service.import_glossary(glossary_file('termo,en\naceleração,acceleration\n'), SPECIALITY, 'pt')
+        protected = self.service.protect('A massa e a aceleração.', SPECIALITY, 'pt')
+        self.assertEqual(protected.text, 'A massa e a ⟦0⟧.')
+        self.assertEqual(Glossary.objects.get().term_count, 1)
+
+    def test_unknown_language_column_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.import_glossary(glossary_file('termo,xx\nmassa,mass\n'), SPECIALITY, 'pt')
+
+    def test_file_without_translations_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.import_glossary(glossary_file('termo\nmassa\n'), SPECIALITY, 'pt')
+        with self.assertRaises(ValueError):
+            self.service.import_glossary(glossary_file('termo,en\n'), SPECIALITY, 'pt')
+
+    def test_file_that_is_not_utf8_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.import_glossary(
+                SimpleUploadedFile('glossario.csv', 'termo,en\nforça,force\n'.encode('latin-1')), SPECIALITY, 'pt'
+            )
+
+
+class StubStreamingOpenAIService:
+    def __init__(self, deltas):
+        self.deltas = deltas
+
+    def stream_simplify(self, text, **kwargs):
+        yield from self.deltas
+
+
+class StubAwsTranslateService:
+    def translate_long_text(self, text, target_language_code, source_language_code='auto'):
+        return text, 'pt'
+
+
+@override_settings(TRANSLATION_MEMORY={'ENABLED': False})
+class GlossaryStreamTests(TestCase):
+    def test_placeholder_split_across_deltas_is_held(self):
+        GlossaryService().import_glossary(glossary_file(), SPECIALITY, 'pt')
+        pipeline = TranslationPipeline(
+            aws_service=StubAwsTranslateService(),
+            openai_service=StubStreamingOpenAIService(['A ⟦', '0⟧ e a ⟦1', '⟧ ', 'crescem.']),
+            readability_service=SimpleNamespace(calculate_readability=lambda text, language_code: {}),
+            quality_service=SimpleNamespace(score=lambda *args, **kwargs: {'bleu_score': None, 'bleu_mode': 'off'}),
+            language_detector=SimpleNamespace(detect=lambda text: 'pt', aws_source_language=lambda text, target: 'pt'),
+        )
+        events = list(pipeline.stream('A força normal e a massa crescem.', 'en', SPECIALITY, 'Formal', False, 'gpt-4o-mini'))
+
+        simplified = [data['text'] for name, data in events if name == 'simplified']
+        self.assertEqual(simplified, ['A ', 'força normal e a ', 'massa ', 'crescem.'])
+        done = events[-1][1]
+        self.assertEqual(done['translated_text'], 'A normal force e a mass crescem.')
+        self.assertEqual(done['glossary']['restored'], 2)
@@ -0,0 +1,139 @@
+import asyncio
+from unittest import mock
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from django.urls import reverse
+
+from aws_translator_app import instrumentation
+from aws_translator_app.instrumentation import (
+    HTTP_REQUESTS,
+    OPENAI_TOKENS,
+    STAGE_ERRORS,
+    STAGE_SECONDS,
+    Counter,
+    Histogram,
+    MetricsMiddleware,
+    count_tokens,
+    render_metrics,
+    stage_timer,
+)
+
+
+def value(metric, **labels):
+    key = tuple(str(labels.get(name, '')) for name in metric.labelnames)
+    entry = metric._values.get(key)
+    if isinstance(metric, Histogram):
+        return entry[2] if entry else 0
+    return entry or 0
+
+
+def cache_stats(hits, misses):
+    return mock.Mock(stats=mock.Mock(return_value={'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses)}))
+
+
+class MetricTypesTests(SimpleTestCase):
+    def test_counter(self):
+        counter = Counter('teste_eventos', 'Eventos.', ('tipo',))
+        counter.inc(tipo='a')
+        counter.inc(2, tipo='a')
+        counter.inc(tipo='b"c')
+        self.assertEqual(counter.render(), ['teste_eventos_total{tipo="a"} 3', 'teste_eventos_total{tipo="b\\"c"} 1'])
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram('teste_segundos', 'Tempo.', ('etapa',), buckets=(1, 0.1))
+        histogram.observe(0.05, etapa='x')
+        histogram.observe(0.5, etapa='x')
+        histogram.observe(3, etapa='x')
+        self.assertEqual(histogram.render(), [
+            'teste_segundos_bucket{etapa="x",le="0.1"} 1',
+            'teste_segundos_bucket{etapa="x",le="1"} 2',
+            'teste_segundos_bucket{etapa="x",le="+Inf"} 3',
+            'teste_segundos_sum{etapa="x"} 3.55',
+            'teste_segundos_count{etapa="x"} 3',
+        ])
+
+
+class StageTimerTests(SimpleTestCase):
+    def test_records_the_duration(self):
+        before = value(STAGE_SECONDS, stage='teste', model='gpt-4o-mini', target_language='en')
+        with stage_timer('teste', model='gpt-4o-mini', target_language='en'):
+            pass
+        self.assertEqual(value(STAGE_SECONDS, stage='teste', model='gpt-4o-mini', target_language='en'), before + 1)
+
+    def test_records_errors_but_not_client_disconnects(self):
+        before = value(STAGE_ERRORS, stage='teste-erro', error='ValueError')
+        with self.assertRaises(ValueError):
+            with stage_timer('teste-erro'):
+                raise ValueError()
+        with self.assertRaises(GeneratorExit):
+            with stage_timer('teste-erro'):
+                raise GeneratorExit()
+        self.assertEqual(value(STAGE_ERRORS, stage='teste-erro', error='ValueError'), before + 1)
+        self.assertEqual(value(STAGE_ERRORS, stage='teste-erro', error='GeneratorExit'), 0)
+
+    def test_count_tokens(self):
+        before = value(OPENAI_TOKENS, model='modelo-teste', kind='prompt')
+        count_tokens('modelo-teste', {'prompt_tokens': 120, 'completion_tokens': 0})
+        self.assertEqual(value(OPENAI_TOKENS, model='modelo-teste', kind='prompt'), before + 120)
+        self.assertEqual(value(OPENAI_TOKENS, model='modelo-teste', kind='completion'), 0)
+
+    @mock.patch.object(instrumentation, '_enabled', False)
+    def test_disabled_metrics_record_nothing(self):
+        with stage_timer('teste-desativado'):
+            pass
+        count_tokens('modelo-desativado', {'prompt_tokens': 10})
+        self.assertEqual(value(STAGE_SECONDS, stage='teste-desativado'), 0)
+        self.assertEqual(value(OPENAI_TOKENS, model='modelo-desativado', kind='prompt'), 0)
+
+
+class MetricsMiddlewareTests(SimpleTestCase):
+    def test_requests_are_counted_by_route_name(self):
+        before = value(HTTP_REQUESTS, endpoint='languages', method='GET', status=200)
+        self.assertEqual(self.client.get(reverse('languages')).status_code, 200)
+        self.assertEqual(value(HTTP_REQUESTS, endpoint='languages', method='GET', status=200), before + 1)
+
+    def test_unknown_paths_share_one_endpoint(self):
+        before = value(HTTP_REQUESTS, endpoint='unmatched', method='GET', status=404)
+        self.client.get('/caminho-inexistente/')
+        self.assertEqual(value(HTTP_REQUESTS, endpoint='unmatched', method='GET', status=404), before + 1)
+
+    def test_async_chain(self):
+        async def get_response(request):
+            return HttpResponse(status=201)
+
+        middleware = MetricsMiddleware(get_response)
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        before = value(HTTP_REQUESTS, endpoint='unmatched', method='POST', status=201)
+        response = asyncio.run(middleware(RequestFactory().post('/')))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(value(HTTP_REQUESTS, endpoint='unmatched', method='POST', status=201), before + 1)
+
+    @mock.patch.object(instrumentation, '_enabled', False)
+    def test_removed_when_disabled(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            MetricsMiddleware(lambda request: HttpResponse())
+
+
+@mock.patch('aws_translator_app.services.cache.llm_cache.get_llm_cache', return_value=cache_stats(1, 3))
+@mock.patch('aws_translator_app.services.cache.translation_cache.get_translation_cache',
+            return_value=cache_stats(3, 1))
+class MetricsEndpointTests(SimpleTestCase):
+    def test_render_metrics(self, *caches):
+        text = render_metrics()
+        self.assertIn('# TYPE translator_stage_seconds histogram\n', text)
+        self.assertIn('# TYPE translator_http_requests_total counter\n', text)
+        self.assertIn('translator_cache_hits_total{cache="translation"} 3\n', text)
+        self.assertIn('translator_cache_hit_ratio{cache="llm"} 0.25\n', text)
+        self.assertTrue(text.endswith('\n'))
+
+    def test_metrics_endpoint(self, *caches):
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        self.assertIn(b'# HELP translator_stage_seconds ', response.content)
+
+    @mock.patch.object(instrumentation, '_enabled', False)
+    def test_metrics_endpoint_is_hidden_when_disabled(self, *caches):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 404)
@@ -0,0 +1,177 @@
+import os
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from aws_translator_app.models import Job
+from aws_translator_app.services.jobs.brokers import DatabaseBroker
+from aws_translator_app.services.jobs.job_service import JobService
+
+METRICS = {'flesch_reading_ease': 50.0}
+
+
+class JobResultViewTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def get_result(self, result):
+        job = Job.objects.create(status=Job.STATUS_SUCCEEDED, result=result)
+        return self.client.get(reverse('job_result', args=[job.pk]))
+
+    def test_single_target_result(self):
+        response = self.get_result({
+            'translated_text': 'Hello.',
+            'metrics_original': METRICS,
+            'metrics_simplified': METRICS,
+            'bleu_score': None,
+            'bleu_mode': 'off',
+            'source_language_code': 'pt',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['translated_text'], 'Hello.')
+
+    def test_multi_target_result(self):
+        response = self.get_result({
+            'translations': {
+                'en': {'translated_text': 'Hello.', 'source_language_code': 'pt', 'bleu_score': None, 'bleu_mode': 'off'},
+                'es': {'translated_text': 'Hola.', 'source_language_code': 'pt', 'bleu_score': None, 'bleu_mode': 'off'},
+            },
+            'metrics_original': METRICS,
+            'metrics_simplified': METRICS,
+            'chunks': [],
+            'token_usage': {},
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {code: translation['translated_text'] for code, translation in response.json()['translations'].items()},
+            {'en': 'Hello.', 'es': 'Hola.'}
+        )
+        self.assertNotIn('translated_text', response.json())
+
+    def test_pending_job(self):
+        job = Job.objects.create()
+        response = self.client.get(reverse('job_result', args=[job.pk]))
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response['Retry-After'], '5')
+
+
+PARAMS = {
+    'text': 'Texto.', 'target_language': 'en', 'speciality': 'Física', 'style': 'Formal', 'model': 'gpt-4o-mini',
+}
+
+
+def age(job, seconds):
+    # updated_at é auto_now: só um update() direto grava um valor no passado
+    Job.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timedelta(seconds=seconds))
+
+
+class DatabaseBrokerTests(TestCase):
+    def setUp(self):
+        self.broker = DatabaseBroker()
+
+    def test_claim_reserves_pending_jobs_in_order(self):
+        first = Job.objects.create()
+        second = Job.objects.create()
+        Job.objects.filter(pk=second.pk).update(created_at=timezone.now() + timedelta(seconds=1))
+
+        claimed = self.broker.claim('w1', timeout=0)
+        self.assertEqual(claimed.pk, first.pk)
+        self.assertEqual(claimed.status, Job.STATUS_RUNNING)
+        self.assertEqual(claimed.worker_id, 'w1')
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNotNone(claimed.started_at)
+
+        self.assertEqual(self.broker.claim('w2', timeout=0).pk, second.pk)
+        self.assertIsNone(self.broker.claim('w3', timeout=0))
+
+    def test_requeue_stale_only_touches_old_running_jobs(self):
+        stale = Job.objects.create(status=Job.STATUS_RUNNING, worker_id='w1', attempts=1)
+        fresh = Job.objects.create(status=Job.STATUS_RUNNING, worker_id='w2', attempts=1)
+        age(stale, 120)
+
+        self.assertEqual(self.broker.requeue_stale(older_than=60, max_attempts=3), 1)
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual((stale.status, stale.worker_id), (Job.STATUS_PENDING, ''))
+        self.assertEqual((fresh.status, fresh.worker_id), (Job.STATUS_RUNNING, 'w2'))
+        self.assertEqual(self.broker.claim('w3', timeout=0).attempts, 2)
+
+    def test_requeue_stale_fails_jobs_out_of_attempts(self):
+        job = Job.objects.create(status=Job.STATUS_RUNNING, worker_id='w1', attempts=3)
+        age(job, 120)
+
+        self.assertEqual(self.broker.requeue_stale(older_than=60, max_attempts=3), 0)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_FAILED)
+        self.assertIn('máximo de tentativas', job.error)
+        self.assertIsNotNone(job.finished_at)
+
+
+@mock.patch('aws_translator_app.services.jobs.job_service.TranslationPipeline')
+class JobServiceRunTests(TestCase):
+    def setUp(self):
+        Job.objects.create(params=PARAMS)
+        self.job = DatabaseBroker().claim('w1', timeout=0)
+
+    def test_result_is_recorded(self, pipeline):
+        pipeline.return_value.run.return_value = {'translated_text': 'Text.'}
+        JobService().run(self.job)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, Job.STATUS_SUCCEEDED)
+        self.assertEqual(self.job.result, {'translated_text': 'Text.'})
+
+    def test_failure_is_recorded(self, pipeline):
+        pipeline.return_value.run.side_effect = RuntimeError('Falha no pipeline')
+        with self.assertLogs('aws_translator_app.services.jobs.job_service', 'ERROR'):
+            JobService().run(self.job)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, Job.STATUS_FAILED)
+        self.assertEqual(self.job.error, 'Falha no pipeline')
+
+    def test_requeued_job_is_not_overwritten_by_the_previous_worker(self, pipeline):
+        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as document:
+            document.write(b'Texto.')
+        self.addCleanup(lambda: os.path.exists(document.name) and os.remove(document.name))
+        Job.objects.filter(pk=self.job.pk).update(document_path=document.name, document_name='texto.txt')
+        self.job.refresh_from_db()
+
+        def run(**options):
+            # Enquanto w1 executa, a tarefa é devolvida à fila e reservada por w2
+            age(self.job, 120)
+            DatabaseBroker().requeue_stale(older_than=60)
+            DatabaseBroker().claim('w2', timeout=0)
+            options['progress_callback']('chunks', 1, 1)
+            return {'translated_text': 'Text.'}
+
+        pipeline.return_value.run.side_effect = run
+        with mock.patch('aws_translator_app.services.jobs.job_service.DocumentService') as documents:
+            documents.return_value.import_document.return_value = 'Texto.'
+            with self.assertLogs('aws_translator_app.services.jobs.job_service', 'WARNING'):
+                JobService().run(self.job)
+
+        job = Job.objects.get(pk=self.job.pk)
+        self.assertEqual((job.status, job.worker_id, job.attempts), (Job.STATUS_RUNNING, 'w2', 2))
+        self.assertIsNone(job.result)
+        self.assertNotIn('chunks', job.progress)
+        self.assertTrue(os.path.exists(document.name))
+
+    def test_heartbeat_refreshes_updated_at_while_owned(self, pipeline):
+        age(self.job, 120)
+        finished = mock.Mock()
+        finished.wait.side_effect = [False, True]
+        JobService._heartbeat(self.job, finished)
+        self.job.refresh_from_db()
+        self.assertGreater(self.job.updated_at, timezone.now() - timedelta(seconds=60))
+
+        Job.objects.filter(pk=self.job.pk).update(worker_id='w2')
+        age(self.job, 120)
+        finished.wait.side_effect = [False, False]
+        JobService._heartbeat(self.job, finished)
+        self.assertEqual(finished.wait.call_count, 3)  # parou ao perder a tarefa
+        self.job.refresh_from_db()
+        self.assertLess(self.job.updated_at, timezone.now() - timedelta(seconds=60))
@@ -0,0 +1,97 @@
+import hashlib
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from aws_translator_app.services.language import language_detection_service
+from aws_translator_app.services.language.language_detection_service import (
+    LanguageDetectionService,
+    get_language_detection_service,
+)
+
+PORTUGUESE = 'A força normal é perpendicular à superfície de contato entre os corpos.'
+MIXED = 'Olá mundo, hello world, bonjour le monde, hola mundo, ciao mondo.'
+
+
+class LanguageDetectionServiceTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Os perfis de idioma são carregados uma vez para a classe
+        cls.service = LanguageDetectionService(sample_chars=100, min_sample_chars=40, cache_entries=2)
+
+    def setUp(self):
+        self.service._cache.clear()
+        self.service._hits = self.service._misses = 0
+
+    def test_detect(self):
+        self.assertEqual(self.service.detect(PORTUGUESE), 'pt')
+        self.assertEqual(self.service.detect('这是一个关于物理学的中文句子，我们在这里测试语言检测。'), 'zh')
+        self.assertIsNone(self.service.detect('12345 !!!'))
+        self.assertEqual(self.service.detect_with_probability('   '), (None, 0.0))
+
+    def test_seeded_detector_is_deterministic(self):
+        first = LanguageDetectionService(cache_entries=0).detect_with_probability(MIXED)
+        second = LanguageDetectionService(cache_entries=0)
+        self.assertEqual(second.detect_with_probability(MIXED), first)
+        self.assertEqual(second.detect_with_probability(MIXED), first)
+
+    def test_sample_is_a_prefix_cut_at_a_space(self):
+        self.assertEqual(self.service.sample(f'  {PORTUGUESE}  '), PORTUGUESE)
+        self.assertEqual(self.service.sample('palavra ' * 20), ' '.join(['palavra'] * 12))
+        self.assertEqual(self.service.sample('x' * 150), 'x' * 100)
+
+    def test_only_the_prefix_is_analysed(self):
+        text = PORTUGUESE + ' ' + 'This is a long English appendix that the sample never reaches. ' * 20
+        with mock.patch.object(LanguageDetectionService, '_detect_uncached', autospec=True,
+                               side_effect=LanguageDetectionService._detect_uncached) as detect:
+            self.assertEqual(self.service.detect(text), 'pt')
+        self.assertEqual(detect.call_args.args[1], self.service.sample(text))
+
+    def test_results_are_memoized_by_the_sample_hash(self):
+        with mock.patch.object(LanguageDetectionService, '_detect_uncached', autospec=True,
+                               return_value=('pt', 0.99)) as detect:
+            self.service.detect(PORTUGUESE)
+            # Espaços nas pontas não mudam a amostra
+            self.service.detect(f'  {PORTUGUESE}\n')
+            self.service.detect('Outro texto.')
+        self.assertEqual(detect.call_count, 2)
+        self.assertIn(hashlib.sha256(PORTUGUESE.encode('utf-8')).hexdigest(), self.service._cache)
+        self.assertEqual(self.service.stats(), {'entries': 2, 'hits': 1, 'misses': 2, 'hit_rate': 1 / 3})
+
+    def test_least_recently_used_result_is_evicted(self):
+        with mock.patch.object(LanguageDetectionService, '_detect_uncached', autospec=True,
+                               return_value=('pt', 0.99)) as detect:
+            self.service.detect('primeiro')
+            self.service.detect('segundo')
+            self.service.detect('primeiro')
+            self.service.detect('terceiro')
+            self.service.detect('primeiro')
+            self.service.detect('segundo')
+        self.assertEqual([call.args[1] for call in detect.call_args_list],
+                         ['primeiro', 'segundo', 'terceiro', 'segundo'])
+        self.assertEqual(self.service.stats()['entries'], 2)
+
+    def test_aws_source_language(self):
+        self.assertEqual(self.service.aws_source_language(PORTUGUESE, 'en'), 'pt')
+
+    def test_short_text_is_left_to_aws(self):
+        self.assertEqual(self.service.aws_source_language('Olá', 'en'), 'auto')
+
+    def test_unconfident_detection_is_left_to_aws(self):
+        with mock.patch.object(self.service, 'detect_with_probability', return_value=('pt', 0.5)):
+            self.assertEqual(self.service.aws_source_language(PORTUGUESE, 'en'), 'auto')
+
+    def test_unsupported_or_target_language_is_left_to_aws(self):
+        with mock.patch.object(self.service, 'detect_with_probability', return_value=('la', 0.99)):
+            self.assertEqual(self.service.aws_source_language(PORTUGUESE, 'en'), 'auto')
+        self.assertEqual(self.service.aws_source_language(PORTUGUESE, 'pt'), 'auto')
+
+
+class SharedLanguageDetectionServiceTests(SimpleTestCase):
+    @override_settings(LANGUAGE_DETECTION={'SAMPLE_CHARS': 500, 'MIN_SAMPLE_CHARS': 10})
+    def test_service_is_created_once_from_the_settings(self):
+        with mock.patch.object(language_detection_service, '_language_detection_service', None):
+            service = get_language_detection_service()
+            self.assertIs(get_language_detection_service(), service)
+        self.assertEqual((service.sample_chars, service.min_sample_chars), (500, 10))
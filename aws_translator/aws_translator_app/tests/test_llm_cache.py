@@ -0,0 +1,146 @@
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from aws_translator_app.services.api.openai_service import OpenAIService
+from aws_translator_app.services.cache.backends import LRUCacheBackend, SQLiteCacheBackend
+from aws_translator_app.services.cache.llm_cache import LLMCacheMissError, LLMResponseCache
+from aws_translator_app.tests.utils import patch_clients
+
+
+def completion(content):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason='stop')],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+    )
+
+
+class LLMCacheModeTests(TestCase):
+    def setUp(self):
+        cache.clear()  # contadores do ratelimit
+        self.openai = mock.Mock()
+        self.openai.chat.completions.create.side_effect = [
+            completion('Primeira resposta.'), completion('Segunda resposta.'),
+        ]
+        aws = mock.Mock()
+        aws.translate_text.side_effect = lambda Text, SourceLanguageCode, TargetLanguageCode, **kwargs: {
+            'TranslatedText': Text, 'SourceLanguageCode': 'pt',
+        }
+        patch_clients(self, aws=aws, openai=self.openai)
+        self.llm_cache = LLMResponseCache(LRUCacheBackend())
+        patcher = mock.patch('aws_translator_app.services.api.openai_service.get_llm_cache',
+                             return_value=self.llm_cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def simplify(self, cache_mode, text='O texto original.'):
+        return OpenAIService().simplify(text, 'Física', 'Formal', False, 'gpt-4o-mini', cache_mode=cache_mode).text
+
+    def test_bypass_always_calls_the_api(self):
+        self.assertEqual(self.simplify('bypass'), 'Primeira resposta.')
+        self.assertEqual(self.simplify('bypass'), 'Segunda resposta.')
+        self.assertEqual(self.openai.chat.completions.create.call_count, 2)
+
+    def test_prefer_reuses_the_stored_response(self):
+        self.assertEqual(self.simplify('prefer'), 'Primeira resposta.')
+        self.assertEqual(self.simplify('prefer'), 'Primeira resposta.')
+        self.assertEqual(self.openai.chat.completions.create.call_count, 1)
+        self.assertEqual(self.llm_cache.stats()['hits'], 1)
+
+    def test_bypass_does_not_store(self):
+        self.simplify('bypass')
+        with self.assertRaises(LLMCacheMissError):
+            self.simplify('only')
+
+    def test_only_never_calls_the_api(self):
+        with self.assertRaises(LLMCacheMissError):
+            self.simplify('only')
+        self.openai.chat.completions.create.assert_not_called()
+
+        self.simplify('prefer')
+        self.assertEqual(self.simplify('only'), 'Primeira resposta.')
+        self.assertEqual(self.openai.chat.completions.create.call_count, 1)
+
+    def test_key_depends_on_the_prompt(self):
+        self.simplify('prefer')
+        with self.assertRaises(LLMCacheMissError):
+            self.simplify('only', text='Outro texto.')
+
+    def test_translate_view_returns_404_on_cache_miss(self):
+        api = APIClient()
+        payload = {
+            'text': 'A força normal é perpendicular à superfície.',
+            'target_language': 'en',
+            'speciality': 'Física',
+            'style': 'Formal',
+            'complexity_level': 'Básico',
+            'model': 'gpt-4o-mini',
+            'bleu_mode': 'off',
+        }
+        response = api.post(reverse('translate'), {**payload, 'cache': 'only'}, format='json')
+        self.assertEqual(response.status_code, 404)
+        self.openai.chat.completions.create.assert_not_called()
+
+        response = api.post(reverse('translate'), {**payload, 'cache': 'prefer'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        response = api.post(reverse('translate'), {**payload, 'cache': 'only'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.openai.chat.completions.create.call_count, 1)
+
+
+class SQLiteByteBudgetTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'cache.sqlite3')
+        patcher = mock.patch('aws_translator_app.services.cache.backends.time')
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.clock.time.return_value = 1000.0
+
+    def set(self, backend, key):
+        # 'k1' + '"xxxxxxxx"' ocupam 12 bytes
+        backend.set(key, 'x' * 8)
+        self.clock.time.return_value += 1
+
+    def test_least_recently_used_entries_are_removed_to_fit(self):
+        backend = SQLiteCacheBackend(self.path, max_entries=0, max_bytes=30)
+        self.set(backend, 'k1')
+        self.set(backend, 'k2')
+        backend.get('k1')
+        self.clock.time.return_value += 1
+        self.set(backend, 'k3')
+
+        self.assertIsNone(backend.get('k2'))
+        self.assertEqual(backend.get('k1'), 'x' * 8)
+        self.assertEqual(backend.stats()['bytes'], 24)
+
+    def test_value_larger_than_the_budget_is_not_stored(self):
+        backend = SQLiteCacheBackend(self.path, max_bytes=12)
+        self.set(backend, 'k1')
+        backend.set('k2', 'x' * 100)
+        self.assertIsNone(backend.get('k2'))
+        self.assertEqual(backend.get('k1'), 'x' * 8)
+
+    def test_bytes_follow_overwrites_and_deletes(self):
+        backend = SQLiteCacheBackend(self.path, max_bytes=100)
+        self.set(backend, 'k1')
+        backend.set('k1', 'x' * 18)
+        self.assertEqual(backend.stats()['bytes'], 22)
+        backend.delete('k1')
+        self.assertEqual(backend.stats()['bytes'], 0)
+
+    def test_budget_is_shared_between_instances(self):
+        first = SQLiteCacheBackend(self.path, max_bytes=24)
+        second = SQLiteCacheBackend(self.path, max_bytes=24)
+        self.set(first, 'k1')
+        self.set(second, 'k2')
+        self.set(second, 'k3')
+        self.assertIsNone(first.get('k1'))
+        self.assertEqual(first.stats()['bytes'], 24)
@@ -0,0 +1,65 @@
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+from aws_translator_app.constants import AVAILABLE_MODELS, LANGUAGES
+from aws_translator_app.metadata import METADATA_PAYLOADS, build_metadata, etag_matches
+
+
+class EtagMatchesTests(SimpleTestCase):
+    def test_matching_etag(self):
+        self.assertTrue(etag_matches('"abc"', '"abc"'))
+        self.assertTrue(etag_matches('"outro", "abc"', '"abc"'))
+
+    def test_weak_comparison_and_wildcard(self):
+        self.assertTrue(etag_matches('W/"abc"', '"abc"'))
+        self.assertTrue(etag_matches('*', '"abc"'))
+
+    def test_different_or_missing_etag(self):
+        self.assertFalse(etag_matches('"outro"', '"abc"'))
+        self.assertFalse(etag_matches('abc', '"abc"'))
+        self.assertFalse(etag_matches('', '"abc"'))
+
+
+class MetadataPayloadTests(SimpleTestCase):
+    def test_each_payload_has_its_own_etag(self):
+        etags = [payload.etag for payload in METADATA_PAYLOADS.values()]
+        self.assertEqual(sorted(METADATA_PAYLOADS),
+                         ['complexity_levels', 'languages', 'metadata', 'models', 'specialities', 'styles'])
+        self.assertEqual(len(set(etags)), len(etags))
+        self.assertTrue(all(etag.startswith('"') and etag.endswith('"') for etag in etags))
+
+    def test_combined_payload_contains_every_list(self):
+        self.assertEqual(sorted(build_metadata()),
+                         ['complexity_levels', 'languages', 'models', 'specialities', 'styles'])
+
+
+@override_settings(METADATA={'MAX_AGE': 120})
+class MetadataViewTests(SimpleTestCase):
+    def test_languages(self):
+        response = self.client.get(reverse('languages'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response['ETag'], METADATA_PAYLOADS['languages'].etag)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=120')
+        self.assertEqual(response.json(), [{'name': name, 'code': code} for name, code in LANGUAGES.items()])
+
+    def test_combined_metadata(self):
+        response = self.client.get(reverse('metadata'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], METADATA_PAYLOADS['metadata'].etag)
+        self.assertEqual(response.json()['models'], [{'name': model} for model in AVAILABLE_MODELS])
+        self.assertEqual(response.json(), build_metadata())
+
+    def test_current_etag_gets_not_modified(self):
+        etag = METADATA_PAYLOADS['metadata'].etag
+        response = self.client.get(reverse('metadata'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=120')
+
+    def test_stale_etag_gets_the_payload(self):
+        # O ETag de outro endpoint não vale para este
+        response = self.client.get(reverse('styles'), HTTP_IF_NONE_MATCH=METADATA_PAYLOADS['models'].etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, METADATA_PAYLOADS['styles'].body)
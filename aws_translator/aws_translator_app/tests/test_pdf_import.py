@@ -0,0 +1,69 @@
+import io
+import os
+from unittest import mock
+
+import PyPDF2
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+from reportlab.pdfgen import canvas
+
+from aws_translator_app.services.document_service import DocumentService
+
+extract_text = PyPDF2.PageObject.extract_text
+
+
+def pdf_file(*pages):
+    """
+    Builds a PDF with one line of text per page (an empty string gives a blank page).
+    """
+    buffer = io.BytesIO()
+    document = canvas.Canvas(buffer)
+    for text in pages:
+        if text:
+            document.drawString(72, 720, text)
+        document.showPage()
+    document.save()
+    return SimpleUploadedFile('documento.pdf', buffer.getvalue(), content_type='application/pdf')
+
+
+class PdfImportTests(SimpleTestCase):
+    def test_pages_are_extracted_on_demand(self):
+        pages = DocumentService.iter_pdf_pages(pdf_file('Primeira página', 'Segunda página', 'Terceira página'),
+                                               workers=1)
+        with mock.patch.object(PyPDF2.PageObject, 'extract_text', autospec=True, side_effect=extract_text) as spy:
+            self.assertEqual(next(pages).strip(), 'Primeira página')
+            self.assertEqual(spy.call_count, 1)
+            self.assertEqual([page.strip() for page in pages], ['Segunda página', 'Terceira página'])
+            self.assertEqual(spy.call_count, 3)
+
+    def test_import_document_skips_blank_pages(self):
+        text = DocumentService().import_document(pdf_file('Primeira página', '', 'Terceira página'))
+        self.assertEqual(text.split('\n')[0], 'Primeira página')
+        self.assertEqual([line for line in text.split('\n') if line], ['Primeira página', 'Terceira página'])
+
+    def test_iter_document_yields_one_part_per_page(self):
+        parts = list(DocumentService().iter_document(pdf_file('Primeira página', '', 'Terceira página')))
+        self.assertEqual([part.strip() for part in parts], ['Primeira página', 'Terceira página'])
+
+    @override_settings(DOCUMENT_IMPORT={'PDF_PARALLEL_MIN_PAGES': 4, 'PDF_PAGES_PER_TASK': 2})
+    def test_parallel_extraction_keeps_page_order(self):
+        texts = [f'Página {number}' for number in range(1, 8)]
+        with mock.patch('aws_translator_app.services.document_service._get_pdf_pool') as get_pool:
+            # Um executor síncrono no lugar do pool de processos: os lotes são extraídos do arquivo temporário
+            get_pool.return_value.submit.side_effect = lambda fn, *args: mock.Mock(result=lambda: fn(*args))
+            pages = list(DocumentService.iter_pdf_pages(pdf_file(*texts), workers=2))
+
+        self.assertEqual([page.strip() for page in pages], texts)
+        calls = get_pool.return_value.submit.call_args_list
+        self.assertEqual([call.args[2:] for call in calls], [(0, 2), (2, 4), (4, 6), (6, 7)])
+        # A cópia do upload em memória lida pelos processos é removida ao final
+        self.assertFalse(os.path.exists(calls[0].args[1]))
+
+    def test_small_pdf_is_not_sent_to_the_pool(self):
+        with mock.patch('aws_translator_app.services.document_service._get_pdf_pool') as get_pool:
+            list(DocumentService.iter_pdf_pages(pdf_file('Única página'), workers=4))
+        get_pool.assert_not_called()
+
+    def test_invalid_pdf(self):
+        with self.assertRaisesMessage(Exception, 'Erro ao importar PDF'):
+            DocumentService().import_document(SimpleUploadedFile('documento.pdf', b'not a pdf'))
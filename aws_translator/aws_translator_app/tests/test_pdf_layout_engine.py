@@ -0,0 +1,96 @@
+import io
+from unittest import mock
+
+import PyPDF2
+from django.test import SimpleTestCase
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+from aws_translator_app.services.document_service import DocumentService
+from aws_translator_app.services.pdf_layout_engine import LayoutLine, PdfLayoutEngine
+
+PARAGRAPH = (
+    'O pipeline de tradução simplifica documentos técnicos antes de traduzi-los. As métricas de '
+    'legibilidade são calculadas para o texto original e para o texto simplificado, de modo que '
+    'o usuário possa comparar o quanto o resultado ficou mais fácil de ler.'
+)
+
+
+def legacy_wrap(paragraph, max_width, font_name='Helvetica', font_size=12):
+    # Quebra de linhas da versão anterior de DocumentService._export_pdf
+    lines, buffer = [], ''
+    for word in paragraph.split(' '):
+        if stringWidth(buffer + word, font_name, font_size) < max_width:
+            buffer += word + ' '
+        else:
+            lines.append(buffer.strip())
+            buffer = word + ' '
+    lines.append(buffer.strip())
+    return lines
+
+
+class PdfLayoutEngineTests(SimpleTestCase):
+    def setUp(self):
+        self.engine = PdfLayoutEngine()
+
+    def test_wrap_matches_the_previous_line_breaks(self):
+        for max_width in (150, 300, 512):
+            engine = PdfLayoutEngine(page_size=(max_width + 100, 792))
+            self.assertEqual(engine.wrap(PARAGRAPH, 'Helvetica', 12), legacy_wrap(PARAGRAPH, max_width))
+
+    def test_wrapped_lines_fit_the_page(self):
+        lines = self.engine.wrap(PARAGRAPH * 3, 'Helvetica', 12)
+        self.assertGreater(len(lines), 3)
+        self.assertTrue(all(stringWidth(line, 'Helvetica', 12) < self.engine.max_width for line in lines))
+        self.assertEqual(' '.join(lines).split(), (PARAGRAPH * 3).split())
+
+    def test_word_wider_than_the_page_gets_its_own_line(self):
+        long_word = 'x' * 200
+        self.assertEqual(self.engine.wrap(f'antes {long_word} depois', 'Helvetica', 12), ['antes', long_word, 'depois'])
+
+    def test_each_word_is_measured_once(self):
+        with mock.patch('aws_translator_app.services.pdf_layout_engine.stringWidth', wraps=stringWidth) as measure:
+            # Um tamanho de fonte exclusivo do teste começa com a memória de larguras vazia
+            self.engine.wrap('um dois um dois um dois', 'Helvetica', 11.25)
+            self.engine.wrap('dois um', 'Helvetica', 11.25)
+        self.assertEqual(sorted(call.args[0] for call in measure.call_args_list), [' ', 'dois', 'um'])
+
+    def test_paginate(self):
+        # Página de 200 pt com margens de 10 pt e fonte de 10 pt (entrelinha 12): 15 linhas por página
+        engine = PdfLayoutEngine(page_size=(200, 200), margin=10, font_size=10)
+        lines = [LayoutLine(str(number), 'Helvetica', 10) for number in range(40)]
+        pages = engine.paginate(lines)
+        self.assertEqual([len(page) for page in pages], [15, 15, 10])
+        self.assertEqual([line for page in pages for line in page], lines)
+        self.assertEqual(engine.paginate([]), [[]])
+
+    def test_larger_fonts_take_more_room(self):
+        engine = PdfLayoutEngine(page_size=(200, 200), margin=10, font_size=10)
+        lines = [LayoutLine('Título', 'Helvetica-Bold', 20)] * 10
+        self.assertEqual([len(page) for page in engine.paginate(lines)], [8, 2])
+
+    def test_render_draws_every_page(self):
+        engine = PdfLayoutEngine(page_size=(300, 200), margin=10)
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pagesize=engine.page_size)
+        engine.render(c, engine.paginate(list(engine.heading('Título')) + list(engine.paragraphs(PARAGRAPH * 5))))
+        c.save()
+
+        reader = PyPDF2.PdfReader(io.BytesIO(buffer.getvalue()))
+        self.assertGreater(len(reader.pages), 1)
+        text = ' '.join(page.extract_text() for page in reader.pages)
+        self.assertTrue(text.startswith('Título'))
+        self.assertEqual(text.split()[-1], PARAGRAPH.split()[-1])
+
+
+class ExportPdfTests(SimpleTestCase):
+    def test_export_includes_text_and_metrics(self):
+        buffer = io.BytesIO()
+        metrics = {'flesch_reading_ease': 55.5}
+        DocumentService._export_pdf('\n'.join([PARAGRAPH] * 40), buffer, metrics, metrics)
+
+        reader = PyPDF2.PdfReader(io.BytesIO(buffer.getvalue()))
+        self.assertGreater(len(reader.pages), 1)
+        text = ''.join(page.extract_text() for page in reader.pages)
+        self.assertIn('Texto Simplificado e Traduzido:', text)
+        self.assertIn('Índice de Flesch Reading Ease: 55.50', text)
@@ -0,0 +1,110 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from aws_translator_app.models import QualityScore
+from aws_translator_app.services.language.bleu_score_service import BleuScoreService
+from aws_translator_app.services.language.quality_scoring_service import QualityScoringService
+
+ORIGINAL = 'A força normal é perpendicular à superfície.'
+TRANSLATED = 'The normal force is perpendicular to the surface.'
+
+
+class SynchronousExecutor:
+    """
+    Runs the background scoring inline, so the test sees its result.
+    """
+
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+class QualityScoringServiceTests(TestCase):
+    def setUp(self):
+        self.aws = mock.Mock()
+        self.aws.lookup_cached_translation.return_value = None
+        self.aws.translate_long_text.return_value = (ORIGINAL, 'en')
+        self.bleu = BleuScoreService(self.aws)
+
+    def score(self, mode, sample_rate=0.1):
+        return QualityScoringService(self.bleu, sample_rate=sample_rate).score(ORIGINAL, TRANSLATED, 'pt', 'en', mode)
+
+    def test_always_back_translates(self):
+        result = self.score('always')
+        self.assertEqual(result['bleu_mode'], 'always')
+        self.assertAlmostEqual(result['bleu_score'], 1.0)
+        self.aws.translate_long_text.assert_called_once_with(TRANSLATED, 'pt')
+
+    def test_off_does_not_call_aws(self):
+        self.assertEqual(self.score('off'), {'bleu_score': None, 'bleu_mode': 'off'})
+        self.aws.lookup_cached_translation.assert_not_called()
+        self.aws.translate_long_text.assert_not_called()
+
+    def test_local_uses_only_the_cache(self):
+        self.assertEqual(self.score('local'), {'bleu_score': None, 'bleu_mode': 'skipped'})
+        self.aws.translate_long_text.assert_not_called()
+
+        self.aws.lookup_cached_translation.return_value = (ORIGINAL, 'en')
+        result = self.score('local')
+        self.assertEqual(result['bleu_mode'], 'local')
+        self.assertAlmostEqual(result['bleu_score'], 1.0)
+        self.aws.translate_long_text.assert_not_called()
+
+    def test_cached_back_translation_wins_in_every_mode(self):
+        self.aws.lookup_cached_translation.return_value = (ORIGINAL, 'en')
+        for mode in ('sampled', 'async'):
+            self.assertEqual(self.score(mode)['bleu_mode'], 'local')
+        self.aws.translate_long_text.assert_not_called()
+        self.assertFalse(QualityScore.objects.exists())
+
+    @mock.patch('aws_translator_app.services.language.quality_scoring_service.random.random')
+    def test_sampled_scores_the_configured_fraction(self, random):
+        random.return_value = 0.05
+        self.assertEqual(self.score('sampled', sample_rate=0.1)['bleu_mode'], 'sampled')
+        random.return_value = 0.1
+        self.assertEqual(self.score('sampled', sample_rate=0.1), {'bleu_score': None, 'bleu_mode': 'skipped'})
+        self.assertEqual(self.aws.translate_long_text.call_count, 1)
+
+    def test_sampled_with_rate_bounds(self):
+        self.assertEqual(self.score('sampled', sample_rate=0)['bleu_mode'], 'skipped')
+        self.assertEqual(self.score('sampled', sample_rate=1)['bleu_mode'], 'sampled')
+
+    @mock.patch('aws_translator_app.services.language.quality_scoring_service._get_executor',
+                return_value=SynchronousExecutor())
+    def test_async_persists_the_score(self, executor):
+        result = self.score('async')
+        self.assertEqual((result['bleu_score'], result['bleu_mode']), (None, 'async'))
+
+        record = QualityScore.objects.get(pk=result['quality_score_id'])
+        self.assertEqual(record.status, QualityScore.STATUS_SUCCEEDED)
+        self.assertAlmostEqual(record.bleu_score, 1.0)
+        self.assertEqual((record.source_language_code, record.target_language_code), ('pt', 'en'))
+        self.assertIsNotNone(record.finished_at)
+
+    @mock.patch('aws_translator_app.services.language.quality_scoring_service._get_executor',
+                return_value=SynchronousExecutor())
+    def test_async_records_failures(self, executor):
+        self.aws.translate_long_text.side_effect = RuntimeError('AWS indisponível')
+        with self.assertLogs('aws_translator_app.services.language.quality_scoring_service', 'ERROR'):
+            result = self.score('async')
+        record = QualityScore.objects.get(pk=result['quality_score_id'])
+        self.assertEqual(record.status, QualityScore.STATUS_FAILED)
+        self.assertIn('AWS indisponível', record.error)
+
+    @override_settings(QUALITY_SCORING={'MODE': 'off'})
+    def test_default_mode_comes_from_settings(self):
+        self.assertEqual(QualityScoringService(self.bleu).score(ORIGINAL, TRANSLATED, 'pt')['bleu_mode'], 'off')
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            self.score('never')
+
+
+class QualityScoreDetailViewTests(TestCase):
+    def test_returns_the_stored_score(self):
+        record = QualityScore.objects.create(status=QualityScore.STATUS_SUCCEEDED, bleu_score=0.42)
+        response = APIClient().get(reverse('quality_score_detail', args=[record.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['bleu_score'], 0.42)
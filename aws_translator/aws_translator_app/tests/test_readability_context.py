@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from aws_translator_app.services.language import readability_context
+from aws_translator_app.services.language.readability_context import get_readability_context
+from aws_translator_app.services.language.readability_engine import ReadabilityEngine
+from aws_translator_app.services.language.readability_service import ReadabilityService
+
+TEXTS = {
+    'en': 'The normal force is perpendicular to the surface. Students should understand it first.',
+    'de': 'Die Normalkraft steht senkrecht auf der Oberfläche. Studierende sollten sie zuerst verstehen.',
+}
+
+
+class ReadabilityContextTests(SimpleTestCase):
+    def test_context_is_immutable(self):
+        context = get_readability_context('de')
+        with self.assertRaises(TypeError):
+            context.flesch['base'] = 0
+        with self.assertRaises(TypeError):
+            context.syllables['haus'] = 5
+        with self.assertRaises(AttributeError):
+            context.easy_words.add('Normalkraft')
+        with self.assertRaises(AttributeError):
+            context.language_code = 'en'
+
+    def test_context_is_loaded_once_per_language(self):
+        self.assertIs(get_readability_context('es'), get_readability_context('es'))
+        self.assertIs(get_readability_context('xx'), get_readability_context('en'))
+
+    def test_languages_have_their_own_parameters(self):
+        self.assertEqual(get_readability_context('de').flesch['base'], 180)
+        self.assertTrue(get_readability_context('es').syllables_per_100_words)
+        self.assertFalse(get_readability_context('en').syllables_per_100_words)
+
+    def test_calls_do_not_read_files_or_change_textstat(self):
+        for language_code, text in TEXTS.items():
+            ReadabilityService.calculate_readability(text, language_code)
+
+        with mock.patch.object(readability_context, 'load_readability_context') as load, \
+                mock.patch('builtins.open') as open_file, \
+                mock.patch('textstat.set_lang') as set_lang:
+            for language_code, text in TEXTS.items():
+                ReadabilityService.calculate_readability(text, language_code)
+            ReadabilityService.load_easy_words('en')
+        load.assert_not_called()
+        open_file.assert_not_called()
+        set_lang.assert_not_called()
+
+    def test_parallel_calls_match_sequential_ones(self):
+        expected = {code: ReadabilityEngine(get_readability_context(code)).calculate(text) for code, text in TEXTS.items()}
+        engine = {code: ReadabilityEngine(get_readability_context(code)) for code in TEXTS}
+        jobs = [code for code in TEXTS for _ in range(20)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda code: (code, engine[code].calculate(TEXTS[code])), jobs))
+        for code, metrics in results:
+            self.assertEqual(metrics, expected[code])
@@ -0,0 +1,77 @@
+import warnings
+from unittest import mock
+
+import textstat
+from django.test import SimpleTestCase
+
+from aws_translator_app.services.language import readability_context
+from aws_translator_app.services.language.readability_engine import ReadabilityEngine
+
+TEXTS = {
+    'en': ('The translation pipeline simplifies technical documents before translating them. Readability '
+           'metrics are computed for both texts, so users can compare them! Does it help? In most cases it does.'),
+    'es': ('La fuerza normal es perpendicular a la superficie. Los estudiantes deben comprender este concepto '
+           'antes de resolver problemas complejos. ¿Es difícil? No tanto.'),
+    'de': ('Die Normalkraft steht senkrecht auf der Oberfläche. Studierende sollten dieses Konzept verstehen, '
+           'bevor sie komplizierte Aufgaben lösen. Ist das schwierig? Nicht wirklich.'),
+    'pt': ('A força normal é perpendicular à superfície. Os estudantes devem compreender este conceito antes '
+           'de resolver problemas complexos. É difícil? Nem tanto.'),
+}
+METRICS = [
+    'flesch_reading_ease',
+    'flesch_kincaid_grade',
+    'smog_index',
+    'coleman_liau_index',
+    'automated_readability_index',
+    'dale_chall_readability_score',
+]
+
+
+def textstat_metrics(text, language_code):
+    textstat.set_lang(language_code)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return {name: getattr(textstat, name)(text) for name in METRICS}
+    finally:
+        textstat.set_lang('en')
+
+
+class ReadabilityEngineTests(SimpleTestCase):
+    def engine(self, language_code):
+        # Sem a lista de palavras fáceis do projeto, o Dale-Chall usa a mesma lista que o textstat
+        with mock.patch.dict(readability_context.LOCAL_EASY_WORDS_FILES, clear=True):
+            return ReadabilityEngine(readability_context.load_readability_context(language_code))
+
+    def test_english_matches_textstat(self):
+        self.assertEqual(self.engine('en').calculate(TEXTS['en']), textstat_metrics(TEXTS['en'], 'en'))
+
+    def test_spanish_matches_textstat(self):
+        self.assertEqual(self.engine('es').calculate(TEXTS['es']), textstat_metrics(TEXTS['es'], 'es'))
+
+    def test_german_matches_textstat(self):
+        self.assertEqual(self.engine('de').calculate(TEXTS['de']), textstat_metrics(TEXTS['de'], 'de'))
+
+    def test_portuguese_matches_textstat(self):
+        self.assertEqual(self.engine('pt').calculate(TEXTS['pt']), textstat_metrics(TEXTS['pt'], 'pt'))
+
+    def test_repeated_text_gives_the_same_result(self):
+        engine = self.engine('en')
+        text = TEXTS['en'] + '\n\n' + TEXTS['en']
+        self.assertEqual(engine.calculate(text), textstat_metrics(text, 'en'))
+        self.assertEqual(engine.calculate(text), engine.calculate(text))
+
+    def test_counts_match_textstat(self):
+        text = TEXTS['en']
+        counts = self.engine('en').count(text)
+        textstat.set_lang('en')
+        self.assertEqual(counts.words, textstat.lexicon_count(text))
+        self.assertEqual(counts.sentences, textstat.sentence_count(text))
+        self.assertEqual(counts.syllables, textstat.syllable_count(text))
+        self.assertEqual(counts.polysyllables, textstat.polysyllabcount(text))
+
+    def test_empty_text(self):
+        metrics = self.engine('en').calculate('')
+        self.assertEqual(metrics['smog_index'], 0.0)
+        self.assertEqual(metrics['automated_readability_index'], 0.0)
+        self.assertEqual(metrics['dale_chall_readability_score'], 0.0)
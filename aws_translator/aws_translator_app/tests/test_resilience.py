@@ -0,0 +1,316 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+import openai
+from botocore.exceptions import ClientError
+from django.test import SimpleTestCase, override_settings
+
+from aws_translator_app.services.api.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Deadline,
+    DeadlineExceededError,
+    ResiliencePolicy,
+    get_resilience_policy,
+    is_retryable,
+    resilience_stats,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeCall:
+    """
+    Returns or raises the given outcomes in order, recording the timeout of each attempt.
+    """
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.timeouts = []
+
+    def __call__(self, timeout):
+        self.timeouts.append(timeout)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def aws_error(code, status=400):
+    return ClientError({'Error': {'Code': code}, 'ResponseMetadata': {'HTTPStatusCode': status}}, 'TranslateText')
+
+
+def openai_error(cls, status, body=None):
+    response = httpx.Response(status, request=httpx.Request('POST', 'https://api.openai.com/v1/chat/completions'))
+    return cls('error', response=response, body=body)
+
+
+class ClockTestCase(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch(
+            'aws_translator_app.services.api.resilience.time',
+            SimpleNamespace(monotonic=self.clock.monotonic, sleep=self.clock.sleep),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class IsRetryableTests(SimpleTestCase):
+    def test_aws_throttling_and_server_errors_are_retried(self):
+        self.assertTrue(is_retryable(aws_error('ThrottlingException')))
+        self.assertTrue(is_retryable(aws_error('ServiceUnavailableException', 503)))
+        self.assertTrue(is_retryable(aws_error('SomethingElse', 500)))
+
+    def test_aws_client_errors_are_not_retried(self):
+        self.assertFalse(is_retryable(aws_error('AccessDeniedException', 403)))
+        self.assertFalse(is_retryable(aws_error('ValidationException')))
+
+    def test_openai_transient_errors_are_retried(self):
+        self.assertTrue(is_retryable(openai_error(openai.RateLimitError, 429)))
+        self.assertTrue(is_retryable(openai_error(openai.InternalServerError, 500)))
+        self.assertTrue(is_retryable(openai_error(openai.ConflictError, 409)))
+        self.assertTrue(is_retryable(
+            openai.APIConnectionError(request=httpx.Request('POST', 'https://api.openai.com'))
+        ))
+
+    def test_openai_definitive_errors_are_not_retried(self):
+        # Cota esgotada também responde 429, mas não se resolve com novas tentativas
+        self.assertFalse(is_retryable(openai_error(openai.RateLimitError, 429, {'code': 'insufficient_quota'})))
+        self.assertFalse(is_retryable(openai_error(openai.BadRequestError, 400)))
+        self.assertFalse(is_retryable(openai_error(openai.AuthenticationError, 401)))
+
+    def test_network_errors_are_retried(self):
+        self.assertTrue(is_retryable(TimeoutError()))
+        self.assertTrue(is_retryable(ConnectionResetError()))
+
+    def test_other_errors_are_not_retried(self):
+        self.assertFalse(is_retryable(ValueError()))
+        self.assertFalse(is_retryable(CircuitOpenError()))
+        self.assertFalse(is_retryable(DeadlineExceededError()))
+
+
+class DeadlineTests(ClockTestCase):
+    def test_remaining_and_expired(self):
+        deadline = Deadline(10)
+        self.assertEqual(deadline.remaining(), 10)
+        self.clock.now += 4
+        self.assertEqual(deadline.remaining(), 6)
+        self.assertFalse(deadline.expired())
+        self.clock.now += 7
+        self.assertEqual(deadline.remaining(), 0)
+        self.assertTrue(deadline.expired())
+
+
+class CircuitBreakerTests(ClockTestCase):
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker('svc', failure_threshold=3, recovery_timeout=30)
+        for _ in range(2):
+            breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.before_call()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        self.assertEqual(breaker.stats()['rejected_calls'], 1)
+        self.assertEqual(breaker.stats()['times_opened'], 1)
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker('svc', failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_half_open_allows_a_single_probe(self):
+        breaker = CircuitBreaker('svc', failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        self.clock.now += 30
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        breaker.before_call()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.before_call()
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker('svc', failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        self.clock.now += 30
+        breaker.before_call()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.clock.now += 29
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        self.assertEqual(breaker.stats()['times_opened'], 2)
+
+    def test_released_probe_can_be_retried(self):
+        breaker = CircuitBreaker('svc', failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        self.clock.now += 30
+        breaker.before_call()
+        breaker.release_probe()
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        breaker.before_call()
+
+    def test_zero_threshold_disables_breaker(self):
+        breaker = CircuitBreaker('svc', failure_threshold=0)
+        for _ in range(10):
+            breaker.record_failure()
+        breaker.before_call()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+class ResiliencePolicyTests(ClockTestCase):
+    def policy(self, **config):
+        config = {'MAX_ATTEMPTS': 3, 'DEADLINE': 60, 'BASE_DELAY': 1, 'MAX_DELAY': 8, 'FAILURE_THRESHOLD': 5, **config}
+        return ResiliencePolicy('svc', config)
+
+    def test_retries_transient_errors(self):
+        fn = FakeCall(TimeoutError(), aws_error('ThrottlingException'), 'ok')
+        with mock.patch('aws_translator_app.services.api.resilience.random.uniform', side_effect=lambda a, b: b):
+            policy = self.policy()
+            self.assertEqual(policy.call(fn), 'ok')
+        self.assertEqual(self.clock.sleeps, [1, 2])
+        self.assertEqual(fn.timeouts, [60, 59, 57])
+        self.assertEqual(policy.stats()['retries'], 2)
+        self.assertEqual(policy.stats()['circuit']['consecutive_failures'], 0)
+
+    def test_definitive_error_is_not_retried(self):
+        fn = FakeCall(aws_error('ValidationException'), 'ok')
+        policy = self.policy()
+        with self.assertRaises(ClientError):
+            policy.call(fn)
+        self.assertEqual(len(fn.timeouts), 1)
+        self.assertEqual(policy.stats()['circuit']['consecutive_failures'], 0)
+
+    def test_attempts_exhausted(self):
+        fn = FakeCall(TimeoutError(), TimeoutError(), TimeoutError())
+        policy = self.policy()
+        with self.assertRaises(TimeoutError):
+            policy.call(fn)
+        self.assertEqual(len(fn.timeouts), 3)
+        self.assertEqual(policy.stats()['failures'], 1)
+
+    def test_backoff_beyond_deadline(self):
+        fn = FakeCall(TimeoutError(), 'ok')
+        with mock.patch('aws_translator_app.services.api.resilience.random.uniform', return_value=5):
+            policy = self.policy(DEADLINE=4)
+            with self.assertRaises(DeadlineExceededError):
+                policy.call(fn)
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(policy.stats()['deadline_exceeded'], 1)
+
+    def test_backoff_is_capped(self):
+        policy = self.policy(BASE_DELAY=1, MAX_DELAY=4)
+        with mock.patch('aws_translator_app.services.api.resilience.random.uniform', side_effect=lambda a, b: b):
+            self.assertEqual([policy.backoff(attempt) for attempt in range(1, 6)], [1, 2, 4, 4, 4])
+
+    def test_open_circuit_rejects_without_calling(self):
+        policy = self.policy(MAX_ATTEMPTS=1, FAILURE_THRESHOLD=1)
+        with self.assertRaises(TimeoutError):
+            policy.call(FakeCall(TimeoutError()))
+        fn = FakeCall('ok')
+        with self.assertRaises(CircuitOpenError):
+            policy.call(fn)
+        self.assertEqual(fn.timeouts, [])
+
+    def test_acall_retries(self):
+        outcomes = FakeCall(TimeoutError(), 'ok')
+
+        async def fn(timeout):
+            return outcomes(timeout)
+
+        async def no_sleep(seconds):
+            self.clock.sleep(seconds)
+
+        policy = self.policy()
+        with mock.patch('aws_translator_app.services.api.resilience.asyncio.sleep', no_sleep):
+            self.assertEqual(asyncio.run(policy.acall(fn)), 'ok')
+        self.assertEqual(len(outcomes.timeouts), 2)
+
+
+class HedgingTests(SimpleTestCase):
+    def policy(self):
+        return ResiliencePolicy('svc', {'HEDGE_AFTER': 0.01, 'DEADLINE': 5, 'MAX_ATTEMPTS': 1})
+
+    def test_slow_attempt_is_hedged(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = []
+
+        def fn(timeout):
+            calls.append(timeout)
+            if len(calls) == 1:
+                release.wait(5)
+                return 'slow'
+            return 'fast'
+
+        policy = self.policy()
+        self.assertEqual(policy.call(fn), 'fast')
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(policy.stats()['hedged'], 1)
+
+    def test_fast_attempt_is_not_hedged(self):
+        fn = FakeCall('ok')
+        policy = self.policy()
+        self.assertEqual(policy.call(fn, hedge=True), 'ok')
+        self.assertEqual(len(fn.timeouts), 1)
+        self.assertEqual(policy.stats()['hedged'], 0)
+
+    def test_async_slow_attempt_is_hedged_and_cancelled(self):
+        calls = []
+        cancelled = []
+
+        async def fn(timeout):
+            calls.append(timeout)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+                return 'slow'
+            return 'fast'
+
+        async def run():
+            result = await policy.acall(fn)
+            await asyncio.sleep(0)
+            return result
+
+        policy = self.policy()
+        self.assertEqual(asyncio.run(run()), 'fast')
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cancelled, [True])
+
+
+class SharedPolicyTests(SimpleTestCase):
+    @override_settings(RESILIENCE={'servico-teste': {'MAX_ATTEMPTS': 7, 'FAILURE_THRESHOLD': 2}})
+    def test_policy_is_created_once_from_the_settings(self):
+        policies = mock.patch.dict('aws_translator_app.services.api.resilience._policies', clear=True)
+        policies.start()
+        self.addCleanup(policies.stop)
+
+        policy = get_resilience_policy('servico-teste')
+        self.assertIs(get_resilience_policy('servico-teste'), policy)
+        self.assertEqual(policy.max_attempts, 7)
+        self.assertEqual(policy.breaker.failure_threshold, 2)
+        self.assertEqual(list(resilience_stats()), ['servico-teste'])
+        self.assertEqual(resilience_stats()['servico-teste']['circuit']['state'], CircuitBreaker.CLOSED)
@@ -0,0 +1,160 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from aws_translator_app.services.api.token_budget import (
+    DEFAULT_MODEL_LIMITS,
+    ModelLimits,
+    TokenBudget,
+    TokenBudgeter,
+    TokenCounter,
+    estimate_tokens,
+    merge_usage,
+    usage_from_budget,
+)
+
+LIMITS = ModelLimits(context_window=1000, max_output_tokens=300, encoding='test')
+CONFIG = {'OUTPUT_RATIO': 1.5, 'SUMMARY_OUTPUT_RATIO': 0.6, 'MIN_OUTPUT_TOKENS': 50}
+# Tokens das instruções e da formatação das mensagens, além do texto
+MESSAGES_OVERHEAD = 100
+
+
+class FakeTokenCounter:
+    """
+    Counts one token per word, with a fixed overhead per request.
+    """
+
+    limits = LIMITS
+    exact = True
+
+    def count(self, text):
+        return len(text.split())
+
+    def count_messages(self, messages):
+        return MESSAGES_OVERHEAD + sum(self.count(message['content']) for message in messages)
+
+
+def words(count):
+    return ' '.join(['palavra'] * count)
+
+
+class TokenBudgeterTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch(
+            'aws_translator_app.services.api.token_budget.get_token_counter', return_value=FakeTokenCounter()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.budgeter = TokenBudgeter(CONFIG)
+
+    def plan(self, text_tokens, summarize=False, max_tokens=None):
+        text = words(text_tokens)
+        return self.budgeter.plan([{'role': 'user', 'content': text}], text, 'gpt-4o-mini', summarize, max_tokens)
+
+    def test_output_is_proportional_to_the_text(self):
+        budget = self.plan(100)
+        self.assertEqual((budget.prompt_tokens, budget.text_tokens), (200, 100))
+        self.assertEqual((budget.max_tokens, budget.desired_output_tokens, budget.fits), (150, 150, True))
+        self.assertTrue(budget.exact)
+
+    def test_summary_uses_its_own_ratio(self):
+        budget = self.plan(100, summarize=True)
+        self.assertEqual((budget.max_tokens, budget.desired_output_tokens, budget.fits), (60, 60, True))
+
+    def test_short_text_gets_the_minimum_output(self):
+        budget = self.plan(10)
+        self.assertEqual((budget.max_tokens, budget.desired_output_tokens, budget.fits), (50, 50, True))
+
+    def test_output_above_the_model_limit_does_not_fit(self):
+        budget = self.plan(300)
+        self.assertEqual((budget.max_tokens, budget.desired_output_tokens, budget.fits), (300, 450, False))
+
+    def test_input_that_fills_the_context_window_does_not_fit(self):
+        # 900 tokens de entrada deixam 100 para a resposta
+        budget = self.plan(800, summarize=True)
+        self.assertEqual((budget.max_tokens, budget.desired_output_tokens, budget.fits), (100, 480, False))
+
+    def test_requested_max_tokens_is_capped_by_the_model(self):
+        budget = self.plan(10, max_tokens=1000)
+        self.assertEqual((budget.max_tokens, budget.desired_output_tokens, budget.fits), (300, 1000, True))
+
+    def test_requested_max_tokens_fits_the_remaining_context(self):
+        budget = self.plan(880, max_tokens=20)
+        self.assertEqual((budget.max_tokens, budget.desired_output_tokens, budget.fits), (20, 20, True))
+        self.assertEqual(budget.prompt_tokens + budget.max_tokens, LIMITS.context_window)
+
+    def test_requested_max_tokens_without_room_for_the_response(self):
+        budget = self.plan(890, max_tokens=100)
+        self.assertEqual((budget.max_tokens, budget.fits), (10, False))
+        budget = self.plan(900, max_tokens=100)
+        self.assertEqual((budget.max_tokens, budget.fits), (1, False))
+
+    def test_max_text_tokens(self):
+        self.assertEqual(self.budgeter.max_text_tokens(100, 'gpt-4o-mini', False), 200)
+        self.assertEqual(self.budgeter.max_text_tokens(100, 'gpt-4o-mini', True), 500)
+        self.assertEqual(self.budgeter.max_text_tokens(900, 'gpt-4o-mini', False), 20)
+        self.assertEqual(self.budgeter.max_text_tokens(990, 'gpt-4o-mini', False), 1)
+
+    def test_max_text_tokens_fit_the_plan(self):
+        self.assertTrue(self.plan(self.budgeter.max_text_tokens(MESSAGES_OVERHEAD, 'gpt-4o-mini', False)).fits)
+        self.assertTrue(self.plan(self.budgeter.max_text_tokens(MESSAGES_OVERHEAD, 'gpt-4o-mini', True),
+                                  summarize=True).fits)
+        self.assertFalse(self.plan(self.budgeter.max_text_tokens(MESSAGES_OVERHEAD, 'gpt-4o-mini', False) + 1).fits)
+
+
+class TokenCounterTests(SimpleTestCase):
+    def test_without_tiktoken_the_count_is_estimated(self):
+        with mock.patch('aws_translator_app.services.api.token_budget.tiktoken', None):
+            counter = TokenCounter('gpt-4o-mini')
+        self.assertFalse(counter.exact)
+        self.assertEqual(counter.count('abcdef'), 2)
+        # 3 tokens do início da resposta, 3 por mensagem e os valores de cada campo
+        self.assertEqual(counter.count_messages([{'role': 'user', 'content': 'abcdef'}]), 3 + 3 + 2 + 2)
+
+    def test_encoding_of_the_model(self):
+        fake_tiktoken = mock.Mock()
+        fake_tiktoken.get_encoding.return_value.encode.side_effect = lambda text, **kwargs: text.split()
+        with mock.patch('aws_translator_app.services.api.token_budget.tiktoken', fake_tiktoken):
+            counter = TokenCounter('gpt-4o-mini')
+            unknown = TokenCounter('modelo-desconhecido')
+        self.assertTrue(counter.exact)
+        self.assertEqual(counter.count('um dois três'), 3)
+        self.assertEqual(fake_tiktoken.get_encoding.call_args_list, [mock.call('o200k_base'), mock.call('cl100k_base')])
+        self.assertEqual(unknown.limits, DEFAULT_MODEL_LIMITS)
+
+    def test_unavailable_encoding_falls_back_to_the_estimate(self):
+        fake_tiktoken = mock.Mock()
+        fake_tiktoken.get_encoding.side_effect = OSError('sem rede')
+        with mock.patch('aws_translator_app.services.api.token_budget.tiktoken', fake_tiktoken):
+            counter = TokenCounter('gpt-4o')
+        self.assertFalse(counter.exact)
+        self.assertEqual(counter.count('abc'), 1)
+
+
+class TokenUsageTests(SimpleTestCase):
+    def test_estimate_tokens(self):
+        self.assertEqual(estimate_tokens(''), 0)
+        self.assertEqual(estimate_tokens('abc'), 1)
+        self.assertEqual(estimate_tokens('abcd'), 2)
+        # Caracteres fora do ASCII contam como um token inteiro
+        self.assertEqual(estimate_tokens('ação'), 3)
+        self.assertEqual(estimate_tokens('日本語'), 3)
+
+    def test_usage_from_budget(self):
+        budget = TokenBudget('gpt-4o', 120, 100, 150, 150, LIMITS, True, True)
+        response = mock.Mock(usage=mock.Mock(prompt_tokens=118, completion_tokens=140),
+                             choices=[mock.Mock(finish_reason='length')])
+        self.assertEqual(usage_from_budget(budget, response), {
+            'model': 'gpt-4o', 'exact': True, 'predicted_prompt_tokens': 120, 'max_tokens': 150,
+            'prompt_tokens': 118, 'completion_tokens': 140, 'calls': 1, 'cached_calls': 0, 'truncated_calls': 1,
+        })
+        cached = usage_from_budget(budget, cached=True)
+        self.assertEqual((cached['prompt_tokens'], cached['calls'], cached['cached_calls']), (0, 0, 1))
+
+    def test_merge_usage(self):
+        first = {'model': 'gpt-4o', 'exact': True, 'prompt_tokens': 10, 'calls': 1, 'cached_calls': 0}
+        second = {'model': 'gpt-4o', 'exact': False, 'prompt_tokens': 5, 'calls': 0, 'cached_calls': 1}
+        self.assertEqual(merge_usage([first, second]), {
+            'model': 'gpt-4o', 'exact': False, 'prompt_tokens': 15, 'calls': 1, 'cached_calls': 1,
+        })
+        self.assertEqual(merge_usage([]), {})
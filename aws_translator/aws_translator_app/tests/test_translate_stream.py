@@ -0,0 +1,180 @@
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from aws_translator_app.services.api.resilience import UpstreamUnavailableError
+from aws_translator_app.services.language.glossary_service import ProtectedText
+from aws_translator_app.services.pipeline.translation_pipeline import TranslationPipeline
+
+PAYLOAD = {
+    'text': 'A força normal é perpendicular à superfície.',
+    'target_language': 'en',
+    'speciality': 'Física',
+    'style': 'Formal',
+    'complexity_level': 'Básico',
+    'model': 'gpt-4o-mini',
+}
+
+
+class FakeOpenAIStream:
+    """
+    Stands in for OpenAIService.stream_simplify: yields the given deltas and records whether the
+    stream was closed and which segments were already sent to translation before each delta.
+    """
+
+    def __init__(self, deltas, detector):
+        self.deltas = deltas
+        self.detector = detector
+        self.closed = False
+        self.detected_before = []
+
+    def __call__(self, **kwargs):
+        return self._generate()
+
+    def _generate(self):
+        try:
+            for delta in self.deltas:
+                self.detected_before.append([call.args[0] for call in self.detector.aws_source_language.call_args_list])
+                yield delta
+        finally:
+            self.closed = True
+
+
+def make_pipeline(deltas):
+    detector = mock.Mock()
+    detector.detect.return_value = 'pt'
+    detector.aws_source_language.return_value = 'pt'
+    glossary = mock.Mock()
+    glossary.protect.side_effect = lambda text, speciality, language: ProtectedText(text, [], [], None)
+    glossary.restore.side_effect = lambda text, protected, *args: (text, 0)
+    memory = mock.Mock()
+    memory.translate.side_effect = lambda text, target, source: (f'[{text}]', source)
+    quality = mock.Mock()
+    quality.score.return_value = {'bleu_score': 42.0, 'bleu_mode': 'always'}
+    readability = mock.Mock()
+    readability.calculate_readability.return_value = {'flesch_reading_ease': 50.0}
+    openai = mock.Mock()
+    openai.stream_simplify.side_effect = FakeOpenAIStream(deltas, detector)
+    pipeline = TranslationPipeline(
+        aws_service=mock.Mock(), openai_service=openai, readability_service=readability,
+        quality_service=quality, language_detector=detector, translation_memory=memory, glossary_service=glossary,
+    )
+    return pipeline, openai.stream_simplify.side_effect
+
+
+def stream_kwargs():
+    return {
+        'text': PAYLOAD['text'], 'target_language': 'en', 'speciality': 'Física', 'style': 'Formal',
+        'summarize': False, 'model': 'gpt-4o-mini',
+    }
+
+
+class TranslationPipelineStreamTests(SimpleTestCase):
+    def test_events_are_delivered_in_order(self):
+        pipeline, openai_stream = make_pipeline(['Primeira frase.', '\n\n', 'Segunda', ' frase.'])
+        events = list(pipeline.stream(**stream_kwargs()))
+        names = [name for name, _ in events]
+
+        self.assertEqual(events[0], ('start', {'chunks': 1}))
+        self.assertEqual(names[-3:], ['metrics', 'quality', 'done'])
+        self.assertEqual(''.join(data['text'] for name, data in events if name == 'simplified'),
+                         'Primeira frase.\n\nSegunda frase.')
+        self.assertEqual([data for name, data in events if name == 'translated'], [
+            {'index': 0, 'text': '[Primeira frase.]', 'separator': '\n\n', 'source_language_code': 'pt'},
+            {'index': 1, 'text': '[Segunda frase.]', 'separator': '', 'source_language_code': 'pt'},
+        ])
+        # O primeiro parágrafo é enviado à tradução antes do fim da geração
+        self.assertEqual(openai_stream.detected_before[-1], ['Primeira frase.'])
+
+        self.assertEqual(events[-3][1], {
+            'metrics_original': {'flesch_reading_ease': 50.0},
+            'metrics_simplified': {'flesch_reading_ease': 50.0},
+        })
+        self.assertEqual(events[-2][1], {'bleu_score': 42.0, 'bleu_mode': 'always'})
+        pipeline.quality_service.score.assert_called_once_with(
+            'Primeira frase.\n\nSegunda frase.', '[Primeira frase.]\n\n[Segunda frase.]', 'pt', 'en', mode=None
+        )
+        done = events[-1][1]
+        self.assertEqual(done['translated_text'], '[Primeira frase.]\n\n[Segunda frase.]')
+        self.assertEqual(done['source_language_code'], 'pt')
+        self.assertTrue(openai_stream.closed)
+
+    def test_quality_is_skipped_when_nothing_was_translated(self):
+        pipeline, _ = make_pipeline(['   '])
+        events = dict(pipeline.stream(**stream_kwargs()))
+
+        self.assertEqual(events['quality'], {'bleu_score': None, 'bleu_mode': 'skipped'})
+        self.assertEqual(events['done']['translated_text'], '')
+        self.assertIsNone(events['done']['source_language_code'])
+        self.assertNotIn('translated', events)
+        pipeline.quality_service.score.assert_not_called()
+        pipeline.translation_memory.translate.assert_not_called()
+
+    def test_closing_the_events_closes_the_openai_stream(self):
+        pipeline, openai_stream = make_pipeline(['Primeira frase.', ' Segunda frase.'])
+        events = pipeline.stream(**stream_kwargs())
+        self.assertEqual(next(events)[0], 'start')
+        self.assertEqual(next(events)[0], 'simplified')
+        events.close()
+        self.assertTrue(openai_stream.closed)
+
+
+def parse_events(body):
+    events = []
+    for block in body.strip().split('\n\n'):
+        event, data = block.split('\n')
+        events.append((event.removeprefix('event: '), json.loads(data.removeprefix('data: '))))
+    return events
+
+
+class TranslateStreamViewTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()  # contadores do ratelimit
+
+    def post(self, pipeline, payload=None):
+        with mock.patch('aws_translator_app.views.TranslationPipeline', return_value=pipeline):
+            return self.client.post(reverse('translate_stream'), payload or PAYLOAD, content_type='application/json')
+
+    def test_events_are_sent_as_server_sent_events(self):
+        pipeline, _ = make_pipeline(['Primeira frase.\n\nSegunda', ' frase.'])
+        response = self.post(pipeline)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        self.assertEqual(response['X-Accel-Buffering'], 'no')
+
+        events = parse_events(b''.join(response.streaming_content).decode('utf-8'))
+        self.assertEqual(events[0], ('start', {'chunks': 1}))
+        self.assertEqual(events[-1][0], 'done')
+        self.assertEqual(events[-1][1]['translated_text'], '[Primeira frase.]\n\n[Segunda frase.]')
+
+    def test_client_disconnect_closes_the_openai_stream(self):
+        pipeline, openai_stream = make_pipeline(['Primeira frase.', ' Segunda frase.'])
+        response = self.post(pipeline)
+        content = iter(response.streaming_content)
+        self.assertTrue(next(content).startswith(b'event: start'))
+        self.assertTrue(next(content).startswith(b'event: simplified'))
+
+        response.close()
+        self.assertTrue(openai_stream.closed)
+        pipeline.quality_service.score.assert_not_called()
+
+    def test_errors_are_reported_in_band(self):
+        pipeline, _ = make_pipeline([])
+        pipeline.openai_service.stream_simplify.side_effect = UpstreamUnavailableError('OpenAI indisponível')
+        response = self.post(pipeline)
+        self.assertEqual(response.status_code, 200)
+        events = parse_events(b''.join(response.streaming_content).decode('utf-8'))
+        self.assertEqual(events, [
+            ('start', {'chunks': 1}),
+            ('error', {'error': 'OpenAI indisponível', 'status': 503}),
+        ])
+
+    def test_several_target_languages_are_refused(self):
+        pipeline, _ = make_pipeline([])
+        response = self.post(pipeline, {**PAYLOAD, 'target_languages': ['en', 'es']})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('target_languages', response.json())
@@ -0,0 +1,152 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from aws_translator_app.services.api.aws_translate_service import AwsTranslateService
+from aws_translator_app.services.cache.backends import LRUCacheBackend, SQLiteCacheBackend
+from aws_translator_app.services.cache.translation_cache import TranslationCache
+from aws_translator_app.tests.utils import patch_clients
+
+
+class LRUCacheBackendTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch('aws_translator_app.services.cache.backends.time')
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.clock.monotonic.return_value = 1000.0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        backend = LRUCacheBackend(max_entries=2)
+        backend.set('a', 1)
+        backend.set('b', 2)
+        self.assertEqual(backend.get('a'), 1)
+        backend.set('c', 3)
+
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual(backend.get('a'), 1)
+        self.assertEqual(backend.get('c'), 3)
+        self.assertEqual(backend.stats()['evictions'], 1)
+
+    def test_byte_budget(self):
+        # 'k1' + '"xxxxxxxx"' ocupam 12 bytes
+        backend = LRUCacheBackend(max_entries=0, max_bytes=30)
+        backend.set('k1', 'x' * 8)
+        backend.set('k2', 'x' * 8)
+        self.assertEqual(backend.stats()['bytes'], 24)
+
+        backend.set('k3', 'x' * 8)
+        self.assertIsNone(backend.get('k1'))
+        self.assertEqual(backend.stats()['bytes'], 24)
+
+        backend.set('k4', 'x' * 100)
+        self.assertIsNone(backend.get('k4'))
+        self.assertEqual(backend.get('k2'), 'x' * 8)
+
+    def test_overwrite_replaces_size(self):
+        backend = LRUCacheBackend()
+        backend.set('k1', 'x' * 8)
+        backend.set('k1', 'x' * 18)
+        self.assertEqual(backend.stats()['bytes'], 22)
+        backend.delete('k1')
+        self.assertEqual(backend.stats()['bytes'], 0)
+
+    def test_entries_expire(self):
+        backend = LRUCacheBackend(default_ttl=60)
+        backend.set('default', 1)
+        backend.set('short', 2, ttl=10)
+
+        self.clock.monotonic.return_value = 1010.0
+        self.assertIsNone(backend.get('short'))
+        self.assertEqual(backend.get('default'), 1)
+
+        self.clock.monotonic.return_value = 1060.0
+        self.assertIsNone(backend.get('default'))
+        self.assertEqual(backend.stats()['entries'], 0)
+
+
+class SQLiteCacheBackendTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'cache.sqlite3')
+
+    def test_entries_survive_a_new_instance(self):
+        SQLiteCacheBackend(self.path).set('k1', ['Olá ⟦0⟧', 'pt'])
+        self.assertEqual(SQLiteCacheBackend(self.path).get('k1'), ['Olá ⟦0⟧', 'pt'])
+
+    def test_least_recently_used_entry_is_evicted(self):
+        backend = SQLiteCacheBackend(self.path, max_entries=2)
+        with mock.patch('aws_translator_app.services.cache.backends.time') as clock:
+            clock.time.return_value = 1000.0
+            backend.set('a', 1)
+            clock.time.return_value = 1001.0
+            backend.set('b', 2)
+            clock.time.return_value = 1002.0
+            self.assertEqual(backend.get('a'), 1)
+            clock.time.return_value = 1003.0
+            backend.set('c', 3)
+
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual(backend.get('a'), 1)
+        self.assertEqual(backend.stats()['entries'], 2)
+
+    def test_expired_entry_is_deleted_on_read(self):
+        backend = SQLiteCacheBackend(self.path)
+        with mock.patch('aws_translator_app.services.cache.backends.time') as clock:
+            clock.time.return_value = 1000.0
+            backend.set('k1', 1, ttl=10)
+            clock.time.return_value = 1010.0
+            self.assertIsNone(backend.get('k1'))
+        self.assertEqual(backend.stats()['entries'], 0)
+
+
+class TranslationCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.cache = TranslationCache(LRUCacheBackend())
+
+    def test_key_ignores_spacing_but_not_line_breaks(self):
+        key = self.cache.make_key('Olá  mundo.\nSegunda linha. ', 'pt', 'en')
+        self.assertEqual(self.cache.make_key(' Olá mundo.\nSegunda   linha.', 'pt', 'en'), key)
+        self.assertNotEqual(self.cache.make_key('Olá mundo. Segunda linha.', 'pt', 'en'), key)
+
+    def test_key_depends_on_the_languages(self):
+        key = self.cache.make_key('Olá mundo.', 'pt', 'en')
+        self.assertNotEqual(self.cache.make_key('Olá mundo.', 'auto', 'en'), key)
+        self.assertNotEqual(self.cache.make_key('Olá mundo.', 'pt', 'es'), key)
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = TranslationCache(LRUCacheBackend(), enabled=False)
+        cache.set('Olá.', 'pt', 'en', ('Hello.', 'pt'))
+        self.assertIsNone(cache.get('Olá.', 'pt', 'en'))
+
+    def test_aws_is_called_once_per_text(self):
+        aws = mock.Mock()
+        aws.translate_text.return_value = {'TranslatedText': 'Hello.', 'SourceLanguageCode': 'pt'}
+        patch_clients(self, aws=aws)
+        service = AwsTranslateService()
+        service.cache = self.cache
+
+        self.assertEqual(service.translate_text('Olá.', 'en', 'pt'), ('Hello.', 'pt'))
+        self.assertEqual(service.translate_text(' Olá. ', 'en', 'pt'), ('Hello.', 'pt'))
+        aws.translate_text.assert_called_once()
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+
+class CacheStatsViewTests(TestCase):
+    def test_requires_staff(self):
+        client = APIClient()
+        url = reverse('cache_stats')
+        self.assertEqual(client.get(url).status_code, 401)
+
+        client.force_authenticate(User.objects.create_user('user'))
+        self.assertEqual(client.get(url).status_code, 403)
+
+        client.force_authenticate(User.objects.create_user('admin', is_staff=True))
+        response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()), {'translation', 'llm', 'translation_memory'})
@@ -0,0 +1,173 @@
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from aws_translator_app.models import TranslationMemoryBand, TranslationMemoryEntry
+from aws_translator_app.services.pipeline.chunking_service import TextChunk
+from aws_translator_app.services.pipeline.translation_memory_service import (
+    MinHasher,
+    TranslationMemoryService,
+    _shingles,
+    get_translation_memory_stats,
+)
+
+LONG = ('O relatório anual da diretoria descreve os resultados financeiros e operacionais da empresa '
+        'em todas as regiões onde ela atua.')
+LONG_EDITED = ('O relatório anual da diretoria não descreve os resultados financeiros e operacionais da empresa '
+               'em todas as regiões onde ela atua.')
+
+
+class StubAwsTranslateService:
+    """
+    Translates by upper-casing each line, recording every request.
+    """
+
+    def __init__(self, merge_lines=False):
+        self.merge_lines = merge_lines
+        self.packed = []
+        self.long = []
+
+    def translate_text(self, text, target_language_code, source_language_code='auto'):
+        self.packed.append(text)
+        if self.merge_lines:
+            return ' '.join(text.upper().split('\n')), 'pt'
+        return text.upper(), 'pt'
+
+    def translate_long_text(self, text, target_language_code, source_language_code='auto'):
+        self.long.append(text)
+        return text.upper(), 'pt'
+
+
+def chunks(*texts, separator=' '):
+    return [TextChunk(index, text, separator) for index, text in enumerate(texts)]
+
+
+PLAN_SEGMENTS = chunks('Um.', 'Dois.', 'Tres.', 'Quatro.', 'Linha\nquebrada.', 'Uma frase bem mais longa.', 'Fim.')
+
+
+class TranslationMemoryServiceTests(TestCase):
+    def setUp(self):
+        self.aws = StubAwsTranslateService()
+        self.memory = TranslationMemoryService(self.aws)
+
+    def test_new_text_is_packed_and_stitched(self):
+        text = 'Primeira frase. Segunda frase!\n\nTerceiro parágrafo.'
+        translated, source = self.memory.translate(text, 'en', 'pt')
+        self.assertEqual(translated, 'PRIMEIRA FRASE. SEGUNDA FRASE!\n\nTERCEIRO PARÁGRAFO.')
+        self.assertEqual(source, 'pt')
+        self.assertEqual(self.aws.packed, ['Primeira frase.\nSegunda frase!\nTerceiro parágrafo.'])
+        self.assertEqual(TranslationMemoryEntry.objects.count(), 3)
+
+    def test_revision_sends_only_changed_sentences(self):
+        self.memory.translate('Primeira frase. Segunda frase. Terceira frase.', 'en', 'pt')
+        self.aws.packed.clear()
+        translated, _ = self.memory.translate('Primeira frase. Frase nova. Terceira frase.', 'en', 'pt')
+        self.assertEqual(translated, 'PRIMEIRA FRASE. FRASE NOVA. TERCEIRA FRASE.')
+        self.assertEqual(self.aws.packed, [])
+        self.assertEqual(self.aws.long, ['Frase nova.'])
+        self.assertEqual(TranslationMemoryEntry.objects.get(source_text='Primeira frase.').hits, 1)
+
+    def test_memory_is_per_language_pair(self):
+        self.memory.translate('Primeira frase.', 'en', 'pt')
+        self.memory.translate('Primeira frase.', 'es', 'pt')
+        self.assertEqual(self.aws.long, ['Primeira frase.', 'Primeira frase.'])
+
+    def test_fuzzy_matching_is_off_by_default(self):
+        before = get_translation_memory_stats()
+        self.memory.translate(LONG, 'en', 'pt')
+        self.memory.translate(LONG_EDITED, 'en', 'pt')
+        after = get_translation_memory_stats()
+        self.assertEqual(self.memory.fuzzy_threshold, 0)
+        self.assertEqual(after['fuzzy_hits'] - before['fuzzy_hits'], 0)
+        self.assertFalse(TranslationMemoryBand.objects.exists())
+
+    @override_settings(TRANSLATION_MEMORY={'FUZZY_THRESHOLD': 0.9})
+    def test_fuzzy_match_is_counted_but_translated(self):
+        memory = TranslationMemoryService(self.aws)
+        before = get_translation_memory_stats()
+        memory.translate(LONG, 'en', 'pt')
+        self.assertEqual(TranslationMemoryBand.objects.count(), 8)
+        translated, _ = memory.translate(LONG_EDITED, 'en', 'pt')
+        after = get_translation_memory_stats()
+        self.assertEqual(translated, LONG_EDITED.upper())
+        self.assertEqual(self.aws.long, [LONG, LONG_EDITED])
+        self.assertEqual(after['fuzzy_hits'] - before['fuzzy_hits'], 1)
+        self.assertEqual(after['exact_hits'] - before['exact_hits'], 0)
+
+    @override_settings(TRANSLATION_MEMORY={'FUZZY_THRESHOLD': 0.9})
+    def test_short_sentences_are_not_indexed(self):
+        TranslationMemoryService(self.aws).translate('Frase curta.', 'en', 'pt')
+        self.assertEqual(TranslationMemoryEntry.objects.count(), 1)
+        self.assertFalse(TranslationMemoryBand.objects.exists())
+
+    def test_unaligned_group_falls_back_to_running_text(self):
+        aws = StubAwsTranslateService(merge_lines=True)
+        translated, _ = TranslationMemoryService(aws).translate('Primeira frase. Segunda frase!\n\nOutra.', 'en', 'pt')
+        self.assertEqual(aws.long, ['Primeira frase. Segunda frase!\n\nOutra.'])
+        self.assertEqual(translated, 'PRIMEIRA FRASE. SEGUNDA FRASE!\n\nOUTRA.')
+        self.assertFalse(TranslationMemoryEntry.objects.exists())
+
+    def test_unaligned_group_keeps_trailing_separator(self):
+        self.memory.translate('Terceira frase.', 'en', 'pt')
+        aws = StubAwsTranslateService(merge_lines=True)
+        translated, _ = TranslationMemoryService(aws).translate(
+            'Primeira frase. Segunda frase.\n\nTerceira frase.', 'en', 'pt'
+        )
+        self.assertEqual(aws.long, ['Primeira frase. Segunda frase.'])
+        self.assertEqual(translated, 'PRIMEIRA FRASE. SEGUNDA FRASE.\n\nTERCEIRA FRASE.')
+
+    @override_settings(TRANSLATION_MEMORY={'PACK_MAX_BYTES': 20})
+    def test_consecutive_sentences_are_packed(self):
+        memory = TranslationMemoryService(self.aws)
+        self.assertEqual(memory._plan(PLAN_SEGMENTS, [0, 1, 2]), [[0, 1, 2]])
+        self.assertEqual(memory._plan(PLAN_SEGMENTS, [0, 2, 3]), [[0], [2, 3]])
+        self.assertEqual(memory._plan(PLAN_SEGMENTS, []), [])
+
+    @override_settings(TRANSLATION_MEMORY={'PACK_MAX_BYTES': 20})
+    def test_group_is_closed_at_the_byte_limit(self):
+        memory = TranslationMemoryService(self.aws)
+        # 'Um.', 'Dois.' e 'Tres.' somam 17 bytes com os separadores; 'Quatro.' não cabe no grupo
+        self.assertEqual(memory._plan(PLAN_SEGMENTS, [0, 1, 2, 3]), [[0, 1, 2], [3]])
+
+    @override_settings(TRANSLATION_MEMORY={'PACK_MAX_BYTES': 20})
+    def test_multiline_and_oversized_sentences_are_sent_alone(self):
+        memory = TranslationMemoryService(self.aws)
+        self.assertEqual(memory._plan(PLAN_SEGMENTS, [3, 4, 6]), [[3], [4], [6]])
+        self.assertEqual(memory._plan(PLAN_SEGMENTS, [5, 6]), [[5], [6]])
+
+    def test_stitch_uses_separator_of_last_covered_segment(self):
+        segments = chunks('A.', 'B.', 'C.')
+        segments[1] = segments[1]._replace(separator='\n\n')
+        segments[2] = segments[2]._replace(separator='')
+        self.assertEqual(
+            TranslationMemoryService._stitch(segments, {0: ('a.', 'pt'), 1: ('b.', 'pt'), 2: ('c.', 'en')}),
+            ('a. b.\n\nc.', 'pt')
+        )
+        # Grupo traduzido como trecho corrido: ocupa o primeiro segmento e leva o separador do último
+        self.assertEqual(
+            TranslationMemoryService._stitch(segments, {0: ('a. b.', 'pt'), 1: None, 2: (' c. ', 'en')}),
+            ('a. b.\n\nc.', 'pt')
+        )
+        self.assertEqual(
+            TranslationMemoryService._stitch(segments, {0: ('a. b. c.', 'en'), 1: None, 2: None}),
+            ('a. b. c.', 'en')
+        )
+
+
+class MinHasherTests(SimpleTestCase):
+    def test_band_keys_are_deterministic(self):
+        shingles = _shingles(LONG, 5)
+        self.assertEqual(MinHasher(32, 8).band_keys(shingles), MinHasher(32, 8).band_keys(shingles))
+        self.assertEqual(len(MinHasher(32, 8).band_keys(shingles)), 8)
+
+    def test_similar_texts_share_a_band(self):
+        hasher = MinHasher(32, 8)
+        first = set(hasher.band_keys(_shingles(LONG, 5)))
+        self.assertTrue(first & set(hasher.band_keys(_shingles(LONG_EDITED, 5))))
+        self.assertFalse(first & set(hasher.band_keys(_shingles('Texto completamente diferente sobre outra coisa.', 5))))
+
+    def test_shingles_ignore_case_and_spacing(self):
+        self.assertEqual(_shingles('Olá  Mundo', 3), _shingles('olá mundo', 3))
+        self.assertEqual(_shingles('ab', 5), {'ab'})
+
+    def test_bands_must_divide_permutations(self):
+        with self.assertRaises(ValueError):
+            MinHasher(30, 8)
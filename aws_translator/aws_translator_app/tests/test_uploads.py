@@ -0,0 +1,101 @@
+from unittest import mock
+
+from django.core.files.uploadhandler import StopUpload
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import StreamingHttpResponse
+from django.test import SimpleTestCase, override_settings
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from aws_translator_app.uploads import MaxBytesUploadHandler, UploadBudget, upload_limits
+
+
+class UploadView(APIView):
+    permission_classes = [AllowAny]
+
+    @upload_limits
+    def post(self, request):
+        upload = request.data['file']
+        if upload.name == 'stream.txt':
+            return StreamingHttpResponse(iter([b'parte']))
+        if upload.name == 'erro.txt':
+            raise RuntimeError('Falha na view')
+        return Response({'size': upload.size, 'on_disk': hasattr(upload, 'temporary_file_path')})
+
+
+@override_settings(UPLOAD_LIMITS={'MAX_REQUEST_BYTES': 2000, 'RETRY_AFTER': 7})
+class UploadLimitsTests(SimpleTestCase):
+    def setUp(self):
+        self.budget = UploadBudget(limit=5000)
+        patcher = mock.patch('aws_translator_app.uploads.get_upload_budget', return_value=self.budget)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.view = UploadView.as_view()
+
+    def post(self, name='documento.txt', size=100, **extra):
+        request = APIRequestFactory().post(
+            '/upload/', {'file': SimpleUploadedFile(name, b'x' * size)}, format='multipart', **extra
+        )
+        return self.view(request)
+
+    def test_upload_is_accepted_and_the_reservation_released(self):
+        response = self.post()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['size'], 100)
+        self.assertEqual(self.budget.in_use, 0)
+
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=1000)
+    def test_large_upload_is_spooled_to_disk(self):
+        self.assertFalse(self.post(size=500).data['on_disk'])
+        self.assertTrue(self.post(size=1500).data['on_disk'])
+
+    def test_declared_size_above_the_limit_is_refused_before_reading(self):
+        response = self.post(size=3000)
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(self.budget.in_use, 0)
+
+    def test_upload_that_does_not_fit_the_budget(self):
+        self.assertTrue(self.budget.try_acquire(4900))
+        response = self.post()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '7')
+        self.assertEqual(self.budget.in_use, 4900)
+
+    def test_request_without_content_length_reserves_the_maximum(self):
+        with mock.patch.object(UploadBudget, 'try_acquire', autospec=True, return_value=False) as try_acquire:
+            self.post(CONTENT_LENGTH='')
+        self.assertEqual(try_acquire.call_args.args[1], 2000)
+
+    def test_streaming_response_holds_the_reservation_until_closed(self):
+        response = self.post(name='stream.txt')
+        self.assertGreater(self.budget.in_use, 0)
+        self.assertEqual(b''.join(response.streaming_content), b'parte')
+        response.close()
+        self.assertEqual(self.budget.in_use, 0)
+
+    def test_reservation_is_released_when_the_view_fails(self):
+        with self.assertRaises(RuntimeError):
+            self.post(name='erro.txt')
+        self.assertEqual(self.budget.in_use, 0)
+
+
+class MaxBytesUploadHandlerTests(SimpleTestCase):
+    def test_stops_the_upload_past_the_limit(self):
+        handler = MaxBytesUploadHandler(max_bytes=10)
+        self.assertEqual(handler.receive_data_chunk(b'x' * 6, 0), b'x' * 6)
+        with self.assertRaises(StopUpload):
+            handler.receive_data_chunk(b'x' * 6, 6)
+        self.assertTrue(handler.exceeded)
+
+
+class UploadBudgetTests(SimpleTestCase):
+    def test_acquire_and_release(self):
+        budget = UploadBudget(limit=100)
+        self.assertTrue(budget.try_acquire(60))
+        self.assertFalse(budget.try_acquire(50))
+        budget.release(60)
+        self.assertTrue(budget.try_acquire(100))
+        budget.release(500)
+        self.assertEqual(budget.stats(), {'limit': 100, 'in_use': 0})
@@ -0,0 +1,21 @@
+from unittest import mock
+
+from aws_translator_app.services.api.client_registry import client_registry
+
+
+def patch_clients(test_case, aws=None, openai=None):
+    """
+    Replaces the shared API clients and credentials for the duration of a test.
+
+    Services read their credentials from the environment when they are created, so the
+    credential lookups are patched too: the tests must not depend on a .env file.
+    """
+    patchers = [
+        mock.patch.object(client_registry, 'get_aws_credentials', return_value=('test', 'test', 'us-east-1')),
+        mock.patch.object(client_registry, 'get_openai_api_key', return_value='test'),
+        mock.patch.object(client_registry, 'get_aws_translate_client', return_value=aws or mock.Mock()),
+        mock.patch.object(client_registry, 'get_openai_client', return_value=openai or mock.Mock()),
+    ]
+    for patcher in patchers:
+        patcher.start()
+        test_case.addCleanup(patcher.stop)
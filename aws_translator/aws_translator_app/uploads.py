@@ -0,0 +1,203 @@
+# aws_translator_app/uploads.py
+
+"""
+Upload Limits Module
+====================
+
+Este módulo controla o volume de uploads aceitos pelo processo, para que vários envios
+simultâneos de arquivos grandes não esgotem a memória do worker:
+
+- Cada requisição tem um tamanho máximo (`MAX_REQUEST_BYTES`). Requisições que declaram um
+  `Content-Length` maior são recusadas com 413 antes de qualquer leitura do corpo; as que não
+  declaram o tamanho (ou mentem) são interrompidas assim que o limite é ultrapassado.
+- O processo tem um orçamento global de bytes em trânsito (`MAX_INFLIGHT_BYTES`). Se o envio não
+  couber no orçamento, a requisição é recusada com 503 (e `Retry-After`), em vez de ser aceita e
+  disputar memória com as demais.
+
+Os arquivos acima de `FILE_UPLOAD_MAX_MEMORY_SIZE` são gravados em disco pelo próprio Django
+(`TemporaryFileUploadHandler`), de modo que o orçamento limita sobretudo o espaço temporário e
+o processamento simultâneo.
+
+Classes:
+    UploadBudget: Orçamento de bytes em trânsito do processo.
+    MaxBytesUploadHandler: Upload handler que interrompe envios acima do limite por requisição.
+
+Funções:
+    get_upload_budget() ⇾ UploadBudget:
+        Retorna o orçamento do processo.
+    upload_limits(view_method):
+        Decorator para métodos de views DRF que recebem arquivos.
+
+Configurações (settings.UPLOAD_LIMITS):
+    - MAX_REQUEST_BYTES (int): tamanho máximo do corpo de uma requisição.
+    - MAX_INFLIGHT_BYTES (int): total de bytes de uploads em processamento simultâneo no processo.
+    - RETRY_AFTER (int): valor do cabeçalho `Retry-After` nas respostas 503, em segundos.
+"""
+
+import functools
+import threading
+from typing import Optional
+
+from django.conf import settings
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def _config() -> dict:
+    return getattr(settings, 'UPLOAD_LIMITS', {})
+
+
+class UploadBudget:
+    """
+    Orçamento de bytes em trânsito compartilhado pelas threads do processo.
+
+    Métodos:
+        try_acquire(size: int) ⇾ bool: Reserva `size` bytes, se houver saldo.
+        release(size: int) ⇾ None: Devolve `size` bytes ao orçamento.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, size: int) -> bool:
+        with self._lock:
+            if self.in_use + size > self.limit:
+                return False
+            self.in_use += size
+            return True
+
+    def release(self, size: int) -> None:
+        with self._lock:
+            self.in_use = max(0, self.in_use - size)
+
+    def stats(self) -> dict:
+        return {'limit': self.limit, 'in_use': self.in_use}
+
+
+class MaxBytesUploadHandler(FileUploadHandler):
+    """
+    Upload handler que conta os bytes recebidos e interrompe o envio ao ultrapassar `max_bytes`.
+
+    Deve ser o primeiro da lista de handlers da requisição; os demais (memória/disco) continuam
+    recebendo os dados normalmente enquanto o limite não é atingido. Cobre as requisições sem
+    `Content-Length` (ou com um valor menor que o real), já que as demais são recusadas antes.
+    """
+
+    def __init__(self, max_bytes: int, request=None):
+        super().__init__(request)
+        self.max_bytes = max_bytes
+        self.received = 0
+        self.exceeded = False
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > self.max_bytes:
+            self.exceeded = True
+            raise StopUpload(connection_reset=True)
+        return raw_data
+
+    def file_complete(self, file_size):
+        return None
+
+
+class _ReleasingIterator:
+    """
+    Envolve o conteúdo de uma resposta em streaming e devolve a reserva ao orçamento quando a
+    resposta é fechada (fim da transmissão ou desconexão do cliente).
+    """
+
+    def __init__(self, iterable, budget: UploadBudget, size: int):
+        self._iterator = iter(iterable)
+        self._budget = budget
+        self._size = size
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._iterator)
+
+    def close(self):
+        if self._size:
+            self._budget.release(self._size)
+            self._size = 0
+        close = getattr(self._iterator, 'close', None)
+        if close is not None:
+            close()
+
+
+_budget: Optional[UploadBudget] = None
+_budget_lock = threading.Lock()
+
+
+def get_upload_budget() -> UploadBudget:
+    """
+    Retorna o orçamento de bytes em trânsito do processo, criado no primeiro acesso.
+    """
+    global _budget
+    if _budget is None:
+        with _budget_lock:
+            if _budget is None:
+                _budget = UploadBudget(_config().get('MAX_INFLIGHT_BYTES', 512 * 1024 * 1024))
+    return _budget
+
+
+def _too_large_response(max_bytes: int) -> Response:
+    return Response(
+        {'error': f'O arquivo excede o tamanho máximo permitido ({max_bytes / (1024 * 1024):.1f} MB).'},
+        status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    )
+
+
+def upload_limits(view_method):
+    """
+    Aplica os limites de upload a um metodo de view DRF (e.g., `post`).
+
+    Antes de o corpo ser lido, recusa com 413 as requisições acima de `MAX_REQUEST_BYTES` e com
+    503 as que não cabem no orçamento do processo. A reserva é devolvida quando a view termina
+    (ou, para respostas em streaming, quando a transmissão termina).
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(view, request, *args, **kwargs):
+        max_bytes = _config().get('MAX_REQUEST_BYTES', 100 * 1024 * 1024)
+        try:
+            content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > max_bytes:
+            return _too_large_response(max_bytes)
+
+        # Sem Content-Length, reserva o máximo permitido por requisição
+        reserved = content_length or max_bytes
+        budget = get_upload_budget()
+        if not budget.try_acquire(reserved):
+            response = Response(
+                {'error': 'O servidor está processando muitos envios no momento. Tente novamente em instantes.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+            response['Retry-After'] = str(_config().get('RETRY_AFTER', 5))
+            return response
+
+        handler = MaxBytesUploadHandler(max_bytes, request)
+        request._request.upload_handlers.insert(0, handler)
+        try:
+            response = view_method(view, request, *args, **kwargs)
+        except BaseException:
+            budget.release(reserved)
+            raise
+
+        if handler.exceeded:
+            budget.release(reserved)
+            return _too_large_response(max_bytes)
+        if isinstance(response, StreamingHttpResponse):
+            response.streaming_content = _ReleasingIterator(response.streaming_content, budget, reserved)
+        else:
+            budget.release(reserved)
+        return response
+
+    return wrapper
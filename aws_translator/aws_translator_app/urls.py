@@ -9,7 +9,19 @@ from .views import (
     StylesView,
     ComplexityLevelsView,
     ModelsView,
+    CombinedMetadataView,
+    ClientPoolStatsView,
+    CacheStatsView,
     TranslateView,
+    TranslateStreamView,
+    AsyncTranslateView,
+    BatchTranslateView,
+    JobCreateView,
+    JobDetailView,
+    JobResultView,
+    QualityScoreDetailView,
+    GlossaryListView,
+    GlossaryDetailView,
     ImportDocumentView,
     ExportDocumentView,
 )
@@ -20,7 +32,19 @@ urlpatterns = [
     path('styles/', StylesView.as_view(), name='styles'),
     path('complexity-levels/', ComplexityLevelsView.as_view(), name='complexity_levels'),
     path('models/', ModelsView.as_view(), name='models'),
+    path('metadata/', CombinedMetadataView.as_view(), name='metadata'),
+    path('client-pool-stats/', ClientPoolStatsView.as_view(), name='client_pool_stats'),
+    path('cache-stats/', CacheStatsView.as_view(), name='cache_stats'),
     path('translate/', TranslateView.as_view(), name='translate'),
+    path('translate/stream/', TranslateStreamView.as_view(), name='translate_stream'),
+    path('translate/async/', AsyncTranslateView.as_view(), name='translate_async'),
+    path('translate/batch/', BatchTranslateView.as_view(), name='translate_batch'),
+    path('jobs/', JobCreateView.as_view(), name='job_create'),
+    path('jobs/<uuid:job_id>/', JobDetailView.as_view(), name='job_detail'),
+    path('jobs/<uuid:job_id>/result/', JobResultView.as_view(), name='job_result'),
+    path('quality-scores/<uuid:score_id>/', QualityScoreDetailView.as_view(), name='quality_score_detail'),
+    path('glossaries/', GlossaryListView.as_view(), name='glossary_list'),
+    path('glossaries/<uuid:glossary_id>/', GlossaryDetailView.as_view(), name='glossary_detail'),
     path('import-document/', ImportDocumentView.as_view(), name='import_document'),
     path('export-document/', ExportDocumentView.as_view(), name='export_document'),
 ]
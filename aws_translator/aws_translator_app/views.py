@@ -1,78 +1,143 @@
 # aws_translator_app/views.py
 
+import asyncio
+import io
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from django_ratelimit.core import is_ratelimited
 from django_ratelimit.decorators import ratelimit
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.permissions import AllowAny
-from .permissions import IsOwnerOrReadOnly
+from rest_framework.permissions import AllowAny, IsAdminUser
+from .instrumentation import metrics_enabled, render_metrics
+from .metadata import METADATA_PAYLOADS, etag_matches
+from .permissions import IsAdminOrReadOnly, IsOwnerOrReadOnly
+from .uploads import upload_limits
+from .models import Glossary, Job, QualityScore
 from .serializers import (
     TranslateRequestSerializer,
     TranslateResponseSerializer,
+    MultiTranslateResponseSerializer,
+    BatchTranslateRequestSerializer,
     ImportDocumentSerializer,
-    ExportDocumentSerializer
+    ExportDocumentSerializer,
+    JobCreateSerializer,
+    JobSerializer,
+    QualityScoreSerializer,
+    GlossaryUploadSerializer,
+    GlossarySerializer,
 )
-from .services.api.aws_translate_service import AwsTranslateService
-from .services.api.openai_service import OpenAIService
-from .services.document_service import DocumentService
-from .services.language.readability_service import ReadabilityService
-from .services.language.bleu_score_service import BleuScoreService
+from .services.api.client_registry import client_registry
+from .services.api.resilience import UpstreamUnavailableError, resilience_stats
+from .services.api.token_budget import TokenBudgetExceededError
+from .services.cache.llm_cache import LLMCacheMissError, get_llm_cache
+from .services.cache.translation_cache import get_translation_cache
+from .services.document_service import EXPORT_CONTENT_TYPES, DocumentService
+from .services.jobs.job_service import JobService
+from .services.pipeline.batch_translation_service import BatchTranslationService
+from .services.pipeline.translation_pipeline import TranslationPipeline
+from .services.pipeline.translation_memory_service import get_translation_memory_stats
+from .services.language.glossary_service import GlossaryService
 import os  # Make sure to import os if not already imported
-from .constants import LANGUAGES, SPECIALITIES, STYLES, COMPLEXITY_LEVELS, AVAILABLE_MODELS
 
+RATE_LIMIT = getattr(settings, 'RATELIMIT_RATE', '10/m')
 
-class LanguagesView(APIView):
-    permission_classes = [AllowAny]
+
+class MetadataView(View):
+    """
+    Serves a precomputed metadata payload (see metadata.py).
+
+    A plain Django view rather than an APIView: the payloads are public and static, so there is
+    no need for DRF's authentication, content negotiation or rendering on every request.
+    """
+    payload_name = None
 
     def get(self, request):
-        languages_list = [{'name': name, 'code': code} for name, code in LANGUAGES.items()]
-        return Response(languages_list)
+        payload = METADATA_PAYLOADS[self.payload_name]
+        if etag_matches(request.headers.get('If-None-Match', ''), payload.etag):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(payload.body, content_type='application/json')
+        response['ETag'] = payload.etag
+        response['Cache-Control'] = f"public, max-age={getattr(settings, 'METADATA', {}).get('MAX_AGE', 3600)}"
+        return response
 
 
-class SpecialitiesView(APIView):
-    permission_classes = [AllowAny]
+class LanguagesView(MetadataView):
+    payload_name = 'languages'
 
-    def get(self, request):
-        specialities_list = [{'name': name, 'value': value} for name, value in SPECIALITIES.items()]
-        return Response(specialities_list)
 
+class SpecialitiesView(MetadataView):
+    payload_name = 'specialities'
+
+
+class StylesView(MetadataView):
+    payload_name = 'styles'
+
+
+class ComplexityLevelsView(MetadataView):
+    payload_name = 'complexity_levels'
 
-class StylesView(APIView):
-    permission_classes = [AllowAny]
+
+class ModelsView(MetadataView):
+    payload_name = 'models'
+
+
+class CombinedMetadataView(MetadataView):
+    # languages, specialities, styles, complexity_levels and models in a single round trip
+    payload_name = 'metadata'
+
+
+class ClientPoolStatsView(APIView):
+    # Internal connection-pool and circuit-breaker state: staff only
+    permission_classes = [IsAdminUser]
 
     def get(self, request):
-        styles_list = [{'name': name, 'value': value} for name, value in STYLES.items()]
-        return Response(styles_list)
+        return Response({**client_registry.stats(), 'resilience': resilience_stats()})
 
 
-class ComplexityLevelsView(APIView):
-    permission_classes = [AllowAny]
+class MetricsView(View):
+    """
+    Prometheus scrape endpoint (see instrumentation.py). A plain Django view, like MetadataView:
+    the exposition format is plain text, not something DRF should negotiate or render.
+    """
 
     def get(self, request):
-        complexity_levels_list = [{'name': name, 'value': value} for name, value in COMPLEXITY_LEVELS.items()]
-        return Response(complexity_levels_list)
+        if not metrics_enabled():
+            return HttpResponse(status=404)
+        return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
 
 
-class ModelsView(APIView):
-    permission_classes = [AllowAny]
+class CacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
 
     def get(self, request):
-        models_list = [{'name': model} for model in AVAILABLE_MODELS]
-        return Response(models_list)
+        return Response({
+            'translation': get_translation_cache().stats(),
+            'llm': get_llm_cache().stats(),
+            'translation_memory': get_translation_memory_stats(),
+        })
 
 
 class TranslateView(APIView):
     permission_classes = [AllowAny]
 
-    @method_decorator(ratelimit(key='ip', rate='10/m', block=True))
+    @method_decorator(ratelimit(key='ip', rate=RATE_LIMIT, block=True))
     def post(self, request):
         serializer = TranslateRequestSerializer(data=request.data)
         if serializer.is_valid():
             data = serializer.validated_data
             text = data['text']
-            target_language = data['target_language']
             speciality = data['speciality']
             style = data['style']
             summarize = data['summarize']
@@ -80,80 +145,359 @@ class TranslateView(APIView):
             complexity_level = data['complexity_level']
             focus_aspects = data.get('focus_aspects', [])
             temperature = data['temperature']
-            max_tokens = data['max_tokens']
+            max_tokens = data.get('max_tokens')
+            cache_mode = data['cache']
+            options = dict(
+                speciality=speciality,
+                style=style,
+                summarize=summarize,
+                model=model,
+                complexity_level=complexity_level,
+                focus_aspects=focus_aspects,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                cache_mode=cache_mode,
+                bleu_mode=data.get('bleu_mode')
+            )
 
             try:
-                # Initialize services
-                aws_service = AwsTranslateService()
-                openai_service = OpenAIService()
-                readability_service = ReadabilityService()
-                bleu_service = BleuScoreService()
-
-                # Simplify text using OpenAI
-                simplified_text = openai_service.simplify_text(
+                # Run the chunked simplify → translate → metrics pipeline
+                pipeline = TranslationPipeline()
+                if data.get('target_languages'):
+                    # Fan-out: simplified and scored once, translated to every target, keyed by language code
+                    response_data = pipeline.run_multi(
+                        text=text,
+                        target_languages=data['target_languages'],
+                        bleu_targets=data.get('bleu_targets'),
+                        **options
+                    )
+                    response_serializer = MultiTranslateResponseSerializer(response_data)
+                    return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+                response_data = pipeline.run(
                     text=text,
-                    area_tecnica=speciality,
-                    estilo=style,
-                    summarize=summarize,
-                    model=model,
-                    complexity_level=complexity_level,
-                    focus_aspects=focus_aspects,
-                    temperature=temperature,
-                    max_tokens=max_tokens
+                    target_language=data['target_language'],
+                    **options
                 )
 
-                # Calculate readability metrics
-                metrics_original = readability_service.calculate_readability(text)
-                metrics_simplified = readability_service.calculate_readability(simplified_text)
+                response_serializer = TranslateResponseSerializer(response_data)
+                return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+            except LLMCacheMissError as e:
+                return Response({'error': str(e)}, status=status.HTTP_404_NOT_FOUND)
+            except TokenBudgetExceededError as e:
+                # Refused before any call to OpenAI
+                return Response({'error': str(e)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            except UpstreamUnavailableError as e:
+                # Circuit open or deadline exhausted: fail fast instead of holding the worker
+                return Response({'error': str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            except Exception as e:
+                return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        else:
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class TranslateStreamView(APIView):
+    """
+    Streaming version of TranslateView, as Server-Sent Events.
 
-                # Translate simplified text
-                translated_text, source_language_code = aws_service.translate_text(
-                    simplified_text, target_language
+    Accepts the same body as /translate/. The simplified text is pushed as OpenAI generates it,
+    each completed paragraph (or group of sentences) is translated as soon as it is available,
+    and the metrics and BLEU score are the last events (see TranslationPipeline.stream).
+    """
+    permission_classes = [AllowAny]
+
+    @method_decorator(ratelimit(key='ip', rate=RATE_LIMIT, block=True))
+    def post(self, request):
+        serializer = TranslateRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+        if data.get('target_languages'):
+            return Response(
+                {'target_languages': 'Streaming supports a single target_language; use /translate/ for several.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        events = TranslationPipeline().stream(
+            text=data['text'],
+            target_language=data['target_language'],
+            speciality=data['speciality'],
+            style=data['style'],
+            summarize=data['summarize'],
+            model=data['model'],
+            complexity_level=data['complexity_level'],
+            focus_aspects=data.get('focus_aspects', []),
+            temperature=data['temperature'],
+            max_tokens=data.get('max_tokens'),
+            cache_mode=data['cache'],
+            bleu_mode=data.get('bleu_mode')
+        )
+        response = StreamingHttpResponse(self._sse(events), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # Disable proxy buffering (nginx), otherwise the events arrive all at once
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    @staticmethod
+    def _format_event(event, data):
+        return f'event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n'
+
+    @classmethod
+    def _sse(cls, events):
+        try:
+            for event, data in events:
+                yield cls._format_event(event, data)
+        except LLMCacheMissError as e:
+            # Headers are already sent, so errors are reported in-band with the status /translate/ would use
+            yield cls._format_event('error', {'error': str(e), 'status': status.HTTP_404_NOT_FOUND})
+        except TokenBudgetExceededError as e:
+            yield cls._format_event('error', {'error': str(e), 'status': status.HTTP_413_REQUEST_ENTITY_TOO_LARGE})
+        except UpstreamUnavailableError as e:
+            yield cls._format_event('error', {'error': str(e), 'status': status.HTTP_503_SERVICE_UNAVAILABLE})
+        except Exception as e:
+            yield cls._format_event('error', {'error': str(e), 'status': status.HTTP_500_INTERNAL_SERVER_ERROR})
+        finally:
+            # Client disconnects close the response iterator; stop the OpenAI stream and pending translations
+            events.close()
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncTranslateView(View):
+    """
+    Async (ASGI-native) version of TranslateView.
+
+    Runs TranslationPipeline.arun, so a single event loop can hold many in-flight
+    translations while waiting on OpenAI. Accepts the same JSON body and returns the
+    same payload as /translate/.
+    """
+
+    async def post(self, request):
+        # django_ratelimit's decorator is sync-only, so the check is done inline; it hits the cache
+        # backend, which may block, so it runs off the event loop like the serializer below
+        limited = await sync_to_async(is_ratelimited)(
+            request=request, group='translate-async', key='ip', rate=RATE_LIMIT, increment=True
+        )
+        if limited:
+            return JsonResponse(
+                {'error': 'Muitas requisições. Por favor, tente novamente mais tarde.'},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
+        try:
+            payload = json.loads(request.body or b'{}')
+        except ValueError:
+            return JsonResponse({'error': 'JSON inválido.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = TranslateRequestSerializer(data=payload)
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+
+        try:
+            pipeline = TranslationPipeline()
+            options = dict(
+                text=data['text'],
+                speciality=data['speciality'],
+                style=data['style'],
+                summarize=data['summarize'],
+                model=data['model'],
+                complexity_level=data['complexity_level'],
+                focus_aspects=data.get('focus_aspects', []),
+                temperature=data['temperature'],
+                max_tokens=data.get('max_tokens'),
+                cache_mode=data['cache'],
+                bleu_mode=data.get('bleu_mode')
+            )
+            if data.get('target_languages'):
+                # The fan-out is thread-based (one translation per target), so it runs off the event loop
+                response_data = await asyncio.to_thread(
+                    pipeline.run_multi,
+                    target_languages=data['target_languages'],
+                    bleu_targets=data.get('bleu_targets'),
+                    **options
                 )
+                response_serializer = MultiTranslateResponseSerializer(response_data)
+            else:
+                response_data = await pipeline.arun(target_language=data['target_language'], **options)
+                response_serializer = TranslateResponseSerializer(response_data)
+            return JsonResponse(response_serializer.data, status=status.HTTP_200_OK)
+        except LLMCacheMissError as e:
+            return JsonResponse({'error': str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except TokenBudgetExceededError as e:
+            return JsonResponse({'error': str(e)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        except UpstreamUnavailableError as e:
+            return JsonResponse({'error': str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class BatchTranslateView(APIView):
+    permission_classes = [AllowAny]
 
-                # Compute BLEU score
-                bleu_score = bleu_service.compute_bleu_score(
-                    simplified_text, translated_text, source_language_code
+    @method_decorator(ratelimit(key='ip', rate=RATE_LIMIT, block=True))
+    def post(self, request):
+        serializer = BatchTranslateRequestSerializer(data=request.data)
+        if serializer.is_valid():
+            data = serializer.validated_data
+            try:
+                # Per-item failures are reported inside the results, not as an error response
+                response_data = BatchTranslationService().translate(
+                    texts=data['texts'],
+                    target_language_codes=data['target_languages'],
+                    source_language_code=data['source_language']
                 )
+                return Response(response_data, status=status.HTTP_200_OK)
+            except Exception as e:
+                return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-                response_data = {
-                    'translated_text': translated_text,
-                    'metrics_original': metrics_original,
-                    'metrics_simplified': metrics_simplified,
-                    'bleu_score': bleu_score,
-                    'source_language_code': source_language_code
-                }
 
-                response_serializer = TranslateResponseSerializer(response_data)
-                return Response(response_serializer.data, status=status.HTTP_200_OK)
+class JobCreateView(APIView):
+    permission_classes = [AllowAny]
 
+    @method_decorator(ratelimit(key='ip', rate=RATE_LIMIT, block=True))
+    @upload_limits
+    def post(self, request):
+        serializer = JobCreateSerializer(data=request.data)
+        if serializer.is_valid():
+            params = dict(serializer.validated_data)
+            document = params.pop('file', None)
+            try:
+                job = JobService().submit(params=params, document=document)
             except Exception as e:
                 return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        else:
+            return Response({
+                'job_id': str(job.id),
+                'status': job.status,
+                'status_url': request.build_absolute_uri(reverse('job_detail', args=[job.id])),
+                'result_url': request.build_absolute_uri(reverse('job_result', args=[job.id])),
+            }, status=status.HTTP_202_ACCEPTED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class JobDetailView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, job_id):
+        job = get_object_or_404(Job, pk=job_id)
+        return Response(JobSerializer(job).data)
+
+
+class JobResultView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, job_id):
+        job = get_object_or_404(Job, pk=job_id)
+        if job.status == Job.STATUS_SUCCEEDED:
+            # Jobs created with target_languages store the run_multi result (one entry per language)
+            if 'translations' in job.result:
+                return Response(MultiTranslateResponseSerializer(job.result).data, status=status.HTTP_200_OK)
+            return Response(TranslateResponseSerializer(job.result).data, status=status.HTTP_200_OK)
+        if job.status == Job.STATUS_FAILED:
+            return Response({'status': job.status, 'error': job.error}, status=status.HTTP_409_CONFLICT)
+        # Ainda em andamento: o cliente deve consultar novamente mais tarde
+        response = Response(JobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+        response['Retry-After'] = '5'
+        return response
+
+
+class QualityScoreDetailView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, score_id):
+        quality_score = get_object_or_404(QualityScore, pk=score_id)
+        return Response(QualityScoreSerializer(quality_score).data)
+
+
+class GlossaryListView(APIView):
+    """
+    Lists the glossaries and uploads one (CSV), replacing the glossary of the same speciality and
+    source language. The upload is compiled right away, so the first translation does not pay for it.
+
+    Glossaries change every user's translations, so uploads (and deletions) are admin-only.
+    """
+    permission_classes = [IsAdminOrReadOnly]
+
+    def get(self, request):
+        return Response(GlossarySerializer(Glossary.objects.all(), many=True).data)
+
+    @method_decorator(ratelimit(key='ip', rate=RATE_LIMIT, block=True))
+    @upload_limits
+    def post(self, request):
+        serializer = GlossaryUploadSerializer(data=request.data)
+        if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+        try:
+            glossary, compile_seconds = GlossaryService().import_glossary(
+                data['file'], data['speciality'], data['source_language'], data['name']
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        response_data = dict(GlossarySerializer(glossary).data, compile_seconds=round(compile_seconds, 4))
+        return Response(response_data, status=status.HTTP_201_CREATED)
+
+
+class GlossaryDetailView(APIView):
+    permission_classes = [IsAdminOrReadOnly]
+
+    def get(self, request, glossary_id):
+        glossary = get_object_or_404(Glossary, pk=glossary_id)
+        return Response(GlossarySerializer(glossary).data)
+
+    @method_decorator(ratelimit(key='ip', rate=RATE_LIMIT, block=True))
+    def delete(self, request, glossary_id):
+        GlossaryService.delete(get_object_or_404(Glossary, pk=glossary_id))
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class ImportDocumentView(APIView):
     permission_classes = [AllowAny]
 
-    @method_decorator(ratelimit(key='ip', rate='10/m', block=True))
+    @method_decorator(ratelimit(key='ip', rate=RATE_LIMIT, block=True))
+    @upload_limits
     def post(self, request):
         serializer = ImportDocumentSerializer(data=request.data)
         if serializer.is_valid():
             file = serializer.validated_data['file']
+            output = serializer.validated_data['output']
             doc_service = DocumentService()
+            if output == 'stream':
+                # One JSON object per line as each page (or document part) is extracted, so clients can start
+                # translating before the whole document has been read
+                return StreamingHttpResponse(
+                    self._stream_pages(doc_service, file), content_type='application/x-ndjson'
+                )
             try:
+                if output == 'pages':
+                    pages = list(doc_service.iter_document(file))
+                    return Response({'text': '\n'.join(pages).strip(), 'pages': pages}, status=status.HTTP_200_OK)
                 text = doc_service.import_document(file)
                 return Response({'text': text}, status=status.HTTP_200_OK)
             except Exception as e:
                 return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @staticmethod
+    def _stream_pages(doc_service, file):
+        count = 0
+        try:
+            for count, page_text in enumerate(doc_service.iter_document(file), start=1):
+                yield json.dumps({'index': count, 'text': page_text}, ensure_ascii=False) + '\n'
+        except Exception as e:
+            # Headers are already sent, so errors are reported in-band
+            yield json.dumps({'error': str(e)}, ensure_ascii=False) + '\n'
+            return
+        yield json.dumps({'done': True, 'pages': count}) + '\n'
+
 
 class ExportDocumentView(APIView):
     permission_classes = [AllowAny]
 
-    @method_decorator(ratelimit(key='ip', rate='10/m', block=True))
+    @method_decorator(ratelimit(key='ip', rate=RATE_LIMIT, block=True))
     def post(self, request):
         serializer = ExportDocumentSerializer(data=request.data)
         if serializer.is_valid():
@@ -164,22 +508,55 @@ class ExportDocumentView(APIView):
             format = data['format']
             doc_service = DocumentService()
             try:
-                # Generate the document and get the file path
-                file_path = doc_service.export_document(
+                # Generate the document (or reuse the cached one for the same content) and get the file path
+                exported = doc_service.export_document_cached(
                     text=text,
                     metrics_original=metrics_original,
                     metrics_simplified=metrics_simplified,
                     format=format
                 )
-                # Return the file as a response
-                with open(file_path, 'rb') as f:
-                    response = Response(f.read(), content_type='application/octet-stream')
-                    response['Content-Disposition'] = f'attachment; filename="{os.path.basename(file_path)}"'
-                    return response
+                # Stream the file instead of reading it into memory; FileResponse sets Content-Length and
+                # uses the server's wsgi.file_wrapper (sendfile) when available
+                return self._file_response(exported.path, format, temporary=exported.temporary)
             except Exception as e:
                 return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @staticmethod
+    def _file_response(file_path, format, temporary=True):
+        # Cached exports stay on disk for the next download; temporary ones are deleted by the file
+        # object itself once the response has been sent and closed
+        file = _TemporaryExportFile(file_path) if temporary else open(file_path, 'rb')
+        return FileResponse(
+            file,
+            as_attachment=True,
+            filename=f'output.{format.lower()}',
+            content_type=EXPORT_CONTENT_TYPES.get(format.lower(), 'application/octet-stream')
+        )
+
+
+class _TemporaryExportFile(io.FileIO):
+    """
+    Read-only file that removes itself from disk when closed.
+
+    FileResponse closes its file when the response is closed (end of the download or client
+    disconnect), so the exported file lives exactly as long as the response that streams it.
+    """
+
+    def __init__(self, path):
+        super().__init__(path, 'rb')
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            super().close()
+        finally:
+            try:
+                os.remove(self.name)
+            except OSError:
+                pass
+
 
 class TranslationDetailView(APIView):
     permission_classes = [AllowAny]